@@ -15,6 +15,23 @@ class ActionType(Enum):
     MULLIGAN = auto()        # Mulligan selection
     TRADE = auto()           # Trade card back to deck
     FORGE = auto()           # Forge card in hand
+    TITAN = auto()           # Use a Titan's ability
+
+
+# Action index layout (see Action.to_index)
+HERO_POWER_BASE = 1
+PLAY_CARD_BASE = 11
+PLAY_TARGETS = 20            # slots per hand card
+ATTACK_BASE = 211
+CHOOSE_BASE = 275
+TRADE_BASE = 280
+FORGE_BASE = 290
+HERO_POWER_FRIENDLY_BASE = 300
+PLAY_POSITION_BASE = 307
+BOARD_POSITIONS = 7          # slots per hand card
+TITAN_BASE = 377
+TITAN_ABILITIES = 3          # slots per board minion
+MAX_CHOICES = 5
 
 
 @dataclass
@@ -44,8 +61,8 @@ class Action:
     
     @classmethod
     def play_card(cls, card_index: int, target_index: Optional[int] = None,
-                  target_is_friendly: bool = False, position: int = 0) -> "Action":
-        """Create a PLAY_CARD action."""
+                  target_is_friendly: bool = False, position: Optional[int] = None) -> "Action":
+        """Create a PLAY_CARD action (position: board slot for minions and locations)."""
         return cls(
             action_type=ActionType.PLAY_CARD,
             card_index=card_index,
@@ -125,13 +142,22 @@ class Action:
             card_index=card_index,
         )
     
+    @classmethod
+    def titan(cls, attacker_index: int, ability_index: int) -> "Action":
+        """Create a TITAN action (attacker_index: the Titan's board slot)."""
+        return cls(
+            action_type=ActionType.TITAN,
+            attacker_index=attacker_index,
+            choice_index=ability_index,
+        )
+    
     def to_index(self, max_hand: int = 10, max_board: int = 7) -> int:
         """
         Convert action to a unique integer index for the neural network.
         
         Action space layout:
         - 0: END_TURN
-        - 1-10: HERO_POWER (0 = no target, 1-7 = enemy minions, 8 = enemy hero, 9 = friendly)
+        - 1-10: HERO_POWER (0 = no target, 1-7 = enemy minions, 8 = enemy hero, 9 = friendly hero)
         - 11-210: PLAY_CARD (10 cards * 20 targets each)
             - 0: No target
             - 1-7: Enemy minions
@@ -139,64 +165,76 @@ class Action:
             - 9: Friendly hero
             - 10-16: Friendly minions
         - 211-274: ATTACK (8 attackers * 8 targets)
+        - 275-279: CHOOSE (5 options)
+        - 280-289: TRADE (10 cards)
+        - 290-299: FORGE (10 cards)
+        - 300-306: HERO_POWER on friendly minions
+        - 307-376: PLAY_CARD without target at a board position (10 cards * 7 positions)
+        - 377-397: TITAN (7 board slots * 3 abilities)
         
-        Total: ~300 actions
+        Total: 400 actions (ACTION_SPACE_SIZE)
         """
         if self.action_type == ActionType.END_TURN:
             return 0
         
         elif self.action_type == ActionType.HERO_POWER:
-            base = 1
-            if self.target_index is None:
-                return base
-            elif self.target_is_friendly:
-                if self.target_index == -1: # Friendly hero (fallback)
-                    return base + 9
-                return base + 9 + (self.target_index or 0)
-            elif self.target_index == -1:  # Enemy hero
-                return base + 8
-            else:
-                return base + 1 + self.target_index
+            if self.target_is_friendly and self.target_index is not None and self.target_index >= 0:
+                return HERO_POWER_FRIENDLY_BASE + self.target_index
+            return HERO_POWER_BASE + self._target_offset()
         
         elif self.action_type == ActionType.PLAY_CARD:
-            base = 11
-            card_offset = (self.card_index or 0) * 20
-            if self.target_index is None:
-                target_offset = 0
-            elif self.target_is_friendly:
-                if self.target_index == -1: # Friendly hero
-                    target_offset = 9
-                else: # Friendly minion 0-6
-                    target_offset = 10 + (self.target_index or 0)
-            elif self.target_index == -1:  # Enemy hero
-                target_offset = 8
-            else: # Enemy minion 0-6
-                target_offset = 1 + (self.target_index or 0)
-            return base + card_offset + target_offset
+            if self.target_index is None and self.position is not None:
+                return PLAY_POSITION_BASE + (self.card_index or 0) * BOARD_POSITIONS + self.position
+            return PLAY_CARD_BASE + (self.card_index or 0) * PLAY_TARGETS + self._target_offset()
         
         elif self.action_type == ActionType.ATTACK:
-            base = 211
             attacker_offset = ((self.attacker_index or 0) + 1) * 8  # +1 because -1 = hero
             if self.target_index == -1:  # Enemy hero
                 target_offset = 0
             else:
                 target_offset = 1 + (self.target_index or 0)
-            return base + attacker_offset + target_offset
+            return ATTACK_BASE + attacker_offset + target_offset
             
         elif self.action_type == ActionType.CHOOSE:
-            base = 275
-            return base + (self.choice_index or 0)
+            return CHOOSE_BASE + (self.choice_index or 0)
             
         elif self.action_type == ActionType.TRADE:
-            base = 280
-            return base + (self.card_index or 0)
+            return TRADE_BASE + (self.card_index or 0)
             
         elif self.action_type == ActionType.FORGE:
-            base = 290
-            return base + (self.card_index or 0)
+            return FORGE_BASE + (self.card_index or 0)
+        
+        elif self.action_type == ActionType.TITAN:
+            return TITAN_BASE + (self.attacker_index or 0) * TITAN_ABILITIES + (self.choice_index or 0)
         
         return 0
     
+    def _target_offset(self) -> int:
+        """Target slot within a PLAY_CARD or HERO_POWER block."""
+        if self.target_index is None:
+            return 0
+        elif self.target_is_friendly:
+            if self.target_index == -1:  # Friendly hero
+                return 9
+            return 10 + self.target_index  # Friendly minion 0-6
+        elif self.target_index == -1:  # Enemy hero
+            return 8
+        return 1 + self.target_index  # Enemy minion 0-6
+    
+    @staticmethod
+    def _target_from_offset(offset: int) -> dict:
+        if offset == 0:
+            return {}
+        elif offset == 8:
+            return {"target_index": -1}
+        elif offset == 9:
+            return {"target_index": -1, "target_is_friendly": True}
+        elif offset <= 7:
+            return {"target_index": offset - 1}
+        elif offset <= 16:
+            return {"target_index": offset - 10, "target_is_friendly": True}
+        return {}
+    
     @classmethod
     def from_index(cls, index: int) -> "Action":
         """
@@ -207,36 +245,15 @@ class Action:
         if index == 0:
             return cls.end_turn()
         
-        elif 1 <= index <= 10:
-            offset = index - 1
-            if offset == 0:
-                return cls.hero_power()
-            elif offset == 8:
-                return cls.hero_power(target_index=-1)
-            elif offset == 9:
-                return cls.hero_power(target_index=0, target_is_friendly=True)
-            else:
-                return cls.hero_power(target_index=offset - 1)
+        elif HERO_POWER_BASE <= index < PLAY_CARD_BASE:
+            return cls.hero_power(**cls._target_from_offset(index - HERO_POWER_BASE))
         
-        elif 11 <= index <= 210:
-            offset = index - 11
-            card_index = offset // 20
-            target_offset = offset % 20
-            if target_offset == 0:
-                return cls.play_card(card_index)
-            elif target_offset == 8:
-                return cls.play_card(card_index, target_index=-1)
-            elif target_offset == 9:
-                return cls.play_card(card_index, target_index=-1, target_is_friendly=True)
-            elif 1 <= target_offset <= 7:
-                return cls.play_card(card_index, target_index=target_offset - 1)
-            elif 10 <= target_offset <= 16:
-                return cls.play_card(card_index, target_index=target_offset - 10, target_is_friendly=True)
-            else:
-                return cls.play_card(card_index)
+        elif PLAY_CARD_BASE <= index < ATTACK_BASE:
+            card_index, target_offset = divmod(index - PLAY_CARD_BASE, PLAY_TARGETS)
+            return cls.play_card(card_index, **cls._target_from_offset(target_offset))
         
-        elif 211 <= index <= 274:
-            offset = index - 211
+        elif ATTACK_BASE <= index < CHOOSE_BASE:
+            offset = index - ATTACK_BASE
             attacker_index = (offset // 8) - 1  # -1 converts back to hero = -1
             target_offset = offset % 8
             if target_offset == 0:
@@ -244,14 +261,24 @@ class Action:
             else:
                 return cls.attack(attacker_index, target_index=target_offset - 1)
         
-        elif 275 <= index <= 277:
-            return cls.choose(index - 275)
+        elif CHOOSE_BASE <= index < TRADE_BASE:
+            return cls.choose(index - CHOOSE_BASE)
             
-        elif 280 <= index <= 289:
-            return cls.trade(index - 280)
+        elif TRADE_BASE <= index < FORGE_BASE:
+            return cls.trade(index - TRADE_BASE)
             
-        elif 290 <= index <= 294:
-            return cls.forge(index - 290)
+        elif FORGE_BASE <= index < HERO_POWER_FRIENDLY_BASE:
+            return cls.forge(index - FORGE_BASE)
+        
+        elif HERO_POWER_FRIENDLY_BASE <= index < PLAY_POSITION_BASE:
+            return cls.hero_power(target_index=index - HERO_POWER_FRIENDLY_BASE, target_is_friendly=True)
+        
+        elif PLAY_POSITION_BASE <= index < TITAN_BASE:
+            card_index, position = divmod(index - PLAY_POSITION_BASE, BOARD_POSITIONS)
+            return cls.play_card(card_index, position=position)
+        
+        elif TITAN_BASE <= index < TITAN_BASE + BOARD_POSITIONS * TITAN_ABILITIES:
+            return cls.titan(*divmod(index - TITAN_BASE, TITAN_ABILITIES))
             
         return cls.end_turn()
     
@@ -284,8 +311,10 @@ class Action:
             return f"Action(TRADE[{self.card_index}])"
         elif self.action_type == ActionType.FORGE:
             return f"Action(FORGE[{self.card_index}])"
+        elif self.action_type == ActionType.TITAN:
+            return f"Action(TITAN[{self.attacker_index}] ability {self.choice_index})"
         return f"Action({self.action_type.name})"
 
 
 # Action space constants
-ACTION_SPACE_SIZE = 300  # Expanded for full targeting
+ACTION_SPACE_SIZE = 400  # Expanded for board positions and Titans
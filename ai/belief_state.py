@@ -64,13 +64,23 @@ class BeliefState:
         
         elif action_type == "end_turn":
             mana_left = action_data.get("mana_remaining", 0)
-            if mana_left >= 2:
+            if mana_left >= 2 and self.probabilities:
                 # Inférence : Il n'avait probablement pas de drop de coût <= mana_left
-                for cid, prob in self.probabilities.items():
-                    # Simulation simplifiée du coût (devrait ideally venir du CardDatabase)
-                    estimated_cost = 2 # Placeholder
-                    if estimated_cost <= mana_left:
-                        self.probabilities[cid] *= 0.8 # Légère baisse de proba
+                cards = list(self.probabilities.keys())
+                probs = np.fromiter(self.probabilities.values(), dtype=np.float64, count=len(cards))
+                probs[self._card_costs(cards) <= mana_left] *= 0.8 # Légère baisse de proba
+                self.probabilities = dict(zip(cards, probs.tolist()))
+
+    @staticmethod
+    def _card_costs(cards: List[str]) -> np.ndarray:
+        """Coûts des cartes via le catalogue colonnaire (2 si carte inconnue)."""
+        try:
+            from simulator.card_loader import CardDatabase
+            catalog = CardDatabase.catalog()
+        except Exception:
+            return np.full(len(cards), 2, dtype=np.int16)
+        rows = np.array([catalog.row_of.get(cid, -1) for cid in cards], dtype=np.int64)
+        return np.where(rows >= 0, catalog.cost[rows], 2)
 
     def sample_hand(self, hand_size: int) -> List[str]:
         """Échantillonne une main possible de l'adversaire."""
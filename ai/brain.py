@@ -12,7 +12,8 @@ from typing import Optional, Tuple, List
 
 from ai.model import HearthstoneModel
 from ai.encoder import FeatureEncoder
-from ai.actions import Action, ActionType
+from ai.inference import InferenceModel, TORCHSCRIPT_SUFFIX
+from ai.actions import Action, ActionType, ACTION_SPACE_SIZE
 from ai.game_wrapper import HearthstoneGame
 from ai.game_state import GameState
 
@@ -27,9 +28,10 @@ class AIBrain:
         action, confidence = brain.suggest_action(game_state)
     """
     
-    def __init__(self, input_dim: int = 870, action_dim: int = 300, use_gpu: bool = True):
+    def __init__(self, input_dim: int = 870, action_dim: int = ACTION_SPACE_SIZE, use_gpu: bool = True):
         self.input_dim = input_dim
         self.action_dim = action_dim
+        self.use_gpu = use_gpu
         self.device = torch.device("cuda" if use_gpu and torch.cuda.is_available() else "cpu")
         
         # Initialize model
@@ -41,18 +43,26 @@ class AIBrain:
         self.model_path = None
         
     def load_model(self, path: str) -> bool:
-        """Load a trained model checkpoint."""
+        """Load a trained model checkpoint, or a TorchScript export (.ts)."""
         if not os.path.exists(path):
             print(f"Model not found: {path}")
             return False
             
         try:
-            checkpoint = torch.load(path, map_location=self.device)
-            # Handle both full checkpoint (dict) and direct state_dict
-            if isinstance(checkpoint, dict) and 'model_state_dict' in checkpoint:
-                self.model.load_state_dict(checkpoint['model_state_dict'])
+            if path.endswith(TORCHSCRIPT_SUFFIX):
+                # Frozen CPU export (tools/export_model.py)
+                self.model = InferenceModel.load(path)
+                self.device = torch.device("cpu")
             else:
-                self.model.load_state_dict(checkpoint)
+                if isinstance(self.model, InferenceModel):
+                    self.device = torch.device("cuda" if self.use_gpu and torch.cuda.is_available() else "cpu")
+                    self.model = HearthstoneModel(self.input_dim, self.action_dim).to(self.device)
+                checkpoint = torch.load(path, map_location=self.device)
+                # Handle both full checkpoint (dict) and direct state_dict
+                if isinstance(checkpoint, dict) and 'model_state_dict' in checkpoint:
+                    self.model.load_state_dict(checkpoint['model_state_dict'])
+                else:
+                    self.model.load_state_dict(checkpoint)
             self.model.eval()
             self.model_loaded = True
             self.model_path = path
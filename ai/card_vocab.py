@@ -0,0 +1,188 @@
+"""
+Card vocabulary - stable embedding ids and static card features.
+
+Embedding ids come from the card database ordered by dbf_id, after the
+reserved ids PAD, UNKNOWN and HIDDEN. The vocabulary is saved next to the
+checkpoints it was trained with (card_vocab.json) and loaded back with
+them, so a card keeps its embedding row in every worker, in the server
+and across restarts; cards added to the database later are appended, never
+renumbered.
+
+    vocab = CardVocabulary.load_or_build("models/card_vocab.json")
+    ids = vocab.lookup(["CS2_029", None])        # [row of Fireball, HIDDEN]
+    static = vocab.features[ids]                 # one gather, STATIC_FEATURES wide
+
+features is the per-card static feature matrix (base cost, attack and
+health, type, class, keyword bits, mechanic flags), built column-wise from
+the card catalog.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from simulator.card_loader import CardDatabase
+from simulator.card_catalog import CardCatalog
+from simulator.entities import KEYWORD_BITS
+from simulator.enums import CardClass, CardType
+
+PAD, UNKNOWN, HIDDEN = 0, 1, 2
+RESERVED = ("<pad>", "<unknown>", "<hidden>")
+
+# Embedding rows reserved for the vocabulary (room for new sets)
+VOCAB_CAPACITY = 32768
+VOCAB_FILE = "card_vocab.json"
+
+_TYPES = (CardType.MINION, CardType.SPELL, CardType.WEAPON, CardType.HERO,
+          CardType.HERO_POWER, CardType.LOCATION)
+_CLASSES = tuple(CardClass)
+_KEYWORDS = tuple(sorted(KEYWORD_BITS, key=KEYWORD_BITS.get))
+
+# Column layout of CardVocabulary.features
+FEATURE_NAMES = (
+    ("cost", "attack", "health")
+    + tuple(f"type_{t.name.lower()}" for t in _TYPES) + ("type_other",)
+    + tuple(f"class_{c.name.lower()}" for c in _CLASSES)
+    + tuple(f"keyword_{k}" for k in _KEYWORDS)
+    + ("collectible", "has_race", "has_spell_school")
+)
+STATIC_FEATURES = len(FEATURE_NAMES)
+TYPE_COLUMNS = slice(3, 3 + len(_TYPES) + 1)
+
+
+class CardVocabulary:
+    """card_id <-> embedding id, with a static feature row per id."""
+
+    _default: Optional["CardVocabulary"] = None
+
+    def __init__(self, card_ids: Sequence[str], dbf_ids: Sequence[int]):
+        self.card_ids: List[str] = list(card_ids)     # by id - len(RESERVED)
+        self.dbf_ids: List[int] = [int(d) for d in dbf_ids]
+        if len(RESERVED) + len(self.card_ids) > VOCAB_CAPACITY:
+            raise ValueError(f"Card vocabulary exceeds {VOCAB_CAPACITY} ids")
+        # card_id -> embedding id
+        self.ids: Dict[str, int] = {cid: i + len(RESERVED) for i, cid in enumerate(self.card_ids)}
+        self._features: Optional[np.ndarray] = None
+
+    # === Construction and persistence ===
+
+    @classmethod
+    def build(cls, catalog: Optional[CardCatalog] = None) -> "CardVocabulary":
+        """Vocabulary of every card in the database, by dbf_id (then card_id)."""
+        catalog = catalog or CardDatabase.catalog()
+        order = sorted(range(len(catalog)), key=lambda row: (int(catalog.dbf_id[row]), catalog.card_ids[row]))
+        return cls([catalog.card_ids[row] for row in order], [int(catalog.dbf_id[row]) for row in order])
+
+    def extend(self, catalog: Optional[CardCatalog] = None) -> int:
+        """Append database cards missing from the vocabulary; returns how many were added."""
+        catalog = catalog or CardDatabase.catalog()
+        new = [row for row in range(len(catalog)) if catalog.card_ids[row] not in self.ids]
+        new.sort(key=lambda row: (int(catalog.dbf_id[row]), catalog.card_ids[row]))
+        if len(RESERVED) + len(self.card_ids) + len(new) > VOCAB_CAPACITY:
+            raise ValueError(f"Card vocabulary exceeds {VOCAB_CAPACITY} ids")
+        for row in new:
+            card_id = catalog.card_ids[row]
+            self.ids[card_id] = len(RESERVED) + len(self.card_ids)
+            self.card_ids.append(card_id)
+            self.dbf_ids.append(int(catalog.dbf_id[row]))
+        if new:
+            self._features = None
+        return len(new)
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "reserved": list(RESERVED),
+                       "card_ids": self.card_ids, "dbf_ids": self.dbf_ids}, f)
+
+    @classmethod
+    def load(cls, path: str) -> "CardVocabulary":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("reserved") != list(RESERVED):
+            raise ValueError(f"{path}: unexpected reserved ids {data.get('reserved')}")
+        return cls(data["card_ids"], data["dbf_ids"])
+
+    @classmethod
+    def load_or_build(cls, path: str) -> "CardVocabulary":
+        """The vocabulary saved at path, extended with new cards (saved back); built if missing."""
+        if os.path.exists(path):
+            vocab = cls.load(path)
+            if vocab.extend():
+                vocab.save(path)
+        else:
+            vocab = cls.build()
+            vocab.save(path)
+        return vocab
+
+    @classmethod
+    def default(cls) -> "CardVocabulary":
+        """Process-wide vocabulary built from the loaded database."""
+        if cls._default is None:
+            CardDatabase.load()
+            cls._default = cls.build()
+        return cls._default
+
+    # === Lookup ===
+
+    def __len__(self) -> int:
+        return len(RESERVED) + len(self.card_ids)
+
+    def __contains__(self, card_id: str) -> bool:
+        return card_id in self.ids
+
+    def index(self, card_id: Optional[str]) -> int:
+        """Embedding id of card_id (HIDDEN for None, UNKNOWN if not in the vocabulary)."""
+        if card_id is None:
+            return HIDDEN
+        return self.ids.get(card_id, UNKNOWN)
+
+    def lookup(self, card_ids: Iterable[Optional[str]]) -> np.ndarray:
+        """Embedding ids of card_ids (see index)."""
+        ids = self.ids
+        return np.array([HIDDEN if cid is None else ids.get(cid, UNKNOWN) for cid in card_ids],
+                        dtype=np.int64)
+
+    def card_id(self, index: int) -> Optional[str]:
+        """card_id of an embedding id (None for reserved ids)."""
+        return self.card_ids[index - len(RESERVED)] if index >= len(RESERVED) else None
+
+    # === Static features ===
+
+    @property
+    def features(self) -> np.ndarray:
+        """float32[len(self), STATIC_FEATURES]; reserved rows are zero."""
+        if self._features is None:
+            self._features = self._build_features(CardDatabase.catalog())
+        return self._features
+
+    def _build_features(self, catalog: CardCatalog) -> np.ndarray:
+        features = np.zeros((len(self), STATIC_FEATURES), dtype=np.float32)
+        rows = np.array([catalog.row_of.get(cid, -1) for cid in self.card_ids], dtype=np.int64)
+        known = rows >= 0
+        target = np.flatnonzero(known) + len(RESERVED)
+        rows = rows[known]
+
+        col = 0
+        for name in ("cost", "attack", "health"):
+            features[target, col] = getattr(catalog, name)[rows] / 10.0
+            col += 1
+        card_type = catalog.card_type[rows]
+        for t in _TYPES:
+            features[target, col] = card_type == int(t)
+            col += 1
+        features[target, col] = ~np.isin(card_type, [int(t) for t in _TYPES])
+        col += 1
+        card_class = catalog.card_class[rows]
+        for c in _CLASSES:
+            features[target, col] = card_class == int(c)
+            col += 1
+        bits = np.array([KEYWORD_BITS[k] for k in _KEYWORDS], dtype=np.uint64)
+        features[target, col:col + len(bits)] = (catalog.keywords[rows, None] & bits) != 0
+        col += len(bits)
+        features[target, col] = catalog.collectible[rows]
+        features[target, col + 1] = catalog.race[rows] != 0
+        features[target, col + 2] = catalog.spell_school[rows] != 0
+        return features
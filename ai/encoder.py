@@ -1,8 +1,34 @@
 import numpy as np
 import torch
-from typing import Dict, Any
+from operator import attrgetter
+from typing import Dict, Any, List, Optional, Tuple
 from .game_state import GameState
 from .actions import ACTION_SPACE_SIZE
+from .card_vocab import CardVocabulary, FEATURE_NAMES, UNKNOWN
+from simulator.entities import KEYWORD_BITS
+
+# Card row layout: column -> static feature of the vocabulary table
+_STATIC_COLUMNS = {
+    4: "type_minion", 5: "type_spell", 6: "type_weapon",
+    10: "keyword_rush", 11: "keyword_lifesteal", 12: "keyword_poisonous",
+    14: "keyword_windfury", 15: "keyword_reborn", 16: "keyword_cleave", 17: "keyword_magnetic",
+}
+_OTHER_TYPE = 7
+# Columns read from the live card: cost, atk, hp, max hp, taunt, divine shield, stealth, frozen, exhausted
+_DYNAMIC_COLUMNS = np.array([0, 1, 2, 3, 8, 9, 13, 19, 21])
+_DYNAMIC_SCALE = np.array([10.0, 10.0, 10.0, 10.0, 1, 1, 1, 1, 1], dtype=np.float32)
+# Scalars: mana, max mana, health, armor, overload, fatigue, hand, deck (both players, no mana
+# for the enemy), then is_my_turn
+_SCALAR_SCALE = np.array([10, 10, 30, 20, 10, 10, 10, 30, 30, 20, 10, 10, 10, 30, 1], dtype=np.float32)
+STRUCTURED_STATS = 10
+_RAW_STATE = attrgetter("_keywords", "silenced", "frozen", "exhausted")
+_TAUNT, _DIVINE_SHIELD, _STEALTH = (KEYWORD_BITS[k] for k in ("taunt", "divine_shield", "stealth"))
+
+
+def _card_id(card) -> Optional[str]:
+    info = getattr(card, "info", None)
+    return info.card_id if info is not None else getattr(card, "card_id", None)
+
 
 class FeatureEncoder:
     """
@@ -16,7 +42,9 @@ class FeatureEncoder:
     - History features
     """
     
-    def __init__(self):
+    def __init__(self, vocab: Optional[CardVocabulary] = None):
+        # Card ids -> embedding ids; saved with the checkpoints (see ai/card_vocab.py)
+        self.vocab = vocab or CardVocabulary.default()
         # Define dimensions
         self.scalar_dim = 20 # Mana, Health, Armor, Overload, Fatigue, Deck, Hand, etc.
         self.card_dim = 25   # Cost, Atk, HP, MaxHP, Type(4), Keywords(10), State(5), etc.
@@ -24,6 +52,16 @@ class FeatureEncoder:
         self.max_board = 7
         self.input_dim = self.scalar_dim + (self.max_hand * 2 * self.card_dim) + (self.max_board * 2 * self.card_dim) 
         
+        # Static part of every card row, by embedding id
+        features = self.vocab.features
+        self._card_static = np.zeros((len(self.vocab), self.card_dim), dtype=np.float32)
+        for column, name in _STATIC_COLUMNS.items():
+            self._card_static[:, column] = features[:, FEATURE_NAMES.index(name)]
+        types = self._card_static[:, 4:7].sum(axis=1)
+        self._card_static[:, _OTHER_TYPE] = (types == 0) & (features.any(axis=1))
+        self._scratch_buffers: Optional["StateBuffers"] = None
+        self._batch_buffers: Dict[bool, "StateBuffers"] = {}
+        
     def encode(self, state: GameState) -> torch.Tensor:
         """Encodes state to tensor."""
         # 1. Scalars (Global context)
@@ -51,76 +89,44 @@ class FeatureEncoder:
         scalars.extend([0.0] * (self.scalar_dim - len(scalars)))
         
         # 2. Hand Cards
-        hand_features = []
-        for card in p1.hand:
-            hand_features.extend(self._encode_card(card))
-        hand_features.extend([0.0] * (self.card_dim * (self.max_hand - len(p1.hand))))
+        hand_features = self._zone(p1.hand, self.max_hand)
         
         # Opponent hand (Hidden - limited info)
         opp_hand_features = [0.0] * (self.card_dim * self.max_hand)
         
         # 3. Board Minions
-        board_features = []
-        for minion in p1.board:
-            board_features.extend(self._encode_card(minion))
-        board_features.extend([0.0] * (self.card_dim * (self.max_board - len(p1.board))))
-        
-        opp_board_features = []
-        for minion in p2.board:
-            opp_board_features.extend(self._encode_card(minion))
-        opp_board_features.extend([0.0] * (self.card_dim * (self.max_board - len(p2.board))))
+        board_features = self._zone(p1.board, self.max_board)
+        opp_board_features = self._zone(p2.board, self.max_board)
         
         # Combine
-        full_vector = scalars + hand_features + opp_hand_features + board_features + opp_board_features
-        return torch.tensor(full_vector, dtype=torch.float32)
+        full_vector = np.concatenate([
+            np.asarray(scalars, dtype=np.float32), hand_features.ravel(),
+            np.asarray(opp_hand_features, dtype=np.float32), board_features.ravel(), opp_board_features.ravel()])
+        return torch.from_numpy(full_vector)
+
+    def _zone(self, cards, max_size: int) -> np.ndarray:
+        """float32[max_size, card_dim] rows of cards, zero-padded."""
+        out = np.zeros((max_size, self.card_dim), dtype=np.float32)
+        cards = cards[:max_size]
+        if cards:
+            out[:len(cards)] = self._card_rows(cards, self.vocab.lookup(_card_id(c) for c in cards))
+        return out
+
+    def _card_rows(self, cards, ids: np.ndarray) -> np.ndarray:
+        """Static columns gathered from the vocabulary table, then the live state of each card."""
+        rows = self._card_static[ids]
+        rows[:, _DYNAMIC_COLUMNS] = np.array([self._dynamic(c) for c in cards], dtype=np.float32) / _DYNAMIC_SCALE
+        return rows
+
+    @staticmethod
+    def _dynamic(card) -> tuple:
+        """Live values of a CardInstance, in _DYNAMIC_COLUMNS order."""
+        return (card.current_cost, card.current_attack or 0, card.current_health or 0, card.max_health or 0,
+                card.has_taunt, card.has_divine_shield, card.has_stealth, card.is_frozen, card.is_exhausted)
 
     def _encode_card(self, card) -> list:
         """Detailed encoding of a card/minion."""
-        # Stats normalized roughly
-        res = [
-            getattr(card, 'cost', 0) / 10.0,
-            getattr(card, 'attack', 0) / 10.0,
-            getattr(card, 'health', 0) / 10.0,
-            getattr(card, 'max_health', 1) / 10.0,
-        ]
-        
-        # Card Type (One-hot: Minion, Spell, Weapon, Other)
-        ctype = getattr(card, 'card_type', 0)
-        res.extend([
-            1.0 if ctype == 4 else 0.0, # MINION
-            1.0 if ctype == 5 else 0.0, # SPELL
-            1.0 if ctype == 7 else 0.0, # WEAPON
-            1.0 if ctype not in [4, 5, 7] else 0.0
-        ])
-        
-        # Keywords (Binary)
-        res.extend([
-            1.0 if getattr(card, 'taunt', False) else 0.0,
-            1.0 if getattr(card, 'divine_shield', False) else 0.0,
-            1.0 if getattr(card, 'rush', False) else 0.0,
-            1.0 if getattr(card, 'lifesteal', False) else 0.0,
-            1.0 if getattr(card, 'poisonous', False) else 0.0,
-            1.0 if getattr(card, 'stealth', False) else 0.0,
-            1.0 if getattr(card, 'windfury', False) else 0.0,
-            1.0 if getattr(card, 'reborn', False) else 0.0,
-            # New mechanics
-            1.0 if getattr(card, 'cleave', False) else 0.0,
-            1.0 if getattr(card, 'magnetic', False) else 0.0,
-        ])
-        
-        # States
-        res.extend([
-            1.0 if getattr(card, 'dormant', 0) > 0 else 0.0,
-            1.0 if getattr(card, 'frozen', False) else 0.0,
-            1.0 if getattr(card, 'silenced', False) else 0.0,
-            1.0 if getattr(card, 'exhausted', False) else 0.0,
-            getattr(card, 'dormant', 0) / 5.0 # Counter value
-        ])
-        
-        # Fill rest to card_dim
-        if len(res) < self.card_dim:
-            res.extend([0.0] * (self.card_dim - len(res)))
-        return res[:self.card_dim]
+        return self._card_rows([card], self.vocab.lookup([_card_id(card)]))[0].tolist()
 
     def structured_encode(self, state: GameState) -> Dict[str, Any]:
         """Encodes state into structured format for Transformer model."""
@@ -136,27 +142,14 @@ class FeatureEncoder:
         scalars.extend([0.0] * (20 - len(scalars)))
         
         def encode_list(cards, max_size):
-            ids = []
-            stats = []
-            mask = []
-            for i in range(max_size):
-                if i < len(cards):
-                    c = cards[i]
-                    # Simple card ID hashing for embedding (should ideally use a proper mapping)
-                    try:
-                        cid_numeric = hash(getattr(c, 'card_id', "0")) % 5000
-                    except:
-                        cid_numeric = 0
-                    ids.append(cid_numeric)
-                    # Convert to numeric list and then to 10-stat vector for the model
-                    card_feat = self._encode_card(c)
-                    stats.append(card_feat[:10]) # Use first 10 core stats
-                    mask.append(False) # Not padded
-                else:
-                    ids.append(0)
-                    stats.append([0.0] * 10)
-                    mask.append(True) # Padded
-            return torch.tensor(ids, dtype=torch.long), torch.tensor(stats, dtype=torch.float32), torch.tensor(mask, dtype=torch.bool)
+            cards = cards[:max_size]
+            ids = np.zeros(max_size, dtype=np.int64)  # PAD
+            stats = np.zeros((max_size, STRUCTURED_STATS), dtype=np.float32)
+            if cards:
+                ids[:len(cards)] = self.vocab.lookup(_card_id(c) for c in cards)
+                stats[:len(cards)] = self._card_rows(cards, ids[:len(cards)])[:, :STRUCTURED_STATS] # Use first 10 core stats
+            mask = np.arange(max_size) >= len(cards) # Padded
+            return torch.from_numpy(ids), torch.from_numpy(stats), torch.from_numpy(mask)
 
         hand_ids, hand_stats, hand_mask = encode_list(p1.hand, self.max_hand)
         my_board_ids, my_board_stats, my_board_mask = encode_list(p1.board, self.max_board)
@@ -173,3 +166,238 @@ class FeatureEncoder:
                 "enemy_board": en_board_mask
             }
         }
+
+    # === Direct simulator path ===
+    # Reads a simulator Game without building GameState/PlayerState/CardInstance
+    # objects and writes into StateBuffers. Same values as encode/structured_encode
+    # of GameState.from_simulator_game(game, player + 1).
+
+    def encode_game(self, game, player: Optional[int] = None,
+                    out: Optional["StateBuffers"] = None, row: int = 0) -> torch.Tensor:
+        """encode() of game from player's view (default: the player to act)."""
+        if out is None:
+            out = self._scratch()
+        self.encode_into(game, player, out, row)
+        return out.flat_tensor[row]
+
+    def structured_encode_game(self, game, player: Optional[int] = None,
+                               out: Optional["StateBuffers"] = None, row: int = 0) -> Dict[str, Any]:
+        """
+        structured_encode() of game from player's view (default: the player to act).
+
+        Written into row of out; the tensors share its memory. By default out is a
+        buffer of this encoder that the next call overwrites: to keep several
+        states, give each its own row of a StateBuffers.
+        """
+        if out is None:
+            out = self._scratch()
+        self.encode_into(game, player, out, row)
+        return out.row(row)
+
+    def encode_batch(self, games, perspectives=None, out: Optional["StateBuffers"] = None,
+                     start: int = 0, device=None, pin_memory: bool = False) -> tuple:
+        """
+        Encode games into one batch: the HearthstoneTransformer.forward arguments
+        (hand, my_board, enemy_board, global_state, masks), [len(games), ...] each.
+
+        perspectives are player indices (default: the player to act in each game).
+        The games fill rows start.. of out, by default a buffer of this encoder
+        that the next call overwrites (pinned for CUDA with pin_memory). With a
+        device, the batch is moved with one copy per buffer.
+        """
+        n = len(games)
+        if out is None:
+            out = self._batch(start + n, pin_memory)
+        self._encode_rows(games, (None,) * n if perspectives is None else perspectives, out, start)
+        return out.inputs(n, device, start)
+
+    def _batch(self, size: int, pin_memory: bool) -> "StateBuffers":
+        buffers = self._batch_buffers.get(pin_memory)
+        if buffers is None or buffers.size < size:
+            # Grow by powers of two
+            buffers = self._batch_buffers[pin_memory] = StateBuffers(
+                self, 1 << max(size - 1, 0).bit_length(), pin_memory=pin_memory)
+        return buffers
+
+    def _scratch(self) -> "StateBuffers":
+        if self._scratch_buffers is None:
+            self._scratch_buffers = StateBuffers(self)
+        return self._scratch_buffers
+
+    def encode_into(self, game, player: Optional[int], out: "StateBuffers", i: int) -> None:
+        """Encode game from player's view (None: the player to act) into row i of out."""
+        self._encode_rows((game,), (player,), out, i)
+
+    def _encode_rows(self, games, players, out: "StateBuffers", start: int) -> None:
+        """Encode games[k] from players[k]'s view into row start + k of out."""
+        # Scalars of every game, then (embedding id, live values) of every card,
+        # in two flat conversions: numpy pays per call and per element, not per
+        # card or per game
+        scalars, values, slots = [], [], []
+        vocab = self.vocab.ids
+        for game, player in zip(games, players):
+            if player is None:
+                player = game.current_player_idx
+            me = game.players[player]
+            enemy = me.opponent
+            hand, board, enemy_board = me.hand[:self.max_hand], me.board[:self.max_board], enemy.board[:self.max_board]
+            scalars += (
+                me.mana, me.mana_crystals, me.health, me.armor, me.overload, me.fatigue_counter,
+                len(me.hand), len(me.deck),
+                enemy.health, enemy.armor, enemy.overload, enemy.fatigue_counter,
+                len(enemy.hand), len(enemy.deck),
+                game.current_player_idx == player,
+            )
+            for c in hand + board + enemy_board:
+                keywords, silenced, frozen, exhausted = _RAW_STATE(c)
+                if silenced:
+                    keywords = 0
+                values.append(vocab.get(c.card_id, UNKNOWN))
+                values.extend(c.stats())
+                values += (keywords & _TAUNT != 0, keywords & _DIVINE_SHIELD != 0, keywords & _STEALTH != 0,
+                           frozen, exhausted)
+            slots.append(out.slots_of(len(hand), len(board), len(enemy_board)))
+
+        n = len(slots)
+        rows = slice(start, start + n)
+        out.globals[rows, :len(_SCALAR_SCALE)] = (
+            np.array(scalars, dtype=np.int64).reshape(n, len(_SCALAR_SCALE)) / _SCALAR_SCALE)
+
+        # All zones of all games at once: one gather of static rows, one scatter
+        # into the card slots
+        cards, ids, mask = out.cards[rows], out.ids[rows], out.mask[rows]
+        cards.fill(0)
+        ids.fill(0)
+        mask.fill(True)
+        if values:
+            values = np.array(values, dtype=np.int64).reshape(-1, 1 + len(_DYNAMIC_COLUMNS))
+            card_ids = values[:, 0]
+            static = self._card_static[card_ids]
+            static[:, _DYNAMIC_COLUMNS] = values[:, 1:] / _DYNAMIC_SCALE
+            if n == 1:
+                card_slots, zone_slots = slots[0].card, slots[0].zone
+                cards, ids, mask = cards[0], ids[0], mask[0]
+            else:
+                game_of = np.repeat(np.arange(n), [len(s.card) for s in slots])
+                card_slots = (game_of, np.concatenate([s.card for s in slots]))
+                zone_slots = (game_of, np.concatenate([s.zone for s in slots]))
+            cards[card_slots] = static
+            ids[zone_slots] = card_ids
+            mask[zone_slots] = False
+
+
+class _Slots:
+    """Positions of the cards of a state, in StateBuffers.cards and in ids/mask."""
+
+    __slots__ = ("card", "zone")
+
+    def __init__(self, card: np.ndarray, zone: np.ndarray):
+        self.card = card
+        self.zone = zone
+
+
+class StateBuffers:
+    """
+    Preallocated encoder output for `size` states, written by FeatureEncoder.
+
+    One float32 row per state in the flat encode() layout; the structured inputs
+    of HearthstoneTransformer (zone stats, global state) are views of the same
+    rows, next to the zone ids and padding masks. NumPy arrays and torch tensors
+    share memory, so nothing is copied or allocated per state. With pin_memory
+    (CUDA only) the tensors are page-locked for asynchronous device copies.
+    """
+
+    ZONES = ("hand", "my_board", "enemy_board")
+
+    def __init__(self, encoder: FeatureEncoder, size: int = 1, pin_memory: bool = False):
+        self.size = size
+        self.pinned = pin_memory and torch.cuda.is_available()
+        self._scalar_dim, self._card_dim = encoder.scalar_dim, encoder.card_dim
+        self._max_hand, self._max_board = encoder.max_hand, encoder.max_board
+        slots = self._max_hand + 2 * self._max_board
+        self.flat_tensor = torch.zeros(size, encoder.input_dim, pin_memory=self.pinned)
+        # Ids and masks of the structured zones: hand, my board, enemy board
+        self.id_tensor = torch.zeros(size, slots, dtype=torch.long, pin_memory=self.pinned)
+        self.mask_tensor = torch.ones(size, slots, dtype=torch.bool, pin_memory=self.pinned)
+
+        self.flat = self.flat_tensor.numpy()
+        self.globals = self.flat[:, :self._scalar_dim]
+        # Card slots after the scalars: my hand, (hidden) enemy hand, my board, enemy board
+        self.cards = self.flat[:, self._scalar_dim:].reshape(size, -1, self._card_dim)
+        self.ids = self.id_tensor.numpy()
+        self.mask = self.mask_tensor.numpy()
+        self._card_offsets = (0, 2 * self._max_hand, 2 * self._max_hand + self._max_board)
+        self._zone_offsets = (0, self._max_hand, self._max_hand + self._max_board)
+        self._slots: Dict[tuple, _Slots] = {}
+
+        # structured_encode() layout with a leading batch dimension
+        self.structured = self._views(self.flat_tensor, self.id_tensor, self.mask_tensor)
+        self._rows: Optional[List[Dict[str, Any]]] = None
+
+    def _views(self, flat: torch.Tensor, ids: torch.Tensor, mask: torch.Tensor) -> Dict[str, Any]:
+        """structured_encode() layout over (flat, ids, mask) rows, on their device."""
+        n, max_hand, max_board = flat.shape[0], self._max_hand, self._max_board
+        cards = flat[:, self._scalar_dim:].view(n, -1, self._card_dim)
+        zones = (cards[:, :max_hand], cards[:, 2 * max_hand:2 * max_hand + max_board],
+                 cards[:, 2 * max_hand + max_board:])
+        bounds = (0, max_hand, max_hand + max_board, max_hand + 2 * max_board)
+        return {
+            **{name: (ids[:, a:b], zone[..., :STRUCTURED_STATS])
+               for name, a, b, zone in zip(self.ZONES, bounds, bounds[1:], zones)},
+            "global_state": flat[:, :self._scalar_dim],
+            "masks": {name: mask[:, a:b] for name, a, b in zip(self.ZONES, bounds, bounds[1:])},
+        }
+
+    def inputs(self, n: Optional[int] = None, device=None, start: int = 0) -> tuple:
+        """
+        HearthstoneTransformer.forward arguments (hand, my_board, enemy_board,
+        global_state, masks) of rows start:start + n (default: to the end).
+
+        Views of the buffers on their own device; otherwise one copy per buffer
+        (asynchronous when pinned), the zones being views of the copies.
+        """
+        stop = self.size if n is None else start + n
+        flat, ids, mask = self.flat_tensor[start:stop], self.id_tensor[start:stop], self.mask_tensor[start:stop]
+        if device is not None and torch.device(device) != flat.device:
+            flat, ids, mask = (t.to(device, non_blocking=self.pinned) for t in (flat, ids, mask))
+        views = self._views(flat, ids, mask)
+        return (views["hand"], views["my_board"], views["enemy_board"], views["global_state"], views["masks"])
+
+    def stacked_inputs(self, parts: List[Tuple["StateBuffers", int]], device=None) -> tuple:
+        """
+        inputs() of the first n rows of each (buffers, n) in parts, as one batch.
+
+        One copy per buffer kind (the buffers must share this encoder layout);
+        with a device, the batch is moved there.
+        """
+        flat, ids, mask = (torch.cat([getattr(b, name)[:n] for b, n in parts])
+                           for name in ("flat_tensor", "id_tensor", "mask_tensor"))
+        if device is not None and torch.device(device) != flat.device:
+            flat, ids, mask = (t.to(device) for t in (flat, ids, mask))
+        views = self._views(flat, ids, mask)
+        return (views["hand"], views["my_board"], views["enemy_board"], views["global_state"], views["masks"])
+
+    def slots_of(self, n_hand: int, n_board: int, n_enemy_board: int) -> _Slots:
+        """Slots of n_hand + n_board + n_enemy_board cards (memoized per zone sizes)."""
+        key = (n_hand, n_board, n_enemy_board)
+        slots = self._slots.get(key)
+        if slots is None:
+            card = np.concatenate([np.arange(n) + o for n, o in zip(key, self._card_offsets)])
+            zone = np.concatenate([np.arange(n) + o for n, o in zip(key, self._zone_offsets)])
+            slots = self._slots[key] = _Slots(card.astype(np.intp), zone.astype(np.intp))
+        return slots
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """structured_encode() layout of state i (views, built for all rows on first use)."""
+        if self._rows is None:
+            s = self.structured
+            columns = [s[name][k].unbind(0) for name in self.ZONES for k in (0, 1)]
+            columns += [s["global_state"].unbind(0)] + [s["masks"][name].unbind(0) for name in self.ZONES]
+            self._rows = [
+                {"hand": (h_ids, h_stats), "my_board": (b_ids, b_stats), "enemy_board": (e_ids, e_stats),
+                 "global_state": global_state,
+                 "masks": {"hand": h_mask, "my_board": b_mask, "enemy_board": e_mask}}
+                for h_ids, h_stats, b_ids, b_stats, e_ids, e_stats, global_state, h_mask, b_mask, e_mask
+                in zip(*columns)
+            ]
+        return self._rows[i]
@@ -7,6 +7,7 @@ import numpy as np
 
 from .game_state import GameState
 from .actions import Action, ActionType, ACTION_SPACE_SIZE
+from .legal_actions import LegalActions, perform
 from .card import CardInstance
 
 from simulator import Game, Player, CardDatabase, create_card, Hero, CardType, CardData
@@ -18,7 +19,7 @@ class HearthstoneGame:
         self._game: Optional[Game] = None
         self._step_count = 0
         self._max_steps = 500
-        self._cache = {} # Action cache for MCTS
+        self._legal = LegalActions() # Legal sets for MCTS, by Game.state_hash
         # Pre-load DB on init
         CardDatabase.get_instance().load()
 
@@ -41,7 +42,9 @@ class HearthstoneGame:
         "DEATHKNIGHT": "HERO_10", "DEMONHUNTER": "HERO_10a"
     }
 
-    def reset(self, deck1=None, deck2=None, class1=None, class2=None, randomize_first=True) -> GameState:
+    def reset(self, deck1=None, deck2=None, class1=None, class2=None, randomize_first=True,
+              seed=None) -> GameState:
+        # seed fixes the game's random stream; deck picks still use `random`
         # Use Meta decks, Arena decks, or fallback
         if deck1 is None or deck2 is None:
             # 50% chance of Meta deck, 50% chance of Arena deck
@@ -58,7 +61,7 @@ class HearthstoneGame:
             c1, d1, c2, d2 = class1 or "MAGE", deck1, class2 or "WARRIOR", deck2
         
         p1, p2 = Player("P1"), Player("P2")
-        self._game = Game()
+        self._game = Game(seed=seed)
         self._game.setup(p1, p2)
         
         # === CREATE HEROES ===
@@ -86,10 +89,10 @@ class HearthstoneGame:
             
         p1.shuffle_deck()
         p2.shuffle_deck()
+        self._game.preload_effects()
         self._game.start_mulligan()
         self._game.start_game()
         self._step_count = 0
-        self._cache = {}
         # Initialize health tracking for reward shaping
         self._prev_my_health = 30
         self._prev_enemy_health = 30
@@ -99,101 +102,23 @@ class HearthstoneGame:
         return GameState.from_simulator_game(self.game, self.perspective)
     
     def get_action_mask(self) -> np.ndarray:
-        """Returns a binary mask of valid actions for the current state."""
-        mask = np.zeros(ACTION_SPACE_SIZE, dtype=np.float32)
-        valid_actions = self.get_valid_actions()
-        for action in valid_actions:
-            idx = action.to_index()
-            if 0 <= idx < ACTION_SPACE_SIZE:
-                mask[idx] = 1.0
-        return mask
+        """Returns a binary mask of valid actions (overwritten by the next call)."""
+        return self._legal.mask(self.game)
     
     def get_valid_actions(self) -> List[Action]:
         if self.is_game_over: return []
-        
-        # State-based cache key
-        p = self.current_player
-        state_key = f"{self.game.turn}_{self.game.current_player_idx}_{len(p.hand)}_{len(p.board)}_{p.mana}"
-        if state_key in self._cache: return self._cache[state_key]
+        # Full legal set, memoized on Game.state_hash
+        return self._legal.get(self.game).actions
 
-        actions = []
-        
-        # 1. Play cards
-        for i, card in enumerate(p.hand):
-            if p.can_play_card(card):
-                targets = p.get_valid_targets(card)
-                if targets:
-                    for t in targets:
-                        # Find target index
-                        is_friendly = (t.controller == p)
-                        target_idx = -1
-                        if t.card_type == CardType.MINION:
-                            target_idx = t.controller.board.index(t)
-                        
-                        act = Action.play_card(i, target_idx, is_friendly)
-                        act._sim_action = ("play", card, t)
-                        actions.append(act)
-                        break # Limit exploration speed
-                else:
-                    act = Action.play_card(i)
-                    act._sim_action = ("play", card, None)
-                    actions.append(act)
-                    
-        # 2. Minion Attacks
-        for i, m in enumerate(p.board):
-            if m.can_attack():
-                targets = p.get_valid_attack_targets(m)
-                for t in targets:
-                    # Target index (relative to enemy board if minion)
-                    is_hero = (t.card_type == CardType.HERO)
-                    target_idx = -1 if is_hero else p.opponent.board.index(t)
-                    
-                    act = Action.attack(i, target_idx)
-                    act._sim_action = ("attack", m, t)
-                    actions.append(act)
-                    if is_hero: break # Prioritize face
-                    
-        # 3. Hero Attack
-        if p.hero and p.hero.can_attack():
-            targets = p.get_valid_attack_targets(p.hero)
-            for t in targets:
-                is_hero = (t.card_type == CardType.HERO)
-                target_idx = -1 if is_hero else p.opponent.board.index(t)
-                act = Action.attack(-1, target_idx)
-                act._sim_action = ("attack", p.hero, t)
-                actions.append(act)
-                if is_hero: break
-                
-        # 4. Hero Power
-        if p.hero_power and p.hero_power.can_use():
-            act = Action.hero_power()
-            act._sim_action = ("hero_power", p.hero_power, None)
-            actions.append(act)
-            
-        actions.append(Action.end_turn())
-        self._cache[state_key] = actions
-        return actions
-
-    def step(self, action: Action) -> Tuple[GameState, float, bool, Dict[str, Any]]:
+    def step(self, action: Action, observe: bool = True) -> Tuple[Optional[GameState], float, bool, Dict[str, Any]]:
+        # observe=False skips building the GameState (training encodes the Game directly)
         self._step_count += 1
-        self._cache = {} # Clear cache
-        try:
-            op, ent, target = getattr(action, '_sim_action', (None, None, None))
-            if action.action_type == ActionType.END_TURN: 
-                self.game.end_turn()
-            elif op == "play": 
-                self.game.play_card(ent, target=target)
-            elif op == "attack": 
-                self.game.attack(ent, target)
-            elif op == "hero_power": 
-                self.game.use_hero_power(target=target)
-            else:
-                # Direct index fallback
-                valid = self.get_valid_actions()
-                for v in valid:
-                    if v.to_index() == action.to_index():
-                        return self.step(v)
-        except: pass
+        move = getattr(action, '_sim_action', None)
+        if move is not None:
+            perform(self.game, move)
+        else:
+            # Decode the index (actions from Action.from_index)
+            self._legal.execute(self.game, action.to_index())
         
         done = self.is_game_over
         
@@ -240,7 +165,7 @@ class HearthstoneGame:
             self._prev_my_health = my_health
             self._prev_enemy_health = enemy_health
                 
-        return self.get_state(), reward, done, {}
+        return (self.get_state() if observe else None), reward, done, {}
 
 def play_random_game(verbose: bool = False) -> int:
     env = HearthstoneGame()
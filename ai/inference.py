@@ -0,0 +1,182 @@
+"""
+CPU inference runtime - frozen TorchScript exports of the policy networks.
+
+export() turns a HearthstoneTransformer or HearthstoneModel into a frozen
+TorchScript artifact: eval mode (dropout gone), weights folded in as
+constants and, by default, linear layers dynamically quantized to int8.
+InferenceModel runs an artifact with the eager call signature, so the
+server and AIBrain can use either one:
+
+    export(model, "models/policy_int8.ts")
+    runtime = InferenceModel.load("models/policy_int8.ts", threads=4)
+    policy, value = runtime(*encoder.encode_batch(games))
+
+export_onnx() writes the float graph as ONNX (needs the onnx package).
+Quantized exports drift slightly from eager; tests/test_inference.py and
+tools/benchmark_inference.py measure that drift and the speedup.
+"""
+
+import copy
+import json
+import os
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import torch
+import torch.nn as nn
+
+from .encoder import FeatureEncoder, StateBuffers
+from .model import HearthstoneModel
+from .transformer_model import HearthstoneTransformer
+
+TORCHSCRIPT_SUFFIX = ".ts"
+_META = "meta.json"
+
+TRANSFORMER, FLAT = "transformer", "flat"
+_ZONES = StateBuffers.ZONES
+_INPUT_NAMES = {
+    TRANSFORMER: [f"{zone}_{part}" for zone in _ZONES for part in ("ids", "stats")]
+                 + ["global_state"] + [f"{zone}_mask" for zone in _ZONES] + ["action_mask"],
+    FLAT: ["state", "action_mask"],
+}
+
+
+class _PositionalTransformer(nn.Module):
+    """HearthstoneTransformer with flat positional inputs (no tuples or dict to trace)."""
+
+    def __init__(self, model: HearthstoneTransformer):
+        super().__init__()
+        self.model = model
+
+    def forward(self, hand_ids, hand_stats, board_ids, board_stats, enemy_ids, enemy_stats,
+                global_state, hand_mask, board_mask, enemy_mask, action_mask):
+        masks = {"hand": hand_mask, "my_board": board_mask, "enemy_board": enemy_mask}
+        return self.model((hand_ids, hand_stats), (board_ids, board_stats), (enemy_ids, enemy_stats),
+                          global_state, masks, action_mask)
+
+
+def _kind(model: nn.Module) -> str:
+    if isinstance(model, HearthstoneTransformer):
+        return TRANSFORMER
+    if isinstance(model, HearthstoneModel):
+        return FLAT
+    raise TypeError(f"Cannot export {type(model).__name__}")
+
+
+def _flatten(kind: str, inputs: tuple, action_mask: torch.Tensor) -> tuple:
+    """Eager forward arguments -> positional export arguments."""
+    if kind == FLAT:
+        return inputs[0], action_mask
+    hand, my_board, enemy_board, global_state, masks = inputs
+    return (*hand, *my_board, *enemy_board, global_state,
+            *(masks[zone] for zone in _ZONES), action_mask)
+
+
+def _example_inputs(model: nn.Module, encoder: Optional[FeatureEncoder]) -> tuple:
+    """Batch of one (padding only) in the model's eager call signature."""
+    if _kind(model) == FLAT:
+        return (torch.zeros(1, model.input_dim),)
+    return StateBuffers(encoder or FeatureEncoder(), size=1).inputs(1)
+
+
+def _prepare(model: nn.Module, quantize: bool) -> nn.Module:
+    """CPU eval-mode copy (the caller's model keeps its device and mode)."""
+    model = copy.deepcopy(model).cpu().eval()
+    if quantize:
+        model = torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+    return _PositionalTransformer(model).eval() if _kind(model) == TRANSFORMER else model
+
+
+def export(model: nn.Module, path: str, quantize: bool = True,
+           encoder: Optional[FeatureEncoder] = None) -> "InferenceModel":
+    """
+    Save model as a frozen TorchScript artifact at path and return its runtime.
+
+    The graph is traced on a batch of one; the batch dimension stays dynamic.
+    encoder only provides the zone sizes of a transformer's inputs.
+    """
+    kind = _kind(model)
+    inputs = _example_inputs(model, encoder)
+    action_mask = torch.ones(1, model.action_dim)
+    with torch.no_grad():
+        traced = torch.jit.trace(_prepare(model, quantize), _flatten(kind, inputs, action_mask))
+        frozen = torch.jit.freeze(traced)
+    meta = {"kind": kind, "quantized": quantize, "action_dim": model.action_dim}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    torch.jit.save(frozen, path, _extra_files={_META: json.dumps(meta)})
+    return InferenceModel(frozen, kind, model.action_dim, quantize)
+
+
+def export_onnx(model: nn.Module, path: str, encoder: Optional[FeatureEncoder] = None) -> None:
+    """Save the float model as ONNX at path, with a dynamic batch dimension."""
+    kind = _kind(model)
+    inputs = _example_inputs(model, encoder)
+    args = _flatten(kind, inputs, torch.ones(1, model.action_dim))
+    names = _INPUT_NAMES[kind]
+    with torch.no_grad():
+        # The TorchScript exporter: no onnxscript needed, only onnx itself
+        torch.onnx.export(_prepare(model, quantize=False), args, path, dynamo=False,
+                          input_names=names, output_names=["policy", "value"],
+                          dynamic_axes={name: {0: "batch"} for name in names + ["policy", "value"]})
+
+
+def set_threads(threads: int) -> None:
+    """Intra-op threads for CPU inference (inter-op pool only if not started yet)."""
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Already set, or parallel work already ran
+
+
+class InferenceModel:
+    """Runs an exported artifact with the eager model's call signature, on CPU."""
+
+    def __init__(self, module: torch.jit.ScriptModule, kind: str, action_dim: int, quantized: bool):
+        self.module = module
+        self.kind = kind
+        self.action_dim = action_dim
+        self.quantized = quantized
+        self._all_actions: Dict[int, torch.Tensor] = {}
+
+    @classmethod
+    def load(cls, path: str, threads: Optional[int] = None) -> "InferenceModel":
+        extra = {_META: ""}
+        module = torch.jit.load(path, map_location="cpu", _extra_files=extra)
+        meta = json.loads(extra[_META])
+        if threads:
+            set_threads(threads)
+        return cls(module, meta["kind"], meta["action_dim"], meta["quantized"])
+
+    def __call__(self, *inputs, action_mask: Optional[torch.Tensor] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+        """(policy, value) like model(*inputs, action_mask) in eval mode."""
+        if len(inputs) == (2 if self.kind == FLAT else 6):
+            *inputs, action_mask = inputs
+        batch = inputs[0].shape[0] if self.kind == FLAT else inputs[3].shape[0]
+        if action_mask is None:
+            action_mask = self._all_actions.get(batch)
+            if action_mask is None:
+                action_mask = self._all_actions[batch] = torch.ones(batch, self.action_dim)
+        with torch.inference_mode():
+            return self.module(*_flatten(self.kind, tuple(inputs), action_mask.cpu()))
+
+    def eval(self) -> "InferenceModel":
+        return self
+
+    def tune_threads(self, inputs: tuple, candidates: Optional[Iterable[int]] = None,
+                     repeat: int = 10) -> int:
+        """Time inputs at each thread count, keep the fastest and return it."""
+        candidates = list(candidates or range(1, (os.cpu_count() or 1) + 1))
+        best, best_time = candidates[0], float("inf")
+        for threads in candidates:
+            torch.set_num_threads(threads)
+            self(*inputs)  # warm up the pool and the profiling executor
+            elapsed = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                self(*inputs)
+                elapsed = min(elapsed, time.perf_counter() - start)
+            if elapsed < best_time:
+                best, best_time = threads, elapsed
+        torch.set_num_threads(best)
+        return best
@@ -0,0 +1,204 @@
+"""
+Legal action generator - the full legal set of a state, by action index.
+
+Enumerates every legal action straight from the simulator: all targets of
+cards and the hero power, every board position for minions and locations,
+every attack target, trades, forges, Titan abilities and pending choices.
+The result is written into a preallocated mask aligned with
+ACTION_SPACE_SIZE, with a decoder from index to the engine call:
+
+    legal = LegalActions()
+    mask = legal.mask(game)        # float32[ACTION_SPACE_SIZE], reused by the next call
+    legal.execute(game, index)     # performs the action at index
+
+Sets are memoized on Game.state_hash, so a state seen before (search,
+rollbacks, the same position reached twice) is never enumerated again.
+Location activation is not generated: the engine has no call for it yet.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from simulator import CardType, Game
+
+from .actions import (
+    Action, ACTION_SPACE_SIZE, ATTACK_BASE, BOARD_POSITIONS, CHOOSE_BASE, FORGE_BASE,
+    HERO_POWER_BASE, HERO_POWER_FRIENDLY_BASE, MAX_CHOICES, PLAY_CARD_BASE, PLAY_POSITION_BASE,
+    PLAY_TARGETS, TITAN_ABILITIES, TITAN_BASE, TRADE_BASE,
+)
+
+# (operation, source, target, argument): how the engine performs an action.
+# The argument is the board position of a play, the option of a choice, or
+# the ability of a Titan.
+Move = Tuple[str, object, object, int]
+
+_END_TURN: Move = ("end_turn", None, None, 0)
+_MAX_HAND = 10
+
+
+class LegalSet:
+    """The legal actions of one state: indices, decoder and (lazily) Action objects."""
+
+    __slots__ = ("indices", "moves", "_actions")
+
+    def __init__(self, moves: Dict[int, Move]):
+        self.moves = moves
+        self.indices = np.fromiter(moves, dtype=np.intp, count=len(moves))
+        self._actions: Optional[List[Action]] = None
+
+    @property
+    def actions(self) -> List[Action]:
+        if self._actions is None:
+            actions = []
+            for index, move in self.moves.items():
+                action = Action.from_index(index)
+                action._sim_action = move
+                actions.append(action)
+            self._actions = actions
+        return self._actions
+
+
+def generate(game: Game) -> Dict[int, Move]:
+    """Every legal action of game's current state, by action index."""
+    moves: Dict[int, Move] = {}
+    if game.ended:
+        return moves
+    pending = game.pending_choices
+    if pending and pending["options"]:
+        # A pending choice must be resolved first
+        for i in range(min(len(pending["options"]), MAX_CHOICES)):
+            moves[CHOOSE_BASE + i] = ("choose", None, None, i)
+        return moves
+
+    p = game.current_player
+    enemy = p.opponent
+    # Target slots within a play or hero power block
+    slots = {id(m): 1 + i for i, m in enumerate(enemy.board)}
+    slots.update((id(m), 10 + i) for i, m in enumerate(p.board))
+    if enemy.hero is not None:
+        slots[id(enemy.hero)] = 8
+    if p.hero is not None:
+        slots[id(p.hero)] = 9
+
+    # 1. Cards in hand: plays, trades, forges
+    positions = min(len(p.board), BOARD_POSITIONS - 1) + 1
+    for i, card in enumerate(p.hand[:_MAX_HAND]):
+        if p.can_play_card(card):
+            targets = p.get_valid_targets(card)
+            if targets:
+                base = PLAY_CARD_BASE + i * PLAY_TARGETS
+                for t in targets:
+                    slot = slots.get(id(t))
+                    if slot is not None:
+                        moves[base + slot] = ("play", card, t, -1)
+            elif card.card_type in (CardType.MINION, CardType.LOCATION):
+                base = PLAY_POSITION_BASE + i * BOARD_POSITIONS
+                for position in range(positions):
+                    moves[base + position] = ("play", card, None, position)
+            else:
+                moves[PLAY_CARD_BASE + i * PLAY_TARGETS] = ("play", card, None, -1)
+        data = card.data
+        if data.tradeable and p.mana >= 1:
+            moves[TRADE_BASE + i] = ("trade", card, None, 0)
+        if data.forge and data.forged_version and p.mana >= 2:
+            moves[FORGE_BASE + i] = ("forge", card, None, 0)
+
+    # 2. Attacks: every target of every attacker (hero in slot 0)
+    for slot, attacker in enumerate((p.hero, *p.board[:BOARD_POSITIONS])):
+        if attacker is None or not attacker.can_attack():
+            continue
+        base = ATTACK_BASE + slot * 8
+        for t in p.get_valid_attack_targets(attacker):
+            if t.card_type == CardType.HERO:
+                moves[base] = ("attack", attacker, t, 0)
+            else:
+                moves[base + 1 + enemy.board.index(t)] = ("attack", attacker, t, 0)
+
+    # 3. Titan abilities not used yet
+    for i, minion in enumerate(p.board[:BOARD_POSITIONS]):
+        data = minion.data
+        if data.titan and minion.attacks_this_turn == 0:
+            for k, ability in enumerate(data.titan_abilities[:TITAN_ABILITIES]):
+                if ability not in minion.titan_abilities_used:
+                    moves[TITAN_BASE + i * TITAN_ABILITIES + k] = ("titan", minion, None, k)
+
+    # 4. Hero power
+    power = p.hero_power
+    if power is not None and power.can_use():
+        targets = p.get_valid_targets(power)
+        if targets:
+            for t in targets:
+                slot = slots.get(id(t))
+                if slot is None:
+                    continue
+                index = HERO_POWER_BASE + slot if slot <= 9 else HERO_POWER_FRIENDLY_BASE + slot - 10
+                moves[index] = ("hero_power", power, t, 0)
+        else:
+            moves[HERO_POWER_BASE] = ("hero_power", power, None, 0)
+
+    moves[0] = _END_TURN
+    return moves
+
+
+def perform(game: Game, move: Move) -> bool:
+    """Carry out a move from generate() in game."""
+    op, source, target, arg = move
+    if op == "end_turn":
+        game.end_turn()
+        return True
+    if op == "play":
+        return bool(game.play_card(source, target=target, position=arg))
+    if op == "attack":
+        return bool(game.attack(source, target))
+    if op == "hero_power":
+        return bool(game.use_hero_power(target=target))
+    if op == "choose":
+        return bool(game.choose_discover(arg))
+    if op == "trade":
+        return bool(game.trade_card(source))
+    if op == "forge":
+        return bool(game.forge_card(source))
+    if op == "titan":
+        return bool(game.use_titan_ability(source, arg, target=target))
+    return False
+
+
+class LegalActions:
+    """Legal sets of one game's states, memoized on Game.state_hash."""
+
+    CACHE_SIZE = 4096
+
+    def __init__(self):
+        self._sets: Dict[int, LegalSet] = {}
+        self._game: Optional[Game] = None
+        self._mask = np.zeros(ACTION_SPACE_SIZE, dtype=np.float32)
+
+    def get(self, game: Game) -> LegalSet:
+        """Legal set of game's current state."""
+        # Moves hold this game's entities: start over for another game
+        if self._game is not game or len(self._sets) >= self.CACHE_SIZE:
+            self._sets = {}
+            self._game = game
+        key = game.state_hash
+        legal = self._sets.get(key)
+        if legal is None:
+            legal = self._sets[key] = LegalSet(generate(game))
+        return legal
+
+    def mask(self, game: Game, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """1.0 at every legal index; written into out, or a buffer reused by the next call."""
+        if out is None:
+            out = self._mask
+        out.fill(0)
+        out[self.get(game).indices] = 1
+        return out
+
+    def decode(self, game: Game, index: int) -> Optional[Move]:
+        """The move at index in game's current state, or None if it is not legal."""
+        return self.get(game).moves.get(index)
+
+    def execute(self, game: Game, index: int) -> bool:
+        """Perform the action at index; False if it is not legal here."""
+        move = self.decode(game, index)
+        return move is not None and perform(game, move)
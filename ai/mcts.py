@@ -0,0 +1,479 @@
+"""
+Monte Carlo tree search over the simulator, guided by a policy/value network.
+
+PUCT search (AlphaZero-style) on the real engine: each simulation descends
+the tree on a working copy of the game, replaying moves with the game's
+do/undo journal (Game.mark / rollback) instead of cloning:
+
+    mcts = MCTS(model, encoder, num_simulations=200)   # or time_budget=0.5
+    probs = mcts.search(game)      # visit distribution over ACTION_SPACE_SIZE
+    index = mcts.best_action()
+    ...                            # play index in the real game
+    mcts.advance(index)            # keep the subtree for the next decision
+                                   # (and advance over the opponent's moves too)
+
+Hidden information is handled by determinization (single-observer IS-MCTS):
+every simulation shuffles both decks and, given a BeliefState, replaces the
+opponent's hand with a sampled one. Nodes are keyed by action index, so a
+node's legal actions are those of the current determinization.
+
+Descents run on num_threads threads, each on its own journaled copy of the
+game, over one shared tree: virtual loss steers concurrent descents (and the
+several descents of one thread's batch) onto different lines. Each leaf is
+encoded straight into its row of the thread's batch buffer
+(FeatureEncoder.encode_into), and the batches go to one evaluator thread
+that stacks the batches waiting for it into a single forward pass. A thread
+collects its next batch while its previous one is evaluated. The tree
+itself is updated under a lock; the engine work of a descent is not.
+
+The network is either HearthstoneModel (flat encoder.encode layout) or
+HearthstoneTransformer (encoder.structured_encode layout); its value is from
+the point of view of the player to act.
+"""
+
+import math
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from simulator import Game, create_card
+
+from .actions import ACTION_SPACE_SIZE
+from .encoder import StateBuffers
+from .legal_actions import generate, perform
+from .transformer_model import HearthstoneTransformer
+
+
+class MCTSNode:
+    """Statistics of one decision point (edges by action index)."""
+
+    __slots__ = ("player", "prior", "visits", "value_sum", "children", "pending")
+
+    def __init__(self):
+        self.player = -1               # index of the player to act
+        self.prior: Optional[np.ndarray] = None   # network policy; None until expanded
+        self.visits: Optional[np.ndarray] = None  # N per action
+        self.value_sum: Optional[np.ndarray] = None  # W per action, for self.player
+        self.children: Dict[int, "MCTSNode"] = {}
+        self.pending = False           # waiting for its network evaluation
+
+    def expand(self, prior: np.ndarray) -> None:
+        self.prior = prior
+        self.visits = np.zeros(ACTION_SPACE_SIZE, dtype=np.float32)
+        self.value_sum = np.zeros(ACTION_SPACE_SIZE, dtype=np.float32)
+        self.pending = False
+
+
+class _Descent:
+    """What one search thread owns: its copy of the game, batch buffers and random stream."""
+
+    __slots__ = ("game", "rng", "buffers", "out", "rows")
+
+    def __init__(self, game: Optional[Game], rng: random.Random, buffers: List[StateBuffers]):
+        self.game = game
+        self.rng = rng
+        # Two batch buffers: one in flight while leaves are encoded into the other
+        self.buffers = buffers
+        self.out = buffers[0]
+        self.rows = 0
+
+
+class MCTS:
+    """PUCT search with batched network evaluation and subtree reuse.
+
+    num_simulations and time_budget (seconds) bound each search; either may
+    be None, not both. Each of the num_threads search threads evaluates
+    batch_size leaves per batch; batches waiting together share a forward pass.
+    """
+
+    def __init__(self, model, encoder, game: Optional[Game] = None,
+                 num_simulations: Optional[int] = 100,
+                 time_budget: Optional[float] = None,
+                 c_puct: float = 1.5,
+                 batch_size: int = 8,
+                 num_threads: int = 1,
+                 virtual_loss: float = 1.0,
+                 belief=None,
+                 max_depth: int = 200,
+                 seed: Optional[int] = None,
+                 device=None):
+        if num_simulations is None and time_budget is None:
+            raise ValueError("MCTS needs num_simulations or time_budget")
+        self.model = model
+        self.encoder = encoder
+        self.game = game
+        self.num_simulations = num_simulations
+        self.time_budget = time_budget
+        self.c_puct = c_puct
+        self.batch_size = max(1, batch_size)
+        self.num_threads = max(1, num_threads)
+        self.virtual_loss = virtual_loss
+        self.belief = belief
+        self.max_depth = max_depth
+        self.rng = random.Random(seed)
+        self.device = device if device is not None else next(model.parameters()).device
+        self.structured = isinstance(model, HearthstoneTransformer)
+
+        self.root: Optional[MCTSNode] = None
+        self._root_hash: Optional[int] = None   # state the tree was built for (None: advanced)
+        self.simulations = 0                    # of the last search
+        self._pending = 0                       # leaves claimed and not backed up yet
+        self._stopped = False                   # a search thread failed
+        # Guards the tree and the counters; notified when leaves are backed up
+        self._tree = threading.Condition()
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._evaluator: Optional[threading.Thread] = None
+        self._requests: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._descents: List[_Descent] = []
+
+    # === Public interface ===
+
+    def search(self, game: Optional[Game] = None) -> np.ndarray:
+        """Search from game (default: the game given at construction); returns root visit shares."""
+        game = game if game is not None else self.game
+        if game is None:
+            raise ValueError("MCTS.search needs a game")
+        start = time.perf_counter()
+        deadline = start + self.time_budget if self.time_budget is not None else None
+
+        key = game.state_hash
+        root = self.root
+        if root is None or (self._root_hash is not None and self._root_hash != key) or \
+                (root.player >= 0 and root.player != game.current_player_idx):
+            self.root = MCTSNode()
+        self._root_hash = key
+        self.player = game.current_player_idx
+
+        self.simulations = 0
+        self._pending = 0
+        self._stopped = False
+        if game.ended:
+            return self.policy()
+        descents = self._start(game)
+        self.model.eval()
+        others = []             # the threads other than this one
+        try:
+            others = [self._pool().submit(self._run, descent, deadline) for descent in descents[1:]]
+            self._run(descents[0], deadline)
+        finally:
+            wait(others)
+            for descent in descents:
+                descent.game.end_journal()
+                descent.game = None
+        for future in others:
+            future.result()
+        return self.policy()
+
+    def policy(self, temperature: float = 1.0) -> np.ndarray:
+        """Root visit distribution over ACTION_SPACE_SIZE (sharpened by a low temperature)."""
+        probs = np.zeros(ACTION_SPACE_SIZE, dtype=np.float32)
+        root = self.root
+        if root is None or root.visits is None or root.visits.sum() == 0:
+            return probs
+        if temperature <= 1e-3:
+            probs[int(np.argmax(root.visits))] = 1.0
+            return probs
+        visits = root.visits.astype(np.float64) ** (1.0 / temperature)
+        return (visits / visits.sum()).astype(np.float32)
+
+    def best_action(self) -> int:
+        """Most visited action index at the root (0, END_TURN, before any search)."""
+        root = self.root
+        if root is None or root.visits is None:
+            return 0
+        return int(np.argmax(root.visits))
+
+    def advance(self, index: int) -> None:
+        """Move the root to the child reached by index, keeping its subtree.
+
+        Call it for every move played, the opponent's included: search keeps
+        an advanced root without checking the state, only that the same
+        player is to act.
+        """
+        child = self.root.children.get(index) if self.root is not None else None
+        self.root = child if child is not None else MCTSNode()
+        self._root_hash = None
+
+    def reset(self) -> None:
+        """Drop the tree."""
+        self.root = None
+        self._root_hash = None
+
+    def close(self) -> None:
+        if self._threads is not None:
+            self._threads.shutdown()
+            self._threads = None
+        if self._evaluator is not None:
+            self._requests.put(None)
+            self._evaluator.join()
+            self._evaluator = None
+
+    # === Simulations ===
+
+    def _start(self, game: Game) -> List[_Descent]:
+        """One descent state per thread, each on its own copy of game."""
+        if not self._descents:
+            pin = torch.device(self.device).type == "cuda"
+            for i in range(self.num_threads):
+                buffers = [StateBuffers(self.encoder, self.batch_size, pin_memory=pin) for _ in range(2)]
+                rng = self.rng if i == 0 else random.Random(self.rng.getrandbits(64))
+                self._descents.append(_Descent(None, rng, buffers))
+        for descent in self._descents:
+            descent.game = game.clone()
+            descent.game.is_simulation = True
+        return self._descents
+
+    def _run(self, descent: _Descent, deadline: Optional[float]) -> None:
+        """Search thread: collect a batch, hand it to the evaluator, apply the previous one."""
+        in_flight = None        # (future, batch) being evaluated
+        try:
+            while True:
+                done = self._stopped or (deadline is not None and time.perf_counter() >= deadline)
+                batch, progress = ([], False) if done else self._collect(descent)
+                waited = in_flight is not None
+                if waited:
+                    (future, previous), in_flight = in_flight, None
+                    self._apply(previous, future.result())
+                if batch:
+                    in_flight = (self._submit(descent.out, len(batch)), batch)
+                elif done or not (waited or progress or self._wait_for_others()):
+                    break
+        except BaseException:
+            self._stopped = True    # the other threads finish their batches and stop
+            raise
+        finally:
+            if in_flight is not None:
+                self._apply(in_flight[1], in_flight[0].result())
+
+    def _wait_for_others(self) -> bool:
+        """Wait for other threads' leaves to be backed up; False if none are pending (or the budget is spent)."""
+        with self._tree:
+            if not self._pending or self._budget_spent():
+                return False
+            self._tree.wait(timeout=0.1)
+            return True
+
+    def _budget_spent(self) -> bool:
+        if self._stopped:
+            return True
+        return self.num_simulations is not None and self.simulations + self._pending >= self.num_simulations
+
+    def _claim(self) -> bool:
+        """Reserve one simulation of the budget (under the tree lock)."""
+        if self._budget_spent():
+            return False
+        self._pending += 1
+        return True
+
+    def _collect(self, descent: _Descent) -> Tuple[List[tuple], bool]:
+        """Run simulations until a batch of leaves awaits evaluation (or the tree collides).
+
+        Returns the batch and whether any simulation got through.
+        """
+        batch: List[tuple] = []
+        progress = False
+        descent.out = descent.buffers[0] if descent.out is descent.buffers[1] else descent.buffers[1]
+        descent.rows = 0
+        while len(batch) < self.batch_size:
+            with self._tree:
+                if not self._claim():
+                    break
+            leaf = self._simulate(descent)
+            if leaf is None:            # reached a leaf already being evaluated
+                break
+            progress = True
+            if leaf is not True:        # True: terminal, already backed up
+                batch.append(leaf)
+        return batch, progress
+
+    def _simulate(self, descent: _Descent):
+        """One descent; returns a leaf to evaluate, True if it ended in a terminal state, None on collision."""
+        game = descent.game
+        mark = game.mark()
+        try:
+            self._determinize(game, descent.rng)
+            node, path = self.root, []
+            while True:
+                if game.ended:
+                    value = self._outcome(game, path)
+                    with self._tree:
+                        self._backup(path, value, None)
+                    return True
+                with self._tree:
+                    if node.player < 0:
+                        node.player = game.current_player_idx
+                    expanded = node.prior is not None
+                    if not expanded:
+                        if node.pending:
+                            self._unclaim(path)
+                            return None
+                        node.pending = True
+                if not expanded:
+                    return self._leaf(descent, node, path)
+                moves = generate(game)
+                if not moves or len(path) >= self.max_depth:
+                    return self._leaf(descent, None, path)
+                with self._tree:
+                    index = self._select(node, moves)
+                    path.append((node, index))
+                    self._add_virtual_loss(node, index)
+                    child = node.children.get(index)
+                    if child is None:
+                        child = node.children[index] = MCTSNode()
+                perform(game, moves[index])
+                node = child
+        finally:
+            game.rollback(mark)
+
+    def _leaf(self, descent: _Descent, node: Optional[MCTSNode], path) -> tuple:
+        """(node to expand or None, path, player to act) for evaluation; encoded into the next row."""
+        player = descent.game.current_player_idx
+        self.encoder.encode_into(descent.game, player, descent.out, descent.rows)
+        descent.rows += 1
+        return (node, path, player)
+
+    def _select(self, node: MCTSNode, moves: Dict[int, tuple]) -> int:
+        """PUCT over the actions legal in this determinization."""
+        legal = np.fromiter(moves, dtype=np.intp, count=len(moves))
+        prior = node.prior[legal]
+        total = prior.sum()
+        prior = prior / total if total > 0 else np.full(len(legal), 1.0 / len(legal), dtype=np.float32)
+        visits = node.visits[legal]
+        q = np.divide(node.value_sum[legal], visits, out=np.zeros(len(legal), dtype=np.float32),
+                      where=visits > 0)
+        u = self.c_puct * prior * math.sqrt(visits.sum() + 1) / (1.0 + visits)
+        return int(legal[int(np.argmax(q + u))])
+
+    def _add_virtual_loss(self, node: MCTSNode, index: int) -> None:
+        node.visits[index] += self.virtual_loss
+        node.value_sum[index] -= self.virtual_loss
+
+    def _unclaim(self, path) -> None:
+        """Give back a collided simulation: its virtual loss and its budget."""
+        loss = self.virtual_loss
+        for node, index in path:
+            node.visits[index] -= loss
+            node.value_sum[index] += loss
+        self._pending -= 1
+
+    def _backup(self, path, value: float, player: Optional[int]) -> None:
+        """Add value (for player; None: for the last mover) along path, removing virtual loss."""
+        if player is None and path:
+            player = path[-1][0].player
+        loss = self.virtual_loss
+        for node, index in path:
+            node.visits[index] += 1 - loss
+            node.value_sum[index] += loss + (value if node.player == player else -value)
+        self._pending -= 1
+        self.simulations += 1
+        self._tree.notify_all()
+
+    def _outcome(self, game: Game, path) -> float:
+        """Result of an ended game for the player who made the last move."""
+        if not path:
+            return 0.0
+        winner = game.winner
+        if winner is None:
+            return 0.0
+        return 1.0 if game.players.index(winner) == path[-1][0].player else -1.0
+
+    def _determinize(self, game: Game, rng: random.Random) -> None:
+        """Hide what the searching player cannot know: deck order, and the opponent's hand."""
+        for player in game.players:
+            if len(player.deck) > 1:
+                deck = list(player.deck)
+                rng.shuffle(deck)
+                player.deck[:] = deck
+        if self.belief is None:
+            return
+        enemy = game.players[1 - self.player]
+        sampled = self.belief.sample_hand(len(enemy.hand))
+        if len(sampled) < len(enemy.hand):
+            return
+        enemy.hand.clear()
+        for card_id in sampled:
+            card = create_card(card_id, game)
+            if card is not None:
+                enemy.add_to_hand(card)
+
+    # === Network ===
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=max(1, self.num_threads - 1),
+                                               thread_name_prefix="mcts-search")
+        return self._threads
+
+    def _submit(self, out: StateBuffers, n: int) -> Future:
+        """Queue the first n rows of out for the evaluator thread."""
+        if self._evaluator is None:
+            self._evaluator = threading.Thread(target=self._evaluate_requests, name="mcts-eval", daemon=True)
+            self._evaluator.start()
+        future: Future = Future()
+        self._requests.put((out, n, future))
+        return future
+
+    def _evaluate_requests(self) -> None:
+        """Evaluator thread: one forward pass for all the batches waiting, until close()."""
+        requests = self._requests
+        while True:
+            request = requests.get()
+            if request is None:
+                return
+            waiting = [request]
+            while True:
+                try:
+                    request = requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    requests.put(None)  # stop after this pass
+                    break
+                waiting.append(request)
+            try:
+                policies, values = self._evaluate([(out, n) for out, n, _ in waiting])
+            except BaseException as e:
+                for _, _, future in waiting:
+                    future.set_exception(e)
+                continue
+            start = 0
+            for _, n, future in waiting:
+                future.set_result((policies[start:start + n], values[start:start + n]))
+                start += n
+
+    def _evaluate(self, parts: List[Tuple[StateBuffers, int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """One forward pass for the first n rows of each (out, n) in parts: (policies, values)."""
+        with torch.inference_mode():
+            if len(parts) == 1:
+                out, n = parts[0]
+                if self.structured:
+                    policy, value = self.model(*out.inputs(n, self.device))
+                else:
+                    policy, value = self.model(out.flat_tensor[:n].to(self.device, non_blocking=out.pinned))
+            elif self.structured:
+                policy, value = self.model(*parts[0][0].stacked_inputs(parts, self.device))
+            else:
+                policy, value = self.model(torch.cat([out.flat_tensor[:n] for out, n in parts]).to(self.device))
+        policy = policy.float().cpu().numpy()
+        n = policy.shape[0]
+        if policy.shape[1] != ACTION_SPACE_SIZE:
+            padded = np.zeros((n, ACTION_SPACE_SIZE), dtype=np.float32)
+            width = min(policy.shape[1], ACTION_SPACE_SIZE)
+            padded[:, :width] = policy[:, :width]
+            policy = padded
+        return policy, value.float().cpu().numpy().reshape(-1)
+
+    def _apply(self, batch: List[tuple], result: Tuple[np.ndarray, np.ndarray]) -> None:
+        """Expand the evaluated leaves and back their values up."""
+        policies, values = result
+        with self._tree:
+            for (node, path, player), prior, value in zip(batch, policies, values):
+                if node is not None:
+                    node.expand(prior)
+                self._backup(path, float(value), player)
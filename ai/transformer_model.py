@@ -10,6 +10,9 @@ import torch.nn.functional as F
 import math
 from typing import Dict, List, Tuple, Optional
 
+from .actions import ACTION_SPACE_SIZE
+from .card_vocab import VOCAB_CAPACITY
+
 
 class MultiHeadAttention(nn.Module):
     """Multi-Head Self-Attention pour le Set Transformer."""
@@ -33,28 +36,20 @@ class MultiHeadAttention(nn.Module):
         K = self.W_k(x).view(batch_size, -1, self.n_heads, self.d_k).transpose(1, 2)
         V = self.W_v(x).view(batch_size, -1, self.n_heads, self.d_k).transpose(1, 2)
         
-        # Scaled Dot-Product Attention
-        scores = torch.matmul(Q, K.transpose(-2, -1)) / math.sqrt(self.d_k)
-        
+        # Scaled Dot-Product Attention (fused kernel), mask: [batch, seq_len], True for padding
+        attn_mask = None
         if mask is not None:
-            # Mask must be [batch, 1, 1, seq_len] or [batch, 1, seq_len, seq_len]
-            # Here we assume mask is [batch, seq_len] (True for padding)
-            m = mask.unsqueeze(1).unsqueeze(2)
-            scores = scores.masked_fill(m, float('-inf'))
-            
-            # Additional protection: if a whole row is -inf, softmax results in NaNs
-            # This happens if a card cannot attend to anything (including itself)
-            # which shouldn't happen for active cards, but can for padded cards.
-            probs = F.softmax(scores, dim=-1)
-            # Mask out NaNs for padded rows
-            probs = probs.masked_fill(torch.isnan(probs), 0.0)
-        else:
-            probs = F.softmax(scores, dim=-1)
-        
-        out = torch.matmul(probs, V)
+            # A fully padded set (empty board) has no key to attend to and its
+            # softmax would be NaN: let it attend to every slot, then zero its
+            # attention output
+            empty = mask.all(dim=1, keepdim=True)
+            attn_mask = (~mask | empty)[:, None, None, :]
+        out = F.scaled_dot_product_attention(Q, K, V, attn_mask=attn_mask)
+        if mask is not None:
+            out = out.masked_fill(empty[:, :, None, None], 0.0)
         
         # Concat heads
-        out = out.transpose(1, 2).contiguous().view(batch_size, -1, self.d_model)
+        out = out.transpose(1, 2).reshape(batch_size, -1, self.d_model)
         return self.W_o(out)
 
 
@@ -90,7 +85,7 @@ class SetTransformerBlock(nn.Module):
 class CardEncoder(nn.Module):
     """Encode une carte individuelle en combinant son ID et ses stats."""
     
-    def __init__(self, card_vocab_size: int = 5000, d_model: int = 128):
+    def __init__(self, card_vocab_size: int = VOCAB_CAPACITY, d_model: int = 128):
         super().__init__()
         # Embedding pour l'identité de la carte
         self.card_embedding = nn.Embedding(card_vocab_size, d_model // 2)
@@ -114,11 +109,11 @@ class HearthstoneTransformer(nn.Module):
     """Architecture State-of-the-Art pour Hearthstone."""
     
     def __init__(self, 
-                 card_vocab_size: int = 5000,
+                 card_vocab_size: int = VOCAB_CAPACITY,
                  d_model: int = 128,
                  n_heads: int = 4,
                  n_layers: int = 3,
-                 action_dim: int = 300):
+                 action_dim: int = ACTION_SPACE_SIZE):
         super().__init__()
         
         self.d_model = d_model
@@ -187,25 +182,34 @@ class HearthstoneTransformer(nn.Module):
     
     def forward(self, hand_data, my_board_data, enemy_board_data, global_state, masks, action_mask=None):
         """Forward pass utilisant les différentes zones du jeu."""
+        n_hand, n_board = hand_data[0].size(1), my_board_data[0].size(1)
         
-        # 1. Encode cards
+        # 1. Encode cards : toutes les zones en un seul appel
         # hand_data = (ids, stats)
-        hand_emb = self.card_encoder(hand_data[0], hand_data[1])
-        my_board_emb = self.card_encoder(my_board_data[0], my_board_data[1])
-        enemy_board_emb = self.card_encoder(enemy_board_data[0], enemy_board_data[1])
+        ids = torch.cat([hand_data[0], my_board_data[0], enemy_board_data[0]], dim=1)
+        stats = torch.cat([hand_data[1], my_board_data[1], enemy_board_data[1]], dim=1)
+        hand_emb, my_board_emb, enemy_board_emb = self.card_encoder(ids, stats).split(
+            [n_hand, n_board, n_board], dim=1)
+        
+        # Les deux plateaux passent ensemble dans board_transformer : [2 * batch, N, D]
+        boards_emb = torch.cat([my_board_emb, enemy_board_emb], dim=0)
+        hand_mask = masks.get("hand")
+        board_masks = (masks.get("my_board"), masks.get("enemy_board"))
+        boards_mask = None
+        if board_masks[0] is not None or board_masks[1] is not None:
+            no_padding = torch.zeros_like(my_board_data[0], dtype=torch.bool)
+            boards_mask = torch.cat([no_padding if m is None else m for m in board_masks], dim=0)
         
         # 2. Transformers (Self-Attention inter-cartes)
         for block in self.hand_transformer:
-            hand_emb = block(hand_emb, masks.get("hand"))
+            hand_emb = block(hand_emb, hand_mask)
             
         for block in self.board_transformer:
-            my_board_emb = block(my_board_emb, masks.get("my_board"))
-            enemy_board_emb = block(enemy_board_emb, masks.get("enemy_board"))
+            boards_emb = block(boards_emb, boards_mask)
             
         # 3. Pooling
-        hand_p = self._pool(hand_emb, masks.get("hand"))
-        my_p = self._pool(my_board_emb, masks.get("my_board"))
-        en_p = self._pool(enemy_board_emb, masks.get("enemy_board"))
+        hand_p = self._pool(hand_emb, hand_mask)
+        my_p, en_p = self._pool(boards_emb, boards_mask).chunk(2, dim=0)
         global_emb = self.global_encoder(global_state)
         
         # 4. Concatenation & Heads
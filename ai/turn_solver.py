@@ -0,0 +1,403 @@
+"""
+Turn solver - exhaustive search of the current player's turn.
+
+Searches card plays, hero power and attack orderings on a clone of the game,
+undoing each move with the game's do/undo journal (Game.mark / rollback).
+States reached by different orderings are merged through a transposition
+table. The solver first looks for lethal, pruning lines that cannot deal
+enough damage, then for the line with the best board evaluation, both
+within a time budget. Once only minion attacks are left on a board the
+vectorized combat resolver supports, lethal is searched for over every
+attack order at once (simulator.combat.find_lethal). It needs no UI and can be benchmarked headless
+(tools/benchmark_turn_solver.py).
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from simulator import combat
+from simulator.card_search import normalize
+
+
+WIN = 1_000_000.0
+LOSS = -WIN
+
+
+@dataclass(frozen=True)
+class Move:
+    """One move of a turn; entities are named by entity_id (stable under clone)."""
+    kind: str                   # "play", "hero_power" or "attack"
+    source: int                 # card played, hero power, or attacker
+    target: Optional[int] = None
+
+    def resolve(self, game) -> Tuple[object, object]:
+        """(source, target) entities of this move in game."""
+        entities = _entities(game)
+        return entities.get(self.source), entities.get(self.target) if self.target is not None else None
+
+    def describe(self, game) -> str:
+        source, target = self.resolve(game)
+        name = getattr(source, "name", "?")
+        if self.kind == "attack":
+            return f"{name} attacks {getattr(target, 'name', '?')}"
+        if self.kind == "hero_power":
+            return f"Hero power{' on ' + target.name if target is not None else ''}"
+        return f"Play {name}{' on ' + target.name if target is not None else ''}"
+
+
+@dataclass
+class TurnPlan:
+    """Result of TurnSolver.solve."""
+    moves: List[Move]
+    score: float
+    lethal: bool = False
+    complete: bool = True       # False if the budget ran out before the search ended
+    nodes: int = 0
+    table_hits: int = 0
+    elapsed: float = 0.0
+
+
+class _Timeout(Exception):
+    pass
+
+
+def _entities(game) -> Dict[int, object]:
+    found = {}
+    for player in game.players:
+        for entity in (player.hero, player.hero_power, *player.hand, *player.board):
+            if entity is not None:
+                found[entity.entity_id] = entity
+    return found
+
+
+# Card texts whose whole effect is known (normalized, see card_search.normalize)
+_FACE_DAMAGE = re.compile(r"deal (\d+) damage( to (the enemy hero|a character|an enemy|all enemies|all characters))?"
+                          r"( randomly split among all enemies)?( and freeze it)?( overload \d+)?")
+_MINION_DAMAGE = re.compile(r"deal \d+ damage to (a minion|an enemy minion|all minions|all enemy minions|"
+                            r"two random enemy minions|an undamaged minion)( and freeze (it|them))?( overload \d+)?")
+_TEMPORARY_MANA = re.compile(r"gain (\d+) mana crystals? this turn only")
+# Minions and weapons with no effect beyond these keywords (many such cards have a stub script)
+_KEYWORDS_ONLY = re.compile(r"((taunt|charge|rush|divine shield|windfury|mega windfury|stealth|"
+                            r"poisonous|lifesteal|reborn)( |$))*")
+
+
+@lru_cache(maxsize=None)
+def _text_effect(kind: str, text: str) -> Optional[Tuple[str, int]]:
+    """What a card of this type and text does for lethal: (what, amount) or None if unknown.
+
+    what is "attack" (a keyword-only minion or weapon), "damage" (to the
+    enemy hero), "spell damage" (the same, boosted by Spell Damage) or "mana".
+    """
+    words = normalize(text)
+    if kind in ("MINION", "WEAPON"):
+        return ("attack", 0) if _KEYWORDS_ONLY.fullmatch(words) else None
+    match = _FACE_DAMAGE.fullmatch(words)
+    if match is not None:
+        return ("spell damage" if "$" in text else "damage"), int(match.group(1))
+    if _MINION_DAMAGE.fullmatch(words):
+        return "damage", 0
+    match = _TEMPORARY_MANA.fullmatch(words)
+    if match is not None:
+        return "mana", int(match.group(1))
+    return None
+
+
+def _face_damage(card, spell_damage: int) -> Optional[Tuple[int, int]]:
+    """(mana gained, most damage to the enemy hero) of playing card; None if unknown."""
+    kind = card.card_type.name
+    effect = _text_effect(kind, card.data.text)
+    if effect is None:
+        return None
+    what, amount = effect
+    if what == "attack":
+        attacks = 4 if card.data.mega_windfury else (2 if card.windfury else 1)
+        return 0, card.attack * attacks if kind == "WEAPON" or card.charge else 0
+    if what == "mana":
+        return amount, 0
+    return 0, amount + (spell_damage if what == "spell damage" and amount else 0)
+
+
+def _effective_health(hero) -> int:
+    return hero.health + hero.armor
+
+
+def _minion_value(minion) -> float:
+    value = 1.0 + minion.attack + minion.health
+    if minion.taunt:
+        value += 1.0
+    if minion.divine_shield:
+        value += 1.0 + minion.attack * 0.5
+    if minion.poisonous or minion.lifesteal:
+        value += 1.0
+    if minion.windfury:
+        value += minion.attack * 0.5
+    return value
+
+
+def evaluate_board(game, player) -> float:
+    """Default evaluation of the position at the end of player's turn."""
+    enemy = player.opponent
+    if enemy.hero is None or player.hero is None:
+        return 0.0
+    if enemy.hero.health <= 0:
+        return WIN
+    if player.hero.health <= 0:
+        return LOSS
+    score = _effective_health(player.hero) - 1.5 * _effective_health(enemy.hero)
+    score += sum(_minion_value(m) for m in player.board)
+    score -= 1.25 * sum(_minion_value(m) for m in enemy.board)
+    return score
+
+
+def state_key(game) -> int:
+    """Identity of game's state (Game.state_hash): equal keys are the same position."""
+    return game.state_hash
+
+
+class TurnSolver:
+    """Searches the current turn for lethal, else the best line.
+
+    evaluate(game, player) scores the position when the turn ends (higher
+    is better for player); time_budget is in seconds for the whole solve.
+    """
+
+    def __init__(self, time_budget: float = 0.2,
+                 evaluate: Callable = evaluate_board,
+                 max_moves: int = 30):
+        self.time_budget = time_budget
+        self.evaluate = evaluate
+        self.max_moves = max_moves
+
+    def solve(self, game, player=None) -> TurnPlan:
+        """Plan player's turn (default: the current player) in game (left untouched)."""
+        start = time.perf_counter()
+        work = game.clone()
+        work.is_simulation = True
+        if player is not None:
+            work.current_player_idx = game.players.index(player)
+        me = work.current_player
+        self._nodes = 0
+        if me.hero is None or me.opponent.hero is None:
+            return TurnPlan([], 0.0, elapsed=time.perf_counter() - start)
+        self._hits = 0
+        self._deadline = start + self.time_budget
+
+        mark = work.mark()
+        try:
+            # Lethal first, with half the budget at most
+            lethal_deadline = self._deadline
+            self._deadline = start + self.time_budget / 2
+            self._dead_ends = set()
+            line, complete = None, True
+            try:
+                line = self._find_lethal(work, me, mark, 0)
+            except _Timeout:
+                complete = False
+            if line is not None:
+                return self._plan(line, WIN, True, True, start)
+
+            self._deadline = lethal_deadline
+            self._table: Dict[int, Tuple[float, List[Move]]] = {}
+            self._best: Tuple[float, List[Move]] = (self.evaluate(work, me), [])
+            try:
+                score, line = self._search(work, me, mark, 0, [])
+            except _Timeout:
+                score, line = self._best
+                complete = False
+            return self._plan(line, score, score >= WIN, complete, start)
+        finally:
+            work.rollback(mark)
+            work.end_journal()
+
+    def _plan(self, moves, score, lethal, complete, start) -> TurnPlan:
+        return TurnPlan(list(moves), score, lethal, complete, self._nodes, self._hits,
+                        time.perf_counter() - start)
+
+    # === Moves ===
+
+    def _moves(self, game, player) -> List[Move]:
+        """Legal moves, most promising first (face attacks, costly cards, trades, hero power)."""
+        if game.ended or game.pending_choices:
+            return []
+        face, plays, trades = [], [], []
+        enemy_hero = player.opponent.hero
+        for attacker in (*player.board, player.hero):
+            if attacker is None or not attacker.can_attack():
+                continue
+            for target in player.get_valid_attack_targets(attacker):
+                move = Move("attack", attacker.entity_id, target.entity_id)
+                (face if target is enemy_hero else trades).append(move)
+        for card in player.hand:
+            if not player.can_play_card(card):
+                continue
+            targets = player.get_valid_targets(card)
+            if targets:
+                plays.extend((game.get_card_cost(player, card), Move("play", card.entity_id, t.entity_id))
+                             for t in targets)
+            else:
+                plays.append((game.get_card_cost(player, card), Move("play", card.entity_id)))
+        plays.sort(key=lambda item: -item[0])
+        moves = face + [move for _, move in plays] + trades
+        power = player.hero_power
+        if power is not None and power.can_use():
+            targets = player.get_valid_targets(power)
+            if targets:
+                moves.extend(Move("hero_power", power.entity_id, t.entity_id) for t in targets)
+            else:
+                moves.append(Move("hero_power", power.entity_id))
+        return moves
+
+    def _apply(self, game, move: Move) -> bool:
+        source, target = move.resolve(game)
+        if source is None:
+            return False
+        if move.kind == "attack":
+            return bool(game.attack(source, target))
+        if move.kind == "play":
+            return bool(game.play_card(source, target=target))
+        return bool(game.use_hero_power(target=target))
+
+    def _tick(self) -> None:
+        self._nodes += 1
+        if time.perf_counter() > self._deadline:
+            raise _Timeout()
+
+    # === Lethal search ===
+
+    def _damage_bound(self, game, player) -> Optional[int]:
+        """Most face damage still possible, or None if it cannot be bounded.
+
+        Attacks left, plus the best set of damage cards and hero power that
+        fits in the mana left. Cards are only counted when their effect is
+        known (_face_damage) and nothing friendly could react to them.
+        """
+        bound = 0
+        for attacker in (*player.board, player.hero):
+            if attacker is not None and attacker.can_attack():
+                attacks = 4 if attacker.data.mega_windfury else (2 if attacker.windfury else 1)
+                bound += attacker.attack * max(1, attacks - attacker.attacks_this_turn)
+
+        power = player.hero_power
+        mana = player.mana + player.temp_mana
+        spell_damage = player.spell_damage
+        effects = [(card, game.get_card_cost(player, card), _face_damage(card, spell_damage))
+                   for card in player.hand]
+        # Temporary mana (The Coin) only ever adds to what can be spent
+        mana += sum(max(0, effect[0] - cost) for _, cost, effect in effects if effect is not None)
+        playable = [(card, cost, effect) for card, cost, effect in effects if cost <= mana]
+        if power is not None and power.can_use():
+            playable.append((power, power.cost, _face_damage(power, 0)))
+        if not playable:
+            return bound
+        if game._auras or game.has_listeners("on_calculate_damage") or any(
+                game._trigger_handles.get(entity.entity_id)
+                for entity in (player.hero, *player.board, *player.hand) if entity is not None):
+            return None
+        items = []              # (cost, damage)
+        for _, cost, effect in playable:
+            if effect is None:
+                return None
+            if effect[1]:
+                items.append((max(0, cost), effect[1]))
+
+        # 0/1 knapsack over mana: best[m] = most damage for at most m mana
+        best = [0] * (max(0, mana) + 1)
+        for cost, damage in items:
+            for m in range(len(best) - 1, cost - 1, -1):
+                best[m] = max(best[m], best[m - cost] + damage)
+        return bound + best[-1]
+
+    def _attacks_only(self, game, player) -> bool:
+        """Whether only minion attacks are left, on a board the combat resolver supports."""
+        if any(player.can_play_card(card) for card in player.hand):
+            return False
+        power = player.hero_power
+        if power is not None and power.can_use():
+            return False
+        if player.hero.can_attack() or game.pending_choices:
+            return False
+        return combat.supports(game, player)
+
+    def _combat_lethal(self, game, player) -> Tuple[Optional[List[Move]], bool]:
+        """Lethal among all minion attack orders: (line or None, whether the search was complete)."""
+        boards, _ = combat.from_games([game], [player])
+        sequence, complete = combat.find_lethal(boards, check=self._tick)
+        if sequence is None:
+            return None, complete
+        mark = game.mark()
+        try:
+            line = [Move("attack", attacker.entity_id, target.entity_id)
+                    for attacker, target in combat.play(game, sequence)]
+            if player.opponent.hero.health > 0:
+                return None, False  # the engine disagrees: search move by move
+            return line, True
+        finally:
+            game.rollback(mark)
+
+    def _find_lethal(self, game, player, mark, depth) -> Optional[List[Move]]:
+        self._tick()
+        enemy = player.opponent.hero
+        if enemy.health <= 0:
+            return []
+        if depth >= self.max_moves or player.hero.health <= 0:
+            return None
+        key = state_key(game)
+        if key in self._dead_ends:
+            self._hits += 1
+            return None
+        bound = self._damage_bound(game, player)
+        if bound is not None and bound < _effective_health(enemy):
+            self._dead_ends.add(key)
+            return None
+        if self._attacks_only(game, player):
+            line, complete = self._combat_lethal(game, player)
+            if line is not None:
+                return line
+            if complete:
+                self._dead_ends.add(key)
+                return None
+        for move in self._moves(game, player):
+            child = game.mark()
+            try:
+                if self._apply(game, move):
+                    line = self._find_lethal(game, player, mark, depth + 1)
+                    if line is not None:
+                        return [move] + line
+            finally:
+                game.rollback(child)
+        self._dead_ends.add(key)
+        return None
+
+    # === Best line ===
+
+    def _search(self, game, player, mark, depth, path: List[Move]) -> Tuple[float, List[Move]]:
+        """Best (score, line) from this state; the turn may end at any point."""
+        self._tick()
+        key = state_key(game)
+        cached = self._table.get(key)
+        if cached is not None:
+            self._hits += 1
+            return cached
+        best = (self.evaluate(game, player), [])
+        if best[0] > self._best[0]:
+            self._best = (best[0], list(path))
+        if best[0] < WIN and depth < self.max_moves:
+            for move in self._moves(game, player):
+                child = game.mark()
+                try:
+                    if not self._apply(game, move):
+                        continue
+                    path.append(move)
+                    score, line = self._search(game, player, mark, depth + 1, path)
+                    path.pop()
+                finally:
+                    game.rollback(child)
+                if score > best[0]:
+                    best = (score, [move] + line)
+                    if score >= WIN:
+                        break
+        self._table[key] = best
+        return best
@@ -3,7 +3,7 @@
 
 def on_play(game, source, target):
     player = source.controller
-    options = list(set(source.controller.opponent.cards_played_this_game))
+    options = sorted(set(source.controller.opponent.cards_played_this_game))
     if options:
         import random
         chosen = random.sample(options, min(3, len(options)))
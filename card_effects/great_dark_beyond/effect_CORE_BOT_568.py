@@ -14,8 +14,6 @@ def play(game, source, target):
         card = source.controller.draw()
         if card:
              cards_drawn.append(card)
-             input_attr = f"_soularium_discard_{game.turn}"
-             setattr(card, input_attr, True)
              
     # Register end of turn trigger dynamically?
     # Or rely on cards themselves... no, hard to attach scripts to cards dynamically.
@@ -7,6 +7,4 @@ def deathrattle(game, source):
         import random
         target = random.choice(opp_board)
         # Steal target
-        target.controller.board.remove(target)
-        source.controller.board.append(target)
-        target.controller = source.controller
+        game.take_control(target, source.controller)
@@ -13,7 +13,7 @@ def on_play(game, source, target):
     import random
     from simulator import CardDatabase
     db = CardDatabase.get_instance()
-    cards = [c.card_id for c in db._cards.values() if c.collectible][:100]
+    cards = db.get_collectible_ids()[:100]
     def on_discover(game, chosen_id):
         from simulator.factory import create_card
         c = create_card(chosen_id, game)
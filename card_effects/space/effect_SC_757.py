@@ -11,11 +11,5 @@ def on_play(game, source, target):
     copy = game.summon_copy(target, player)
     
     if copy:
-        # Mark the copy as taking double damage
-        if not hasattr(copy, '_hallucination'):
-            copy._hallucination = True
-            # Attach damage modifier
-            original_take_damage = copy.take_damage
-            def take_double_damage(amount):
-                return original_take_damage(amount * 2)
-            copy.take_damage = take_double_damage
+        # Mark the copy as taking double damage (applied in Game.deal_damage)
+        copy._hallucination = True
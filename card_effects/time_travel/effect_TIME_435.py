@@ -4,6 +4,4 @@
 def battlecry(game, source, target):
     if target and target.health <= source.health:
         # Steal minion
-        target.controller.board.remove(target)
-        source.controller.board.append(target)
-        target.controller = source.controller
+        game.take_control(target, source.controller)
@@ -3,12 +3,10 @@
 Card Text: Your other minions have +1/+1.
 """
 
-from simulator.enums import CardType
+from simulator.auras import Aura, other_friendly_minions
 
-def battlecry(game, source, target):
-    player = source.controller
-    opponent = player.opponent
+AURA = Aura(other_friendly_minions, attack=1, health=1)
 
-    if target:
-        target._attack += 1
-        target._max_health += 1
\ No newline at end of file
+
+def setup(game, card):
+    game.register_aura(card, AURA)
@@ -1,6 +1,11 @@
 """Effect for DEEP_030 in WILD_WEST"""
 
 
-def setup(game, source):
-    source.battlecry = lambda g, s, t: (s.controller.draw(1), game.deal_damage(s.controller.hero, 2, s))
-    source.deathrattle = lambda g, s: (s.controller.draw(1), game.deal_damage(s.controller.hero, 2, s))
+def battlecry(game, source, target):
+    source.controller.draw(1)
+    game.deal_damage(source.controller.hero, 2, source)
+
+
+def deathrattle(game, source):
+    source.controller.draw(1)
+    game.deal_damage(source.controller.hero, 2, source)
@@ -20,6 +20,7 @@ from overlay.geometry import HearthstoneGeometry, Point
 from runtime.log_watcher import LogWatcher
 from runtime.parser import LogParser
 from ai.game_state import GameState
+from ai.turn_solver import TurnSolver
 from simulator.game import Game
 from simulator.player import Player
 
@@ -57,6 +58,9 @@ class AssistantWorker(QThread):
         # For now, always use heuristics until model architecture supports variable input
         print("[Assistant] Using heuristic-based suggestions (model disabled for live play)")
         
+        # Turn planner (lethal first, then best line), searched within 200 ms
+        self.solver = TurnSolver(time_budget=0.2)
+        
         # Throttle analysis to avoid spam
         self.last_analysis_time = 0
         self.analysis_cooldown = 0.5  # seconds
@@ -148,8 +152,9 @@ class AssistantWorker(QThread):
             self._suggest_with_brain(state, local_player)
             return
 
-        # === FALLBACK HEURISTIC AI ===
-        self._suggest_heuristic(local_player)
+        # === TURN SOLVER, THEN FALLBACK HEURISTIC AI ===
+        if not self._suggest_with_solver(local_player):
+            self._suggest_heuristic(local_player)
 
     def _suggest_with_brain(self, state: GameState, local_player):
         """Use trained AlphaZero model for suggestions."""
@@ -218,6 +223,53 @@ class AssistantWorker(QThread):
                         
                 self.arrow_signal.emit(start_pos, end_pos)
 
+    def _suggest_with_solver(self, local_player) -> bool:
+        """Build the turn plan with the turn solver; False if it could not run."""
+        try:
+            plan = self.solver.solve(self.game, local_player)
+        except Exception as e:
+            print(f"[SOLVER] Failed, using heuristics: {e}")
+            return False
+        
+        opponent = local_player.opponent
+        actions = []
+        for move in plan.moves:
+            kind = {"play": "PLAY", "attack": "ATTACK", "hero_power": "HERO_POWER"}[move.kind]
+            actions.append((kind, move.describe(self.game), "LETHAL" if plan.lethal else ""))
+        actions.append(("END", "Fin du tour", "Passer la main"))
+        
+        # Show the first move on the board (positions are those of the live game)
+        if plan.moves:
+            first = plan.moves[0]
+            source, target = first.resolve(self.game)
+            self.status_signal.emit(("LETHAL: " if plan.lethal else "") + first.describe(self.game).upper())
+            if first.kind == "play" and source in local_player.hand:
+                self.highlight_signal.emit(self.geometry.get_hand_card_pos(
+                    local_player.hand.index(source), len(local_player.hand)))
+            elif first.kind == "hero_power":
+                self.highlight_signal.emit(self.geometry.get_hero_power_pos(is_opponent=False))
+            elif first.kind == "attack":
+                if source in local_player.board:
+                    start_pos = self.geometry.get_player_minion_pos(
+                        local_player.board.index(source), len(local_player.board))
+                else:
+                    start_pos = self.geometry.get_hero_pos(is_opponent=False)
+                if target in opponent.board:
+                    end_pos = self.geometry.get_opponent_minion_pos(
+                        opponent.board.index(target), len(opponent.board))
+                else:
+                    end_pos = self.geometry.get_hero_pos(is_opponent=True)
+                self.arrow_signal.emit(start_pos, end_pos)
+        else:
+            self.status_signal.emit("FIN DU TOUR")
+            self.arrow_signal.emit(None, None)
+            self.highlight_signal.emit(None)
+        
+        self.info_signal.emit(f"{plan.nodes} positions, {plan.elapsed * 1000:.0f} ms"
+                              + ("" if plan.complete else " (partial)"))
+        self.action_queue_signal.emit(actions)
+        return True
+    
     def _suggest_heuristic(self, local_player):
         """Build a full turn plan using simple heuristics."""
         actions = []
@@ -344,7 +344,7 @@ class LogParser:
                 entity = self._get_or_create_entity(entity_id, entity_data)
                 if entity:
                      try:
-                        entity.num_attacks_this_turn = int(value)
+                        entity.attacks_this_turn = int(value)
                         state_changed = True
                      except ValueError:
                         pass
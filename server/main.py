@@ -16,20 +16,30 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from ai.transformer_model import HearthstoneTransformer
 from ai.encoder import FeatureEncoder
-from ai.actions import Action
+from ai.card_vocab import CardVocabulary, VOCAB_FILE
+from ai.actions import Action, ACTION_SPACE_SIZE
+from ai.inference import InferenceModel, TORCHSCRIPT_SUFFIX
 
 # Configuration IA
 DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 MODEL_PATH = "models/ppo_checkpoint_0.pt"
+VOCAB_PATH = os.path.join(os.path.dirname(MODEL_PATH), VOCAB_FILE)
+# Export CPU (tools/export_model.py) : TorchScript figé, quantifié int8
+EXPORT_PATH = os.path.splitext(MODEL_PATH)[0] + TORCHSCRIPT_SUFFIX
+INFERENCE_THREADS = int(os.environ.get("HS_INFERENCE_THREADS", "0")) or None
 
 # Initialisation Singleton
 model = None
-encoder = FeatureEncoder()
+# Vocabulaire sauvegardé avec le checkpoint (mêmes ids d'embedding qu'à l'entraînement)
+encoder = FeatureEncoder(CardVocabulary.load(VOCAB_PATH) if os.path.exists(VOCAB_PATH) else None)
 
 def get_model():
     global model
+    if model is None and DEVICE.type == "cpu" and os.path.exists(EXPORT_PATH):
+        logger.info(f"Loading CPU export {EXPORT_PATH}")
+        model = InferenceModel.load(EXPORT_PATH, threads=INFERENCE_THREADS)
     if model is None:
-        model = HearthstoneTransformer(action_dim=300).to(DEVICE)
+        model = HearthstoneTransformer(action_dim=ACTION_SPACE_SIZE).to(DEVICE)
         if os.path.exists(MODEL_PATH):
             logger.info(f"Loading checkpoint {MODEL_PATH}")
             model.load_state_dict(torch.load(MODEL_PATH, map_location=DEVICE))
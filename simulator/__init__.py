@@ -13,6 +13,8 @@ from .entities import (
 from .player import Player
 from .game import Game, GameConfig
 from .card_loader import CardDatabase, create_card, create_deck
+from .effect_registry import EffectRegistry, PreloadReport
+from .card_catalog import CardCatalog
 
 
 __all__ = [
@@ -24,7 +26,7 @@ __all__ = [
     # Core
     'Player', 'Game', 'GameConfig',
     # Card loading
-    'CardDatabase', 'create_card', 'create_deck',
+    'CardDatabase', 'create_card', 'create_deck', 'EffectRegistry', 'PreloadReport', 'CardCatalog',
 ]
 
 
@@ -0,0 +1,117 @@
+"""Hearthstone Simulator - Auras.
+
+Declarative stat, cost and damage modifiers ("Your other minions have +1/+1",
+"Your spells cost (1) less", "Undamaged enemy minions take double damage").
+An effect script describes the aura once and registers it for a source card:
+
+    CHAMPION_AURA = Aura(other_friendly_minions, attack=1, health=1)
+
+    def setup(game, card):
+        game.register_aura(card, CHAMPION_AURA)
+
+The aura applies while its source is in one of the aura's zones and is not
+silenced. Cards cache their aura bonus against Game.aura_version, which the
+game bumps when the set of auras or the board they depend on changes (zone
+moves, control changes, silences, turn changes), so reading a stat is a field
+read until then. Conditions should therefore depend on where cards are (zone,
+controller, board position, type, race), not on stats that change freely;
+damage factors are the exception and are checked when the damage is dealt.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, FrozenSet, Iterable, Optional, TYPE_CHECKING
+
+from .enums import CardType, Race, Zone
+
+if TYPE_CHECKING:
+    from .entities import Card
+
+# condition(source, target) -> whether the aura applies to target
+AuraCondition = Callable[["Card", "Card"], bool]
+
+
+class Aura:
+    """Immutable aura definition, shared by every card registering it."""
+
+    __slots__ = ("condition", "attack", "health", "cost", "damage_factor", "zones")
+
+    def __init__(
+        self,
+        condition: AuraCondition,
+        attack: int = 0,
+        health: int = 0,
+        cost: int = 0,
+        damage_factor: int = 1,
+        zones: Iterable[Zone] = (Zone.PLAY,),
+    ):
+        init = object.__setattr__
+        init(self, "condition", condition)
+        init(self, "attack", attack)
+        init(self, "health", health)
+        init(self, "cost", cost)
+        init(self, "damage_factor", damage_factor)
+        init(self, "zones", frozenset(zones))
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("Aura is immutable")
+
+    def __reduce__(self):
+        return (Aura, (self.condition, self.attack, self.health, self.cost,
+                       self.damage_factor, tuple(self.zones)))
+
+    @property
+    def modifies_stats(self) -> bool:
+        return bool(self.attack or self.health or self.cost)
+
+    def active(self, source: Card) -> bool:
+        """Whether the aura currently applies at all."""
+        return source.zone in self.zones and not source.silenced
+
+    def __repr__(self) -> str:
+        return (f"<Aura {getattr(self.condition, '__name__', 'condition')} "
+                f"{self.attack:+}/{self.health:+} cost {self.cost:+} x{self.damage_factor}>")
+
+
+# === Conditions ===
+
+def friendly_minions(source: Card, target: Card) -> bool:
+    return (target.zone == Zone.PLAY and target.card_type == CardType.MINION
+            and target.controller is source.controller)
+
+
+def other_friendly_minions(source: Card, target: Card) -> bool:
+    return target is not source and friendly_minions(source, target)
+
+
+def enemy_minions(source: Card, target: Card) -> bool:
+    return (target.zone == Zone.PLAY and target.card_type == CardType.MINION
+            and target.controller is not source.controller)
+
+
+def adjacent_minions(source: Card, target: Card) -> bool:
+    if target is source or not friendly_minions(source, target):
+        return False
+    board = source.controller.board
+    try:
+        return abs(board.index(source) - board.index(target)) == 1
+    except ValueError:
+        return False
+
+
+def friendly_race(race: Race, include_self: bool = False) -> AuraCondition:
+    """Friendly minions of a race ("Your other Murlocs have +2 Attack")."""
+    def condition(source: Card, target: Card) -> bool:
+        return ((include_self or target is not source) and friendly_minions(source, target)
+                and (target.race == race or target.race == Race.ALL))
+    condition.__name__ = f"friendly_{race.name.lower()}"
+    return condition
+
+
+def friendly_hand(card_types: Optional[FrozenSet[CardType]] = None) -> AuraCondition:
+    """Cards in the source controller's hand, optionally of some types."""
+    def condition(source: Card, target: Card) -> bool:
+        return (target.zone == Zone.HAND and target.controller is source.controller
+                and (card_types is None or target.card_type in card_types))
+    condition.__name__ = "friendly_hand"
+    return condition
@@ -0,0 +1,197 @@
+"""Hearthstone Simulator - Card Catalog.
+
+Column-oriented NumPy view of the card database. Every card is a row; filters
+such as "collectible DRUID-or-NEUTRAL minions costing 2-4 with Taunt" become
+vectorized boolean masks instead of Python loops over CardData objects.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .enums import CardType, CardClass
+from .entities import CardData, KEYWORD_BITS
+
+CostFilter = Union[int, Tuple[int, int], None]
+
+
+def keyword_mask(keywords: Iterable[str]) -> int:
+    """Bitmask for a set of keyword names (see CARD_KEYWORDS)."""
+    mask = 0
+    for name in keywords:
+        try:
+            mask |= KEYWORD_BITS[name]
+        except KeyError:
+            raise ValueError(f"Unknown keyword: {name}") from None
+    return mask
+
+
+class CardCatalog:
+    """Columnar card table with prebuilt class/type/cost indexes."""
+
+    COLUMNS: Tuple[Tuple[str, type], ...] = (
+        ("dbf_id", np.int32),
+        ("cost", np.int16),
+        ("attack", np.int16),
+        ("health", np.int16),
+        ("card_type", np.int8),
+        ("card_class", np.int8),
+        ("rarity", np.int8),
+        ("race", np.int16),
+        ("spell_school", np.int8),
+        ("card_set", np.int16),      # index into self.sets
+        ("keywords", np.uint64),     # KEYWORD_BITS
+        ("collectible", np.bool_),
+    )
+
+    MAX_COST_BUCKET = 10  # costs above this share the last bucket
+
+    def __init__(self, card_ids: Sequence[str], columns: Dict[str, np.ndarray], sets: Sequence[str]):
+        self.card_ids: List[str] = list(card_ids)
+        self.sets: List[str] = list(sets)
+        self.row_of: Dict[str, int] = {card_id: row for row, card_id in enumerate(self.card_ids)}
+        self._set_codes: Dict[str, int] = {name: code for code, name in enumerate(self.sets)}
+
+        for name, _ in self.COLUMNS:
+            setattr(self, name, columns[name])
+
+        # Prebuilt indexes: one boolean mask per class, type and cost bucket
+        self._class_masks: Dict[int, np.ndarray] = {
+            value: self.card_class == value for value in np.unique(self.card_class).tolist()
+        }
+        self._type_masks: Dict[int, np.ndarray] = {
+            value: self.card_type == value for value in np.unique(self.card_type).tolist()
+        }
+        buckets = np.minimum(self.cost, self.MAX_COST_BUCKET)
+        self._cost_masks: List[np.ndarray] = [buckets == c for c in range(self.MAX_COST_BUCKET + 1)]
+        self._empty = np.zeros(len(self.card_ids), dtype=np.bool_)
+
+    @classmethod
+    def from_cards(cls, cards: Mapping[str, CardData]) -> CardCatalog:
+        """Build the catalog from card_id -> CardData."""
+        card_ids = list(cards.keys())
+        sets: List[str] = []
+        set_codes: Dict[str, int] = {}
+        rows: Dict[str, list] = {name: [] for name, _ in cls.COLUMNS}
+
+        for card_id in card_ids:
+            data = cards[card_id]
+            code = set_codes.get(data.card_set)
+            if code is None:
+                code = set_codes[data.card_set] = len(sets)
+                sets.append(data.card_set)
+            rows["dbf_id"].append(data.dbf_id or 0)
+            rows["cost"].append(data.cost or 0)
+            rows["attack"].append(data.attack or 0)
+            rows["health"].append(data.health or 0)
+            rows["card_type"].append(int(data.card_type))
+            rows["card_class"].append(int(data.card_class))
+            rows["rarity"].append(int(data.rarity))
+            rows["race"].append(int(data.race))
+            rows["spell_school"].append(int(data.spell_school))
+            rows["card_set"].append(code)
+            rows["keywords"].append(data.keywords)
+            rows["collectible"].append(bool(data.collectible))
+
+        columns = {name: np.array(rows[name], dtype=dtype) for name, dtype in cls.COLUMNS}
+        return cls(card_ids, columns, sets)
+
+    def to_columns(self) -> Dict[str, object]:
+        """Plain data for serialization (see card_snapshot)."""
+        data: Dict[str, object] = {name: getattr(self, name) for name, _ in self.COLUMNS}
+        data["card_ids"] = self.card_ids
+        data["sets"] = self.sets
+        return data
+
+    @classmethod
+    def from_columns(cls, data: Mapping[str, object]) -> CardCatalog:
+        return cls(data["card_ids"], {name: data[name] for name, _ in cls.COLUMNS}, data["sets"])
+
+    def __len__(self) -> int:
+        return len(self.card_ids)
+
+    def mask(
+        self,
+        card_class: Optional[CardClass] = None,
+        include_neutral: bool = True,
+        card_type: Union[CardType, Iterable[CardType], None] = None,
+        exclude_type: Union[CardType, Iterable[CardType], None] = None,
+        cost: CostFilter = None,
+        race=None,
+        rarity=None,
+        card_set: Optional[str] = None,
+        keywords: Iterable[str] = (),
+        collectible: Optional[bool] = None,
+    ) -> np.ndarray:
+        """Boolean row mask for the given filters (None means "any").
+
+        cost is an exact value or an inclusive (min, max) range.
+        """
+        mask = np.ones(len(self.card_ids), dtype=np.bool_)
+
+        if collectible is not None:
+            mask &= self.collectible if collectible else ~self.collectible
+        if card_class is not None:
+            class_mask = self._class_masks.get(int(card_class), self._empty)
+            if include_neutral and card_class != CardClass.NEUTRAL:
+                class_mask = class_mask | self._class_masks.get(int(CardClass.NEUTRAL), self._empty)
+            mask &= class_mask
+        if card_type is not None:
+            mask &= self._any_type(card_type)
+        if exclude_type is not None:
+            mask &= ~self._any_type(exclude_type)
+        if cost is not None:
+            mask &= self._cost_mask(cost)
+        if race is not None:
+            mask &= self.race == int(race)
+        if rarity is not None:
+            mask &= self.rarity == int(rarity)
+        if card_set is not None:
+            code = self._set_codes.get(card_set)
+            if code is None:
+                return self._empty.copy()
+            mask &= self.card_set == code
+        bits = keyword_mask(keywords)
+        if bits:
+            mask &= (self.keywords & np.uint64(bits)) == np.uint64(bits)
+        return mask
+
+    def _any_type(self, card_type) -> np.ndarray:
+        types = [card_type] if isinstance(card_type, int) else list(card_type)
+        result = self._empty.copy()
+        for t in types:
+            result |= self._type_masks.get(int(t), self._empty)
+        return result
+
+    def _cost_mask(self, cost: CostFilter) -> np.ndarray:
+        if isinstance(cost, tuple):
+            low, high = cost
+            if high < self.MAX_COST_BUCKET:
+                result = self._empty.copy()
+                for c in range(max(low, 0), high + 1):
+                    result |= self._cost_masks[c]
+                return result
+            return (self.cost >= low) & (self.cost <= high)
+        if 0 <= cost < self.MAX_COST_BUCKET:
+            return self._cost_masks[cost]
+        return self.cost == cost
+
+    def query(self, **filters) -> np.ndarray:
+        """Row indices matching the filters of mask()."""
+        return np.flatnonzero(self.mask(**filters))
+
+    def ids(self, rows: Iterable[int]) -> List[str]:
+        """Card IDs for row indices."""
+        card_ids = self.card_ids
+        return [card_ids[row] for row in rows]
+
+    def sample(self, rows: np.ndarray, k: int, rng: Optional[random.Random] = None) -> List[str]:
+        """k card IDs drawn with replacement from the given rows."""
+        if len(rows) == 0:
+            return []
+        rng = rng or random
+        card_ids = self.card_ids
+        return [card_ids[rows[rng.randrange(len(rows))]] for _ in range(k)]
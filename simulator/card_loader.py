@@ -11,8 +11,11 @@ from hearthstone.enums import CardType as HSCardType, Race as HSRace, Rarity as
 
 from .enums import CardType, CardClass, Rarity, Race, SpellSchool, GameTag
 from .entities import CardData, Card, Minion, Spell, Weapon, Hero, HeroPower, Location
+from .effect_registry import EffectRegistry
+from .card_catalog import CardCatalog
+from .card_search import CardSearchIndex
+from .card_snapshot import SNAPSHOT_PATH, CardSnapshot, LazyCardMap, source_fingerprint, write_snapshot
 import threading
-import importlib
 import logging
 
 class CardDatabase:
@@ -22,6 +25,9 @@ class CardDatabase:
     _cards: Dict[str, CardData] = {}
     _loaded: bool = False
     _lock = threading.Lock()
+    snapshot_path: Optional[str] = SNAPSHOT_PATH  # None disables the compiled snapshot
+    _catalog: Optional[CardCatalog] = None
+    _search_index: Optional[CardSearchIndex] = None
     
     def __new__(cls) -> CardDatabase:
         if cls._instance is None:
@@ -46,12 +52,25 @@ class CardDatabase:
             if cls._loaded:
                 return cls._cards
         
-        # 1. Try loading from updated JSON file (priority)
         import os
         import json
         json_path = os.path.join(os.path.dirname(__file__), "..", "data", "cards.json")
         json_path = os.path.abspath(json_path)
+        manual_path = os.path.join(os.path.dirname(__file__), "..", "data", "manual_cards.json")
+        manual_path = os.path.abspath(manual_path)
+        
+        # 0. Memory-map the compiled snapshot if it matches the current sources
+        fingerprint = None
+        if cls.snapshot_path:
+            fingerprint = cls._source_fingerprint(json_path, manual_path)
+            snapshot = CardSnapshot.open(cls.snapshot_path, fingerprint)
+            if snapshot is not None:
+                cls._cards = LazyCardMap(snapshot)
+                EffectRegistry.build()
+                cls._loaded = True
+                return cls._cards
         
+        # 1. Try loading from updated JSON file (priority)
         if os.path.exists(json_path):
             # print(f"Loading cards from local JSON: {json_path}")
             try:
@@ -59,30 +78,15 @@ class CardDatabase:
                     data = json.load(f)
                     
                 for card_dict in data:
-                    # JSON dicts need a slightly different conversion
                     try:
-                         # Quick adapter to make dict look like an object for the existing _convert_card
-                         # Or better, refactor _convert_card to handle dicts. 
-                         # For minimal diff risk, let's make a dummy object.
-                         class DictObject:
-                             def __init__(self, d): self.__dict__ = d
-                         
-                         obj = DictObject(card_dict)
-                         # Remapping some keys because API JSON differs from library objects sometimes
-                         obj.card_set = card_dict.get('set', 'UNKNOWN')
-                         obj.card_class = card_dict.get('cardClass', 'NEUTRAL')
-                         obj.atk = card_dict.get('attack', 0)
-                         # obj.type is usually uppercase string "MINION" in JSON
-                         # but library expects ENUM. WE need to be careful.
-                         
-                         # Actually, parsing JSON directly is safer than wrapping.
-                         card_data = cls._convert_json_card(card_dict)
-                         if card_data:
+                        card_data = cls._convert_json_card(card_dict)
+                        if card_data:
                             cls._cards[card_dict['id']] = card_data
-                            
                     except Exception as e:
                         pass
                         
+                cls._save_snapshot(fingerprint)
+                EffectRegistry.build()
                 cls._loaded = True
                 print(f"Loaded {len(cls._cards)} cards from JSON.")
                 return cls._cards
@@ -90,9 +94,6 @@ class CardDatabase:
                 print(f"Failed to load local JSON: {e}. Fallback to library.")
                 
         # 1.5 Try loading MANUAL JSON (Patches)
-        manual_path = os.path.join(os.path.dirname(__file__), "..", "data", "manual_cards.json")
-        manual_path = os.path.abspath(manual_path)
-        
         if os.path.exists(manual_path):
             print(f"Loading MANUAL cards patches: {manual_path}")
             try:
@@ -125,9 +126,34 @@ class CardDatabase:
                 print(f"Error loading card {card_id}: {e}")
                 pass
         
+        cls._save_snapshot(fingerprint)
+        
+        # Index effect modules once so handler lookups never scan folders mid-game
+        EffectRegistry.build()
         cls._loaded = True
         return cls._cards
 
+    @classmethod
+    def _source_fingerprint(cls, json_path: str, manual_path: str) -> str:
+        """Fingerprint of everything the card table is built from."""
+        sources = [json_path, manual_path, __file__]
+        try:
+            import hearthstone_data
+            sources.append(hearthstone_data.get_carddefs_path())
+        except ImportError:
+            pass
+        return source_fingerprint(sources)
+    
+    @classmethod
+    def _save_snapshot(cls, fingerprint: Optional[str]) -> None:
+        """Write the compiled snapshot so the next process can skip parsing."""
+        if not cls.snapshot_path or fingerprint is None:
+            return
+        try:
+            write_snapshot(cls.snapshot_path, cls._cards, fingerprint)
+        except Exception as e:
+            print(f"Could not write card snapshot: {e}")
+    
     @classmethod
     def _convert_json_card(cls, data: Dict) -> Optional[CardData]:
         """Convert a JSON dictionary to CardData."""
@@ -262,8 +288,10 @@ class CardDatabase:
         # Get spell school
         spell_school = cls._map_spell_school(getattr(card, 'spell_school', None))
         
-        # Get keywords
-        mechanics = getattr(card, 'mechanics', []) or []
+        # Get keywords (mechanic GameTags set on the card: TAUNT, BATTLECRY, ...)
+        mechanics = getattr(card, 'mechanics', None) or {
+            getattr(tag, 'name', str(tag)) for tag, value in card.tags.items() if value
+        }
         
         collectible = getattr(card, 'collectible', False)
         
@@ -288,7 +316,7 @@ class CardDatabase:
             charge='CHARGE' in mechanics,
             windfury='WINDFURY' in mechanics,
             stealth='STEALTH' in mechanics,
-            poisonous='POISONOUS' in mechanics,
+            poisonous='POISONOUS' in mechanics or 'VENOMOUS' in mechanics,
             lifesteal='LIFESTEAL' in mechanics,
             rush='RUSH' in mechanics,
             reborn='REBORN' in mechanics,
@@ -408,28 +436,58 @@ class CardDatabase:
         return cls._cards.get(card_id)
     
     @classmethod
-    def get_collectible_cards(cls) -> List[CardData]:
-        """Get all collectible cards."""
+    def catalog(cls) -> CardCatalog:
+        """Columnar view of all cards for vectorized queries."""
         if not cls._loaded:
             cls.load()
-        return [c for c in cls._cards.values() if c.collectible]
+        catalog = cls._catalog
+        if catalog is None or len(catalog) != len(cls._cards):
+            cards = cls._cards
+            if (isinstance(cards, LazyCardMap) and cards.snapshot.catalog_columns
+                    and not cards.modified):
+                catalog = CardCatalog.from_columns(cards.snapshot.catalog_columns)
+            else:
+                catalog = CardCatalog.from_cards(cards)
+            cls._catalog = catalog
+        return catalog
+    
+    @classmethod
+    def _rows_to_cards(cls, rows) -> List[CardData]:
+        cards = cls._cards
+        return [cards[card_id] for card_id in cls.catalog().ids(rows)]
+    
+    @classmethod
+    def get_collectible_cards(cls) -> List[CardData]:
+        """Get all collectible cards."""
+        return cls._rows_to_cards(cls.catalog().query(collectible=True))
+    
+    @classmethod
+    def get_collectible_ids(cls, **filters) -> List[str]:
+        """IDs of collectible cards matching CardCatalog.mask() filters (discover pools)."""
+        catalog = cls.catalog()
+        return catalog.ids(catalog.query(collectible=True, **filters))
     
     @classmethod
     def get_cards_by_class(cls, card_class: CardClass) -> List[CardData]:
         """Get all cards for a specific class."""
-        if not cls._loaded:
-            cls.load()
-        return [c for c in cls._cards.values() 
-                if c.card_class == card_class or c.card_class == CardClass.NEUTRAL]
+        return cls._rows_to_cards(cls.catalog().query(card_class=card_class))
     
     @classmethod
-    def search(cls, query: str) -> List[CardData]:
-        """Search cards by name or text."""
+    def search_index(cls) -> CardSearchIndex:
+        """Inverted name/text index, built on first use."""
         if not cls._loaded:
             cls.load()
-        query = query.lower()
-        return [c for c in cls._cards.values() 
-                if query in c.name.lower() or query in c.text.lower()]
+        index = cls._search_index
+        if index is None or len(index) != len(cls._cards):
+            index = cls._search_index = CardSearchIndex(cls._cards)
+        return index
+    
+    @classmethod
+    def search(cls, query: str, limit: Optional[int] = None) -> List[CardData]:
+        """Search cards by name or text (every word matches as a prefix or inside a word, best match first)."""
+        index = cls.search_index()  # loads the database first if needed
+        cards = cls._cards
+        return [cards[card_id] for card_id in index.search(query, limit)]
     
     @classmethod
     def count(cls) -> int:
@@ -462,18 +520,12 @@ def create_card(card_id: str, game=None) -> Optional[Card]:
 
     # Load effects if game is provided
     if game:
-        card_set = data.card_set.lower().replace(" ", "_")
-        module_path = f"card_effects.{card_set}.effect_{card_id}"
-        
-        try:
-            module = importlib.import_module(module_path)
-            if hasattr(module, "setup"):
-                module.setup(game, card)
-        except ImportError:
-            # Effect might not be implemented yet or in a different folder
-            pass
-        except Exception as e:
-            print(f"Error loading effect for {card_id}: {e}")
+        setup = data.effects.setup
+        if setup:
+            try:
+                setup(game, card)
+            except Exception as e:
+                print(f"Error loading effect for {card_id}: {e}")
                 
     return card
 
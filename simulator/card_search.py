@@ -0,0 +1,196 @@
+"""Hearthstone Simulator - Card Search.
+
+Tokenized inverted index over card names and rules text. Markup such as
+``<b>Battlecry:</b>`` or ``[x]`` is stripped, accents and apostrophes are
+folded ("Sen'jin" -> "senjin") and every query token matches as a prefix, so
+"fire ele" finds Fire Elemental. Tokens of MIN_INFIX letters or more also
+match inside words through a trigram index of the vocabulary ("ball" finds
+Fireball), and a query no card matches word by word falls back to a
+substring scan of names and text ("d champ"). Results are ranked name-first.
+"""
+
+from __future__ import annotations
+
+import re
+import bisect
+import unicodedata
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+
+from .entities import CardData
+
+_MARKUP = re.compile(r"<[^>]*>|\[x\]", re.IGNORECASE)
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+# Score for a query token matching a card (best match per token counts)
+NAME_EXACT = 4.0
+NAME_PREFIX = 2.0
+TEXT_EXACT = 1.0
+TEXT_PREFIX = 0.5
+NAME_INFIX = 1.0
+TEXT_INFIX = 0.25
+# Bonuses for the whole query against the card name
+NAME_EQUALS = 100.0
+NAME_STARTS = 10.0
+COLLECTIBLE = 0.25
+
+# Shorter query tokens only match whole words ("a" would expand to most of the vocabulary)
+MIN_PREFIX = 2
+# Shorter query tokens do not match inside words
+MIN_INFIX = 3
+
+# Ignored in multi-word queries so "draw a card" is not ranked by names containing "a"
+STOPWORDS = frozenset({"a", "an", "the", "of", "to", "and", "in", "on", "for", "with", "your"})
+
+
+def normalize(text: str) -> str:
+    """Lowercase, markup-free, accent-free text with single spaces."""
+    if not text:
+        return ""
+    text = _MARKUP.sub(" ", text)
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = text.lower().replace("'", "")
+    return " ".join(_NON_WORD.split(text)).strip()
+
+
+def tokenize(text: str) -> List[str]:
+    """Search tokens of a name or card text."""
+    return normalize(text).split()
+
+
+class CardSearchIndex:
+    """Inverted index from name/text tokens to cards."""
+
+    def __init__(self, cards: Mapping[str, CardData]):
+        self.card_ids: List[str] = []
+        self._names: List[str] = []
+        self._texts: List[str] = []
+        name_postings: Dict[str, List[int]] = {}
+        text_postings: Dict[str, List[int]] = {}
+        collectible: List[bool] = []
+
+        for doc, (card_id, data) in enumerate(cards.items()):
+            self.card_ids.append(card_id)
+            name = normalize(data.name)
+            self._names.append(name)
+            collectible.append(bool(data.collectible))
+            for token in set(name.split()):
+                name_postings.setdefault(token, []).append(doc)
+            text = normalize(data.text)
+            self._texts.append(text)
+            for token in set(text.split()):
+                text_postings.setdefault(token, []).append(doc)
+
+        self._name_postings = {t: np.array(d, dtype=np.int32) for t, d in name_postings.items()}
+        self._text_postings = {t: np.array(d, dtype=np.int32) for t, d in text_postings.items()}
+        self._vocab: List[str] = sorted(set(name_postings) | set(text_postings))
+        self._collectible = np.array(collectible, dtype=np.bool_)
+        self._name_array = np.array(self._names, dtype=np.str_)
+
+        # Trigram -> vocabulary terms containing it
+        grams: Dict[str, List[int]] = {}
+        for term_id, term in enumerate(self._vocab):
+            for gram in {term[i:i + 3] for i in range(len(term) - 2)}:
+                grams.setdefault(gram, []).append(term_id)
+        self._grams = {g: np.array(t, dtype=np.int32) for g, t in grams.items()}
+
+    def __len__(self) -> int:
+        return len(self.card_ids)
+
+    def _terms_with_prefix(self, prefix: str) -> List[str]:
+        vocab = self._vocab
+        start = bisect.bisect_left(vocab, prefix)
+        end = bisect.bisect_left(vocab, prefix + "\x7f", start)
+        return vocab[start:end]
+
+    def _terms_containing(self, token: str) -> List[str]:
+        """Vocabulary terms with token inside them (not as a prefix)."""
+        postings = sorted((self._grams.get(token[i:i + 3]) for i in range(len(token) - 2)),
+                          key=lambda p: -1 if p is None else len(p))
+        if postings[0] is None:
+            return []
+        candidates = postings[0]
+        for p in postings[1:]:
+            candidates = np.intersect1d(candidates, p, assume_unique=True)
+        vocab = self._vocab
+        terms = (vocab[i] for i in candidates.tolist())
+        return [term for term in terms if token in term and not term.startswith(token)]
+
+    def _token_scores(self, token: str) -> np.ndarray:
+        """Best per-card score for one query token (0 = no match)."""
+        scores = np.zeros(len(self.card_ids), dtype=np.float32)
+        terms = self._terms_with_prefix(token) if len(token) >= MIN_PREFIX else [token]
+        matches = [(term, NAME_EXACT if term == token else NAME_PREFIX,
+                    TEXT_EXACT if term == token else TEXT_PREFIX) for term in terms]
+        if len(token) >= MIN_INFIX:
+            matches += [(term, NAME_INFIX, TEXT_INFIX) for term in self._terms_containing(token)]
+        for term, name_score, text_score in matches:
+            # Postings hold each card once, so fancy-index assignment is safe
+            docs = self._text_postings.get(term)
+            if docs is not None:
+                scores[docs] = np.maximum(scores[docs], text_score)
+            docs = self._name_postings.get(term)
+            if docs is not None:
+                scores[docs] = np.maximum(scores[docs], name_score)
+        return scores
+
+    def _phrase_scores(self, phrase: str) -> np.ndarray:
+        """Per-card score for phrase anywhere in the name or text.
+
+        Scans the cards where every token of MIN_INFIX letters or more
+        matches on its own (a card containing the phrase contains them),
+        all cards if there is none.
+        """
+        docs = None
+        for token in phrase.split():
+            if len(token) >= MIN_INFIX:
+                found = np.flatnonzero(self._token_scores(token))
+                docs = found if docs is None else np.intersect1d(docs, found, assume_unique=True)
+        if docs is None:
+            docs = np.arange(len(self.card_ids))
+        scores = np.zeros(len(self.card_ids), dtype=np.float32)
+        names, texts = self._names, self._texts
+        for doc in docs.tolist():
+            if phrase in names[doc]:
+                scores[doc] = NAME_INFIX
+            elif phrase in texts[doc]:
+                scores[doc] = TEXT_INFIX
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Card IDs matching every query token, best match first."""
+        phrase = normalize(query)
+        tokens = phrase.split()
+        if not tokens:
+            return []
+        tokens = [t for t in tokens if t not in STOPWORDS] or tokens
+
+        total = None
+        for token in dict.fromkeys(tokens):
+            scores = self._token_scores(token)
+            if total is None:
+                total = scores
+            else:
+                total = np.where((total > 0) & (scores > 0), total + scores, 0)
+            if not total.any():
+                break
+        if not total.any():
+            if len(phrase) < MIN_INFIX:
+                return []
+            total = self._phrase_scores(phrase)
+            if not total.any():
+                return []
+
+        docs = np.flatnonzero(total)
+        ranked = total[docs] + COLLECTIBLE * self._collectible[docs]
+        names = self._name_array[docs]
+        ranked += NAME_STARTS * np.char.startswith(names, phrase)
+        ranked += (NAME_EQUALS - NAME_STARTS) * (names == phrase)
+
+        # Highest score first; ties keep database order
+        order = np.argsort(-ranked, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        card_ids = self.card_ids
+        return [card_ids[doc] for doc in docs[order].tolist()]
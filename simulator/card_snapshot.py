@@ -0,0 +1,169 @@
+"""Hearthstone Simulator - Card Snapshot.
+
+Compiled, memory-mapped copy of the card database. The first process to load
+the cards writes data/cards.snapshot; later processes map it read-only (the OS
+shares the pages between workers) and only build CardData objects for cards
+that are actually used. The snapshot records a fingerprint of its sources and
+is rebuilt whenever card data or the loader changes.
+"""
+
+from __future__ import annotations
+
+import os
+import mmap
+import pickle
+import struct
+import hashlib
+import threading
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from collections.abc import MutableMapping
+
+from .entities import CardData
+from .card_catalog import CardCatalog
+
+SNAPSHOT_VERSION = 3
+SNAPSHOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "cards.snapshot"))
+
+_MAGIC = b"DMCARDS\x00"
+_HEADER = struct.Struct("<8sII")   # magic, format version, index length
+
+# Files at or above this size are fingerprinted by size/mtime instead of content
+_HASH_LIMIT = 32 * 1024 * 1024
+
+_FIELDS: Tuple[str, ...] = CardData.FIELDS
+
+
+def source_fingerprint(paths: Iterable[str]) -> str:
+    """Fingerprint of the snapshot inputs and the CardData layout."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{SNAPSHOT_VERSION}|{','.join(_FIELDS)}".encode())
+    for path in paths:
+        digest.update(b"|" + os.path.basename(path).encode())
+        try:
+            stat = os.stat(path)
+        except OSError:
+            digest.update(b"missing")
+            continue
+        if stat.st_size >= _HASH_LIMIT:
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        else:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def write_snapshot(path: str, cards: Dict[str, CardData], fingerprint: str) -> None:
+    """Serialize cards to a snapshot file (atomically replaces any old one)."""
+    index: Dict[str, Tuple[int, int]] = {}
+    chunks = []
+    offset = 0
+    for card_id, data in cards.items():
+        record = pickle.dumps(data.to_record(), pickle.HIGHEST_PROTOCOL)
+        index[card_id] = (offset, len(record))
+        chunks.append(record)
+        offset += len(record)
+
+    header = pickle.dumps({
+        "fingerprint": fingerprint,
+        "index": index,
+        "catalog": CardCatalog.from_cards(cards).to_columns(),
+    }, pickle.HIGHEST_PROTOCOL)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, len(header)))
+        f.write(header)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+
+class CardSnapshot:
+    """Read-only view over a snapshot file."""
+
+    def __init__(self, buffer: mmap.mmap, base: int, index: Dict[str, Tuple[int, int]],
+                 catalog: Optional[dict] = None):
+        self._buffer = buffer
+        self._base = base
+        self.index = index
+        self.catalog_columns = catalog
+
+    @classmethod
+    def open(cls, path: str, fingerprint: str) -> Optional[CardSnapshot]:
+        """Map a snapshot, or return None if it is missing, corrupt or stale."""
+        try:
+            with open(path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            magic, version, header_len = _HEADER.unpack_from(buffer, 0)
+            if magic != _MAGIC or version != SNAPSHOT_VERSION:
+                raise ValueError("unknown snapshot format")
+            start = _HEADER.size
+            header = pickle.loads(buffer[start:start + header_len])
+            if header["fingerprint"] != fingerprint:
+                raise ValueError("stale snapshot")
+        except Exception:
+            buffer.close()
+            return None
+        return cls(buffer, start + header_len, header["index"], header.get("catalog"))
+
+    def load(self, card_id: str) -> CardData:
+        """Build the CardData for one card."""
+        offset, length = self.index[card_id]
+        start = self._base + offset
+        return CardData.from_record(pickle.loads(self._buffer[start:start + length]))
+
+
+class LazyCardMap(MutableMapping):
+    """card_id -> CardData mapping that materializes entries on first access."""
+
+    def __init__(self, snapshot: CardSnapshot):
+        self.snapshot = snapshot
+        self._keys: Dict[str, None] = dict.fromkeys(snapshot.index)
+        self._cards: Dict[str, CardData] = {}
+        self._lock = threading.Lock()
+        self.modified = False  # entries were added/replaced/removed after mapping
+
+    def __getitem__(self, card_id: str) -> CardData:
+        data = self._cards.get(card_id)
+        if data is None:
+            if card_id not in self._keys:
+                raise KeyError(card_id)
+            data = self.snapshot.load(card_id)
+            with self._lock:
+                data = self._cards.setdefault(card_id, data)
+        return data
+
+    def get(self, card_id: str, default=None):
+        data = self._cards.get(card_id)
+        if data is not None:
+            return data
+        if card_id in self._keys:
+            return self[card_id]
+        return default
+
+    def __setitem__(self, card_id: str, data: CardData) -> None:
+        self._keys[card_id] = None
+        self._cards[card_id] = data
+        self.modified = True
+
+    def __delitem__(self, card_id: str) -> None:
+        del self._keys[card_id]
+        self._cards.pop(card_id, None)
+        self.modified = True
+
+    def __contains__(self, card_id) -> bool:
+        return card_id in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def materialized(self) -> int:
+        """Number of CardData objects built so far."""
+        return len(self._cards)
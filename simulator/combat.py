@@ -0,0 +1,459 @@
+"""Hearthstone Simulator - Vectorized combat resolver.
+
+Resolves minion attacks on many boards at once with NumPy, for lookahead
+code (lethal checks, trade evaluation, search leaves) that would otherwise
+clone a Game per candidate sequence and call Game.attack.
+
+A CombatBoards batch holds B boards seen from the attacking player: side 0
+is the player whose minions attack, side 1 the opponent. Minions keep the
+slot (board position) they had when the boards were extracted; dead minions
+stay in their slot with alive=False, reborn minions come back in theirs.
+
+Only "vanilla" combat is modelled: keywords (taunt, divine shield, stealth,
+poisonous, windfury, lifesteal, reborn, charge, rush) and hero armor. Boards
+where scripts could react (triggers, auras, secrets, deathrattles, frenzy,
+cleave, ...) are flagged unsupported by from_games, and simulate() resolves
+them through Game.attack on clones instead. find_lethal searches every
+attack order of one board at once (TurnSolver's attack phase); play()
+replays a sequence it found through Game.attack.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .entities import KEYWORD_BITS
+
+SLOTS = 7     # board size
+HERO = SLOTS  # defender index of the enemy hero
+
+# Card mechanics the kernel cannot model (it falls back to Game.attack)
+_SCRIPTED_KEYWORDS = 0
+for _name in ("deathrattle", "frenzy", "overkill", "honorable_kill", "cleave", "enrage",
+              "spellburst", "infuse", "titan", "colossal", "starship", "imbue"):
+    _SCRIPTED_KEYWORDS |= KEYWORD_BITS[_name]
+del _name
+
+# Events whose subscribers could react to an attack, damage or a death
+COMBAT_EVENTS: Tuple[str, ...] = (
+    "on_attack", "on_minion_attack", "on_hero_attack", "on_hero_attacked", "on_after_attack",
+    "on_damage_taken", "on_divine_shield_lost", "on_minion_death", "on_friendly_death",
+    "on_death", "on_hero_death", "on_minion_summon", "on_calculate_attack",
+    "on_calculate_health", "on_calculate_damage",
+)
+
+
+@dataclass
+class CombatBoards:
+    """Board state of B games as (B, 2, SLOTS) arrays, side 0 attacking."""
+    attack: np.ndarray
+    health: np.ndarray
+    alive: np.ndarray
+    divine_shield: np.ndarray
+    poisonous: np.ndarray
+    taunt: np.ndarray
+    stealth: np.ndarray
+    windfury: np.ndarray
+    lifesteal: np.ndarray
+    reborn: np.ndarray
+    attacks_left: np.ndarray   # attacks this minion can still make this turn
+    no_face: np.ndarray        # rush on its first turn: can't attack heroes
+    # Minion a reborn slot comes back as (its card data): attack, charge, rush
+    # and keyword bits (KEYWORD_BITS)
+    base_attack: np.ndarray
+    base_keywords: np.ndarray
+    # Heroes, (B, 2)
+    hero_health: np.ndarray
+    hero_max_health: np.ndarray
+    hero_armor: np.ndarray
+
+    @classmethod
+    def empty(cls, batch: int) -> CombatBoards:
+        arrays = {}
+        for f in fields(cls):
+            shape = (batch, 2) if f.name.startswith("hero_") else (batch, 2, SLOTS)
+            dtype = np.int64 if f.name == "base_keywords" else (
+                np.int32 if f.name in _INT_FIELDS else bool)
+            arrays[f.name] = np.zeros(shape, dtype)
+        return cls(**arrays)
+
+    def __len__(self) -> int:
+        return self.attack.shape[0]
+
+    def copy(self) -> CombatBoards:
+        return CombatBoards(**{f.name: getattr(self, f.name).copy() for f in fields(self)})
+
+    def take(self, index) -> CombatBoards:
+        """Sub-batch (or repeated boards) selected by an index array."""
+        return CombatBoards(**{f.name: getattr(self, f.name)[index] for f in fields(self)})
+
+    def summary(self, i: int) -> CombatSummary:
+        """Heroes and living minions of board i, in board order."""
+        sides = []
+        for side in range(2):
+            minions = tuple(
+                (int(self.attack[i, side, s]), int(self.health[i, side, s]), bool(self.divine_shield[i, side, s]))
+                for s in range(SLOTS) if self.alive[i, side, s]
+            )
+            sides.append((int(self.hero_health[i, side]), int(self.hero_armor[i, side]), minions))
+        return CombatSummary(*sides)
+
+
+_INT_FIELDS = frozenset({"attack", "health", "attacks_left", "base_attack",
+                         "hero_health", "hero_max_health", "hero_armor"})
+
+
+class CombatSummary(NamedTuple):
+    """(hero health, hero armor, ((attack, health, divine shield), ...)) per side."""
+    friendly: Tuple[int, int, Tuple[Tuple[int, int, bool], ...]]
+    enemy: Tuple[int, int, Tuple[Tuple[int, int, bool], ...]]
+
+
+def _max_attacks(minion) -> int:
+    if minion.data.mega_windfury:
+        return 4
+    return 2 if minion.windfury else 1
+
+
+def _attacks_left(minion) -> int:
+    """Attacks the minion can still make, mirroring Card.can_attack."""
+    if minion.cant_attack or minion.frozen or minion.dormant > 0:
+        return 0
+    if minion.exhausted and not minion.charge and not minion.rush:
+        return 0
+    return max(0, _max_attacks(minion) - minion.attacks_this_turn)
+
+
+def supports(game, player=None) -> bool:
+    """Whether attacks by player (default: current player) can be resolved by the kernel."""
+    player = player or game.current_player
+    if game._auras or any(game._triggers.get(event) for event in COMBAT_EVENTS):
+        return False
+    for side in (player, player.opponent):
+        hero = side.hero
+        if hero is None or hero.immune or side.secrets or len(side.board) > SLOTS:
+            return False
+        for minion in side.board:
+            data = minion.data
+            if (data.keywords & _SCRIPTED_KEYWORDS or game._trigger_handles.get(minion.entity_id)
+                    or minion.dormant > 0 or minion.immune or minion._hallucination
+                    or getattr(data, "forgetful", False) or data.effects.deathrattle is not None):
+                return False
+    return True
+
+
+def from_games(games: Sequence, players: Optional[Sequence] = None) -> Tuple[CombatBoards, np.ndarray]:
+    """Extract the boards of games (attacking: players, default current players).
+
+    Returns the batch and a (B,) bool mask of the boards the kernel supports;
+    the others are left empty and must go through Game.attack.
+    """
+    boards = CombatBoards.empty(len(games))
+    supported = np.zeros(len(games), bool)
+    for i, game in enumerate(games):
+        player = players[i] if players is not None else game.current_player
+        if not supports(game, player):
+            continue
+        supported[i] = True
+        for side, owner in enumerate((player, player.opponent)):
+            hero = owner.hero
+            boards.hero_health[i, side] = hero.health
+            boards.hero_max_health[i, side] = hero.max_health
+            boards.hero_armor[i, side] = hero.armor
+            for slot, minion in enumerate(owner.board):
+                boards.attack[i, side, slot] = minion.attack
+                boards.health[i, side, slot] = minion.health
+                boards.alive[i, side, slot] = True
+                boards.divine_shield[i, side, slot] = minion.divine_shield
+                boards.poisonous[i, side, slot] = minion.poisonous
+                boards.taunt[i, side, slot] = minion.taunt
+                boards.stealth[i, side, slot] = minion.stealth
+                boards.windfury[i, side, slot] = minion.windfury
+                boards.lifesteal[i, side, slot] = minion.lifesteal
+                boards.reborn[i, side, slot] = minion.reborn
+                if side == 0:
+                    boards.attacks_left[i, side, slot] = _attacks_left(minion)
+                    boards.no_face[i, side, slot] = minion.rush and minion.exhausted
+                boards.base_attack[i, side, slot] = minion.data.attack
+                boards.base_keywords[i, side, slot] = minion.data.keywords & _BASE_KEYWORDS
+    return boards, supported
+
+
+_KW = {name: KEYWORD_BITS[name] for name in (
+    "taunt", "divine_shield", "charge", "windfury", "stealth", "poisonous",
+    "lifesteal", "rush", "reborn", "mega_windfury")}
+_BASE_KEYWORDS = sum(_KW.values())
+
+
+def _hit_minions(boards: CombatBoards, b: np.ndarray, side: int, slot: np.ndarray,
+                 damage: np.ndarray, poisonous: np.ndarray) -> np.ndarray:
+    """Deal damage to minions (b, side, slot); returns where damage was dealt."""
+    hits = damage > 0
+    shielded = hits & boards.divine_shield[b, side, slot]
+    boards.divine_shield[b[shielded], side, slot[shielded]] = False
+    dealt = hits & ~shielded
+    boards.health[b, side, slot] -= np.where(dealt, damage, 0)
+    # Poisonous destroys: 0 health marks it for the death step
+    poisoned = dealt & poisonous
+    boards.health[b[poisoned], side, slot[poisoned]] = np.minimum(
+        boards.health[b[poisoned], side, slot[poisoned]], 0)
+    return dealt
+
+
+def _heal_heroes(boards: CombatBoards, b: np.ndarray, side: int, amount: np.ndarray) -> None:
+    health = boards.hero_health[b, side] + amount
+    boards.hero_health[b, side] = np.minimum(health, boards.hero_max_health[b, side])
+
+
+def _resolve_deaths(boards: CombatBoards) -> None:
+    dead = boards.alive & (boards.health <= 0)
+    if not dead.any():
+        return
+    back = dead & boards.reborn
+    boards.alive &= ~(dead & ~back)
+    if back.any():
+        # A fresh copy of the card with 1 health and no reborn, summoning sick
+        keywords = boards.base_keywords[back]
+        boards.attack[back] = boards.base_attack[back]
+        boards.health[back] = 1
+        for name in ("divine_shield", "poisonous", "taunt", "stealth", "windfury", "lifesteal"):
+            getattr(boards, name)[back] = keywords & _KW[name] != 0
+        boards.reborn[back] = False
+        charge = keywords & _KW["charge"] != 0
+        rush = keywords & _KW["rush"] != 0
+        max_attacks = np.where(keywords & _KW["mega_windfury"] != 0, 4,
+                               np.where(keywords & _KW["windfury"] != 0, 2, 1))
+        boards.attacks_left[back] = np.where(charge | rush, max_attacks, 0)
+        boards.no_face[back] = rush & ~charge
+
+
+def attack(boards: CombatBoards, attacker, defender) -> np.ndarray:
+    """One attack on every board, in place: side 0 slot attacker hits defender.
+
+    attacker and defender are ints or (B,) int arrays; defender is a slot of
+    side 1 or HERO, and -1 in either skips that board. Deaths (and reborn)
+    are resolved after the attack, as Game.attack does. Returns the (B,) mask
+    of boards where the attack was legal and happened.
+    """
+    n = len(boards)
+    a = np.broadcast_to(np.asarray(attacker, np.int64), (n,))
+    d = np.broadcast_to(np.asarray(defender, np.int64), (n,))
+    b = np.arange(n)
+    a_slot = np.clip(a, 0, SLOTS - 1)
+    d_slot = np.clip(d, 0, SLOTS - 1)
+    at_hero = d == HERO
+
+    # Legality: Card.can_attack and Player.get_valid_attack_targets
+    valid = (a >= 0) & (d >= 0) & boards.alive[b, 0, a_slot] & (boards.attacks_left[b, 0, a_slot] > 0)
+    valid &= boards.attack[b, 0, a_slot] > 0
+    guards = (boards.alive[:, 1] & boards.taunt[:, 1] & ~boards.stealth[:, 1]).any(axis=1)
+    target_ok = np.where(
+        at_hero,
+        ~guards & ~boards.no_face[b, 0, a_slot],
+        boards.alive[b, 1, d_slot] & ~boards.stealth[b, 1, d_slot] & (~guards | boards.taunt[b, 1, d_slot]),
+    )
+    valid &= target_ok
+    valid &= (boards.hero_health > 0).all(axis=1)  # the game is over
+    if not valid.any():
+        return valid
+
+    b, a_slot, d_slot, at_hero = b[valid], a_slot[valid], d_slot[valid], at_hero[valid]
+    boards.stealth[b, 0, a_slot] = False
+    boards.attacks_left[b, 0, a_slot] -= 1
+    power = boards.attack[b, 0, a_slot]
+
+    # Attacker hits the defender
+    hero_b = b[at_hero]
+    if hero_b.size:
+        hit = power[at_hero]
+        absorbed = np.minimum(boards.hero_armor[hero_b, 1], hit)
+        boards.hero_armor[hero_b, 1] -= absorbed
+        boards.hero_health[hero_b, 1] -= hit - absorbed
+    minion_hit = ~at_hero
+    dealt = at_hero.copy()
+    if minion_hit.any():
+        dealt[minion_hit] = _hit_minions(
+            boards, b[minion_hit], 1, d_slot[minion_hit], power[minion_hit],
+            boards.poisonous[b[minion_hit], 0, a_slot[minion_hit]])
+    steal = dealt & boards.lifesteal[b, 0, a_slot]
+    if steal.any():
+        _heal_heroes(boards, b[steal], 0, power[steal])
+
+    # Minions hit back
+    if minion_hit.any():
+        mb, ma, md = b[minion_hit], a_slot[minion_hit], d_slot[minion_hit]
+        back = boards.attack[mb, 1, md]
+        dealt = _hit_minions(boards, mb, 0, ma, back, boards.poisonous[mb, 1, md])
+        steal = dealt & boards.lifesteal[mb, 1, md]
+        if steal.any():
+            _heal_heroes(boards, mb[steal], 1, back[steal])
+
+    _resolve_deaths(boards)
+    return valid
+
+
+def resolve(boards: CombatBoards, sequences) -> np.ndarray:
+    """Play attack sequences, in place.
+
+    sequences is a (B, K, 2) int array of (attacker slot, defender) pairs,
+    padded with -1. Returns the (B, K) mask of attacks that happened.
+    """
+    sequences = np.asarray(sequences, np.int64)
+    done = np.zeros(sequences.shape[:2], bool)
+    for k in range(sequences.shape[1]):
+        done[:, k] = attack(boards, sequences[:, k, 0], sequences[:, k, 1])
+    return done
+
+
+def lethal(boards: CombatBoards) -> np.ndarray:
+    """(B,) mask of boards where the enemy hero is dead."""
+    return boards.hero_health[:, 1] <= 0
+
+
+def face_damage_left(boards: CombatBoards) -> np.ndarray:
+    """(B,) upper bound on the damage side 0's minions can still deal to the enemy hero."""
+    face = boards.alive[:, 0] & ~boards.no_face[:, 0]
+    bound = (np.where(face, boards.attack[:, 0] * boards.attacks_left[:, 0], 0)).sum(axis=1)
+    # A charging minion coming back from reborn attacks again
+    keywords = boards.base_keywords[:, 0]
+    again = boards.alive[:, 0] & boards.reborn[:, 0] & (keywords & _KW["charge"] != 0)
+    attacks = np.where(keywords & _KW["mega_windfury"] != 0, 4,
+                       np.where(keywords & _KW["windfury"] != 0, 2, 1))
+    return bound + np.where(again, boards.base_attack[:, 0] * attacks, 0).sum(axis=1)
+
+
+def _follow(slots: List, board: List) -> List:
+    """Update slot -> minion after an attack: the dead leave their slot,
+    reborn copies (new entities of the same card) take it back."""
+    new = [m for m in board if m not in slots]
+    updated = []
+    for minion in slots:
+        if minion is not None and minion not in board:
+            minion = next((m for m in new if m.card_id == minion.card_id), None)
+            if minion is not None:
+                new.remove(minion)
+        updated.append(minion)
+    return updated
+
+
+def _summarize_game(player) -> CombatSummary:
+    sides = []
+    for owner in (player, player.opponent):
+        hero = owner.hero
+        minions = tuple((m.attack, m.health, m.divine_shield) for m in owner.board)
+        sides.append((hero.health, hero.armor, minions))
+    return CombatSummary(*sides)
+
+
+def simulate(games: Sequence, sequences) -> List[CombatSummary]:
+    """Outcome of an attack sequence per game, for the games' current players.
+
+    Games the kernel supports are resolved together in one batch; the others
+    are cloned and played through Game.attack. The games are not modified.
+    """
+    sequences = np.asarray(sequences, np.int64)
+    boards, supported = from_games(games)
+    results: List[Optional[CombatSummary]] = [None] * len(games)
+    if supported.any():
+        index = np.flatnonzero(supported)
+        batch = boards.take(index)
+        resolve(batch, sequences[index])
+        for row, i in enumerate(index):
+            results[i] = batch.summary(row)
+    for i in np.flatnonzero(~supported):
+        results[i] = simulate_game(games[i], sequences[i])
+    return results
+
+
+def simulate_game(game, sequence) -> CombatSummary:
+    """Outcome of one attack sequence played with Game.attack on a clone.
+
+    sequence holds (attacker slot, defender) pairs as for resolve(); slots
+    refer to the boards of game, and a reborn minion keeps its slot.
+    """
+    clone = game.clone()
+    play(clone, sequence)
+    return _summarize_game(clone.current_player)
+
+
+def play(game, sequence) -> List[Tuple[object, object]]:
+    """Play an attack sequence with Game.attack on game itself, for its current player.
+
+    Slots are read as in simulate_game(). Returns the (attacker, defender)
+    entities of the attacks made, in order.
+    """
+    player = game.current_player
+    friendly, enemy = list(player.board), list(player.opponent.board)
+    made = []
+    for attacker_slot, defender in np.asarray(sequence, np.int64).tolist():
+        if game.ended:
+            break
+        attacker = friendly[attacker_slot] if 0 <= attacker_slot < len(friendly) else None
+        if defender == HERO:
+            target = player.opponent.hero
+        else:
+            target = enemy[defender] if 0 <= defender < len(enemy) else None
+        if attacker is not None and target is not None and game.attack(attacker, target):
+            made.append((attacker, target))
+            friendly = _follow(friendly, player.board)
+            enemy = _follow(enemy, player.opponent.board)
+    return made
+
+
+# Fields an attack can change (the others are fixed per slot)
+_STATE_FIELDS = ("attack", "health", "alive", "divine_shield", "poisonous", "taunt", "stealth",
+                 "windfury", "lifesteal", "reborn", "attacks_left", "no_face",
+                 "hero_health", "hero_armor")
+
+
+def _state_keys(boards: CombatBoards) -> np.ndarray:
+    """One opaque key per board (equal keys: same position), for np.unique."""
+    n = len(boards)
+    rows = np.concatenate([getattr(boards, name).reshape(n, -1).astype(np.int16)
+                           for name in _STATE_FIELDS], axis=1)
+    return np.ascontiguousarray(rows).view(np.dtype((np.void, rows.shape[1] * 2))).ravel()
+
+
+def find_lethal(boards: CombatBoards, i: int = 0, limit: int = 4096,
+                check: Optional[Callable[[], None]] = None) -> Tuple[Optional[np.ndarray], bool]:
+    """Shortest attack sequence that kills the enemy hero on board i, breadth first.
+
+    Each step tries every attacker on every target of every board of the
+    frontier in one attack() call; boards reached by different orders are
+    merged, and boards that can no longer deal enough damage
+    (face_damage_left) are dropped. Returns (sequence, complete): sequence
+    is a (K, 2) array of (attacker slot, defender) pairs or None, and
+    complete is False when a step would have exceeded limit boards, so a
+    lethal sequence may exist anyway. check, if given, is called before
+    each step (e.g. a deadline).
+    """
+    frontier = boards.take(np.array([i]))
+    sequences = np.zeros((1, 0, 2), np.int64)
+    while len(frontier):
+        if check is not None:
+            check()
+        ready = frontier.alive[:, 0] & (frontier.attacks_left[:, 0] > 0) & (frontier.attack[:, 0] > 0)
+        targets = np.concatenate([frontier.alive[:, 1], np.ones((len(frontier), 1), bool)], axis=1)
+        rows, attacker, defender = np.nonzero(ready[:, :, None] & targets[:, None, :])
+        if len(rows) > limit:
+            return None, False
+        children = frontier.take(rows)
+        done = attack(children, attacker, defender)
+        keep = np.flatnonzero(done)
+        children = children.take(keep)
+        step = np.stack([attacker[keep], defender[keep]], axis=1)[:, None, :]
+        sequences = np.concatenate([sequences[rows[keep]], step], axis=1)
+        won = lethal(children)
+        if won.any():
+            return sequences[int(np.argmax(won))], True
+        enemy = children.hero_health[:, 1] + children.hero_armor[:, 1]
+        hopeful = np.flatnonzero(face_damage_left(children) >= enemy)
+        if not len(hopeful):
+            break
+        children, sequences = children.take(hopeful), sequences[hopeful]
+        _, first = np.unique(_state_keys(children), return_index=True)
+        frontier, sequences = children.take(first), sequences[first]
+    return None, True
@@ -1,4 +1,5 @@
 import random
+import numpy as np
 from typing import List, Dict, Optional, Tuple, Any
 from .card_loader import CardDatabase, CardClass, CardType
 
@@ -172,32 +173,21 @@ class DeckGenerator:
     @staticmethod
     def _build_dbf_map():
         """Build the DBF ID to Card ID map."""
-        db = CardDatabase.get_instance()
-        if not db._loaded:
-            db.load()
-        for card in db._cards.values():
-            if hasattr(card, 'dbf_id') and card.dbf_id:
-                DeckGenerator._dbf_map[card.dbf_id] = card.card_id
+        catalog = CardDatabase.catalog()
+        rows = np.flatnonzero(catalog.dbf_id)
+        DeckGenerator._dbf_map.update(zip(catalog.dbf_id[rows].tolist(), catalog.ids(rows)))
 
     @staticmethod
     def get_random_deck(player_class: str = "MAGE", size: int = 30) -> List[str]:
         """Generate a random valid deck for a class."""
-        db = CardDatabase.get_instance()
-        if not db._loaded: db.load()
-            
-        valid_cards = []
-        for card in db._cards.values():
-            if not card.collectible or card.card_type == CardType.HERO: continue
-            is_class = str(card.card_class).upper() == player_class.upper()
-            is_neutral = str(card.card_class).upper() == "NEUTRAL" or "NEUTRAL" in str(card.card_class).upper()
-            
-            if is_class or is_neutral:
-                valid_cards.append(card.card_id)
+        catalog = CardDatabase.catalog()
+        card_class = CardClass.__members__.get(player_class.upper(), CardClass.NEUTRAL)
         
-        if not valid_cards:
-            valid_cards = [c.card_id for c in db._cards.values() if c.collectible and c.card_type != CardType.HERO]
+        valid_rows = catalog.query(collectible=True, exclude_type=CardType.HERO, card_class=card_class)
+        if not len(valid_rows):
+            valid_rows = catalog.query(collectible=True, exclude_type=CardType.HERO)
             
-        return [random.choice(valid_cards) for _ in range(size)] if valid_cards else []
+        return catalog.sample(valid_rows, size)
 
     @staticmethod
     def get_arena_deck() -> Tuple[str, List[str], str]:
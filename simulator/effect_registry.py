@@ -0,0 +1,425 @@
+"""Hearthstone Simulator - Effect Registry.
+
+Maps every card_id to the effect module(s) under card_effects/<set>/ and to
+the handler names those modules define, so handlers can be looked up in O(1)
+instead of probing set folders with importlib on every call.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import importlib
+import importlib.util
+import inspect
+import logging
+import threading
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Dict, List, Optional, Callable, FrozenSet, Iterable, Tuple
+
+from .rng import EFFECT_BUILTINS
+
+logger = logging.getLogger(__name__)
+
+EFFECTS_PACKAGE = "card_effects"
+EFFECTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", EFFECTS_PACKAGE))
+
+# Top-level function definitions in an effect module ("def battlecry(game, ...)")
+_HANDLER_DEF = re.compile(r"^def ([A-Za-z_][A-Za-z0-9_]*)\s*\(", re.MULTILINE)
+
+# Star re-exports ("from ..revendreth.effect_REV_011 import *"): handlers not visible in source
+_STAR_IMPORT = re.compile(r"^\s*from\s+\S+\s+import\s+\*", re.MULTILINE)
+
+# Quoted card IDs in effect source ("CS2_101t", "TOY_330t5"): tokens an effect can create
+_CARD_REF = re.compile(r"[\"']([A-Z][A-Z0-9]*_[A-Za-z0-9_]+)[\"']")
+
+# CardData flags whose behaviour lives entirely in an effect script
+_SCRIPTED_FLAGS: Tuple[str, ...] = (
+    "battlecry", "deathrattle", "secret", "choose_one", "spellburst", "frenzy",
+    "overkill", "inspire", "infuse", "overheal", "honorable_kill", "start_of_game",
+)
+
+# Alternative names generated scripts use for the same slot, in priority order
+_SLOT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "battlecry": ("battlecry", "on_battlecry"),
+    "on_play": ("on_play", "play"),
+    "deathrattle": ("deathrattle", "on_deathrattle", "on_death"),
+}
+
+
+def _adapt(handler: Callable) -> Callable:
+    """Normalize (game, player, card, ...) handlers to the (game, source, ...) convention."""
+    code = getattr(handler, "__code__", None)
+    if code is None or code.co_argcount < 3 or code.co_varnames[1] not in ("player", "owner"):
+        return handler
+
+    def adapted(game, source, *args, **kwargs):
+        return handler(game, source.controller, source, *args, **kwargs)
+
+    adapted.__name__ = handler.__name__
+    adapted.__wrapped__ = handler
+    return adapted
+
+
+def _import_effect_module(module_path: str) -> ModuleType:
+    """Import an effect module with `import random` routed to the game's stream."""
+    module = sys.modules.get(module_path)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(module_path)
+    if spec is None:
+        raise ImportError(f"No module named {module_path!r}")
+    module = importlib.util.module_from_spec(spec)
+    module.__builtins__ = EFFECT_BUILTINS
+    sys.modules[module_path] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_path, None)
+        raise
+    return module
+
+
+class CardEffects:
+    """Handler table for one card definition, shared by all its instances.
+
+    Slots are resolved once per card_id so the engine can call
+    ``card.data.effects.battlecry`` directly. A slot is None when the card
+    has no such handler. Handlers outside the fixed slots (choose_one_0,
+    titan_ability_1, ...) are available through get().
+    """
+
+    SLOTS: Tuple[str, ...] = (
+        "setup",
+        "battlecry",
+        "on_play",
+        "deathrattle",
+        "get_cost_modifier",
+        "on_frenzy",
+        "on_spellburst",
+        "on_overkill",
+        "on_honorable_kill",
+        "on_infuse",
+        "on_overheal",
+        "on_awake",
+        "on_inspire",
+        "on_equip",
+        "on_start_of_game",
+        # Secret triggers
+        "on_attack",
+        "on_spell_cast",
+        "on_minion_played",
+        "on_hero_attacked",
+    )
+
+    __slots__ = SLOTS + ("card_id", "has_handlers")
+
+    def __init__(self, card_id: str, handlers: Dict[str, Callable]):
+        self.card_id = card_id
+        self.has_handlers = bool(handlers)
+        for name in self.SLOTS:
+            setattr(self, name, handlers.get(name))
+
+    def get(self, handler_name: str) -> Optional[Callable]:
+        """Look up any handler by name, including ones without a slot."""
+        if handler_name in self.SLOTS:
+            return getattr(self, handler_name)
+        return EffectRegistry.get_handler(self.card_id, handler_name)
+
+    def __repr__(self) -> str:
+        bound = [name for name in self.SLOTS if getattr(self, name) is not None]
+        return f"<CardEffects {self.card_id} {bound}>"
+
+
+@dataclass(frozen=True)
+class PreloadReport:
+    """Result of resolving every effect a set of cards can reach."""
+    card_ids: FrozenSet[str]        # requested cards plus every token/related card reached
+    unbound: Tuple[str, ...]        # cards with scripted mechanics but no effect module
+    failed: Tuple[str, ...]         # cards whose effect module raised on import
+
+    @property
+    def ok(self) -> bool:
+        return not self.unbound and not self.failed
+
+
+def _related_ids(data) -> List[str]:
+    """Cards a definition can turn into or create (appendages, titan abilities, ...)."""
+    related = list(data.colossal_appendages) + list(data.titan_abilities) + list(data.choose_options)
+    if data.forged_version:
+        related.append(data.forged_version)
+    if data.corrupted_version:
+        related.append(data.corrupted_version)
+    return related
+
+
+class EffectRegistry:
+    """Index of card effect modules, built once per process.
+
+    The filesystem is scanned once; handler names are read from the source
+    text so nothing is imported until a handler is actually requested (modules
+    that re-export with ``import *`` are imported to list their handlers).
+    Module imports and handler lookups (including misses) are cached.
+    """
+
+    _folders: Dict[str, List[str]] = {}                  # card_id -> set folders providing an effect file
+    _resolved: Dict[str, Tuple[str, ...]] = {}           # card_id -> module paths in lookup order
+    _handlers: Dict[str, Dict[str, str]] = {}            # card_id -> {handler name: module path}
+    _modules: Dict[str, Optional[ModuleType]] = {}       # module path -> module (None if import failed)
+    _handler_cache: Dict[Tuple[str, str], Optional[Callable]] = {}
+    _source_names: Dict[str, FrozenSet[str]] = {}        # module path -> handler names defined in source
+    _import_names: FrozenSet[str] = frozenset()         # module paths whose handlers are read after import
+    _bound: Dict[str, CardEffects] = {}                  # card_id -> shared handler table
+    _card_refs: Dict[str, FrozenSet[str]] = {}           # module path -> quoted card IDs in source
+    _preloaded: Dict[FrozenSet[str], PreloadReport] = {} # requested card IDs -> report
+    _built: bool = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def build(cls, root: Optional[str] = None) -> None:
+        """Scan card_effects/ and index every effect module and its handlers."""
+        with cls._lock:
+            if cls._built:
+                return
+            root = root or EFFECTS_ROOT
+            folders: Dict[str, List[str]] = {}
+            source_names: Dict[str, FrozenSet[str]] = {}
+            import_names = set()
+            card_refs: Dict[str, FrozenSet[str]] = {}
+
+            if os.path.isdir(root):
+                for set_entry in sorted(os.scandir(root), key=lambda e: e.name):
+                    if not set_entry.is_dir() or set_entry.name.startswith(("_", ".")):
+                        continue
+                    for entry in os.scandir(set_entry.path):
+                        name = entry.name
+                        if not (name.startswith("effect_") and name.endswith(".py")):
+                            continue
+                        card_id = name[len("effect_"):-len(".py")]
+                        module_path = f"{EFFECTS_PACKAGE}.{set_entry.name}.{name[:-3]}"
+                        try:
+                            with open(entry.path, "r", encoding="utf-8") as f:
+                                source = f.read()
+                        except (OSError, UnicodeDecodeError):
+                            continue
+                        folders.setdefault(card_id, []).append(set_entry.name)
+                        source_names[module_path] = frozenset(_HANDLER_DEF.findall(source))
+                        if not source_names[module_path] or _STAR_IMPORT.search(source):
+                            import_names.add(module_path)
+                        refs = _CARD_REF.findall(source)
+                        if refs:
+                            card_refs[module_path] = frozenset(refs)
+
+            cls._folders = folders
+            cls._source_names = source_names
+            cls._import_names = frozenset(import_names)
+            cls._card_refs = card_refs
+            cls._resolved = {}
+            cls._handlers = {}
+            cls._handler_cache = {}
+            cls._bound = {}
+            cls._preloaded = {}
+            cls._built = True
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget the index (used by tools after generating new effect files)."""
+        with cls._lock:
+            cls._folders = {}
+            cls._resolved = {}
+            cls._handlers = {}
+            cls._modules = {}
+            cls._handler_cache = {}
+            cls._source_names = {}
+            cls._import_names = frozenset()
+            cls._card_refs = {}
+            cls._bound = {}
+            cls._preloaded = {}
+            cls._built = False
+
+    @classmethod
+    def _resolve(cls, card_id: str, card_set: Optional[str] = None) -> Tuple[str, ...]:
+        """Module paths for a card, the one matching its card set first."""
+        resolved = cls._resolved.get(card_id)
+        if resolved is not None:
+            return resolved
+        if not cls._built:
+            cls.build()
+
+        folders = cls._folders.get(card_id)
+        if not folders:
+            cls._resolved[card_id] = ()
+            cls._handlers[card_id] = {}
+            return ()
+
+        if card_set is None:
+            from .card_loader import CardDatabase
+            data = CardDatabase._cards.get(card_id)
+            card_set = data.card_set if data else None
+        preferred = card_set.lower().replace(" ", "_") if card_set else None
+
+        ordered = sorted(folders, key=lambda folder: folder != preferred)
+        modules = tuple(f"{EFFECTS_PACKAGE}.{folder}.effect_{card_id}" for folder in ordered)
+
+        # First module in lookup order that defines a handler wins
+        handlers: Dict[str, str] = {}
+        for module_path in modules:
+            for handler_name in cls._module_names(module_path):
+                handlers.setdefault(handler_name, module_path)
+
+        cls._resolved[card_id] = modules
+        cls._handlers[card_id] = handlers
+        return modules
+
+    @classmethod
+    def _module_names(cls, module_path: str) -> FrozenSet[str]:
+        """Handler names of a module: from its source, or from the module itself when
+        the source cannot tell (star imports, nothing defined at top level)."""
+        names = cls._source_names.get(module_path, frozenset())
+        if module_path in cls._import_names:
+            module = cls._import(module_path)
+            if module is not None:
+                names = names | frozenset(
+                    name for name, value in vars(module).items()
+                    if not name.startswith("_") and inspect.isfunction(value))
+        return names
+
+    @classmethod
+    def _import(cls, module_path: str) -> Optional[ModuleType]:
+        if module_path in cls._modules:
+            return cls._modules[module_path]
+        try:
+            module = _import_effect_module(module_path)
+        except Exception as e:
+            logger.debug("Failed to import effect module %s: %s", module_path, e)
+            module = None
+        cls._modules[module_path] = module
+        return module
+
+    @classmethod
+    def has_effect(cls, card_id: str) -> bool:
+        """Whether any effect module exists for this card."""
+        return bool(cls._resolve(card_id))
+
+    @classmethod
+    def handler_names(cls, card_id: str) -> FrozenSet[str]:
+        """Names of all handlers defined for this card."""
+        cls._resolve(card_id)
+        return frozenset(cls._handlers.get(card_id, ()))
+
+    @classmethod
+    def get_module(cls, card_id: str, card_set: Optional[str] = None) -> Optional[ModuleType]:
+        """Primary effect module for a card, or None."""
+        modules = cls._resolve(card_id, card_set)
+        return cls._import(modules[0]) if modules else None
+
+    @classmethod
+    def get_handler(cls, card_id: str, handler_name: str) -> Optional[Callable]:
+        """Look up an effect handler (battlecry, on_frenzy, ...) for a card."""
+        key = (card_id, handler_name)
+        try:
+            return cls._handler_cache[key]
+        except KeyError:
+            pass
+
+        handler = None
+        cls._resolve(card_id)
+        module_path = cls._handlers[card_id].get(handler_name)
+        if module_path:
+            module = cls._import(module_path)
+            handler = getattr(module, handler_name, None) if module else None
+        cls._handler_cache[key] = handler
+        return handler
+
+    @classmethod
+    def bind(cls, card_id: str, card_set: Optional[str] = None) -> CardEffects:
+        """Resolve the shared handler table for a card definition."""
+        effects = cls._bound.get(card_id)
+        if effects is not None:
+            return effects
+
+        cls._resolve(card_id, card_set)
+        handlers: Dict[str, Callable] = {}
+        if cls._handlers[card_id]:
+            for slot in CardEffects.SLOTS:
+                for name in _SLOT_ALIASES.get(slot, (slot,)):
+                    handler = cls.get_handler(card_id, name)
+                    if handler is not None:
+                        handlers[slot] = _adapt(handler) if slot in _SLOT_ALIASES else handler
+                        break
+
+        effects = CardEffects(card_id, handlers)
+        cls._bound[card_id] = effects
+        return effects
+
+    @classmethod
+    def preload(cls, card_ids: Iterable[str], strict: bool = False) -> PreloadReport:
+        """Import and bind every effect the given cards can reach.
+
+        Follows related cards from CardData (colossal appendages, titan
+        abilities, choose-one options, forged/corrupted versions) and card IDs
+        referenced by the effect scripts themselves, so nothing is imported
+        once the game is running. Results are cached per set of card IDs.
+        With strict=True, cards whose effects could not be bound are logged
+        as warnings (the report lists them either way).
+        """
+        key = frozenset(card_ids)
+        report = cls._preloaded.get(key)
+        if report is None:
+            report = cls._preload(key)
+            cls._preloaded[key] = report
+
+        if strict and not report.ok:
+            for card_id in report.failed:
+                logger.warning("Effect module failed to import: %s", card_id)
+            for card_id in report.unbound:
+                logger.warning("No effect script for: %s", card_id)
+            logger.warning("Preload: %d failed, %d unbound of %d cards",
+                           len(report.failed), len(report.unbound), len(report.card_ids))
+        return report
+
+    @classmethod
+    def _preload(cls, card_ids: FrozenSet[str]) -> PreloadReport:
+        from .card_loader import CardDatabase
+        cards = CardDatabase._cards
+
+        seen = set()
+        pending = list(card_ids)
+        unbound: List[str] = []
+        failed: List[str] = []
+
+        while pending:
+            card_id = pending.pop()
+            if card_id in seen:
+                continue
+            seen.add(card_id)
+
+            data = cards.get(card_id)
+            if data is not None:
+                pending.extend(_related_ids(data))
+
+            modules = cls._resolve(card_id, data.card_set if data else None)
+            if not modules:
+                if data is not None and any(getattr(data, flag) for flag in _SCRIPTED_FLAGS):
+                    unbound.append(card_id)
+                continue
+
+            if any(cls._import(module_path) is None for module_path in modules):
+                failed.append(card_id)
+            for handler_name in cls._handlers[card_id]:
+                cls.get_handler(card_id, handler_name)
+            cls.bind(card_id, data.card_set if data else None)
+
+            for module_path in modules:
+                pending.extend(ref for ref in cls._card_refs.get(module_path, ()) if ref in cards)
+
+        return PreloadReport(frozenset(seen), tuple(sorted(unbound)), tuple(sorted(failed)))
+
+    @classmethod
+    def count(cls) -> int:
+        """Number of cards with at least one effect module."""
+        if not cls._built:
+            cls.build()
+        return len(cls._folders)
@@ -5,8 +5,10 @@ Defines all game entities: Cards, Minions, Heroes, Weapons, etc.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING
+import threading
+from sys import intern
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Callable, Iterable, Mapping, Tuple, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 from .enums import Zone, CardType, CardClass, Rarity, Race, SpellSchool, GameTag
@@ -14,138 +16,442 @@ from .enums import Zone, CardType, CardClass, Rarity, Race, SpellSchool, GameTag
 if TYPE_CHECKING:
     from .game import Game
     from .player import Player
+    from .effect_registry import CardEffects
 
 
-@dataclass
-class CardData:
-    """Static card data loaded from CardDefs."""
-    card_id: str
-    dbf_id: int = 0
-    name: str = ""
-    text: str = ""
-    card_set: str = "UNKNOWN"
-    cost: int = 0
-    attack: int = 0
-    health: int = 0
-    armor: int = 0
-    durability: int = 0
-    card_type: CardType = CardType.INVALID
-    card_class: CardClass = CardClass.NEUTRAL
-    rarity: Rarity = Rarity.FREE
-    race: Race = Race.INVALID
-    spell_school: SpellSchool = SpellSchool.NONE
-    collectible: bool = False
-    
-    # Keywords (boolean flags)
-    taunt: bool = False
-    divine_shield: bool = False
-    charge: bool = False
-    windfury: bool = False
-    stealth: bool = False
-    poisonous: bool = False
-    lifesteal: bool = False
-    rush: bool = False
-    reborn: bool = False
-    battlecry: bool = False
-    deathrattle: bool = False
-    secret: bool = False
-    discover: bool = False
-    outcast: bool = False
-    cleave: bool = False
-    
-    # New mechanics (2020+)
+# Boolean card mechanics, in bit order for CardData.keywords (64 bits max)
+CARD_KEYWORDS: Tuple[str, ...] = (
+    # Keywords
+    "taunt", "divine_shield", "charge", "windfury", "stealth", "poisonous",
+    "lifesteal", "rush", "reborn", "battlecry", "deathrattle", "secret",
+    "discover", "outcast", "cleave",
     # Expansion specific flags
-    magnetic: bool = False          # Can merge with Mech
-    colossal: bool = False          # Has Colossal mechanic
-    colossal_count: int = 0         # Colossal +X appendages
-    colossal_appendages: List[str] = field(default_factory=list)  # IDs of appendage cards
-    titan: bool = False             # Has 3 titan abilities
-    titan_abilities: List[str] = field(default_factory=list)  # IDs of titan abilities
-    forge: bool = False             # Can be forged in hand
-    forged_version: str = ""        # ID of forged card
-    infuse: bool = False            # Upgrades after X friendly minions die
-    infuse_cost: int = 0            # Number of deaths needed
-    spellburst: bool = False        # Trigger once after casting spell
-    frenzy: bool = False            # Trigger once when damaged
-    tradeable: bool = False         # Can swap for card from deck
-    magnetic: bool = False          # Can merge with Mech
-    manathirst: int = 0             # Bonus if you have X+ mana
-    corpse_cost: int = 0            # Corpse cost for Death Knight
-    
+    "magnetic",         # Can merge with Mech
+    "colossal",         # Has Colossal mechanic
+    "titan",            # Has 3 titan abilities
+    "forge",            # Can be forged in hand
+    "infuse",           # Upgrades after X friendly minions die
+    "spellburst",       # Trigger once after casting spell
+    "frenzy",           # Trigger once when damaged
+    "tradeable",        # Can swap for card from deck
     # Classic expansion mechanics
-    echo: bool = False              # Can play again this turn (Witchwood)
-    inspire: bool = False           # After using Hero Power (TGT)
-    overkill: bool = False          # When dealing excess damage (Rastakhan)
-    recruit: bool = False           # Summon from deck (K&C)
-    recruit_cost: int = -1          # Max cost for recruit (-1 = any)
-    joust: bool = False             # Compare card costs (TGT)
-    adapt: bool = False             # Choose 1 of 3 buffs (Ungoro)
-    start_of_game: bool = False     # Effect at game start (Karazhan+)
-    omega: bool = False             # Bonus at 10 mana crystals (Boomsday)
-    
+    "echo",             # Can play again this turn (Witchwood)
+    "inspire",          # After using Hero Power (TGT)
+    "overkill",         # When dealing excess damage (Rastakhan)
+    "recruit",          # Summon from deck (K&C)
+    "joust",            # Compare card costs (TGT)
+    "adapt",            # Choose 1 of 3 buffs (Ungoro)
+    "start_of_game",    # Effect at game start (Karazhan+)
+    "omega",            # Bonus at 10 mana crystals (Boomsday)
     # More expansion mechanics
-    corrupt: bool = False           # Upgrade when higher cost card played (Darkmoon)
-    corrupted_version: str = ""     # Card ID of corrupted version
-    dredge: bool = False            # Look at bottom 3, put 1 on top (Sunken)
-    honorable_kill: bool = False    # Bonus if exact lethal damage (Alterac)
-    finale: bool = False            # Bonus if spends all remaining mana (Festival)
-    enrage: bool = False            # Bonus while damaged (Classic)
-    choose_one: bool = False        # Choose between effects (Druid)
-    choose_options: List[str] = field(default_factory=list)  # IDs of choose options
-    excavate: bool = False          # Excavate counter mechanic (Badlands)
-    elusive: bool = False           # Can't be targeted by spells/powers
-    counter: bool = False           # Card is countered (no effect)
-    
+    "corrupt",          # Upgrade when higher cost card played (Darkmoon)
+    "dredge",           # Look at bottom 3, put 1 on top (Sunken)
+    "honorable_kill",   # Bonus if exact lethal damage (Alterac)
+    "finale",           # Bonus if spends all remaining mana (Festival)
+    "enrage",           # Bonus while damaged (Classic)
+    "choose_one",       # Choose between effects (Druid)
+    "excavate",         # Excavate counter mechanic (Badlands)
+    "elusive",          # Can't be targeted by spells/powers
     # Latest expansion mechanics
-    dark_gift: bool = False         # Apply bonus to Discovered minions (Emerald Dream)
-    tourist: bool = False           # Allows including cards from another class (Perils)
-    tourist_class: str = ""         # Which class this tourist allows
-    drink: bool = False             # Spell with 3 uses (Perils)
-    drink_uses: int = 3             # Remaining uses for drink
-    
+    "dark_gift",        # Apply bonus to Discovered minions (Emerald Dream)
+    "tourist",          # Allows including cards from another class (Perils)
+    "drink",            # Spell with 3 uses (Perils)
     # More mechanics
-    twinspell: bool = False         # Cast twice (Rise of Shadows)
-    mega_windfury: bool = False     # Attack 4 times
-    miniaturize: bool = False       # Get 1/1 copy (Whizbang)
-    overheal: bool = False          # Bonus if heal past full (Festival)
-    quickdraw: bool = False         # Draw bonus (Badlands)
-    starship: bool = False          # Starship main (Great Dark Beyond)
-    starship_piece: bool = False    # Starship component
-    lackey: bool = False            # 1-cost battlecry token
-    invoke: bool = False            # Galakrond power (Descent)
-    sidequest: bool = False         # Small quest (Descent)
-    questline: bool = False         # 3-step quest (Stormwind)
-    questline_step: int = 0         # Current step (0-3)
-    overload_value: int = 0         # Overload amount
-    imbue: bool = False             # New mechanic
-    kindred: bool = False           # Type synergy
-    mini: bool = False              # Mini version
-    fabled: bool = False            # Fabled trait
-    rewind: bool = False            # Rewind mechanic
-    temporary: bool = False         # Temporary card
-    
+    "twinspell",        # Cast twice (Rise of Shadows)
+    "mega_windfury",    # Attack 4 times
+    "miniaturize",      # Get 1/1 copy (Whizbang)
+    "overheal",         # Bonus if heal past full (Festival)
+    "quickdraw",        # Draw bonus (Badlands)
+    "starship",         # Starship main (Great Dark Beyond)
+    "lackey",           # 1-cost battlecry token
+    "invoke",           # Galakrond power (Descent)
+    "sidequest",        # Small quest (Descent)
+    "questline",        # 3-step quest (Stormwind)
+    "imbue",
+    "kindred",          # Type synergy
+    "combo",            # If card played this turn (Rogue)
+    "temporary",        # Temporary card
+    "counter",          # Card is countered (no effect)
+    "starship_piece",   # Starship component
+    "mini",             # Mini version
+    "fabled",           # Fabled trait
+    "rewind",           # Rewind mechanic
     # Synergy trackers
-    elemental_synergy: bool = False  # If played elemental last turn (Ungoro)
-    dragon_synergy: bool = False     # If holding a dragon (BRM)
-    highlander: bool = False         # If no duplicates in deck (LoE)
-    combo: bool = False              # If card played this turn (Rogue)
+    "elemental_synergy",  # If played elemental last turn (Ungoro)
+    "dragon_synergy",     # If holding a dragon (BRM)
+    "highlander",         # If no duplicates in deck (LoE)
+)
+
+KEYWORD_BITS: Dict[str, int] = {name: 1 << i for i, name in enumerate(CARD_KEYWORDS)}
+
+_EMPTY_TAGS: Mapping[int, int] = MappingProxyType({})
+_shared_tags: Dict[Tuple[Tuple[int, int], ...], Mapping[int, int]] = {}
+
+
+def _share_tags(tags: Optional[Mapping[int, int]]) -> Mapping[int, int]:
+    """Read-only tag mapping, one object per distinct tag set."""
+    if not tags:
+        return _EMPTY_TAGS
+    key = tuple(sorted(tags.items()))
+    shared = _shared_tags.get(key)
+    if shared is None:
+        shared = _shared_tags[key] = MappingProxyType(dict(key))
+    return shared
+
+
+def _intern(value: str) -> str:
+    return intern(value) if value else ""
+
+
+class CardData:
+    """Static card data loaded from CardDefs.
+    
+    Immutable and slotted. Boolean mechanics live in the ``keywords`` bitmask
+    (see CARD_KEYWORDS) and are readable under their usual names
+    (``data.taunt``); strings are interned, list fields are tuples and tag
+    mappings are shared, so thousands of definitions stay small. Use
+    replace() to derive a modified copy.
+    """
+    
+    # Stored fields, in constructor/serialization order
+    FIELDS: Tuple[str, ...] = (
+        "card_id", "dbf_id", "name", "text", "card_set", "cost", "attack", "health",
+        "armor", "durability", "card_type", "card_class", "rarity", "race", "spell_school",
+        "collectible", "keywords",
+        "colossal_count",       # Colossal +X appendages
+        "colossal_appendages",  # IDs of appendage cards
+        "titan_abilities",      # IDs of titan abilities
+        "forged_version",       # ID of forged card
+        "infuse_cost",          # Number of deaths needed
+        "manathirst",           # Bonus if you have X+ mana
+        "corpse_cost",          # Corpse cost for Death Knight
+        "recruit_cost",         # Max cost for recruit (-1 = any)
+        "corrupted_version",    # Card ID of corrupted version
+        "choose_options",       # IDs of choose options
+        "tourist_class",        # Which class this tourist allows
+        "drink_uses",           # Remaining uses for drink
+        "questline_step",       # Current step (0-3)
+        "overload_value",       # Overload amount
+        "tags",                 # Extra data
+    )
+    
+    __slots__ = FIELDS + ("_effects",)
+    
+    def __init__(
+        self,
+        card_id: str,
+        dbf_id: int = 0,
+        name: str = "",
+        text: str = "",
+        card_set: str = "UNKNOWN",
+        cost: int = 0,
+        attack: int = 0,
+        health: int = 0,
+        armor: int = 0,
+        durability: int = 0,
+        card_type: CardType = CardType.INVALID,
+        card_class: CardClass = CardClass.NEUTRAL,
+        rarity: Rarity = Rarity.FREE,
+        race: Race = Race.INVALID,
+        spell_school: SpellSchool = SpellSchool.NONE,
+        collectible: bool = False,
+        keywords: int = 0,
+        colossal_count: int = 0,
+        colossal_appendages: Iterable[str] = (),
+        titan_abilities: Iterable[str] = (),
+        forged_version: str = "",
+        infuse_cost: int = 0,
+        manathirst: int = 0,
+        corpse_cost: int = 0,
+        recruit_cost: int = -1,
+        corrupted_version: str = "",
+        choose_options: Iterable[str] = (),
+        tourist_class: str = "",
+        drink_uses: int = 3,
+        questline_step: int = 0,
+        overload_value: int = 0,
+        tags: Optional[Mapping[int, int]] = None,
+        **flags: bool,
+    ):
+        for flag, value in flags.items():
+            bit = KEYWORD_BITS.get(flag)
+            if bit is None:
+                raise TypeError(f"CardData() got an unexpected keyword argument '{flag}'")
+            if value:
+                keywords |= bit
+            else:
+                keywords &= ~bit
+        
+        init = object.__setattr__
+        init(self, "card_id", _intern(card_id))
+        init(self, "dbf_id", dbf_id)
+        init(self, "name", _intern(name))
+        init(self, "text", _intern(text))
+        init(self, "card_set", _intern(card_set))
+        init(self, "cost", cost)
+        init(self, "attack", attack)
+        init(self, "health", health)
+        init(self, "armor", armor)
+        init(self, "durability", durability)
+        init(self, "card_type", card_type)
+        init(self, "card_class", card_class)
+        init(self, "rarity", rarity)
+        init(self, "race", race)
+        init(self, "spell_school", spell_school)
+        init(self, "collectible", bool(collectible))
+        init(self, "keywords", keywords)
+        init(self, "colossal_count", colossal_count)
+        init(self, "colossal_appendages", tuple(_intern(c) for c in colossal_appendages))
+        init(self, "titan_abilities", tuple(_intern(c) for c in titan_abilities))
+        init(self, "forged_version", _intern(forged_version))
+        init(self, "infuse_cost", infuse_cost)
+        init(self, "manathirst", manathirst)
+        init(self, "corpse_cost", corpse_cost)
+        init(self, "recruit_cost", recruit_cost)
+        init(self, "corrupted_version", _intern(corrupted_version))
+        init(self, "choose_options", tuple(_intern(c) for c in choose_options))
+        init(self, "tourist_class", _intern(tourist_class))
+        init(self, "drink_uses", drink_uses)
+        init(self, "questline_step", questline_step)
+        init(self, "overload_value", overload_value)
+        init(self, "tags", _share_tags(tags))
+        init(self, "_effects", None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"CardData is immutable (use replace() to change '{name}')")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("CardData is immutable")
+    
+    def replace(self, **changes: Any) -> CardData:
+        """Copy with some fields or keyword flags changed."""
+        values = {name: getattr(self, name) for name in self.FIELDS}
+        values.update(changes)
+        return CardData(**values)
+    
+    def to_record(self) -> tuple:
+        """Field values in FIELDS order (tags as a plain dict), for serialization."""
+        return tuple(dict(self.tags) if name == "tags" else getattr(self, name) for name in self.FIELDS)
+    
+    @classmethod
+    def from_record(cls, record: tuple) -> CardData:
+        return cls(*record)
+    
+    def __reduce__(self):
+        return (self.__class__.from_record, (self.to_record(),))
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+    
+    def __hash__(self) -> int:
+        return hash((self.card_id, self.dbf_id, self.name, self.keywords))
+    
+    def __repr__(self) -> str:
+        flags = [name for name, bit in KEYWORD_BITS.items() if self.keywords & bit]
+        return (f"CardData(card_id={self.card_id!r}, name={self.name!r}, cost={self.cost}, "
+                f"attack={self.attack}, health={self.health}, card_type={self.card_type!r}, "
+                f"keywords={flags})")
     
-    # Extra data
-    tags: Dict[int, int] = field(default_factory=dict)
+    def has_keywords(self, mask: int) -> bool:
+        """Whether every keyword bit in mask is set."""
+        return self.keywords & mask == mask
+    
+    @property
+    def effects(self) -> CardEffects:
+        """Effect handlers for this card (battlecry, deathrattle, ...)."""
+        effects = self._effects
+        if effects is None:
+            from .effect_registry import EffectRegistry
+            effects = EffectRegistry.bind(self.card_id, self.card_set)
+            object.__setattr__(self, "_effects", effects)
+        return effects
+
+
+def _keyword_property(bit: int) -> property:
+    return property(lambda self: self.keywords & bit != 0)
+
+
+for _name, _bit in KEYWORD_BITS.items():
+    setattr(CardData, _name, _keyword_property(_bit))
+del _name, _bit
+
+
+_TAUNT = KEYWORD_BITS["taunt"]
+_DIVINE_SHIELD = KEYWORD_BITS["divine_shield"]
+_CHARGE = KEYWORD_BITS["charge"]
+_WINDFURY = KEYWORD_BITS["windfury"]
+_STEALTH = KEYWORD_BITS["stealth"]
+_POISONOUS = KEYWORD_BITS["poisonous"]
+_LIFESTEAL = KEYWORD_BITS["lifesteal"]
+_RUSH = KEYWORD_BITS["rush"]
+_REBORN = KEYWORD_BITS["reborn"]
+
+# Keywords cleared by silence
+_SILENCED_KEYWORDS = _TAUNT | _DIVINE_SHIELD | _WINDFURY | _STEALTH | _POISONOUS | _LIFESTEAL
+
+# Keywords with per-card state (the rest are only read from CardData)
+CARD_STATE_KEYWORDS: Tuple[str, ...] = (
+    "taunt", "divine_shield", "charge", "windfury", "stealth",
+    "poisonous", "lifesteal", "rush", "reborn",
+)
+
+# Effect-specific card state, name -> default. Only stored once set (Card._ext),
+# so most cards carry none of it. New effect state must be declared here.
+EXTENSION_STATE: Dict[str, Any] = {
+    "turn_added_to_hand": -1,          # Quickdraw: turn the card entered the hand
+    "mini": False,                     # Mini copy of a Mini card
+    "duration": 0,                     # Turns left on a timed aura (TTN_908)
+    "elusive": False,                  # Can't be targeted by spells or hero powers
+    "is_temporary": False,             # Discarded at end of turn
+    "zilliax_modules": None,           # Module card IDs merged into Zilliax
+    "_echo_copy": False,               # Echo copy, removed at end of turn
+    "_corrupted": False,               # Already upgraded by Corrupt
+    "_forged": False,
+    "_is_twinspell_copy": False,
+    "_quickdraw_active": False,        # Set while the card's effect resolves
+    "_outcast_active": False,
+    "_finale_active": False,
+    "_ebb_active": False,
+    "_hallucination": False,
+    "_double_battlecry": False,        # Dark Gift: battlecry triggers twice
+    "_dark_gift_name": None,
+    "_dark_gift_deathrattle": None,    # Dark Gift deathrattle kind ("draw", ...)
+    "_deios_cleanup": None,            # Callback removing Chrono-Lord Deios' aura
+}
+
+
+# Zones from which an entity's triggers receive game events
+LIVE_ZONES = frozenset({Zone.PLAY, Zone.HAND})
+
+
+# Card attributes caching the aura bonus (recomputed on read, not game state)
+_AURA_CACHE = frozenset(("_aura_version", "_aura_attack", "_aura_health", "_aura_cost"))
+
+
+def _hashing_setattr(self, name: str, value: Any,
+                     _store: Callable = object.__setattr__, _cache: frozenset = _AURA_CACHE) -> None:
+    # Queues the entity for its game's state hash (simulator/zobrist.py), if
+    # that game is hashed; aura caches are not state
+    _store(self, name, value)
+    if name in _cache:
+        return
+    try:
+        game = self.game
+    except AttributeError:
+        return  # being constructed or cloned, no game yet
+    if game is not None:
+        state_hash = game._state_hash
+        if state_hash is not None:
+            state_hash.dirty.add(self)
+
+
+def _unsharing(store: Callable) -> Callable:
+    """store preceded by Game.unshare() of the entity's game, if clones still share its cards."""
+    def setattr_(self, name: str, value: Any, _cache: frozenset = _AURA_CACHE) -> None:
+        if name not in _cache:
+            try:
+                game = self.game
+            except AttributeError:
+                game = None
+            if game is not None and game._shared:
+                game.unshare()
+        store(self, name, value)
+    return setattr_
+
+
+# Who watches entity writes: games with a state hash (hash_writes), games
+# whose cards clones still share (share_writes) and
+# journaling games (record_writes). Each hook acts on the written entity's
+# game only, so games in other threads are unaffected; the lock keeps the
+# counts (also changed from gc callbacks) and the installed hook consistent
+_hashing = 0
+_sharing = 0
+_recording: Optional[Callable[[Callable], Callable]] = None
+_watch_lock = threading.RLock()
+
+
+def _install_setattr() -> None:
+    """Put the Entity.__setattr__ the watchers need on the class (none: plain writes)."""
+    store = _hashing_setattr if _hashing else None
+    if _sharing:
+        store = _unsharing(store or object.__setattr__)
+    if _recording is not None:
+        store = _recording(store or object.__setattr__)
+    if store is not None:
+        Entity.__setattr__ = store
+    elif "__setattr__" in Entity.__dict__:
+        del Entity.__setattr__
+
+
+def hash_writes(games: int) -> None:
+    """Count games (+1/-1) with a state hash; writes queue on it while any has one."""
+    global _hashing
+    with _watch_lock:
+        was_hashing = _hashing > 0
+        _hashing += games
+        if (_hashing > 0) != was_hashing:
+            _install_setattr()
+
+
+def share_writes(games: int) -> None:
+    """Count games (+1/-1) whose cards clones share; writes unshare them while any do."""
+    global _sharing
+    with _watch_lock:
+        was_sharing = _sharing > 0
+        _sharing += games
+        if (_sharing > 0) != was_sharing:
+            _install_setattr()
+
+
+def record_writes(wrap: Optional[Callable[[Callable], Callable]]) -> None:
+    """Route entity writes through wrap(store) (the journals), or stop with None."""
+    global _recording
+    with _watch_lock:
+        _recording = wrap
+        _install_setattr()
 
 
 class Entity:
-    """Base class for all game entities."""
+    """Base class for all game entities.
+    
+    Attribute writes are plain until something watches them: the state hash,
+    clones sharing cards and the journal install Entity.__setattr__
+    (hash_writes, share_writes, record_writes).
+    """
+    
+    __slots__ = ("entity_id", "game", "_zone", "tags")
     
     _next_id: int = 1
     
     def __init__(self, game: Optional[Game] = None):
+        self.game: Optional[Game] = game  # first: writes below may update its state hash
         self.entity_id: int = Entity._next_id
         Entity._next_id += 1
-        self.game: Optional[Game] = game
-        self.zone: Zone = Zone.INVALID
+        self._zone: Zone = Zone.INVALID
         self.tags: Dict[int, int] = {}
     
+    def touch(self) -> None:
+        """Mark the entity changed; call before an in-place change to its tags or dicts."""
+        self.tags = self.tags  # through __setattr__ (and the journal, if recording)
+    
+    @property
+    def zone(self) -> Zone:
+        return self._zone
+    
+    @zone.setter
+    def zone(self, value: Zone) -> None:
+        old = self._zone
+        self._zone = value
+        game = self.game
+        if game is not None and old != value:
+            # Auras depend on where cards are
+            game.aura_version += 1
+            # Triggers only listen from the hand or play; the game tracks moves
+            if (old in LIVE_ZONES) != (value in LIVE_ZONES):
+                game._on_zone_change(self)
+    
     @classmethod
     def reset_ids(cls) -> None:
         """Reset entity ID counter for new game."""
@@ -157,6 +463,7 @@ class Entity:
     
     def set_tag(self, tag: GameTag, value: int) -> None:
         """Set a tag value."""
+        self.touch()
         self.tags[tag.value] = value
     
     def has_tag(self, tag: GameTag) -> bool:
@@ -164,8 +471,41 @@ class Entity:
         return self.tags.get(tag.value, 0) != 0
 
 
+# Entity class -> same class with plain attribute writes (see _unwatched)
+_unwatched_classes: Dict[type, type] = {}
+
+
+def _unwatched(cls: type) -> type:
+    """cls without the write hooks, for building copies that have no game yet.
+    
+    Same layout as cls, so the copy becomes a cls once built (__class__
+    assignment). Cheaper than running the hooks, which would ignore it anyway.
+    """
+    plain = _unwatched_classes.get(cls)
+    if plain is None:
+        plain = _unwatched_classes[cls] = type(cls.__name__, (cls,), {
+            "__slots__": (), "__module__": cls.__module__, "__setattr__": object.__setattr__})
+    return plain
+
+
 class Card(Entity):
-    """A card in the game."""
+    """A card in the game.
+    
+    State lives in __slots__ (no per-card __dict__); effect-specific fields
+    are the declared EXTENSION_STATE entries, kept in the _ext dict.
+    """
+    
+    __slots__ = (
+        "data", "controller", "zone_position",
+        "_cost", "_attack", "_health", "_max_health", "_armor", "_durability",
+        "_damage", "_dormant", "mod_cost", "summon_timestamp",
+        "exhausted", "attacks_this_turn", "frozen", "silenced", "immune",
+        "cant_attack", "cant_be_targeted", "_keywords",
+        "_spellburst_triggered", "_frenzy_triggered", "_infuse_progress", "_infused",
+        "titan_abilities_used", "enchantments",
+        "_aura_version", "_aura_attack", "_aura_health", "_aura_cost",
+        "_ext",
+    )
     
     def __init__(self, data: CardData, game: Optional[Game] = None):
         super().__init__(game)
@@ -194,15 +534,8 @@ class Card(Entity):
         self.cant_attack: bool = False
         self.cant_be_targeted: bool = False
         
-        self._taunt: bool = data.taunt
-        self._divine_shield: bool = data.divine_shield
-        self._charge: bool = data.charge
-        self._windfury: bool = data.windfury
-        self._stealth: bool = data.stealth
-        self._poisonous: bool = data.poisonous
-        self._lifesteal: bool = data.lifesteal
-        self._rush: bool = data.rush
-        self._reborn: bool = data.reborn
+        # Keyword state as one bitmask (CardData KEYWORD_BITS)
+        self._keywords: int = data.keywords
         
         # New mechanics states (one-time triggers)
         self._spellburst_triggered: bool = False  # Has spellburst been used?
@@ -214,18 +547,22 @@ class Card(Entity):
         # Enchantments system (PDF spec: buffs are separate entities)
         self.enchantments: List['Enchantment'] = []
         
-        # Lazy stats cache
-        self._stats_dirty = True
-        self._cached_attack = None
-        self._cached_health = None
-        self._cached_cost = None
+        # Aura bonus, valid while _aura_version matches game.aura_version
+        self._aura_version = -1
+        self._aura_attack = 0
+        self._aura_health = 0
+        self._aura_cost = 0
+        
+        # EXTENSION_STATE values, allocated on first write
+        self._ext: Optional[Dict[str, Any]] = None
     
     def invalidate_stats(self) -> None:
-        """Invalidate cached stats when an aura or enchantment changes."""
-        self._stats_dirty = True
-        self._cached_attack = None
-        self._cached_health = None
-        self._cached_cost = None
+        """Recompute this card's aura bonus on the next stat read.
+        
+        Only needed for aura conditions the game cannot see change; see
+        Game.invalidate_auras to refresh every card.
+        """
+        self._aura_version = -1
     
     def add_enchantment(
         self, 
@@ -277,51 +614,57 @@ class Card(Entity):
         return sum(e.health_mod for e in self.enchantments)
     
     def clone(self) -> 'Card':
-        """Create a deep copy of the card."""
-        # Create new instance of same class (Minion, Spell, etc.)
-        new_card = type(self)(self.data, None)
-        
-        # Copy dynamic stats
-        new_card._cost = self._cost
-        new_card._attack = self._attack
-        new_card._health = self._health
-        new_card._max_health = self._max_health
-        new_card._armor = self._armor
-        new_card._durability = self._durability
-        new_card._damage = self._damage
-        new_card._dormant = self._dormant
-        
-        # Copy states
-        new_card.zone = self.zone
-        new_card.zone_position = self.zone_position
-        new_card.exhausted = self.exhausted
-        new_card.attacks_this_turn = self.attacks_this_turn
-        new_card.frozen = self.frozen
-        new_card.silenced = self.silenced
-        new_card.immune = self.immune
-        new_card.cant_attack = self.cant_attack
-        new_card.cant_be_targeted = self.cant_be_targeted
-        
-        # Copy keywords
-        new_card._taunt = self._taunt
-        new_card._divine_shield = self._divine_shield
-        new_card._charge = self._charge
-        new_card._windfury = self._windfury
-        new_card._stealth = self._stealth
-        new_card._poisonous = self._poisonous
-        new_card._lifesteal = self._lifesteal
-        new_card._rush = self._rush
-        new_card._reborn = self._reborn
-        
-        # Copy tags
-        new_card.tags = self.tags.copy()
-        
-        # Copy ANY extra dynamic attributes added by card effects (like 'dormant' in Nozdormu)
-        for key, value in self.__dict__.items():
-            if key not in new_card.__dict__ and not key.startswith('__'):
-                setattr(new_card, key, value)
-        
-        return new_card
+        """Copy of the card's state, keeping its entity_id.
+        
+        The copy has no game or controller; Game.clone sets them.
+        """
+        cls = self.__class__
+        new = object.__new__(_unwatched(cls))  # plain writes until it is a cls below
+        new.game = None
+        new.entity_id = self.entity_id
+        new._zone = self._zone
+        new.tags = self.tags.copy()
+        new.data = self.data
+        new.controller = None
+        new.zone_position = self.zone_position
+        
+        new._cost = self._cost
+        new._attack = self._attack
+        new._health = self._health
+        new._max_health = self._max_health
+        new._armor = self._armor
+        new._durability = self._durability
+        new._damage = self._damage
+        new._dormant = self._dormant
+        new.mod_cost = self.mod_cost
+        new.summon_timestamp = self.summon_timestamp
+        
+        new.exhausted = self.exhausted
+        new.attacks_this_turn = self.attacks_this_turn
+        new.frozen = self.frozen
+        new.silenced = self.silenced
+        new.immune = self.immune
+        new.cant_attack = self.cant_attack
+        new.cant_be_targeted = self.cant_be_targeted
+        new._keywords = self._keywords
+        
+        new._spellburst_triggered = self._spellburst_triggered
+        new._frenzy_triggered = self._frenzy_triggered
+        new._infuse_progress = self._infuse_progress
+        new._infused = self._infused
+        new.titan_abilities_used = self.titan_abilities_used[:]
+        new.enchantments = [ench.clone(new) for ench in self.enchantments] if self.enchantments else []
+        
+        # The aura bonus belongs to the source game; Game.clone keeps it
+        new._aura_version = -1
+        new._aura_attack = self._aura_attack
+        new._aura_health = self._aura_health
+        new._aura_cost = self._aura_cost
+        
+        ext = self._ext
+        new._ext = None if ext is None else ext.copy()
+        new.__class__ = cls
+        return new
     
     @property
     def card_id(self) -> str:
@@ -383,72 +726,120 @@ class Card(Entity):
     def spell_school(self) -> SpellSchool:
         return self.data.spell_school
     
+    # Stats read as base value (_cost, _attack, _max_health, written freely by
+    # effects) plus the aura bonus; setters take the value including auras
+    
     @property
     def cost(self) -> int:
-        if self._stats_dirty or self._cached_cost is None:
-            self._recalculate_stats()
-        return self._cached_cost
+        game = self.game
+        if game is None:
+            return self._cost
+        if self._aura_version != game.aura_version:
+            self._refresh_auras(game)
+        cost = self._cost + self._aura_cost
+        return cost if cost > 0 else 0
     
     @cost.setter
     def cost(self, value: int) -> None:
-        self._cost = value
-        self.invalidate_stats()
+        self._cost = value - self._current_aura()[2]
     
     @property
     def attack(self) -> int:
-        if self._stats_dirty or self._cached_attack is None:
-            self._recalculate_stats()
-        return self._cached_attack
+        game = self.game
+        if game is None:
+            return self._attack
+        if self._aura_version != game.aura_version:
+            self._refresh_auras(game)
+        attack = self._attack + self._aura_attack
+        return attack if attack > 0 else 0
     
     @attack.setter
     def attack(self, value: int) -> None:
-        self._attack = value
-        self.invalidate_stats()
+        self._attack = value - self._current_aura()[0]
     
     @property
     def health(self) -> int:
-        if self._stats_dirty or self._cached_health is None:
-            self._recalculate_stats()
-        return self._cached_health - self._damage
+        game = self.game
+        if game is None:
+            return self._max_health - self._damage
+        if self._aura_version != game.aura_version:
+            self._refresh_auras(game)
+        return self._max_health + self._aura_health - self._damage
     
     @health.setter
     def health(self, value: int) -> None:
-        self._max_health = value
-        self.invalidate_stats()
-    
-    def _recalculate_stats(self) -> None:
-        """Internal method to recalculate all stats through the 'onion' layers."""
-        # Base values from _attack, _max_health, _cost
-        atk = self._attack
-        max_hp = self._max_health
-        cost = self._cost
-        
-        if self.game and not self.silenced:
-            # 1. Aura/Modifier calculation via Events
-            atk_mod = {"amount": atk}
-            hp_mod = {"amount": max_hp}
-            cost_mod = {"amount": cost}
-            
-            self.game.fire_event("on_calculate_attack", self, atk_mod)
-            self.game.fire_event("on_calculate_health", self, hp_mod)
-            self.game.fire_event("on_calculate_cost", self, cost_mod)
-            
-            atk = max(0, atk_mod["amount"])
-            max_hp = max_hp_mod = hp_mod["amount"]
-            cost = max(0, cost_mod["amount"])
-            
-        self._cached_attack = atk
-        self._cached_health = max_hp
-        self._cached_cost = cost
-        self._stats_dirty = False
+        self._max_health = value - self._current_aura()[1]
+        self._check_lethal()
     
     @property
     def max_health(self) -> int:
-        return self._max_health
+        game = self.game
+        if game is None:
+            return self._max_health
+        if self._aura_version != game.aura_version:
+            self._refresh_auras(game)
+        return self._max_health + self._aura_health
     
     @max_health.setter
     def max_health(self, value: int) -> None:
-        self._max_health = value
+        self._max_health = value - self._current_aura()[1]
+        self._check_lethal()
+
+    def stats(self) -> Tuple[int, int, int, int]:
+        """(cost, attack, health, max_health) with a single aura check, for bulk readers."""
+        game = self.game
+        if game is None:
+            return (self._cost, self._attack, self._max_health - self._damage, self._max_health)
+        if self._aura_version != game.aura_version:
+            self._refresh_auras(game)
+        cost = self._cost + self._aura_cost
+        attack = self._attack + self._aura_attack
+        max_health = self._max_health + self._aura_health
+        return (cost if cost > 0 else 0, attack if attack > 0 else 0, max_health - self._damage, max_health)
+
+    def _current_aura(self) -> Tuple[int, int, int]:
+        """(attack, health, cost) aura bonus, refreshed if stale."""
+        game = self.game
+        if game is None:
+            return (0, 0, 0)
+        if self._aura_version != game.aura_version:
+            self._refresh_auras(game)
+        return (self._aura_attack, self._aura_health, self._aura_cost)
+    
+    def _refresh_auras(self, game: Game) -> None:
+        """Recompute the aura bonus for the game's current aura version."""
+        attack = health = cost = 0
+        if game._auras:
+            for source, aura in game._auras.values():
+                if (aura.modifies_stats and source.zone in aura.zones and not source.silenced
+                        and aura.condition(source, self)):
+                    attack += aura.attack
+                    health += aura.health
+                    cost += aura.cost
+        
+        # Scripted auras listening to the calculation events
+        if game.has_listeners("on_calculate_attack"):
+            modifier = {"amount": self._attack + attack}
+            game.fire_event("on_calculate_attack", self, modifier)
+            attack = modifier["amount"] - self._attack
+        if game.has_listeners("on_calculate_health"):
+            modifier = {"amount": self._max_health + health}
+            game.fire_event("on_calculate_health", self, modifier)
+            health = modifier["amount"] - self._max_health
+        if game.has_listeners("on_calculate_cost"):
+            modifier = {"amount": self._cost + cost}
+            game.fire_event("on_calculate_cost", self, modifier)
+            cost = modifier["amount"] - self._cost
+        
+        # Losing health from auras never kills: current health only drops to
+        # the new maximum, so the damage shrinks with it
+        if health < self._aura_health and self._damage:
+            self._damage = max(0, self._damage - (self._aura_health - health))
+        
+        self._aura_attack = attack
+        self._aura_health = health
+        self._aura_cost = cost
+        self._aura_version = game.aura_version
     
     @property
     def damage(self) -> int:
@@ -457,6 +848,14 @@ class Card(Entity):
     @damage.setter
     def damage(self, value: int) -> None:
         self._damage = max(0, value)
+        self._check_lethal()
+    
+    def _check_lethal(self) -> None:
+        """Queue a minion in play for the next death check once its health reaches 0."""
+        game = self.game
+        if (game is not None and self._zone == Zone.PLAY and self.data.card_type == CardType.MINION
+                and self.health <= 0):
+            game.mark_for_death(self)
 
     @property
     def dormant(self) -> int:
@@ -466,78 +865,88 @@ class Card(Entity):
     def dormant(self, value: int) -> None:
         self._dormant = max(0, value)
     
+    def _set_keyword(self, bit: int, value: bool) -> None:
+        if value:
+            self._keywords |= bit
+        else:
+            self._keywords &= ~bit
+    
+    def has_keyword(self, name: str) -> bool:
+        """Current (unsilenced) state of any CARD_KEYWORDS flag."""
+        return self._keywords & KEYWORD_BITS[name] != 0 and not self.silenced
+    
     # Keyword properties (affected by silence)
     @property
     def taunt(self) -> bool:
-        return self._taunt and not self.silenced
+        return self._keywords & _TAUNT != 0 and not self.silenced
     
     @taunt.setter
     def taunt(self, value: bool) -> None:
-        self._taunt = value
+        self._set_keyword(_TAUNT, value)
     
     @property
     def divine_shield(self) -> bool:
-        return self._divine_shield and not self.silenced
+        return self._keywords & _DIVINE_SHIELD != 0 and not self.silenced
     
     @divine_shield.setter
     def divine_shield(self, value: bool) -> None:
-        self._divine_shield = value
+        self._set_keyword(_DIVINE_SHIELD, value)
     
     @property
     def charge(self) -> bool:
-        return self._charge and not self.silenced
+        return self._keywords & _CHARGE != 0 and not self.silenced
     
     @charge.setter
     def charge(self, value: bool) -> None:
-        self._charge = value
+        self._set_keyword(_CHARGE, value)
     
     @property
     def windfury(self) -> bool:
-        return self._windfury and not self.silenced
+        return self._keywords & _WINDFURY != 0 and not self.silenced
     
     @windfury.setter
     def windfury(self, value: bool) -> None:
-        self._windfury = value
+        self._set_keyword(_WINDFURY, value)
     
     @property
     def stealth(self) -> bool:
-        return self._stealth and not self.silenced
+        return self._keywords & _STEALTH != 0 and not self.silenced
     
     @stealth.setter
     def stealth(self, value: bool) -> None:
-        self._stealth = value
+        self._set_keyword(_STEALTH, value)
     
     @property
     def poisonous(self) -> bool:
-        return self._poisonous and not self.silenced
+        return self._keywords & _POISONOUS != 0 and not self.silenced
     
     @poisonous.setter
     def poisonous(self, value: bool) -> None:
-        self._poisonous = value
+        self._set_keyword(_POISONOUS, value)
     
     @property
     def lifesteal(self) -> bool:
-        return self._lifesteal and not self.silenced
+        return self._keywords & _LIFESTEAL != 0 and not self.silenced
     
     @lifesteal.setter
     def lifesteal(self, value: bool) -> None:
-        self._lifesteal = value
+        self._set_keyword(_LIFESTEAL, value)
     
     @property
     def rush(self) -> bool:
-        return self._rush and not self.silenced
+        return self._keywords & _RUSH != 0 and not self.silenced
     
     @rush.setter
     def rush(self, value: bool) -> None:
-        self._rush = value
+        self._set_keyword(_RUSH, value)
     
     @property
     def reborn(self) -> bool:
-        return self._reborn and not self.silenced
+        return self._keywords & _REBORN != 0 and not self.silenced
 
     @reborn.setter
     def reborn(self, value: bool) -> None:
-        self._reborn = value
+        self._set_keyword(_REBORN, value)
     
     def can_attack(self) -> bool:
         """Check if this entity can attack."""
@@ -563,12 +972,9 @@ class Card(Entity):
     def silence(self) -> None:
         """Silence this entity, removing all card text."""
         self.silenced = True
-        self._taunt = False
-        self._divine_shield = False
-        self._windfury = False
-        self._stealth = False
-        self._poisonous = False
-        self._lifesteal = False
+        self._keywords &= ~_SILENCED_KEYWORDS
+        if self.game is not None:
+            self.game.aura_version += 1  # its own auras stop
         # Restore health to base
         self._max_health = self.data.health
         self._attack = self.data.attack
@@ -582,9 +988,51 @@ class Card(Entity):
         return f"<{self.__class__.__name__} '{self.name}' [{self.card_id}] {self.attack}/{self.health}>"
 
 
+def _raw_keyword_property(bit: int) -> property:
+    def get(self) -> bool:
+        return self._keywords & bit != 0
+    
+    def set(self, value: bool) -> None:
+        self._set_keyword(bit, value)
+    
+    return property(get, set)
+
+
+# card._taunt etc.: raw keyword state ignoring silence, kept for effect scripts
+for _name in CARD_STATE_KEYWORDS:
+    setattr(Card, f"_{_name}", _raw_keyword_property(KEYWORD_BITS[_name]))
+del _name
+
+
+def _extension_property(name: str, default: Any) -> property:
+    def get(self):
+        ext = self._ext
+        return default if ext is None else ext.get(name, default)
+    
+    def set(self, value) -> None:
+        if self._ext is None:
+            self._ext = {}
+        self.touch()
+        self._ext[name] = value
+    
+    def delete(self) -> None:
+        if self._ext is not None:
+            self.touch()
+            self._ext.pop(name, None)
+    
+    return property(get, set, delete)
+
+
+for _name, _default in EXTENSION_STATE.items():
+    setattr(Card, _name, _extension_property(_name, _default))
+del _name, _default
+
+
 class Minion(Card):
     """A minion card."""
     
+    __slots__ = ()
+    
     def __init__(self, data: CardData, game: Optional[Game] = None):
         super().__init__(data, game)
     
@@ -596,6 +1044,8 @@ class Minion(Card):
 class Spell(Card):
     """A spell card."""
     
+    __slots__ = ()
+    
     def __init__(self, data: CardData, game: Optional[Game] = None):
         super().__init__(data, game)
     
@@ -607,11 +1057,18 @@ class Spell(Card):
 class Weapon(Card):
     """A weapon card."""
     
+    __slots__ = ("_max_durability",)
+    
     def __init__(self, data: CardData, game: Optional[Game] = None):
         super().__init__(data, game)
         self._durability = data.durability
         self._max_durability = data.durability
     
+    def clone(self) -> 'Weapon':
+        new = super().clone()
+        new._max_durability = self._max_durability
+        return new
+    
     @property
     def durability(self) -> int:
         return self._durability
@@ -630,11 +1087,20 @@ class Weapon(Card):
 class Hero(Card):
     """A hero card."""
     
+    __slots__ = ("weapon", "hero_power")
+    
     def __init__(self, data: CardData, game: Optional[Game] = None):
         super().__init__(data, game)
         self.weapon: Optional[Weapon] = None
         self.hero_power: Optional[HeroPower] = None
     
+    def clone(self) -> 'Hero':
+        # weapon/hero_power are other entities; Game.clone links them
+        new = super().clone()
+        new.weapon = None
+        new.hero_power = None
+        return new
+    
     @property
     def armor(self) -> int:
         return self._armor
@@ -665,10 +1131,17 @@ class Hero(Card):
 class HeroPower(Card):
     """A hero power."""
     
+    __slots__ = ("used_this_turn",)
+    
     def __init__(self, data: CardData, game: Optional[Game] = None):
         super().__init__(data, game)
         self.used_this_turn: bool = False
     
+    def clone(self) -> 'HeroPower':
+        new = super().clone()
+        new.used_this_turn = self.used_this_turn
+        return new
+    
     def can_use(self) -> bool:
         """Check if hero power can be used."""
         if self.used_this_turn:
@@ -690,16 +1163,19 @@ class HeroPower(Card):
         self.used_this_turn = True
         
         # Trigger Hero Power effect via effect system
-        if self.game and self.card_id in self.game._battlecry_handlers:
-            self.game._battlecry_handlers[self.card_id](self.game, self, target)
+        if self.game:
+            effects = self.data.effects
+            handler = effects.battlecry or effects.on_play
+            if handler:
+                self.game._run_effect(handler, self, target)
         
         # === INSPIRE: Trigger all friendly minions with Inspire ===
         if self.controller and self.game:
             for minion in self.controller.board:
                 if minion.data.inspire:
-                    handler = self.game._get_effect_handler(minion.card_id, "on_inspire")
+                    handler = minion.data.effects.on_inspire
                     if handler:
-                        handler(self.game, self.controller, minion)
+                        self.game._run_effect(handler, self.controller, minion)
             self.game.fire_event("on_hero_power", self.controller)
         
         return True
@@ -712,12 +1188,19 @@ class HeroPower(Card):
 class Location(Card):
     """A location card."""
     
+    __slots__ = ("cooldown",)
+    
     def __init__(self, data: CardData, game: Optional[Game] = None):
         super().__init__(data, game)
         self.cooldown: int = 0
         # Durability from card data, default 3
         self._durability: int = data.durability if hasattr(data, 'durability') and data.durability else 3
     
+    def clone(self) -> 'Location':
+        new = super().clone()
+        new.cooldown = self.cooldown
+        return new
+    
     @property
     def durability(self) -> int:
         return self._durability
@@ -790,12 +1273,26 @@ class Enchantment(Entity):
         if self.source:
             self.set_tag(GameTag.CREATOR, self.source.entity_id)
     
+    def clone(self, target: Optional[Entity]) -> 'Enchantment':
+        """Copy of this enchantment attached to target (a cloned card).
+        
+        The copy has no game; Game.clone sets it.
+        """
+        new = object.__new__(self.__class__)
+        new.game = None  # first: the writes below must not reach this game's hooks
+        new.entity_id = self.entity_id
+        new._zone = self._zone
+        new.tags = self.tags.copy()
+        new.__dict__.update(self.__dict__)
+        new.target = target
+        return new
+    
     def remove(self) -> None:
         """Remove this enchantment from its target."""
+        self.zone = Zone.REMOVEDFROMGAME
         if self.target and hasattr(self.target, 'enchantments'):
             if self in self.target.enchantments:
                 self.target.enchantments.remove(self)
-        self.zone = Zone.REMOVEDFROMGAME
     
     def __repr__(self) -> str:
         return f"<Enchantment '{self.name}' +{self.attack_mod}/+{self.health_mod}>"
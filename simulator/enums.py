@@ -209,3 +209,4 @@ class GameTag(IntEnum):
     CREATOR = 2003  # Entity ID of creator
     ATTACHED = 2004  # Entity ID this enchantment is attached to
     TEMPORARY = 2005  # "Until end of turn" effect
+    TO_BE_DESTROYED = 2006  # Destroyed, removed at the next death check
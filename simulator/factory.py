@@ -31,12 +31,8 @@ def create_card(card_id: str, controller: 'Player') -> Card:
     
     # --- MANUAL TOKEN FALLBACKS ---
     if card_id == "UNG_809t":
-        data.name = "Flame Elemental"
-        data.cost = 1
-        data.attack = 1
-        data.health = 2
-        data.race = Race.ELEMENTAL
-        data.text = ""
+        data = data.replace(name="Flame Elemental", cost=1, attack=1, health=2,
+                            race=Race.ELEMENTAL, text="")
 
     game = controller.game if controller else None
     entity = None
@@ -83,7 +79,7 @@ def create_card(card_id: str, controller: 'Player') -> Card:
                     if module_data.stealth: entity._stealth = True
                     
                     # Store module info
-                    if not hasattr(entity, 'zilliax_modules'):
+                    if entity.zilliax_modules is None:
                         entity.zilliax_modules = []
                     entity.zilliax_modules.append(module_id)
 
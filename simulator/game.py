@@ -5,13 +5,24 @@ Main game loop and state management.
 
 from __future__ import annotations
 
+import logging
 import random
+import weakref
 from typing import Optional, List, Dict, Any, Callable, Tuple
 from dataclasses import dataclass, field
 
 from .enums import GamePhase, Step, Zone, CardType, PlayState, Mulligan, GameTag, Race
-from .entities import Entity, Card, CardData, Minion, Spell, Weapon, Hero, HeroPower
+from .entities import Entity, Card, CardData, Minion, Spell, Weapon, Hero, HeroPower, Enchantment, LIVE_ZONES, share_writes
 from .player import Player
+from .effect_registry import EffectRegistry, PreloadReport
+from .immutable import SharedList
+from .journal import Journal
+from . import rng as rng_streams
+from . import trace
+from . import zobrist
+from .auras import Aura
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -22,17 +33,171 @@ class GameConfig:
     starting_health: int = 30
 
 
+# Events accepted by register_trigger / fire_event
+GAME_EVENTS: Tuple[str, ...] = (
+    # Turn structure
+    "on_turn_start", "on_turn_end",
+    # Cards
+    "on_card_played", "on_card_drawn", "on_card_discarded", "on_card_traded",
+    "on_minion_played", "on_minion_summon", "on_minion_transformed", "on_awake",
+    "on_spell_cast", "on_spell_played", "on_weapon_equipped", "on_hero_power", "on_invoke",
+    # Combat
+    "on_attack", "on_minion_attack", "on_hero_attack", "on_hero_attacked", "on_after_attack",
+    "on_damage_taken", "on_divine_shield_lost", "on_silence",
+    # Deaths
+    "on_minion_death", "on_friendly_death", "on_death", "on_hero_death",
+    # Calculation events (Auras)
+    "on_calculate_attack", "on_calculate_health", "on_calculate_cost", "on_calculate_damage",
+)
+
+# Player zones shared copy-on-write by Game.clone (rarely touched by rollouts)
+SHARED_ZONES = ("deck", "graveyard", "setaside")
+
+# Game attributes shared as-is with clones (card-ID handler tables)
+_SHARED_GAME_ATTRS = frozenset({"config", "_target_handlers", "_trigger_handlers", "_aura_handlers"})
+
+_ATOMIC = frozenset({int, str, bool, float, type(None)})
+
+# Game attributes Game._clone_full sets itself (per-game watchers of writes)
+_CLONE_SETS = frozenset({"_state_hash", "_journal", "_shared", "_sharing"})
+
+# Death queue markers (Card.tags keys)
+_MORTALLY_WOUNDED = GameTag.MORTALLY_WOUNDED.value
+_TO_BE_DESTROYED = GameTag.TO_BE_DESTROYED.value
+
+
+def _play_order(entity: Card) -> int:
+    return entity.summon_timestamp
+
+
+class _CloneContext:
+    """Maps the entities of a game to their copies in a clone.
+    
+    Each entity is copied once, so references between entities (triggers,
+    enchantments, hero weapon, pending choices) keep pointing at the same copy.
+    """
+    
+    __slots__ = ("source", "game", "memo", "shares")
+    
+    def __init__(self, source: Game, game: Game):
+        self.source = source
+        self.game = game
+        # id(original) -> copy; originals stay referenced by the source game
+        self.memo: Dict[int, Any] = {}
+        # (game, SharedList reading its cards), registered once the clone is built
+        self.shares: List[Tuple[Game, SharedList]] = []
+    
+    def value(self, value: Any) -> Any:
+        """Copy a game/player attribute value, remapping entities."""
+        cls = value.__class__
+        if cls in _ATOMIC:
+            return value
+        if isinstance(value, Entity):
+            return self.entity(value)
+        if cls is SharedList:
+            shared = value.fork(self.shared)
+            items = value._source
+            if items is None:
+                items = shared._source  # copied already: the fork reads the source's cards
+            elif items:
+                owner = items[0].game  # not copied yet: it reads that game's cards
+                if owner is not None and owner is not self.source:
+                    self.shares.append((owner, shared))
+            if items:
+                self.shares.append((self.source, shared))
+            return shared
+        if isinstance(value, list):
+            return [v if v.__class__ in _ATOMIC else self.value(v) for v in value]
+        if isinstance(value, dict):
+            return {k: v if v.__class__ in _ATOMIC else self.value(v) for k, v in value.items()}
+        if cls is tuple:
+            return tuple([self.value(v) for v in value])
+        if cls is set:
+            return {self.value(v) for v in value}
+        if value is self.source:
+            return self.game
+        # Enums, card data and callables are shared
+        return value
+    
+    def entity(self, entity: Entity) -> Entity:
+        new = self.memo.get(id(entity))
+        if new is not None:
+            return new
+        if isinstance(entity, Card):
+            return self._card(entity)
+        if isinstance(entity, Enchantment):
+            new = entity.clone(None)
+            self.memo[id(entity)] = new
+            new.game = self.game
+            new.target = self.value(entity.target)
+            new.source = self.value(entity.source)
+            return new
+        return entity
+    
+    def shared(self, card: Card) -> Card:
+        """entity() for copies made on first use (SharedList): auras may have changed since."""
+        new = self.memo.get(id(card))
+        if new is None:
+            new = self.entity(card)
+            new._aura_version = -1
+        return new
+    
+    def _card(self, card: Card) -> Card:
+        new = card.clone()
+        new._aura_version = card._aura_version  # same auras, same version
+        self.memo[id(card)] = new
+        new.game = self.game
+        new.controller = self.value(card.controller)
+        for old, ench in zip(card.enchantments, new.enchantments):
+            self.memo[id(old)] = ench
+            ench.game = self.game
+            ench.source = self.value(old.source)
+        if card._ext:
+            new._ext = self.value(card._ext)
+        if isinstance(card, Hero):
+            new.weapon = self.value(card.weapon)
+            new.hero_power = self.value(card.hero_power)
+        return new
+
+
 class Game:
     """Main game engine."""
     
-    def __init__(self, config: Optional[GameConfig] = None):
+    def __init__(self, config: Optional[GameConfig] = None, seed: Optional[int] = None):
         self.config = config or GameConfig()
         
         # Reset entity IDs
         Entity.reset_ids()
         
+        # Incremental hash of the entities (see state_hash), built on the
+        # first read; entities queue themselves on it when written from then on
+        self._state_hash: Optional[zobrist.StateHash] = None
+        
+        # id -> weak reference to a clone's SharedList still reading this
+        # game's cards; the first entity write copies them (see unshare)
+        self._shared: Dict[int, weakref.ref] = {}
+        # Releases this game's hold on the clone guard (share_writes), also
+        # when the game is collected with clones still sharing its cards
+        self._sharing: Optional[weakref.finalize] = None
+        
+        # Do/undo journal, active between mark() and end_journal()
+        self._journal: Optional[Journal] = None
+        
         self.is_simulation = False # Flag to disable logging during MCTS
         
+        # Structured trace (see set_trace_sink); trace points check only `tracing`
+        self.trace_sink: Optional[trace.TraceSink] = None
+        self.tracing: bool = False
+        self._trace_seq: int = 0
+        
+        # Random stream of this game: the engine and effect scripts draw from
+        # it, so a game replays exactly from its seed. Without one the seed is
+        # drawn from the random module, so seeding `random` still fixes games
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed: int = seed
+        self.rng: random.Random = rng_streams.GameRandom(seed)
+        
         # Players
         self.players: List[Player] = []
         self.current_player_idx: int = 0
@@ -43,34 +208,25 @@ class Game:
         self.turn: int = 0
         self.actions_this_turn: int = 0
         
-        # Trigger system
-        self._triggers: Dict[str, List[Tuple[Entity, Callable]]] = {
-            "on_turn_start": [],
-            "on_turn_end": [],
-            "on_minion_summon": [],
-            "on_minion_death": [],
-            "on_damage_taken": [],
-            "on_card_played": [],
-            "on_hero_power": [],
-            # Secret triggers
-            "on_attack": [],           # Before any attack
-            "on_spell_cast": [],       # When opponent plays a spell
-            "on_minion_played": [],    # When opponent plays a minion
-            "on_hero_attacked": [],    # When hero is attacked
-            "on_friendly_death": [],   # When friendly minion dies
-            # Calculation events (Auras)
-            "on_calculate_attack": [],
-            "on_calculate_health": [],
-            "on_calculate_damage": [],
-        }
+        # Trigger system (event bus): handle -> (source, callback) for sources
+        # that can trigger now, per event; the rest wait in _dormant_triggers
+        # until their source enters the hand or play
+        self._triggers: Dict[str, Dict[int, Tuple[Entity, Callable]]] = {event: {} for event in GAME_EVENTS}
+        self._dormant_triggers: Dict[int, Tuple[str, Entity, Callable]] = {}
+        self._trigger_handles: Dict[int, List[Tuple[str, int]]] = {}  # entity_id -> (event, handle)
+        self._next_trigger_handle: int = 1
+        
+        # Auras: handle -> (source, Aura). Cards cache their aura bonus against
+        # aura_version, bumped whenever an aura or the board it reads changes
+        self._auras: Dict[int, Tuple[Entity, Aura]] = {}
+        self.aura_version: int = 0
         
         # Death processing
         self._pending_deaths: List[Card] = []
         self._pending_deathrattles: List[Tuple[Card, Callable]] = []
         
-        # Effect handlers (to be populated by effect system)
-        self._battlecry_handlers: Dict[str, Callable] = {}
-        self._deathrattle_handlers: Dict[str, Callable] = {}
+        # Effect handlers are bound per card definition (card.data.effects);
+        # only custom targeting is still registered here
         self._target_handlers: Dict[str, Callable] = {}
         self._trigger_handlers: Dict[str, List[Callable]] = {}
         self._aura_handlers: Dict[str, Callable] = {}
@@ -83,10 +239,88 @@ class Game:
         
         self.summon_counter: int = 0
 
-    def clone(self) -> 'Game':
-        """Create a fast copy of the game state for MCTS (minimal cloning)."""
+    def clone(self, full: bool = True, share_rng: bool = False) -> 'Game':
+        """Copy the game state for search (MCTS, lethal checks).
+        
+        full=True keeps the complete state: decks, secrets, quests, sideboards,
+        triggers, pending choices and deaths. Decks, graveyards and set-aside
+        zones are shared with this game and only copied the first time the
+        clone uses them (SharedList), so the cost follows what a rollout
+        touches. This game has clones copy those zones before its own
+        entities change (unshare), so it can keep playing meanwhile.
+        
+        full=False is the minimal copy (heroes, hands and boards; no triggers).
+        
+        The clone's random stream is a fork of this game's (same upcoming
+        values, drawn independently) unless share_rng is set, in which case
+        both games draw from the same stream.
+        """
+        if not full:
+            new_game = self._clone_minimal()
+        else:
+            new_game = self._clone_full()
+        new_game.seed = self.seed
+        new_game.rng = self.rng if share_rng else rng_streams.fork(self.rng)
+        return new_game
+    
+    def _clone_full(self) -> 'Game':
+        """Complete copy-on-write clone (see clone)."""
+        
+        new_game = Game.__new__(Game)
+        # Unwatched while it is built (copied entities start without a game):
+        # the state hash is copied whole at the end, nothing to journal or unshare
+        for key in ("_state_hash", "_journal", "_sharing"):
+            new_game.__dict__[key] = None
+        new_game.__dict__["_shared"] = {}
+        ctx = _CloneContext(self, new_game)
+        memo = ctx.memo
+        
+        # Players first: every entity references its controller
+        for player in self.players:
+            memo[id(player)] = Player.__new__(Player)
+        for player in self.players:
+            new_player = memo[id(player)]
+            new_player.entity_id = player.entity_id
+            new_player.game = new_game
+            new_player._zone = player._zone
+            new_player.tags = player.tags.copy()
+            state = new_player.__dict__
+            for key, value in player.__dict__.items():
+                if value.__class__ in _ATOMIC:
+                    state[key] = value
+                elif key in SHARED_ZONES and value.__class__ is list:
+                    state[key] = SharedList(value, ctx.shared)
+                    if value:
+                        ctx.shares.append((self, state[key]))
+                else:
+                    state[key] = ctx.value(value)
+        
+        state = new_game.__dict__
+        for key, value in self.__dict__.items():
+            if value.__class__ in _ATOMIC or key in _SHARED_GAME_ATTRS:
+                state[key] = value
+            elif key == "rng" or key in _CLONE_SETS:
+                continue  # set by clone() / here
+            elif key == "trace_sink":
+                state[key] = None  # rollouts are not traced
+            elif key == "action_history":
+                state[key] = list(value)  # entries are never modified
+            else:
+                state[key] = ctx.value(value)
+        new_game.tracing = False
+        new_game.is_simulation = True
+        state_hash = self._state_hash
+        if state_hash is not None:
+            state["_state_hash"] = state_hash.copy(self)
+        for owner, shared in ctx.shares:
+            owner._share(shared)
+        return new_game
+    
+    def _clone_minimal(self) -> 'Game':
+        """Heroes, hands and boards only (the pre-full clone behaviour)."""
+        next_id = Entity._next_id
         # 1. Create new empty game
-        new_game = Game(self.config)
+        new_game = Game(self.config, seed=0)  # clone() replaces the stream
         new_game.phase = self.phase
         new_game.step = self.step
         new_game.turn = self.turn
@@ -143,13 +377,89 @@ class Game:
         new_p2.graveyard = []  # Skip graveyard
         
         # 4. Skip trigger cloning for MCTS (effects won't trigger in quick sims)
-        new_game._triggers = {k: [] for k in self._triggers}
-        new_game._battlecry_handlers = self._battlecry_handlers
-        new_game._deathrattle_handlers = self._deathrattle_handlers
+        new_game._target_handlers = self._target_handlers
         new_game.action_history = []
         
+        Entity._next_id = next_id  # Game() resets the counter
         return new_game
 
+    def _share(self, shared: SharedList) -> None:
+        """Copy shared (a clone's zone of this game's cards) before this game changes."""
+        refs = self._shared
+        if not refs:
+            share_writes(1)
+            self.__dict__["_sharing"] = weakref.finalize(self, share_writes, -1)
+        key = id(shared)
+        drop = lambda *_: self._drop_shared(key)
+        refs[key] = weakref.ref(shared, drop)
+        shared.on_copy(drop)  # copied or collected: nothing left to protect
+    
+    def _drop_shared(self, key: int) -> None:
+        refs = self._shared
+        if refs.pop(key, None) is not None and not refs:
+            self._sharing()
+    
+    def unshare(self) -> None:
+        """Make clones copy the cards they still share with this game.
+        
+        Called before this game's entities change (Entity.__setattr__,
+        rollback), so a clone never sees changes made after it was taken.
+        """
+        refs = self._shared
+        if not refs:
+            return
+        self.__dict__["_shared"] = {}
+        self._sharing()
+        for ref in refs.values():
+            shared = ref()
+            if shared is not None:
+                shared.materialize()
+
+    # ==========================================
+    # DO/UNDO JOURNAL (search without cloning)
+    # ==========================================
+    
+    def mark(self) -> int:
+        """Return a point rollback() can restore; starts journaling on first use."""
+        if self._journal is None:
+            journal = Journal(self)
+            journal.start()
+            self.__dict__["_journal"] = journal
+        return self._journal.mark()
+    
+    def rollback(self, mark: int) -> None:
+        """Undo every change made since mark() (the mark stays usable)."""
+        if self._journal is None:
+            raise RuntimeError("rollback() without mark()")
+        self.unshare()
+        self._journal.rollback(mark)
+    
+    def end_journal(self) -> None:
+        """Stop journaling and keep the current state."""
+        if self._journal is not None:
+            self._journal.stop()
+            self.__dict__["_journal"] = None
+    
+    @property
+    def state_hash(self) -> int:
+        """64-bit identity of the game state: equal states have equal hashes.
+        
+        Maintained incrementally (simulator/zobrist.py): the first read hashes
+        every entity, later reads only re-hash the entities written since the
+        last one. The random stream and history counters are not part of the
+        state.
+        """
+        state_hash = self._state_hash
+        if state_hash is None:
+            state_hash = self.__dict__["_state_hash"] = zobrist.StateHash.of(self)
+        value = state_hash.flush(self)
+        choices = self.pending_choices
+        pending = zobrist.value_hash(choices.get("options")) if choices else 0
+        # Hand order is no card's attribute; hands are short, so hash it here
+        hands = tuple([card.entity_id for player in self.players for card in player.hand])
+        return value ^ zobrist.mix(hash((self.turn, self.current_player_idx, self.phase.value,
+                                         self.step.value, pending, hands)) & zobrist.MASK)
+    
     def discover(self, player: Player, options: List[Card], callback: Callable) -> None:
         """Pause game and wait for player to choose one of 3 cards."""
         self.pending_choices = {
@@ -182,7 +492,7 @@ class Game:
         
         self.pending_choices = None  # Clear before callback to avoid loops
         
-        callback(self, choice)
+        self._run_effect(callback, choice)
         
         # Process deaths after effect
         self.process_deaths()
@@ -203,9 +513,9 @@ class Game:
         if getattr(player, 'choose_both', False) or getattr(parent_card, '_choose_both', False):
             # Special case: execute all handlers instead of showing choice
             for idx, opt_id in enumerate(option_ids):
-                handler = self._get_effect_handler(parent_card.card_id, f"choose_one_{idx}")
+                handler = parent_card.data.effects.get(f"choose_one_{idx}")
                 if handler:
-                    handler(self, player, parent_card)
+                    self._run_effect(handler, player, parent_card)
             return True
             
         from .factory import create_card
@@ -266,8 +576,7 @@ class Game:
             "ADAPT_10", # +3 Attack
         ]
         
-        import random
-        chosen_ids = random.sample(adapt_options, 3)
+        chosen_ids = self.rng.sample(adapt_options, 3)
         options = [create_card(cid, minion.controller) for cid in chosen_ids]
         
         def adapt_callback(game, choice):
@@ -308,9 +617,8 @@ class Game:
         if not my_minions:
             return False
         
-        import random
-        my_card = random.choice(my_minions)
-        opp_card = random.choice(opp_minions) if opp_minions else None
+        my_card = self.rng.choice(my_minions)
+        opp_card = self.rng.choice(opp_minions) if opp_minions else None
         
         opp_cost = opp_card.cost if opp_card else -1
         
@@ -340,8 +648,6 @@ class Game:
         9. Horreur persistante (Lingering Horror) - Deathrattle: summon 1/1
         10. Serres de harpie (Harpy Talons) - +2 Attack and Rush
         """
-        import random
-        
         # Build list of applicable gifts
         applicable_gifts = []
         
@@ -410,35 +716,115 @@ class Game:
         )))
         
         # Pick one random gift
-        gift_name, gift_func = random.choice(applicable_gifts)
+        gift_name, gift_func = self.rng.choice(applicable_gifts)
         gift_func(minion)
         minion._dark_gift_name = gift_name  # Store for display
 
-    def register_trigger(self, event_name: str, source: Entity, callback: Callable) -> None:
-        """Register a trigger callback."""
-        if event_name in self._triggers:
-            self._triggers[event_name].append((source, callback))
+    def register_trigger(self, event_name: str, source: Entity, callback: Callable) -> int:
+        """Register a trigger callback; returns its handle."""
+        if event_name not in self._triggers:
+            raise ValueError(f"Unknown event: {event_name}")
+        handle = self._next_trigger_handle
+        self._next_trigger_handle = handle + 1
+        if isinstance(source, Hero) or source.zone in LIVE_ZONES:
+            self._triggers[event_name][handle] = (source, callback)
+        else:
+            self._dormant_triggers[handle] = (event_name, source, callback)
+        handles = self._trigger_handles.get(source.entity_id)
+        if handles is None:
+            self._trigger_handles[source.entity_id] = [(event_name, handle)]
+        else:
+            handles.append((event_name, handle))
+        if event_name.startswith("on_calculate_"):
+            self.aura_version += 1
+        return handle
+    
+    def register_aura(self, source: Card, aura: Aura) -> int:
+        """Apply an aura while source is in one of its zones; returns its handle."""
+        handle = self._next_trigger_handle
+        self._next_trigger_handle = handle + 1
+        self._auras[handle] = (source, aura)
+        self.aura_version += 1
+        return handle
+    
+    def unregister_auras(self, source: Entity) -> None:
+        """Remove every aura provided by source."""
+        handles = [handle for handle, (aura_source, _) in self._auras.items() if aura_source is source]
+        for handle in handles:
+            del self._auras[handle]
+        if handles:
+            self.aura_version += 1
+    
+    def invalidate_auras(self) -> None:
+        """Recompute every card's aura bonus on its next stat read.
+        
+        The game does this itself when cards move; call it after changing
+        something an aura condition reads that the game cannot see.
+        """
+        self.aura_version += 1
+    
+    def take_control(self, minion: Card, player: Player) -> None:
+        """Move a minion on the board to player's side (mind control)."""
+        old = minion.controller
+        if old is player:
+            return
+        if old is not None and minion in old.board:
+            old.board.remove(minion)
+        player.board.append(minion)
+        minion.controller = player
+        self.aura_version += 1
     
     def unregister_triggers(self, source: Entity) -> None:
-        """Remove all triggers for a specific source."""
-        for event_name in self._triggers:
-            self._triggers[event_name] = [t for t in self._triggers[event_name] if t[0] != source]
+        """Remove all triggers and auras for a specific source."""
+        if self._auras:
+            self.unregister_auras(source)
+        handles = self._trigger_handles.pop(source.entity_id, None)
+        if not handles:
+            return
+        for event_name, handle in handles:
+            if self._triggers[event_name].pop(handle, None) is None:
+                self._dormant_triggers.pop(handle, None)
+            if event_name.startswith("on_calculate_"):
+                self.aura_version += 1
+    
+    def _on_zone_change(self, entity: Entity) -> None:
+        """Move an entity's triggers between live and dormant (Entity.zone setter)."""
+        handles = self._trigger_handles.get(entity.entity_id)
+        if not handles or isinstance(entity, Hero):
+            return
+        if entity.zone in LIVE_ZONES:
+            for event_name, handle in handles:
+                entry = self._dormant_triggers.pop(handle, None)
+                if entry is not None:
+                    self._triggers[event_name][handle] = entry[1:]
+        else:
+            for event_name, handle in handles:
+                entry = self._triggers[event_name].pop(handle, None)
+                if entry is not None:
+                    self._dormant_triggers[handle] = (event_name,) + entry
+    
+    def has_listeners(self, event_name: str) -> bool:
+        """Whether firing the event would call anything."""
+        return bool(self._triggers.get(event_name))
 
     def fire_event(self, event_name: str, *args, **kwargs) -> None:
         """Execute all callbacks for an event."""
-        if event_name not in self._triggers:
+        subscribers = self._triggers.get(event_name)
+        if not subscribers:
             return
-            
-        # Execute callbacks
-        for source, callback in list(self._triggers[event_name]):
-            # Only trigger if source is in play or special (Hero)
-            source_zone = getattr(source, 'zone', None)
-            
-            if source_zone == Zone.PLAY or source_zone == Zone.HAND or isinstance(source, Hero):
+        
+        previous = rng_streams.activate(self.rng)
+        try:
+            for handle, (source, callback) in tuple(subscribers.items()):
+                # Skip triggers removed (or whose source left play) during this event
+                if handle not in subscribers:
+                    continue
                 try:
                     callback(self, source, *args, **kwargs)
                 except Exception as e:
-                    print(f"CRITICAL ERROR executing trigger '{event_name}' for {source.name}: {e}")
+                    self._effect_failed(getattr(source, "card_id", None), event_name, e)
+        finally:
+            rng_streams.restore(previous)
 
     # ==========================================
     # DELAYED DEATH PROCESSING (PDF Spec Section 4.2)
@@ -450,82 +836,100 @@ class Game:
         Per PDF: 'Lorsqu'une entité atteint 0 PV, elle n'est pas retirée immédiatement.
         Elle reçoit le Tag MORTALLY_WOUNDED. Elle reste sur le plateau.'
         """
-        if not entity.has_tag(GameTag.MORTALLY_WOUNDED):
-            entity.set_tag(GameTag.MORTALLY_WOUNDED, 1)
-            self._pending_deaths.append(entity)
+        tags = entity.tags
+        if not tags.get(_MORTALLY_WOUNDED):
+            entity.touch()
+            tags[_MORTALLY_WOUNDED] = 1
+            if not tags.get(_TO_BE_DESTROYED):
+                self._pending_deaths.append(entity)
+    
+    def destroy(self, entity: Card) -> None:
+        """Mark an entity for destruction (it dies at the next death check)."""
+        tags = entity.tags
+        if not tags.get(_TO_BE_DESTROYED):
+            entity.touch()
+            tags[_TO_BE_DESTROYED] = 1
+            if not tags.get(_MORTALLY_WOUNDED):
+                self._pending_deaths.append(entity)
     
     def process_deaths(self) -> List[Card]:
-        """Process all mortally wounded entities at end of phase.
+        """Resolve the queued deaths at the end of a phase.
         
         Per PDF: 'Le moteur ne vérifie les morts qu'à la fin de la Phase.'
-        Deathrattles are resolved sequentially by Play Order (first played first).
+        Entities are queued when damage takes them to 0 health (mark_for_death)
+        or when they are destroyed, so this does nothing when the queue is
+        empty. Each batch resolves in Play Order (first played first); deaths
+        caused by deathrattles form the next batch.
         
         Returns:
             List of entities that actually died.
         """
-        # Sort by summon timestamp (Play Order - PDF Section 4.2)
-        deaths_to_process = sorted(
-            [e for e in self._pending_deaths if e.has_tag(GameTag.MORTALLY_WOUNDED)],
-            key=lambda e: getattr(e, 'summon_timestamp', 0)
-        )
-        
-        actually_died: List[Card] = []
-        
-        for entity in deaths_to_process:
-            # Re-check if still mortally wounded (could have been healed)
-            if entity.health > 0:
-                entity.set_tag(GameTag.MORTALLY_WOUNDED, 0)
-                continue
-            
-            actually_died.append(entity)
-            
-            # Get controller before moving zones
-            controller = entity.controller
-            
-            # Fire death event
-            self.fire_event("on_minion_death", entity)
-            if controller:
-                self.fire_event("on_friendly_death", entity)
-            
-            # Process deathrattle (if not silenced)
-            if not entity.silenced and entity.data.deathrattle:
-                handler = self._deathrattle_handlers.get(entity.card_id)
-                if handler:
-                    try:
-                        handler(self, entity.controller, entity)
-                    except Exception as e:
-                        print(f"Deathrattle error for {entity.name}: {e}")
+        pending = self._pending_deaths
+        if not pending:
+            return []
+        
+        died: List[Card] = []
+        while pending:
+            batch = sorted(pending, key=_play_order)
+            pending.clear()
+            for entity in batch:
+                if self._resolve_death(entity):
+                    died.append(entity)
+        return died
+    
+    def _resolve_death(self, entity: Card) -> bool:
+        """Kill one queued entity unless it was healed or already left play."""
+        tags = entity.tags
+        destroyed = tags.pop(_TO_BE_DESTROYED, 0)
+        wounded = tags.pop(_MORTALLY_WOUNDED, 0)
+        controller = entity.controller
+        if not controller or entity.zone != Zone.PLAY:
+            return False
+        if not destroyed and not (wounded and entity.health <= 0):
+            return False
+        
+        # Remove from board
+        controller.remove_from_board(entity)
+        
+        # Trigger deathrattle
+        if entity.data.deathrattle and not entity.silenced:
+            self._trigger_deathrattle(entity)
+        
+        # Handle reborn
+        if entity.reborn and not entity.silenced:
+            self._handle_reborn(entity)
+        
+        # Move to graveyard
+        entity.zone = Zone.GRAVEYARD
+        controller.graveyard.append(entity)
+        self.unregister_triggers(entity)
+        if entity.card_type == CardType.MINION:
+            controller.dead_minions.append(entity.card_id)
             
-            # Death Knight: Generate corpse (unless DONT_LEAVE_CORPSE)
-            if controller and not entity.has_tag(GameTag.DONT_LEAVE_CORPSE):
-                if hasattr(controller, 'corpses'):
-                    controller.corpses = getattr(controller, 'corpses', 0) + 1
+            # === CORPSE: Death Knight gains a corpse ===
+            if not entity.has_tag(GameTag.DONT_LEAVE_CORPSE):
+                controller.corpses += 1
             
-            # Move to graveyard
-            entity.zone = Zone.GRAVEYARD
-            if controller:
-                if entity in controller.board:
-                    controller.board.remove(entity)
+            # === STARSHIP: Components are added to storage ===
+            if entity.data.starship_piece:
+                controller.starship_pieces.append(entity.card_id)
             
-            # Unregister triggers
-            self.unregister_triggers(entity)
+            # === INFUSE: Advance infuse on cards in hand ===
+            for card in controller.hand:
+                if card.data.infuse and not card._infused:
+                    card._infuse_progress += 1
+                    if card._infuse_progress >= card.data.infuse_cost:
+                        card._infused = True
+                        # Trigger infuse transformation
+                        if self.tracing:
+                            self._trace(trace.INFUSE, card=trace.ref(card))
+                        handler = card.data.effects.on_infuse
+                        if handler:
+                            self._run_effect(handler, controller, card)
             
-            # Handle reborn
-            if entity.reborn and not entity.silenced:
-                self._handle_reborn(entity, controller)
-        
-        self._pending_deaths.clear()
-        return actually_died
-    
-    def _handle_reborn(self, entity: Card, controller: Player) -> None:
-        """Handle reborn mechanic - summon 1 HP copy."""
-        from .factory import create_card
-        reborn_copy = create_card(entity.card_id, self)
-        if reborn_copy and controller:
-            reborn_copy._health = 1
-            reborn_copy._max_health = 1
-            reborn_copy._reborn = False  # Reborn doesn't stack
-            controller.summon(reborn_copy)
+            self.fire_event("on_minion_death", entity)
+            self.fire_event("on_friendly_death", entity)
+        return True
 
     def trigger_secrets(self, event_type: str, triggering_player: Player, **kwargs) -> Optional[Card]:
         """
@@ -548,11 +952,10 @@ class Game:
         
         for secret in list(opponent.secrets):  # Copy list to allow modification
             # Get the secret's effect handler
-            handler = self._get_secret_handler(secret.card_id, event_type)
+            handler = secret.data.effects.get(f"on_{event_type}")
             if handler:
                 # Check if the secret should trigger
-                should_trigger = handler(self, opponent, secret, **kwargs)
-                if should_trigger:
+                if self._run_effect(handler, opponent, secret, **kwargs):
                     # Secret triggered! Remove it from play
                     opponent.secrets.remove(secret)
                     secret.zone = Zone.GRAVEYARD
@@ -565,51 +968,24 @@ class Game:
 
     def _get_secret_handler(self, card_id: str, event_type: str) -> Optional[Callable]:
         """Get the secret handler for a specific card and event type."""
-        try:
-            # Try to import the effect module
-            import importlib
-            
-            # Search in multiple effect folders
-            for folder in ['classic', 'basic', 'naxx', 'gvg', 'tgt', 'wog', 'msg', 
-                          'ungoro', 'kft', 'knc', 'witchwood', 'boomsday', 'rastakhan',
-                          'ros', 'uldum', 'dragons', 'outland', 'scholomance', 'darkmoon',
-                          'barrens', 'stormwind', 'alterac', 'sunken', 'nathria', 'lich',
-                          'titans', 'badlands', 'whizbang', 'great_dark_beyond', 'perils',
-                          'space', 'core']:
-                try:
-                    module = importlib.import_module(f"card_effects.{folder}.effect_{card_id}")
-                    # Look for the event handler in the module
-                    handler_name = f"on_{event_type}"
-                    if hasattr(module, handler_name):
-                        return getattr(module, handler_name)
-                except ImportError:
-                    continue
-            return None
-        except Exception:
-            return None
+        return EffectRegistry.get_handler(card_id, f"on_{event_type}")
 
     def _get_effect_handler(self, card_id: str, handler_name: str) -> Optional[Callable]:
         """Get a specific effect handler for a card (spellburst, frenzy, etc.)."""
+        return EffectRegistry.get_handler(card_id, handler_name)
+
+    def _run_effect(self, handler: Callable, *args, **kwargs) -> Any:
+        """Call an effect handler, isolating the engine from script errors."""
+        previous = rng_streams.activate(self.rng)
         try:
-            import importlib
-            
-            folders = ['classic', 'basic', 'naxx', 'gvg', 'tgt', 'wog', 'msg', 
-                      'ungoro', 'kft', 'knc', 'witchwood', 'boomsday', 'rastakhan',
-                      'ros', 'uldum', 'dragons', 'outland', 'scholomance', 'darkmoon',
-                      'barrens', 'stormwind', 'alterac', 'sunken', 'nathria', 'lich',
-                      'titans', 'badlands', 'whizbang', 'great_dark_beyond', 'perils',
-                      'space', 'core', 'time_travel', 'starcraft']
-            
-            for folder in folders:
-                try:
-                    module = importlib.import_module(f"card_effects.{folder}.effect_{card_id}")
-                    if hasattr(module, handler_name):
-                        return getattr(module, handler_name)
-                except ImportError:
-                    continue
-            return None
-        except Exception:
+            return handler(self, *args, **kwargs)
+        except Exception as e:
+            card = next((arg for arg in args if isinstance(arg, Card)), None)
+            card_id = card.card_id if card is not None else getattr(handler, "__module__", "").rpartition(".")[2]
+            self._effect_failed(card_id, getattr(handler, "__name__", str(handler)), e)
             return None
+        finally:
+            rng_streams.restore(previous)
 
     @property
     def current_player(self) -> Player:
@@ -652,9 +1028,9 @@ class Game:
             modified_cost -= player.next_hero_power_cost_reduction
             
         # 3. Dynamic modifiers from script
-        cost_modifier_handler = self._get_effect_handler(card.card_id, "get_cost_modifier")
+        cost_modifier_handler = card.data.effects.get_cost_modifier
         if cost_modifier_handler:
-            modified_cost += cost_modifier_handler(self, player, card)
+            modified_cost += self._run_effect(cost_modifier_handler, player, card) or 0
             
         return max(0, modified_cost)
 
@@ -662,14 +1038,18 @@ class Game:
         """Setup a new game with two players."""
         self.players = [player1, player2]
         
-        # Link players
-        player1.game = self
-        player2.game = self
+        # Link players. Players made before this game reset the entity IDs get
+        # new ones, or they would share an ID with the first cards
+        for player in (player1, player2):
+            if player.game is not self:
+                player.entity_id = Entity._next_id
+                Entity._next_id += 1
+                player.game = self
         player1.opponent = player2
         player2.opponent = player1
         
         # Randomly decide who goes first
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.players = [player2, player1]
         
         # Give second player The Coin (using create_card to Ensure effects are loaded)
@@ -677,8 +1057,26 @@ class Game:
         coin = create_card("GAME_005", self.players[1])
         self.players[1].add_to_hand(coin)
         
+        if any(p.deck for p in self.players):
+            self.preload_effects()
+        
         self.phase = GamePhase.MULLIGAN
     
+    def preload_effects(self, strict: bool = False) -> PreloadReport:
+        """Resolve every effect both decks can reach before the first turn.
+        
+        Call again after the decks are built if they were added after setup().
+        """
+        card_ids = set()
+        for player in self.players:
+            for card in player.deck + player.hand:
+                card_ids.add(card.card_id)
+            if player.hero:
+                card_ids.add(player.hero.card_id)
+            if player.hero_power:
+                card_ids.add(player.hero_power.card_id)
+        return EffectRegistry.preload(card_ids, strict=strict)
+    
     def start_mulligan(self) -> None:
         """Start the mulligan phase."""
         # Draw starting hands
@@ -728,9 +1126,9 @@ class Game:
             all_potential_cards = player.deck + player.hand
             for card in all_potential_cards:
                 if card.data.start_of_game:
-                    handler = self._get_effect_handler(card.card_id, "on_start_of_game")
+                    handler = card.data.effects.on_start_of_game
                     if handler:
-                        handler(self, player, card)
+                        self._run_effect(handler, player, card)
         
         # First player starts their turn
         self.fire_event("on_turn_start", self.current_player)
@@ -749,6 +1147,7 @@ class Game:
         self.current_player_idx = 1 - self.current_player_idx
         self.turn += 1
         self.actions_this_turn = 0
+        self.aura_version += 1
         
         # Check turn limit
         if self.turn > self.config.max_turns:
@@ -859,11 +1258,11 @@ class Game:
             return False
             
         # Trigger ability effect
-        handler = self._get_effect_handler(titan.card_id, f"titan_ability_{ability_idx}")
+        handler = titan.data.effects.get(f"titan_ability_{ability_idx}")
         if handler:
-            if not self.is_simulation:
-                print(f"   ⚡ TITAN ABILITY: {titan.name} uses '{ability_id}'")
-            handler(self, titan.controller, titan, target=target)
+            if self.tracing:
+                self._trace(trace.TITAN_ABILITY, card=trace.ref(titan), ability=ability_id)
+            self._run_effect(handler, titan.controller, titan, target=target)
             
         titan.titan_abilities_used.append(ability_id)
         titan.attacks_this_turn += 1
@@ -928,7 +1327,7 @@ class Game:
         # === MINIATURIZE: Add 1/1 copy to hand ===
         if result and card.data.miniaturize and len(player.hand) < 10:
             from simulator.factory import create_card
-            mini_copy = create_card(card.card_id, self)
+            mini_copy = create_card(card.card_id, player)
             if mini_copy:
                 mini_copy._attack = 1
                 mini_copy._health = 1
@@ -940,7 +1339,7 @@ class Game:
         # === ECHO: Add a copy back to hand ===
         if result and is_echo and len(player.hand) < 10:
             from simulator.factory import create_card
-            echo_copy = create_card(card.card_id, self)
+            echo_copy = create_card(card.card_id, player)
             if echo_copy:
                 echo_copy._echo_copy = True  # Mark as echo copy (disappears at end of turn)
                 player.add_to_hand(echo_copy)
@@ -952,7 +1351,8 @@ class Game:
                 if hand_card.data.corrupt and hand_card.data.corrupted_version:
                     if played_cost > hand_card.data.cost and not getattr(hand_card, '_corrupted', False):
                         # Transform into corrupted version
-                        corrupted = create_card(hand_card.data.corrupted_version, self)
+                        from simulator.factory import create_card
+                        corrupted = create_card(hand_card.data.corrupted_version, player)
                         if corrupted:
                             idx = player.hand.index(hand_card)
                             player.hand[idx] = corrupted
@@ -970,20 +1370,12 @@ class Game:
         minion = card if isinstance(card, Minion) else Minion(card.data, self)
         player = self.current_player
         
-        # DEBUG prints for development, disabled for training
-        # if not self.is_simulation:
-        #     print(f"DEBUG: _play_minion called for {minion.name}, mag: {minion.data.magnetic}, pos: {position}, board: {len(player.board)}")
-        
-        # print(f"DEBUG: _play_minion called for {minion.name}, mag: {minion.data.magnetic}, pos: {position}, board: {len(player.board)}")
-        
         # === MAGNETIC: Check if played to the left of a Mech ===
         if minion.data.magnetic and position != -1 and position < len(player.board):
             target_mech = player.board[position]
-            if not self.is_simulation:
-                print(f"DEBUG: Magnetic check - Target: {target_mech.name}, Race: {target_mech.data.race}")
             if target_mech.data.race and ('MECH' in str(target_mech.data.race).upper() or target_mech.data.race == Race.MECHANICAL):
-                if not self.is_simulation:
-                    print(f"DEBUG: Magnetic fusing {minion.name} into {target_mech.name}")
+                if self.tracing:
+                    self._trace(trace.MAGNETIC, card=trace.ref(minion), target=trace.ref(target_mech))
                 # Fuse into the target mech
                 target_mech._attack += minion.attack
                 target_mech._health += minion.health
@@ -1013,7 +1405,7 @@ class Game:
                 if len(player.board) >= 7:
                     break
                 from simulator.factory import create_card
-                appendage = create_card(appendage_id, self)
+                appendage = create_card(appendage_id, player)
                 if appendage:
                     app_minion = Minion(appendage.data, self) if not isinstance(appendage, Minion) else appendage
                     app_minion.controller = player
@@ -1030,8 +1422,8 @@ class Game:
         
         # Trigger battlecry
         if card.data.battlecry:
-            if not self.is_simulation:
-                print(f"   ⚡ BATTLECRY: {minion.name} is activating!")
+            if self.tracing:
+                self._trace(trace.BATTLECRY, card=trace.ref(minion), target=trace.ref(target))
             self._trigger_battlecry(minion, target)
         
         # Process deaths
@@ -1042,6 +1434,7 @@ class Game:
     
     def _play_spell(self, card: Card, target: Optional[Card] = None) -> bool:
         """Play a spell card."""
+        player = self.current_player
         player.spells_played_this_turn += 1
         
         # Consume Preparation reduction
@@ -1060,17 +1453,19 @@ class Game:
             return True
         
         # Trigger spell effect
-        if card.card_id in self._battlecry_handlers:
-            if not self.is_simulation:
-                print(f"   ⚡ SPELL EFFECT: {card.name}")
-            self._battlecry_handlers[card.card_id](self, card, target)
+        effects = card.data.effects
+        spell_effect = effects.on_play or effects.battlecry
+        if spell_effect:
+            if self.tracing:
+                self._trace(trace.SPELL, card=trace.ref(card), target=trace.ref(target))
+            self._run_effect(spell_effect, card, target)
         
         # === SPELLBURST: Trigger friendly minions with Spellburst ===
         for minion in player.board:
             if minion.data.spellburst and not minion._spellburst_triggered:
-                handler = self._get_effect_handler(minion.card_id, "on_spellburst")
+                handler = minion.data.effects.on_spellburst
                 if handler:
-                    handler(self, player, minion, spell=card)
+                    self._run_effect(handler, player, minion, spell=card)
                 minion._spellburst_triggered = True  # One-time trigger
         
         # Fire event for Quest advancement
@@ -1081,7 +1476,7 @@ class Game:
         is_twinspell = card.data.twinspell and not getattr(card, '_is_twinspell_copy', False)
         if is_twinspell and len(player.hand) < 10:
             from simulator.factory import create_card
-            twin_copy = create_card(card.card_id, self)
+            twin_copy = create_card(card.card_id, player)
             if twin_copy:
                 twin_copy._is_twinspell_copy = True  # Second cast doesn't twinspell
                 twin_copy.data = twin_copy.data  # Keep same data but mark as copy
@@ -1107,9 +1502,11 @@ class Game:
         self.current_player.equip_weapon(weapon)
         
         # Trigger on_equip
-        handler = self._get_effect_handler(weapon.card_id, "on_equip")
-        if handler:
-            handler(self, self.current_player, weapon)
+        effects = weapon.data.effects
+        if effects.on_equip:
+            self._run_effect(effects.on_equip, self.current_player, weapon)
+        elif effects.battlecry:
+            self._run_effect(effects.battlecry, weapon, None)
             
         self.fire_event("on_weapon_equipped", weapon)
         return True
@@ -1146,13 +1543,13 @@ class Game:
             "defender": defender.card_id
         })
 
-        if not self.is_simulation:
-            print(f"   ⚔️ ATTACK: {attacker.name} attacks {defender.name}")
+        if self.tracing:
+            self._trace(trace.ATTACK, attacker=trace.ref(attacker), defender=trace.ref(defender))
         
         # === OGRE RULE: 50% chance to attack wrong enemy (PDF Section 9.1) ===
         # Cards with "forgetful" (like Ogre Brute, Mogor) can redirect attacks
         has_forgetful = getattr(attacker.data, 'forgetful', False) if hasattr(attacker, 'data') else False
-        if has_forgetful and random.random() < 0.5:
+        if has_forgetful and self.rng.random() < 0.5:
             # Get all valid enemy targets (ignoring Taunt for redirect!)
             all_enemies = []
             if player.opponent.hero and not player.opponent.hero.immune:
@@ -1162,7 +1559,7 @@ class Game:
             # Pick a random different target
             other_targets = [t for t in all_enemies if t != defender]
             if other_targets:
-                defender = random.choice(other_targets)
+                defender = self.rng.choice(other_targets)
                 # Log redirect (for UI/debugging)
                 self._log_action("attack_redirect", {
                     "attacker": attacker.card_id,
@@ -1214,8 +1611,8 @@ class Game:
                 for n in neighbors:
                     self.deal_damage(n, attacker_damage, attacker)
         
-        # Defender hits back (unless attacking a hero with a weapon)
-        if defender.card_type != CardType.HERO or not isinstance(attacker, Hero):
+        # Minions hit back; heroes only deal damage when they attack
+        if defender.card_type != CardType.HERO:
             self.deal_damage(attacker, defender_damage, defender)
             
         # === AFTER ATTACK: Trigger hero attack effects ===
@@ -1244,9 +1641,19 @@ class Game:
             
         # Modify damage amount (auras like Talgath)
         # Using a dictionary to pass mutable value
-        modifier = {"amount": amount}
-        self.fire_event("on_calculate_damage", target, source, modifier)
-        amount = modifier["amount"]
+        if self._auras:
+            for aura_source, aura in self._auras.values():
+                if (aura.damage_factor != 1 and aura.active(aura_source)
+                        and aura.condition(aura_source, target)):
+                    amount *= aura.damage_factor
+        if self.has_listeners("on_calculate_damage"):
+            modifier = {"amount": amount}
+            self.fire_event("on_calculate_damage", target, source, modifier)
+            amount = modifier["amount"]
+        if target._hallucination:
+            amount *= 2
+        if amount <= 0:
+            return 0  # no damage: shields, poison and lifesteal do not apply
         if target.divine_shield:
             target._divine_shield = False
             self.fire_event("on_divine_shield_lost", target)
@@ -1258,10 +1665,11 @@ class Game:
         else:
             target._damage += amount
             actual_damage = amount
+            if target.health <= 0 and target._zone == Zone.PLAY:
+                self.mark_for_death(target)
             
-        if actual_damage > 0 and not self.is_simulation:
-            source_name = "Fatigue" if source is None else source.name
-            print(f"   🩸 DAMAGE: {target.name} takes {actual_damage} from {source_name}")
+        if actual_damage > 0 and self.tracing:
+            self._trace(trace.DAMAGE, target=trace.ref(target), amount=actual_damage, source=trace.ref(source))
         
         if actual_damage > 0:
             if isinstance(target, Hero) and target.controller:
@@ -1274,9 +1682,9 @@ class Game:
             
         # Lifesteal
         if source and source.lifesteal and source.controller:
-            if not self.is_simulation:
-                print(f"   ❤️ LIFESTEAL: {source.name} heals for {actual_damage}")
-            source.controller.hero.take_damage(-actual_damage)  # Heal
+            if self.tracing:
+                self._trace(trace.LIFESTEAL, source=trace.ref(source), amount=actual_damage)
+            self.heal(source.controller.hero, actual_damage, source)
         
         # Poisonous kills minions
         if source and source.poisonous and target.card_type == CardType.MINION:
@@ -1285,9 +1693,9 @@ class Game:
         # === FRENZY: Trigger once when minion takes damage ===
         if target.card_type == CardType.MINION and target.data.frenzy and not target._frenzy_triggered:
             if actual_damage > 0 and target.health > 0:  # Must survive the damage
-                handler = self._get_effect_handler(target.card_id, "on_frenzy")
+                handler = target.data.effects.on_frenzy
                 if handler and target.controller:
-                    handler(self, target.controller, target)
+                    self._run_effect(handler, target.controller, target)
                 target._frenzy_triggered = True
         
         # === OVERKILL: Trigger when excess damage kills target ===
@@ -1295,16 +1703,16 @@ class Game:
             if target.health <= 0:  # Target is dead
                 excess_damage = -target.health  # How much overkill
                 if excess_damage >= 0:
-                    handler = self._get_effect_handler(source.card_id, "on_overkill")
+                    handler = source.data.effects.on_overkill
                     if handler and source.controller:
-                        handler(self, source.controller, source, excess=excess_damage)
+                        self._run_effect(handler, source.controller, source, excess=excess_damage)
         
         # === HONORABLE KILL: Trigger when exact lethal damage (no excess) ===
         if source and source.data.honorable_kill and target.card_type == CardType.MINION:
             if target.health == 0:  # Exactly lethal
-                handler = self._get_effect_handler(source.card_id, "on_honorable_kill")
+                handler = source.data.effects.on_honorable_kill
                 if handler and source.controller:
-                    handler(self, source.controller, source, target=target)
+                    self._run_effect(handler, source.controller, source, target=target)
         
         return actual_damage
     
@@ -1325,12 +1733,12 @@ class Game:
             
             # === OVERHEAL: Trigger if healing past full ===
             if potential_overheal > 0 and source and source.data.overheal:
-                handler = self._get_effect_handler(source.card_id, "on_overheal")
+                handler = source.data.effects.on_overheal
                 if handler and target.controller:
-                    handler(self, target.controller, source, overheal=potential_overheal)
+                    self._run_effect(handler, target.controller, source, overheal=potential_overheal)
             
-            if healed > 0 and not self.is_simulation:
-                print(f"   💚 HEAL: {target.name} restored {healed} HP from {source.name if source else 'Unknown'}")
+            if healed > 0 and self.tracing:
+                self._trace(trace.HEAL, target=trace.ref(target), amount=healed, source=trace.ref(source))
             
             return healed
         elif isinstance(target, Card):
@@ -1339,18 +1747,13 @@ class Game:
             
             # === OVERHEAL: Trigger for minions too ===
             if potential_overheal > 0 and source and source.data.overheal:
-                handler = self._get_effect_handler(source.card_id, "on_overheal")
+                handler = source.data.effects.on_overheal
                 if handler and target.controller:
-                    handler(self, target.controller, source, overheal=potential_overheal)
+                    self._run_effect(handler, target.controller, source, overheal=potential_overheal)
             
             return healed
         return 0
     
-    def destroy(self, entity: Card) -> None:
-        """Mark an entity for destruction."""
-        if entity not in self._pending_deaths:
-            self._pending_deaths.append(entity)
-    
     def silence(self, target: Card) -> None:
         """
         Silence a minion - removes all card text and enchantments.
@@ -1360,6 +1763,7 @@ class Game:
             return
         
         target.silenced = True
+        self.aura_version += 1
         
         # Reset keywords to False
         target._taunt = False
@@ -1395,91 +1799,25 @@ class Game:
         self.fire_event("on_silence", target)
 
     
-    def process_deaths(self) -> None:
-        """Process all pending deaths."""
-        while self._pending_deaths or any(
-            m.is_dead() for p in self.players for m in p.board
-        ):
-            # Check for new deaths
-            for player in self.players:
-                for minion in player.board[:]:
-                    if minion.is_dead() and minion not in self._pending_deaths:
-                        self._pending_deaths.append(minion)
-            
-            if not self._pending_deaths:
-                break
-            
-            # Process deaths in order of summon (Hearthstone rule)
-            deaths = sorted(self._pending_deaths, key=lambda x: getattr(x, 'summon_timestamp', 0))
-            self._pending_deaths.clear()
-            
-            for entity in deaths:
-                if entity.controller:
-                    # Remove from board
-                    entity.controller.remove_from_board(entity)
-                    
-                    # Trigger deathrattle
-                    if entity.data.deathrattle and not entity.silenced:
-                        self._trigger_deathrattle(entity)
-                    
-                    # Handle reborn
-                    if entity.reborn and not entity.silenced:
-                        self._handle_reborn(entity)
-                    
-                    # Move to graveyard
-                    entity.zone = Zone.GRAVEYARD
-                    entity.controller.graveyard.append(entity)
-                    if entity.card_type == CardType.MINION:
-                        entity.controller.dead_minions.append(entity.card_id)
-                        
-                        # === CORPSE: Death Knight gains a corpse ===
-                        entity.controller.corpses += 1
-                        
-                        # === STARSHIP: Components are added to storage ===
-                        if entity.data.starship_piece:
-                            entity.controller.starship_pieces.append(entity.card_id)
-                        
-                        # === INFUSE: Advance infuse on cards in hand ===
-                        for card in entity.controller.hand:
-                            if card.data.infuse and not card._infused:
-                                card._infuse_progress += 1
-                                if card._infuse_progress >= card.data.infuse_cost:
-                                    card._infused = True
-                                    # Trigger infuse transformation
-                                    if not self.is_simulation:
-                                        print(f"   💎 INFUSE: {card.name} has been Infused!")
-                                    handler = self._get_effect_handler(card.card_id, "on_infuse")
-                                    if handler:
-                                        handler(self, entity.controller, card)
-                        
-                        self.fire_event("on_minion_death", entity)
-    
     def _trigger_battlecry(self, minion: Card, target: Optional[Card]) -> None:
         """Trigger a battlecry effect."""
-        if minion.card_id in self._battlecry_handlers:
-            self._battlecry_handlers[minion.card_id](self, minion, target)
+        effects = minion.data.effects
+        handler = effects.battlecry or effects.on_play
+        if handler:
+            self._run_effect(handler, minion, target)
     
     def _trigger_deathrattle(self, minion: Card) -> None:
         """Trigger a deathrattle effect."""
-        if not self.is_simulation:
-            print(f"   💀 DEATHRATTLE: {minion.name} is activating!")
-        if minion.card_id in self._deathrattle_handlers:
-            self._deathrattle_handlers[minion.card_id](self, minion)
+        if self.tracing:
+            self._trace(trace.DEATHRATTLE, card=trace.ref(minion))
+        handler = minion.data.effects.deathrattle
+        if handler:
+            self._run_effect(handler, minion)
     
     def _handle_reborn(self, minion: Card) -> None:
         """Handle reborn mechanic."""
         # Create a copy with 1 health and no reborn
-        new_data = CardData(
-            card_id=minion.card_id,
-            name=minion.name,
-            cost=minion.data.cost,
-            attack=minion.data.attack,
-            health=1,  # Reborn with 1 health
-            card_type=CardType.MINION,
-            taunt=minion.data.taunt,
-            divine_shield=minion.data.divine_shield,
-            # No reborn on reborn copy
-        )
+        new_data = minion.data.replace(health=1, reborn=False)
         reborn_minion = Minion(new_data, self)
         reborn_minion._reborn = False  # Can't reborn again
         
@@ -1514,8 +1852,10 @@ class Game:
         })
         
         # Trigger effect
-        if hero_power.card_id in self._battlecry_handlers:
-            self._battlecry_handlers[hero_power.card_id](self, hero_power, target)
+        effects = hero_power.data.effects
+        handler = effects.battlecry or effects.on_play
+        if handler:
+            self._run_effect(handler, hero_power, target)
         
         # Process deaths
         self.process_deaths()
@@ -1573,7 +1913,8 @@ class Game:
                         target = target_player.hero
                     elif 0 <= action.target_index < len(target_player.board):
                         target = target_player.board[action.target_index]
-                return self.play_card(card, target=target, position=action.position or -1)
+                position = action.position if action.position is not None else -1
+                return self.play_card(card, target=target, position=position)
                 
             elif action.action_type == ActionType.ATTACK:
                 attacker = None
@@ -1611,9 +1952,15 @@ class Game:
                 if action.card_index is not None and action.card_index < len(player.hand):
                     return self.forge_card(player.hand[action.card_index])
 
+            elif action.action_type == ActionType.CHOOSE:
+                return self.choose_discover(action.choice_index or 0)
+                    
+            elif action.action_type == ActionType.TITAN:
+                if action.attacker_index is not None and 0 <= action.attacker_index < len(player.board):
+                    return self.use_titan_ability(player.board[action.attacker_index], action.choice_index or 0)
+
         except Exception as e:
-            if not self.is_simulation:
-                print(f"Error executing action {action}: {e}")
+            self._action_failed(action, e)
         return False
 
     def concede(self, player: Player) -> None:
@@ -1622,6 +1969,32 @@ class Game:
         winner = player.opponent
         self._end_game(winner)
     
+    def set_trace_sink(self, sink: Optional[trace.TraceSink]) -> None:
+        """Send this game's trace records to sink (None disables tracing)."""
+        self.trace_sink = sink
+        self.tracing = sink is not None
+    
+    def _trace(self, kind: str, **data: Any) -> None:
+        """Emit a trace record; call sites check self.tracing first."""
+        self._trace_seq += 1
+        self.trace_sink.emit(trace.TraceEvent(self._trace_seq, self.turn, self.current_player_idx, kind, data))
+    
+    def _effect_failed(self, card_id: Optional[str], where: str, error: Exception) -> None:
+        """Count (and trace) an exception swallowed from an effect script."""
+        trace.count_effect_error(card_id)
+        if self.tracing:
+            self._trace(trace.EFFECT_ERROR, card_id=card_id, where=where, error=repr(error))
+    
+    def _action_failed(self, action: 'Action', error: Exception) -> None:
+        """Count, log (and trace) an exception swallowed by execute_action."""
+        action_type = getattr(action.action_type, "name", str(action.action_type))
+        if trace.count_action_error(action_type, error) == 1:
+            logger.warning("execute_action(%s) failed: %r", action, error, exc_info=error)
+        else:
+            logger.debug("execute_action(%s) failed: %r", action, error)
+        if self.tracing:
+            self._trace(trace.ACTION_ERROR, action=str(action), error=repr(error))
+    
     def _log_action(self, action_type: str, data: Dict[str, Any]) -> None:
         """Log an action for replay/training."""
         if self.is_simulation:
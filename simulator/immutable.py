@@ -4,7 +4,7 @@ Permet de cloner l'état du jeu en O(1) au lieu de O(N).
 Basé sur le principe du 'Public Belief State' et du versioning léger.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 class ImmutableDict:
     """Dict immuable avec Copy-on-Write (CoW)."""
@@ -72,3 +72,87 @@ class GameSnapshot:
         if self._parent:
             return self._parent.get_player_stat(player_idx, key, default)
         return default
+
+
+class SharedList(list):
+    """Liste partagée avec sa source et copiée au premier accès (Copy-on-Write).
+
+    Sert aux zones que les simulations touchent rarement (deck, cimetière) :
+    les éléments de la source ne sont copiés par `copy_item` que lorsque la
+    liste est lue ou modifiée pour la première fois. Les éléments de la source
+    ne doivent pas changer tant que la copie n'a pas eu lieu (Game.unshare
+    appelle `materialize` avant toute écriture).
+    """
+
+    __slots__ = ('_source', '_copy_item', '_on_copy', '__weakref__')
+
+    def __init__(self, source: Iterable = (), copy_item: Optional[Callable[[Any], Any]] = None):
+        list.__init__(self)
+        self._source: Optional[tuple] = tuple(source)
+        self._copy_item = copy_item
+        self._on_copy: tuple = ()
+
+    @property
+    def is_shared(self) -> bool:
+        """True tant que les éléments n'ont pas été copiés."""
+        return self._source is not None
+
+    def materialize(self) -> None:
+        """Copie les éléments de la source (une seule fois)."""
+        source = self._source
+        if source is None:
+            return
+        copy_item = self._copy_item
+        self._source = None
+        self._copy_item = None
+        list.extend(self, source if copy_item is None else map(copy_item, source))
+        callbacks = self._on_copy
+        self._on_copy = ()
+        for callback in callbacks:
+            callback()
+
+    def on_copy(self, callback: Callable[[], None]) -> None:
+        """Appelle callback() une fois les éléments copiés."""
+        if self._source is None:
+            callback()
+        else:
+            self._on_copy += (callback,)
+
+    def fork(self, copy_item: Callable[[Any], Any]) -> 'SharedList':
+        """Nouvelle liste partagée sur le même contenu : O(1) si rien n'a été copié."""
+        source = self._source
+        if source is None:
+            return SharedList(self, copy_item)
+        outer = self._copy_item
+        if outer is None:
+            return SharedList(source, copy_item)
+        new = SharedList((), lambda item: copy_item(outer(item)))
+        new._source = source
+        return new
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _materializing(method: Callable) -> Callable:
+    def wrapper(self, *args):
+        if self._source is not None:
+            self.materialize()
+        for arg in args:
+            if arg.__class__ is SharedList and arg._source is not None:
+                arg.materialize()
+        return method(self, *args)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+# Toutes les opérations de list passent par la copie des éléments
+for _name in (
+    '__len__', '__iter__', '__reversed__', '__contains__', '__getitem__', '__setitem__',
+    '__delitem__', '__eq__', '__ne__', '__lt__', '__le__', '__gt__', '__ge__', '__add__',
+    '__iadd__', '__mul__', '__rmul__', '__imul__', '__repr__', 'append', 'extend', 'insert',
+    'pop', 'remove', 'index', 'count', 'clear', 'copy', 'sort', 'reverse',
+):
+    setattr(SharedList, _name, _materializing(getattr(list, _name)))
+del _name
@@ -0,0 +1,318 @@
+"""Hearthstone Simulator - Mutation Journal.
+
+Do/undo log for tree search without cloning. While a journal is active, every
+attribute write on the game, its players and entities, and every change to
+their lists and dicts is recorded, so the state can be rolled back to a mark
+in time proportional to the changes made:
+
+    mark = game.mark()
+    game.execute_action(action)
+    value = evaluate(game)
+    game.rollback(mark)
+    ...
+    game.end_journal()
+
+Recording is installed on the classes only while some game journals, so the
+engine runs at full speed otherwise. A write is recorded in the journal of
+the written object's game, so several games can journal at once, each in its
+own thread (say a turn solver next to an MCTS search). Lists and dicts of the
+game are swapped for JournalList/JournalDict for the duration (and on
+assignment), so code should not keep its own alias to a list across a mark.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .entities import Entity, record_writes
+from .immutable import SharedList
+
+if TYPE_CHECKING:
+    from .game import Game
+
+_MISSING = object()
+
+# Journals started and not stopped; the class-level hooks are installed while any is
+_journals = 0
+_lock = threading.Lock()
+
+
+class JournalList(list):
+    """List that saves its contents before the first change after a mark."""
+
+    __slots__ = ("_journal", "_gen")
+
+    def __init__(self, items=(), journal: Optional[Journal] = None):
+        list.__init__(self, items)
+        self._journal = journal
+        self._gen = -1
+
+    def _save(self) -> None:
+        journal = self._journal
+        if journal is not None and journal.recording and self._gen != journal.gen:
+            self._gen = journal.gen
+            journal.log.append((self, list.copy(self)))
+
+    def _restore(self, saved: list) -> None:
+        list.__setitem__(self, slice(None), saved)
+        self._gen = -1
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+class JournalDict(dict):
+    """Dict that saves its contents before the first change after a mark."""
+
+    __slots__ = ("_journal", "_gen")
+
+    def __init__(self, items=(), journal: Optional[Journal] = None):
+        dict.__init__(self, items)
+        self._journal = journal
+        self._gen = -1
+
+    def _save(self) -> None:
+        journal = self._journal
+        if journal is not None and journal.recording and self._gen != journal.gen:
+            self._gen = journal.gen
+            journal.log.append((self, dict.copy(self)))
+
+    def _restore(self, saved: dict) -> None:
+        dict.clear(self)
+        dict.update(self, saved)
+        self._gen = -1
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+def _saving(method: Callable) -> Callable:
+    def wrapper(self, *args, **kwargs):
+        self._save()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+def _saving_item(method: Callable, index: int) -> Callable:
+    """Like _saving, and journal a list/dict being stored as an item."""
+    def wrapper(self, *args):
+        self._save()
+        journal = self._journal
+        if journal is not None and journal.recording and len(args) > index:
+            value = journal.wrap(args[index])
+            if value is not args[index]:
+                args = args[:index] + (value,) + args[index + 1:]
+        return method(self, *args)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ("extend", "pop", "remove", "clear", "sort", "reverse",
+              "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(JournalList, _name, _saving(getattr(list, _name)))
+for _name in ("__delitem__", "pop", "popitem", "clear", "update", "__ior__"):
+    setattr(JournalDict, _name, _saving(getattr(dict, _name)))
+JournalList.append = _saving_item(list.append, 0)
+JournalList.insert = _saving_item(list.insert, 1)
+JournalDict.__setitem__ = _saving_item(dict.__setitem__, 1)
+JournalDict.setdefault = _saving_item(dict.setdefault, 1)
+del _name
+
+
+def _recording(store: Callable[[Any, str, Any], None]) -> Callable[[Any, str, Any], None]:
+    """Entity __setattr__ that records the write in its game's journal, then stores it with store."""
+    def setattr_(obj, name: str, value: Any) -> None:
+        try:
+            game = object.__getattribute__(obj, "game")
+        except AttributeError:
+            game = None  # still in __init__
+        if game is not None:
+            journal = game._journal
+            if journal is not None and journal.recording:
+                journal.record(obj, name)
+                value = journal.wrap(value)
+        store(obj, name, value)
+    return setattr_
+
+
+def _journaled_setattr(game: Game, name: str, value: Any) -> None:
+    """Game.__setattr__ while any game journals."""
+    journal = game.__dict__.get("_journal")
+    if journal is not None and journal.recording:
+        journal.record(game, name)
+        value = journal.wrap(value)
+    object.__setattr__(game, name, value)
+
+
+class Journal:
+    """Undo log for one game. Created by Game.mark()."""
+
+    def __init__(self, game: Game):
+        self.game = game
+        self.log: List[tuple] = []
+        # Rollback points: (log length, random state, next entity ID)
+        self.marks: List[Tuple[int, Any, int]] = []
+        self.gen = 0  # changes on every mark/rollback; containers save once per gen
+        self.recording = False  # between start() and stop(), except while rolling back
+        # (class, attribute) -> whether writes go through a property (not recorded:
+        # the property setter's own writes are)
+        self._is_property: Dict[Tuple[type, str], bool] = {}
+
+    # === Activation ===
+
+    def start(self) -> None:
+        global _journals
+        from .game import Game
+        with _lock:
+            _journals += 1
+            if _journals == 1:
+                record_writes(_recording)  # around the other watchers' hooks, if installed
+                Game.__setattr__ = _journaled_setattr
+        self._convert(self.wrap)
+        self.recording = True
+
+    def stop(self) -> None:
+        """Stop recording and turn journaled containers back into list/dict."""
+        global _journals
+        from .game import Game
+        self.recording = False
+        with _lock:
+            _journals -= 1
+            if _journals == 0:
+                record_writes(None)
+                del Game.__setattr__
+        self._convert(_unwrap)
+        self.log.clear()
+        self.marks.clear()
+
+    def _convert(self, convert: Callable[[Any], Any]) -> None:
+        """Apply convert to every list/dict reachable from the game's attributes."""
+        seen = set()
+        stack: List[Any] = [self.game]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            for name, value in _attributes(obj):
+                if isinstance(value, (list, dict)):
+                    new = _convert_nested(value, convert, stack)
+                    if new is not value:
+                        object.__setattr__(obj, name, new)
+                elif isinstance(value, Entity) and value.game is self.game:
+                    stack.append(value)
+    
+    # === Recording ===
+
+    def record(self, obj, name: str) -> None:
+        key = (obj.__class__, name)
+        is_property = self._is_property.get(key)
+        if is_property is None:
+            is_property = isinstance(getattr(obj.__class__, name, None), property)
+            self._is_property[key] = is_property
+        if is_property:
+            return
+        try:
+            old = object.__getattribute__(obj, name)
+        except AttributeError:
+            old = _MISSING
+        self.log.append((obj, name, old))
+
+    def wrap(self, value: Any) -> Any:
+        cls = value.__class__
+        if cls is list or cls is SharedList:
+            return JournalList(value, self)
+        if cls is dict:
+            return JournalDict(value, self)
+        return value
+
+    # === Mark / rollback ===
+
+    def mark(self) -> int:
+        self.gen += 1
+        self.marks.append((len(self.log), self.game.rng.getstate(), Entity._next_id))
+        return len(self.marks) - 1
+
+    def rollback(self, mark: int) -> None:
+        length, rng_state, next_id = self.marks[mark]
+        del self.marks[mark + 1:]
+        log = self.log
+        state_hash = self.game._state_hash
+        dirty = state_hash.dirty if state_hash is not None else set()
+        self.recording = False  # restoring must not record
+        try:
+            while len(log) > length:
+                entry = log.pop()
+                if len(entry) == 2:
+                    entry[0]._restore(entry[1])
+                else:
+                    obj, name, old = entry
+                    if isinstance(obj, Entity):
+                        dirty.add(obj)  # re-hashed on the next read
+                    if old is _MISSING:
+                        try:
+                            object.__delattr__(obj, name)
+                        except AttributeError:
+                            pass
+                    else:
+                        object.__setattr__(obj, name, old)
+        finally:
+            self.recording = True
+        self.gen += 1
+        self.game.rng.setstate(rng_state)
+        if _journals == 1:
+            # Same IDs for the entities made again (the counter is shared by
+            # all games: not while others journal, their IDs would repeat)
+            Entity._next_id = next_id
+        if state_hash is not None:
+            state_hash.forget(next_id)
+
+    def __len__(self) -> int:
+        return len(self.log)
+
+
+def _unwrap(value: Any) -> Any:
+    cls = value.__class__
+    if cls is JournalList:
+        return list(value)
+    if cls is JournalDict:
+        return dict(value)
+    return value
+
+
+def _attributes(obj) -> List[Tuple[str, Any]]:
+    """(name, value) of an object's instance attributes (slots and __dict__)."""
+    items = list(getattr(obj, "__dict__", {}).items())
+    for cls in obj.__class__.__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name != "__dict__":
+                try:
+                    items.append((name, object.__getattribute__(obj, name)))
+                except AttributeError:
+                    pass
+    return items
+
+
+def _convert_nested(container, convert: Callable[[Any], Any], stack: List[Any]):
+    """convert() a list/dict and the containers inside it; queue the entities it holds."""
+    container = convert(container)
+    if isinstance(container, dict):
+        items = list(dict.items(container))
+        set_item = dict.__setitem__
+    else:
+        items = list(enumerate(list.__iter__(container)))
+        set_item = list.__setitem__
+    for key, value in items:
+        if isinstance(value, Entity):
+            stack.append(value)
+        elif isinstance(value, (list, dict)):
+            new = _convert_nested(value, convert, stack)
+            if new is not value:
+                set_item(container, key, new)
+        elif isinstance(value, tuple):
+            stack.extend(v for v in value if isinstance(v, Entity))
+    return container
@@ -9,7 +9,7 @@ import random
 from dataclasses import dataclass, field
 from typing import Optional, List, TYPE_CHECKING
 
-from .enums import Zone, PlayState, Mulligan, CardType
+from .enums import Zone, PlayState, Mulligan, CardType, GameTag
 from .entities import Entity, Card, Hero, HeroPower, Weapon, Minion
 
 if TYPE_CHECKING:
@@ -108,6 +108,10 @@ class Player(Entity):
     def clone(self) -> 'Player':
         """Create a deep copy of the player (excluding entities managed by Game.clone)."""
         new_player = Player(self.name, None)
+        # Entity slots are not in __dict__
+        new_player.entity_id = self.entity_id
+        new_player.zone = self.zone
+        new_player.tags = self.tags.copy()
         # Stats
         new_player.mana_crystals = self.mana_crystals
         new_player.mana = self.mana
@@ -177,9 +181,15 @@ class Player(Entity):
         self.deck.append(card)
         return True
     
+    @property
+    def rng(self):
+        """The game's random stream (the random module outside a game)."""
+        game = self.game
+        return game.rng if game is not None else random
+    
     def shuffle_deck(self) -> None:
         """Shuffle the deck."""
-        random.shuffle(self.deck)
+        self.rng.shuffle(self.deck)
     
     def draw_specific_card(self, card: Card) -> Optional[Card]:
         """Draw a specific card instance from the deck."""
@@ -237,8 +247,7 @@ class Player(Entity):
         bottom_count = min(3, len(self.deck))
         bottom_cards = self.deck[-bottom_count:]
         
-        # AI strategy: pick the highest cost card (or random for simplicity)
-        import random
+        # AI strategy: pick the highest cost card
         chosen = max(bottom_cards, key=lambda c: c.data.cost) if bottom_cards else None
         
         if chosen:
@@ -368,7 +377,7 @@ class Player(Entity):
         for _ in range(count):
             if not self.hand:
                 break
-            card = random.choice(self.hand)
+            card = self.rng.choice(self.hand)
             self.hand.remove(card)
             card.zone = Zone.GRAVEYARD
             self.graveyard.append(card)
@@ -399,6 +408,8 @@ class Player(Entity):
         for i, m in enumerate(self.board):
             m.zone_position = i
         
+        # A minion summoned without health dies at the next death check
+        minion._check_lethal()
         return True
     
     def remove_from_board(self, minion: Minion) -> bool:
@@ -477,9 +488,9 @@ class Player(Entity):
                 if minion.dormant == 0:
                     if self.game:
                         self.game.fire_event("on_awake", minion)
-                        handler = self.game._get_effect_handler(minion.card_id, "on_awake")
+                        handler = minion.data.effects.on_awake
                         if handler:
-                            handler(self.game, self, minion)
+                            self.game._run_effect(handler, self, minion)
         
         # Reset hero attacks
         if self.hero:
@@ -669,8 +680,7 @@ class Player(Entity):
         }
         
         tier_to_use = min(current_tier, 4)
-        import random
-        treasure_id = random.choice(treasures.get(tier_to_use, treasures[1]))
+        treasure_id = self.rng.choice(treasures.get(tier_to_use, treasures[1]))
         
         from simulator.factory import create_card
         treasure_card = create_card(treasure_id, self)
@@ -0,0 +1,191 @@
+"""Hearthstone Simulator - Structured game trace.
+
+The engine reports what happens in a game (attacks, damage, battlecries...)
+as TraceEvent records sent to the sink set with Game.set_trace_sink. With no
+sink, Game.tracing is False and every trace point costs a single bool check:
+records are only built behind `if self.tracing:`.
+
+Effect errors swallowed by the engine are counted per card_id in
+EFFECT_ERRORS whether or not a game is traced, so training workers can see
+which scripts fail without paying for logs. Exceptions swallowed by
+Game.execute_action are counted the same way in ACTION_ERRORS, per action
+type and exception type, and logged (a warning the first time each is seen).
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+from collections import Counter, deque
+from typing import Any, Dict, IO, Iterator, List, NamedTuple, Optional
+
+# Kinds of trace records
+ATTACK = "attack"
+DAMAGE = "damage"
+HEAL = "heal"
+LIFESTEAL = "lifesteal"
+BATTLECRY = "battlecry"
+SPELL = "spell"
+DEATHRATTLE = "deathrattle"
+INFUSE = "infuse"
+TITAN_ABILITY = "titan_ability"
+MAGNETIC = "magnetic"
+EFFECT_ERROR = "effect_error"
+ACTION_ERROR = "action_error"
+
+KINDS = (ATTACK, DAMAGE, HEAL, LIFESTEAL, BATTLECRY, SPELL, DEATHRATTLE, INFUSE,
+         TITAN_ABILITY, MAGNETIC, EFFECT_ERROR, ACTION_ERROR)
+
+# Swallowed effect/trigger exceptions per card_id (all games of the process)
+EFFECT_ERRORS: Counter = Counter()
+
+
+def count_effect_error(card_id: Optional[str]) -> None:
+    EFFECT_ERRORS[card_id or "?"] += 1
+
+
+def reset_effect_errors() -> Dict[str, int]:
+    """Clear EFFECT_ERRORS and return the counts it held."""
+    counts = dict(EFFECT_ERRORS)
+    EFFECT_ERRORS.clear()
+    return counts
+
+
+# Swallowed execute_action exceptions per "ACTION_TYPE:ExceptionType" (all games of the process)
+ACTION_ERRORS: Counter = Counter()
+
+
+def count_action_error(action_type: str, error: BaseException) -> int:
+    """Count an execute_action exception; returns how many of its kind were seen so far."""
+    key = f"{action_type}:{type(error).__name__}"
+    ACTION_ERRORS[key] += 1
+    return ACTION_ERRORS[key]
+
+
+def reset_action_errors() -> Dict[str, int]:
+    """Clear ACTION_ERRORS and return the counts it held."""
+    counts = dict(ACTION_ERRORS)
+    ACTION_ERRORS.clear()
+    return counts
+
+
+def ref(entity: Any) -> Optional[Dict[str, Any]]:
+    """JSON-friendly reference to an entity (records never hold live objects)."""
+    if entity is None:
+        return None
+    return {
+        "id": entity.entity_id,
+        "card_id": getattr(entity, "card_id", None),
+        "name": getattr(entity, "name", None),
+    }
+
+
+class TraceEvent(NamedTuple):
+    """One trace record."""
+    seq: int
+    turn: int
+    player: int
+    kind: str
+    data: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seq": self.seq, "turn": self.turn, "player": self.player,
+                "kind": self.kind, **self.data}
+
+    def message(self) -> str:
+        """Human-readable line, as the engine used to print it."""
+        data = self.data
+        name = lambda key: (data.get(key) or {}).get("name", "Unknown")
+        kind = self.kind
+        if kind == ATTACK:
+            return f"ATTACK: {name('attacker')} attacks {name('defender')}"
+        if kind == DAMAGE:
+            source = name("source") if data.get("source") else "Fatigue"
+            return f"DAMAGE: {name('target')} takes {data['amount']} from {source}"
+        if kind == HEAL:
+            return f"HEAL: {name('target')} restored {data['amount']} HP from {name('source')}"
+        if kind == LIFESTEAL:
+            return f"LIFESTEAL: {name('source')} heals for {data['amount']}"
+        if kind == BATTLECRY:
+            return f"BATTLECRY: {name('card')} is activating!"
+        if kind == SPELL:
+            return f"SPELL EFFECT: {name('card')}"
+        if kind == DEATHRATTLE:
+            return f"DEATHRATTLE: {name('card')} is activating!"
+        if kind == INFUSE:
+            return f"INFUSE: {name('card')} has been Infused!"
+        if kind == TITAN_ABILITY:
+            return f"TITAN ABILITY: {name('card')} uses '{data['ability']}'"
+        if kind == MAGNETIC:
+            return f"MAGNETIC: {name('card')} fuses into {name('target')}"
+        if kind == EFFECT_ERROR:
+            return f"ERROR in {data['where']} for {data['card_id']}: {data['error']}"
+        if kind == ACTION_ERROR:
+            return f"ERROR executing action {data['action']}: {data['error']}"
+        return f"{kind}: {data}"
+
+
+class TraceSink(abc.ABC):
+    """Receives the trace records of a game."""
+
+    @abc.abstractmethod
+    def emit(self, event: TraceEvent) -> None:
+        """Handle one record."""
+
+    def close(self) -> None:
+        pass
+
+
+class RingBufferSink(TraceSink):
+    """Keeps the last `capacity` records in memory."""
+
+    def __init__(self, capacity: int = 4096):
+        self.events: deque = deque(maxlen=capacity)
+
+    def emit(self, event: TraceEvent) -> None:
+        self.events.append(event)
+
+    def __iter__(self) -> Iterator[TraceEvent]:
+        return iter(self.events)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def dump_jsonl(self, stream: IO[str]) -> int:
+        """Write the buffered records as JSON lines; returns how many."""
+        for event in self.events:
+            stream.write(json.dumps(event.to_dict(), default=str) + "\n")
+        return len(self.events)
+
+
+class JsonlSink(TraceSink):
+    """Streams records to a text file as JSON lines."""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+
+    def emit(self, event: TraceEvent) -> None:
+        self.stream.write(json.dumps(event.to_dict(), default=str) + "\n")
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class PrintSink(TraceSink):
+    """Prints records to stdout like the engine's former console logging."""
+
+    def emit(self, event: TraceEvent) -> None:
+        print(f"   {event.message()}")
+
+
+class ListSink(TraceSink):
+    """Collects every record (tests, short games)."""
+
+    def __init__(self):
+        self.events: List[TraceEvent] = []
+
+    def emit(self, event: TraceEvent) -> None:
+        self.events.append(event)
+
+    def kinds(self) -> List[str]:
+        return [event.kind for event in self.events]
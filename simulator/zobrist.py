@@ -0,0 +1,317 @@
+"""Hearthstone Simulator - Incremental state hash.
+
+Game.state_hash is a 64-bit identity of the game state, kept up to date as
+the game changes instead of being recomputed from scratch:
+
+    key = game.state_hash        # cheap when little changed since the last read
+    cache.get(key)
+
+Each entity contributes a hash of its state; the game hash is the XOR of the
+contributions (Zobrist-style) mixed with the turn, phase and current player.
+A game's first read hashes its entities from scratch; from then on every
+attribute write on one of its entities queues the entity as dirty, and a
+read re-hashes only the dirty entities, XORing their old contribution out
+and the new one in. The write hook (Entity.__setattr__, entities.hash_writes)
+is installed while some game has a StateHash: until a hash is read, and once
+every hashed game is gone, writes are plain. In-place changes to an entity's tags or extension
+dict call Entity.touch() first.
+
+References are hashed by content (entity ids, card ids), never by object
+identity, so equal states give equal hashes in clones and after a rollback.
+Strings are hashed with a stable digest (blake2b), not Python's salted
+hash, so hashes are comparable across processes.
+Deck order is not part of the hash; board order is (zone_position) and hand
+order is mixed in by Game.state_hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import operator
+import weakref
+from enum import Enum
+from typing import Any, Callable, Dict, List, Mapping, Set, Tuple, TYPE_CHECKING
+
+from .entities import Entity, CardData, _AURA_CACHE, hash_writes
+from .immutable import SharedList
+from .journal import _attributes
+
+if TYPE_CHECKING:
+    from .game import Game
+
+MASK = (1 << 64) - 1
+
+# Not part of an entity's state: back-references and caches derived from auras
+# (enchantments hash themselves; their target links them to the card)
+EXCLUDED_ATTRS = frozenset(("game", "enchantments")) | _AURA_CACHE
+
+# Attributes holding references, by how they are hashed; the others hold
+# numbers, flags and enums, whose own hash is already by value
+REFERENCE_ATTRS: Dict[str, str] = {
+    "data": "card",
+    "controller": "entity", "weapon": "entity", "hero_power": "entity",
+    "hero": "entity", "opponent": "entity", "target": "entity", "source": "entity",
+    "tags": "mapping", "_ext": "mapping",
+    "titan_abilities_used": "sequence",
+}
+
+_ENTITY = 1 << 62  # entity references hash as _ENTITY + entity_id
+_NONE = 1 << 61    # None hashes by address in Python 3.11
+# Classes whose hash is the same in every process (strings are salted)
+_PLAIN = frozenset((int, bool, float))
+# Classes hashed as they are (grows with the int enums met)
+_VALUE_TYPES: Set[type] = set(_PLAIN)
+
+_converters: Dict[type, Callable[[Any], Any]] = {}
+_keys: Dict[type, Tuple[Callable[[Any], tuple], Tuple[str, ...], bool]] = {}
+_layouts: Dict[Tuple[str, ...], Tuple[int, Callable[[Any], tuple]]] = {}
+
+
+def mix(value: int) -> int:
+    """splitmix64 finalizer: spreads the bits of a 64-bit value."""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & MASK
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & MASK
+    return value ^ (value >> 31)
+
+
+class _Digests(dict):
+    """str -> 64-bit blake2b digest, computed on first lookup."""
+
+    def __missing__(self, text: str) -> int:
+        value = self[text] = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+        return value
+
+
+_digests = _Digests()
+stable_hash: Callable[[str], int] = _digests.__getitem__  # a string's hash, the same in every process
+
+
+def value_hash(value: Any) -> Any:
+    """Hashable stand-in for value that compares by content."""
+    cls = value.__class__
+    if cls in _PLAIN:
+        return value
+    convert = _converters.get(cls)
+    if convert is None:
+        convert = _converters[cls] = _converter(cls)
+    return convert(value)
+
+
+def _sequence_hash(values) -> tuple:
+    if _VALUE_TYPES.issuperset(map(type, values)):
+        return values if values.__class__ is tuple else tuple(values)
+    return tuple([v if v.__class__ in _PLAIN else _digests[v] if v.__class__ is str else
+                  _NONE if v is None else value_hash(v) for v in values])
+
+
+def _mapping_hash(mapping) -> frozenset:
+    if _VALUE_TYPES.issuperset(map(type, mapping)) and _VALUE_TYPES.issuperset(map(type, mapping.values())):
+        return frozenset(mapping.items())
+    return frozenset([(k if k.__class__ in _PLAIN else _digests[k] if k.__class__ is str else value_hash(k),
+                       v if v.__class__ in _PLAIN else value_hash(v)) for k, v in mapping.items()])
+
+
+def _converter(cls: type) -> Callable[[Any], Any]:
+    if cls is type(None):
+        return lambda value: _NONE
+    if issubclass(cls, Entity):
+        return lambda value: _ENTITY + value.entity_id
+    if cls is CardData:
+        return lambda value: stable_hash(value.card_id)
+    if issubclass(cls, Enum) and not issubclass(cls, int):
+        return lambda value: value_hash(value.value)  # plain enums hash their (salted) name
+    if issubclass(cls, str):
+        return stable_hash
+    if issubclass(cls, (list, tuple)):
+        return _sequence_hash
+    if issubclass(cls, Mapping):
+        return _mapping_hash
+    if issubclass(cls, (set, frozenset)):
+        return lambda value: frozenset(value_hash(v) for v in value)
+    if cls.__hash__ is not object.__hash__ and cls.__eq__ is not object.__eq__:
+        _VALUE_TYPES.add(cls)  # int enums and other value types
+        return lambda value: value
+    # Game, callables, auras: only their kind
+    kind = stable_hash(cls.__qualname__)
+    return lambda value: kind
+
+
+def _reference(kind: str, get: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Hash of one reference attribute, read with get."""
+    if kind == "entity":
+        def reference(obj):
+            value = get(obj)
+            return 0 if value is None else _ENTITY + value.entity_id
+    elif kind == "card":
+        def reference(obj, digests=_digests):
+            return digests[get(obj).card_id]
+    else:
+        convert = _mapping_hash if kind == "mapping" else _sequence_hash
+
+        def reference(obj):
+            value = get(obj)
+            return convert(value) if value else 0
+    return reference
+
+
+def _key(cls: type) -> Tuple[Callable[[Any], tuple], Tuple[str, ...], bool, int]:
+    """(hashable state of an instance's slots, slot names, whether instances have a
+    __dict__, hash of the class name)."""
+    entry = _keys.get(cls)
+    if entry is None:
+        names = set()
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            names.update((slots,) if isinstance(slots, str) else slots)
+        names -= EXCLUDED_ATTRS | {"__dict__", "__weakref__"}
+        plain = sorted(name for name in names if name not in REFERENCE_ATTRS)
+        get_plain = operator.attrgetter(*plain) if len(plain) > 1 else (
+            lambda entity: tuple([getattr(entity, name) for name in plain]))
+        references = [_reference(REFERENCE_ATTRS[name], operator.attrgetter(name))
+                      for name in sorted(names) if name in REFERENCE_ATTRS]
+
+        def key(entity, value_types=_VALUE_TYPES):
+            values = get_plain(entity)
+            if not value_types.issuperset(map(type, values)):
+                values = _sequence_hash(values)  # None or strings: made stable
+            return values, tuple([reference(entity) for reference in references])
+
+        has_dict = any("__dict__" in klass.__dict__ for klass in cls.__mro__ if klass is not object)
+        entry = _keys[cls] = (key, tuple(sorted(names)), has_dict, stable_hash(cls.__name__))
+    return entry
+
+
+def _layout(state: Dict[str, Any]) -> Tuple[int, Callable[[Any], tuple]]:
+    """(hash of the field names, hashable state) of an instance __dict__ with these keys.
+    
+    Lists and dicts in a __dict__ (a player's zones) change without a write,
+    so they are left out: the cards in them hash their own zone and controller.
+    """
+    names = tuple(state)
+    layout = _layouts.get(names)
+    if layout is None:
+        fields = tuple(sorted(name for name, value in state.items()
+                              if name not in EXCLUDED_ATTRS and not isinstance(value, (list, dict))))
+        plain = [name for name in fields if name not in REFERENCE_ATTRS]
+        get_plain = operator.itemgetter(*plain) if len(plain) > 1 else (
+            lambda state: tuple([state[name] for name in plain]))
+        references = [_reference(REFERENCE_ATTRS[name], operator.itemgetter(name))
+                      for name in fields if name in REFERENCE_ATTRS]
+
+        def key(state):
+            # Dynamic attributes are not known in advance: check their values
+            return _sequence_hash(get_plain(state)), tuple([reference(state) for reference in references])
+
+        layout = _layouts[names] = (hash(tuple([stable_hash(name) for name in fields])), key)
+    return layout
+
+
+def entity_hash(entity: Entity) -> int:
+    """Hash of one entity's state (its contribution to the game hash)."""
+    key, names, has_dict, kind = _key(entity.__class__)
+    try:
+        state = key(entity)
+    except AttributeError:  # a slot not set yet, or an unexpected reference
+        state = _sequence_hash([getattr(entity, name, None) for name in names])
+    if has_dict:
+        fields, key = _layout(entity.__dict__)
+        state = (state, fields, key(entity.__dict__))
+    return hash((kind, state)) & MASK
+
+
+def _entities(game: Game) -> List[Entity]:
+    """Entities reachable from game's attributes, its zones and their enchantments.
+    
+    The cards of a clone's zones still shared with its source (SharedList)
+    belong to the source game; they stand for the copies the clone makes on
+    first use, which hash the same.
+    """
+    found: Dict[int, Entity] = {}
+    seen = set()
+    stack: List[Any] = [game]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if obj.__class__ is SharedList and obj._source is not None:
+            for card in obj._source:
+                found.setdefault(card.entity_id, card)
+                for enchantment in card.enchantments:
+                    found.setdefault(enchantment.entity_id, enchantment)
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.values())
+            continue
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+            continue
+        if isinstance(obj, Entity):
+            if obj.game is not game:
+                continue
+            found[obj.entity_id] = obj
+        elif obj is not game:
+            continue
+        for _, value in _attributes(obj):
+            if isinstance(value, (Entity, list, tuple, dict, set, frozenset)):
+                stack.append(value)
+    return list(found.values())
+
+
+class StateHash:
+    """Incremental hash of a game's entities (see Game.state_hash)."""
+
+    __slots__ = ("value", "contributions", "dirty", "__weakref__")
+
+    def __init__(self, value: int = 0, contributions: Dict[int, int] = None):
+        hash_writes(1)
+        weakref.finalize(self, hash_writes, -1)  # writes are plain again once no game is hashed
+        self.value = value
+        # entity_id -> hash currently XORed into value
+        self.contributions: Dict[int, int] = contributions if contributions is not None else {}
+        # Entities written since the last flush
+        self.dirty: Set[Entity] = set()
+
+    @classmethod
+    def of(cls, game: Game) -> StateHash:
+        """Hash of game's entities from scratch; their writes are tracked from now on."""
+        contributions = {entity.entity_id: entity_hash(entity) for entity in _entities(game)}
+        value = 0
+        for contribution in contributions.values():
+            value ^= contribution
+        return cls(value, contributions)
+
+    def flush(self, game: Game) -> int:
+        """Re-hash the dirty entities of game; returns the updated value."""
+        dirty = self.dirty
+        if dirty:
+            value = self.value
+            contributions = self.contributions
+            for entity in dirty:
+                if entity.game is not game:
+                    continue  # moved to another game (clones) since the write
+                new = entity_hash(entity)
+                entity_id = entity.entity_id
+                value ^= contributions.get(entity_id, 0) ^ new
+                contributions[entity_id] = new
+            dirty.clear()
+            self.value = value
+        return self.value
+
+    def forget(self, next_id: int) -> None:
+        """Drop entities numbered next_id and up (undone by a rollback)."""
+        contributions = self.contributions
+        value = self.value
+        for entity_id in [i for i in contributions if i >= next_id]:
+            value ^= contributions.pop(entity_id)
+        self.value = value
+        dirty = self.dirty
+        if dirty:
+            # (a rollback strips entities made after the mark of their attributes)
+            for entity in [e for e in dirty if getattr(e, "entity_id", next_id) >= next_id]:
+                dirty.discard(entity)
+
+    def copy(self, game: Game) -> StateHash:
+        """Flushed copy, for a clone of game."""
+        self.flush(game)
+        return StateHash(self.value, dict(self.contributions))
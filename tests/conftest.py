@@ -0,0 +1,65 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+
+@pytest.fixture
+def board():
+    """A started game between two fresh players: (game, players)."""
+    from simulator import Game, Player
+
+    game = Game()
+    game.setup(Player("P1", game), Player("P2", game))
+    return game, game.players
+
+
+@pytest.fixture
+def summon():
+    """summon(game, player, card_id): put a new card_id on player's board and return it."""
+    from simulator import create_card
+
+    def summon(game, player, card_id):
+        card = create_card(card_id, game)
+        card.controller = player
+        player.summon(card)
+        return card
+    return summon
+
+
+@pytest.fixture
+def make_game():
+    """make_game(friendly, enemy, ...): player 1 to act, awake minions on both boards.
+
+    Minions are card ids or (card_id, taunt) pairs. enemy_health is the enemy
+    hero's health, hand is added to player 1's hand and mana, if given, is
+    player 1's mana. Heroes are HERO_08 with 30 max health.
+    """
+    from simulator import Game, Player, create_card
+
+    def make_game(friendly, enemy, enemy_health=30, hand=(), mana=None, seed=7):
+        game = Game(seed=seed)
+        game.setup(Player("P1", game), Player("P2", game))
+        game.is_simulation = True
+        for player, minions in zip(game.players, (friendly, enemy)):
+            player.hero = create_card("HERO_08", game)
+            player.hero.controller = player
+            player.hero._max_health = 30
+            for minion in minions:
+                card_id, taunt = (minion, None) if isinstance(minion, str) else minion
+                card = create_card(card_id, game)
+                card.controller = player
+                player.summon(card)
+                card.exhausted = False
+                if taunt is not None:
+                    card.taunt = taunt
+        game.players[1].hero._damage = 30 - enemy_health
+        me = game.players[0]
+        for card_id in hand:
+            card = create_card(card_id, game)
+            card.controller = me
+            me.add_to_hand(card)
+        if mana is not None:
+            me.mana = mana
+        game.current_player_idx = 0
+        return game
+    return make_game
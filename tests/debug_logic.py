@@ -18,7 +18,7 @@ champ.controller = p1
 p1.summon(champ)
 
 print(f"Champion: {champ.name}, Zone: {champ.zone}, Controller: {champ.controller.name}")
-print(f"Triggers for on_calculate_attack: {len(game._triggers.get('on_calculate_attack', []))}")
+print(f"Auras: {len(game._auras)}")
 
 minion = create_card("CS2_120", game) # River Crocolisk
 minion.controller = p1
@@ -40,7 +40,7 @@ def test_aura_stacking():
         
         p1.summon(champ1)
         print(f"DEBUG: Champion game set: {champ1.game is not None}, Zone: {champ1.zone}")
-        print(f"DEBUG: Game triggers: {len(game._triggers.get('on_calculate_attack', []))}")
+        print(f"DEBUG: Game auras: {len(game._auras)}")
         print(f"After 1 Champion: {minion.name} {minion.attack}/{minion.health}")
         
         p1.summon(champ2)
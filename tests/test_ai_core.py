@@ -18,8 +18,8 @@ from ai.mcts import MCTS
 class TestAICore(unittest.TestCase):
     
     def setUp(self):
-        # Setup basic game
-        self.game = Game()
+        # Setup basic game (seeded: setup() picks who goes first, P1 must)
+        self.game = Game(seed=0)
         p1 = Player("P1")
         p2 = Player("P2")
         self.game.setup(p1, p2)
@@ -0,0 +1,82 @@
+"""Tests for declarative auras and the versioned stat cache."""
+
+
+class TestAuras:
+    """Tests for Game.register_aura and aura-aware stats."""
+
+    def test_aura_follows_source(self, board, summon):
+        """Stormwind Champion buffs other friendly minions while it is in play."""
+        game, (p1, p2) = board
+        wisp = summon(game, p1, "CS2_231")
+        enemy = summon(game, p2, "CS2_231")
+        champion = summon(game, p1, "CS2_222")
+        assert (wisp.attack, wisp.health, wisp.max_health) == (2, 2, 2)
+        assert (champion.attack, enemy.attack) == (champion.data.attack, 1)
+
+        game.silence(champion)
+        assert (wisp.attack, wisp.health) == (1, 1)
+
+    def test_reads_are_cached_per_version(self, board, summon):
+        """Conditions run once per card until the aura version changes."""
+        from simulator.auras import Aura, friendly_minions
+
+        game, (p1, _) = board
+        calls = []
+
+        def counting(source, target):
+            calls.append(target)
+            return friendly_minions(source, target)
+
+        wisp = summon(game, p1, "CS2_231")
+        game.register_aura(wisp, Aura(counting, attack=2))
+        for _ in range(5):
+            assert wisp.attack == 3
+        assert calls.count(wisp) == 1
+
+        summon(game, p1, "CS2_231")
+        assert wisp.attack == 3
+        assert calls.count(wisp) == 2
+
+    def test_base_writes_are_not_stale(self, board, summon):
+        """Effects writing _attack directly, or adding to attack, see auras correctly."""
+        game, (p1, _) = board
+        wisp = summon(game, p1, "CS2_231")
+        summon(game, p1, "CS2_222")
+        assert wisp.attack == 2
+        wisp._attack += 3
+        assert wisp.attack == 5
+        wisp.attack += 1
+        assert (wisp.attack, wisp._attack) == (6, 5)
+
+    def test_take_control_moves_aura(self, board, summon):
+        """A stolen minion leaves its old owner's auras."""
+        game, (p1, p2) = board
+        wisp = summon(game, p2, "CS2_231")
+        summon(game, p2, "CS2_222")
+        assert wisp.attack == 2
+        game.take_control(wisp, p1)
+        assert wisp in p1.board and wisp not in p2.board
+        assert wisp.attack == 1
+
+    def test_damage_factor(self, board, summon):
+        """Talgath doubles damage to undamaged enemy minions only."""
+        game, (p1, p2) = board
+        summon(game, p1, "GDB_472")
+        target = summon(game, p2, "CS2_120")
+        friendly = summon(game, p1, "CS2_120")
+        assert game.deal_damage(target, 1) == 2
+        assert game.deal_damage(target, 1) == 1
+        assert game.deal_damage(friendly, 1) == 1
+
+    def test_clone_keeps_auras(self, board, summon):
+        """Auras are remapped to the cloned source."""
+        game, (p1, _) = board
+        wisp = summon(game, p1, "CS2_231")
+        champion = summon(game, p1, "CS2_222")
+        clone = game.clone()
+        copy = clone.players[game.players.index(p1)].board[0]
+        assert copy.attack == 2
+        (source, _), = clone._auras.values()
+        assert source is not champion and source.card_id == champion.card_id
+        game.silence(champion)
+        assert (wisp.attack, copy.attack) == (1, 2)
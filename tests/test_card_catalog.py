@@ -0,0 +1,89 @@
+"""Tests for the columnar card catalog."""
+
+import pytest
+
+
+def _catalog():
+    from simulator import CardData, CardType, CardClass, Race
+    from simulator.card_catalog import CardCatalog
+
+    cards = [
+        CardData(card_id="A", dbf_id=1, cost=2, card_type=CardType.MINION, card_class=CardClass.DRUID,
+                 collectible=True, taunt=True),
+        CardData(card_id="B", dbf_id=2, cost=3, card_type=CardType.MINION, card_class=CardClass.NEUTRAL,
+                 collectible=True, taunt=True, race=Race.BEAST),
+        CardData(card_id="C", dbf_id=3, cost=4, card_type=CardType.MINION, card_class=CardClass.MAGE,
+                 collectible=True, taunt=True),
+        CardData(card_id="D", dbf_id=4, cost=5, card_type=CardType.MINION, card_class=CardClass.DRUID,
+                 collectible=True, taunt=True),
+        CardData(card_id="E", dbf_id=5, cost=2, card_type=CardType.SPELL, card_class=CardClass.DRUID,
+                 collectible=True),
+        CardData(card_id="F", dbf_id=6, cost=12, card_type=CardType.MINION, card_class=CardClass.DRUID,
+                 collectible=False, taunt=True, card_set="CORE"),
+    ]
+    return CardCatalog.from_cards({c.card_id: c for c in cards})
+
+
+class TestCardCatalog:
+    """Tests for vectorized card queries."""
+
+    def test_compound_query(self):
+        """Collectible DRUID-or-NEUTRAL minions costing 2-4 with Taunt."""
+        from simulator import CardType, CardClass
+
+        catalog = _catalog()
+        rows = catalog.query(collectible=True, card_class=CardClass.DRUID, card_type=CardType.MINION,
+                             cost=(2, 4), keywords=["taunt"])
+        assert catalog.ids(rows) == ["A", "B"]
+
+    def test_class_without_neutral(self):
+        """include_neutral=False keeps only the class's own cards."""
+        from simulator import CardClass
+
+        catalog = _catalog()
+        rows = catalog.query(card_class=CardClass.DRUID, include_neutral=False)
+        assert catalog.ids(rows) == ["A", "D", "E", "F"]
+
+    def test_cost_above_bucket_range(self):
+        """Costs beyond the indexed buckets are still matched exactly."""
+        catalog = _catalog()
+        assert catalog.ids(catalog.query(cost=12)) == ["F"]
+        assert catalog.ids(catalog.query(cost=(5, 20))) == ["D", "F"]
+
+    def test_other_filters(self):
+        """Race, set and type exclusion filters."""
+        from simulator import CardType, Race
+
+        catalog = _catalog()
+        assert catalog.ids(catalog.query(race=Race.BEAST)) == ["B"]
+        assert catalog.ids(catalog.query(card_set="CORE")) == ["F"]
+        assert catalog.ids(catalog.query(card_set="NOPE")) == []
+        assert "E" not in catalog.ids(catalog.query(exclude_type=CardType.SPELL))
+
+    def test_unknown_keyword_raises(self):
+        """Typos in keyword names are reported instead of matching nothing."""
+        catalog = _catalog()
+        with pytest.raises(ValueError):
+            catalog.query(keywords=["tuant"])
+
+    def test_columns_round_trip(self):
+        """Catalog columns survive serialization for the card snapshot."""
+        import numpy as np
+        from simulator.card_catalog import CardCatalog
+
+        catalog = _catalog()
+        copy = CardCatalog.from_columns(catalog.to_columns())
+        assert copy.card_ids == catalog.card_ids
+        assert np.array_equal(copy.keywords, catalog.keywords)
+
+    def test_random_deck_uses_class_cards(self):
+        """Generated decks only contain the class's and neutral collectible cards."""
+        from simulator import CardDatabase, CardClass, CardType
+        from simulator.deck_generator import DeckGenerator
+
+        deck = DeckGenerator.get_random_deck("DRUID")
+        assert len(deck) == 30
+        for card_id in deck:
+            data = CardDatabase.get_card(card_id)
+            assert data.collectible and data.card_type != CardType.HERO
+            assert data.card_class in (CardClass.DRUID, CardClass.NEUTRAL)
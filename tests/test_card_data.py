@@ -0,0 +1,136 @@
+"""Tests for the compact CardData representation and Card keyword state."""
+
+import pytest
+
+
+class TestCardData:
+    """Tests for slotted, immutable card definitions."""
+
+    def test_keywords_are_bitmask_backed(self):
+        """Keyword flags keep their attribute names."""
+        from simulator import CardData
+        from simulator.entities import KEYWORD_BITS
+
+        data = CardData(card_id="T", taunt=True, battlecry=True)
+        assert data.taunt and data.battlecry and not data.rush
+        assert data.keywords == KEYWORD_BITS["taunt"] | KEYWORD_BITS["battlecry"]
+
+    def test_immutable(self):
+        """Definitions cannot be mutated in place; replace() derives a copy."""
+        from simulator import CardData
+
+        data = CardData(card_id="T", cost=3, reborn=True)
+        with pytest.raises(AttributeError):
+            data.cost = 1
+        copy = data.replace(cost=1, reborn=False)
+        assert (copy.cost, copy.reborn) == (1, False)
+        assert (data.cost, data.reborn) == (3, True)
+
+    def test_unknown_flag_rejected(self):
+        """Misspelled keyword arguments raise like a normal constructor."""
+        from simulator import CardData
+
+        with pytest.raises(TypeError):
+            CardData(card_id="T", tuant=True)
+
+    def test_shared_storage(self):
+        """Strings are interned, lists become tuples, tag maps are shared."""
+        from simulator import CardData
+
+        a = CardData(card_id="".join(["CS2", "_179"]), colossal_appendages=["X"], tags={106: 0})
+        b = CardData(card_id="CS2_179", tags={106: 0})
+        assert a.card_id is b.card_id
+        assert a.colossal_appendages == ("X",)
+        assert a.tags is b.tags
+        assert not hasattr(a, "__dict__")
+
+    def test_pickle_round_trip(self):
+        """Definitions survive pickling (multiprocessing workers)."""
+        import pickle
+        from simulator import CardData
+
+        data = CardData(card_id="T", name="Test", taunt=True, choose_options=["A", "B"], tags={1: 2})
+        assert pickle.loads(pickle.dumps(data)) == data
+
+
+class TestCardKeywords:
+    """Tests for per-card keyword state stored as one int."""
+
+    def test_card_copies_keywords_from_data(self):
+        """A new card starts with its definition's keywords."""
+        from simulator import CardData, Minion
+
+        minion = Minion(CardData(card_id="T", taunt=True, divine_shield=True), None)
+        assert minion.taunt and minion.divine_shield and not minion.rush
+        assert minion._taunt
+
+    def test_setters_and_clone(self):
+        """Keyword setters flip bits and clone copies the whole mask."""
+        from simulator import CardData, Minion
+
+        minion = Minion(CardData(card_id="T", taunt=True), None)
+        minion.taunt = False
+        minion._rush = True
+        clone = minion.clone()
+        assert not clone.taunt and clone.rush
+        clone.rush = False
+        assert minion.rush
+
+    def test_silence_clears_keywords(self):
+        """Silence removes Taunt and friends but the raw Rush bit stays."""
+        from simulator import CardData, Minion
+
+        minion = Minion(CardData(card_id="T", taunt=True, stealth=True, rush=True), None)
+        minion.silence()
+        assert not minion.taunt and not minion._taunt and not minion.stealth
+        assert minion._rush and not minion.rush
+
+
+class TestCardState:
+    """Tests for slotted card state and declared extension fields."""
+
+    def test_cards_are_slotted(self):
+        """Cards have no __dict__; undeclared attributes are rejected."""
+        from simulator import CardData, Minion
+
+        minion = Minion(CardData(card_id="T"), None)
+        assert not hasattr(minion, "__dict__")
+        with pytest.raises(AttributeError):
+            minion.not_a_field = 1
+
+    def test_extension_state_defaults(self):
+        """Declared extension fields read their default until set."""
+        from simulator import CardData, Minion
+
+        minion = Minion(CardData(card_id="T"), None)
+        assert minion.turn_added_to_hand == -1
+        assert minion.zilliax_modules is None
+        assert minion._ext is None
+        minion.duration = 3
+        assert minion.duration == 3
+        del minion.duration
+        assert minion.duration == 0
+
+    def test_clone_copies_state(self):
+        """clone() keeps the entity ID and copies mutable state."""
+        from simulator import CardData, Minion, HeroPower
+
+        minion = Minion(CardData(card_id="T", attack=2, health=3), None)
+        minion._damage = 1
+        minion._spellburst_triggered = True
+        minion.titan_abilities_used.append("A")
+        minion.add_enchantment(attack_mod=1)
+        minion._echo_copy = True
+        clone = minion.clone()
+        assert clone.entity_id == minion.entity_id
+        assert (clone.health, clone._spellburst_triggered, clone._echo_copy) == (2, True, True)
+        assert clone.get_enchantment_attack_bonus() == 1
+        assert clone.enchantments[0].target is clone
+        clone.titan_abilities_used.append("B")
+        clone.duration = 2
+        assert minion.titan_abilities_used == ["A"]
+        assert minion.duration == 0
+
+        power = HeroPower(CardData(card_id="P"), None)
+        power.used_this_turn = True
+        assert power.clone().used_this_turn
@@ -0,0 +1,71 @@
+"""Tests for the card search index."""
+
+import pytest
+
+
+def _index():
+    from simulator import CardData
+    from simulator.card_search import CardSearchIndex
+
+    cards = [
+        CardData(card_id="ELE", name="Fire Elemental", text="<b>Battlecry:</b> Deal $3 damage.", collectible=True),
+        CardData(card_id="FB", name="Fireball", text="Deal $6 damage.", collectible=True),
+        CardData(card_id="SEN", name="Sen'jin Shieldmasta", text="<b>Taunt</b>", collectible=True),
+        CardData(card_id="FIRE", name="Fire", text="", collectible=False),
+        CardData(card_id="DRAW", name="Arcane Intellect", text="[x]Draw 2 cards.", collectible=True),
+        CardData(card_id="CHAMP", name="Stormwind Champion", text="Your other minions have +1/+1.",
+                 collectible=True),
+    ]
+    return CardSearchIndex({c.card_id: c for c in cards})
+
+
+class TestCardSearch:
+    """Tests for tokenized, ranked card search."""
+
+    def test_normalize_strips_markup(self):
+        """Keyword markup and number prefixes do not leak into tokens."""
+        from simulator.card_search import normalize
+
+        assert normalize("<b>Battlecry:</b> Deal $3 damage.") == "battlecry deal 3 damage"
+        assert normalize("[x]Sen'jin") == "senjin"
+
+    def test_prefix_matching(self):
+        """Every query word matches as a prefix."""
+        index = _index()
+        assert index.search("fire ele") == ["ELE"]
+        assert index.search("shield") == ["SEN"]
+
+    def test_all_words_required(self):
+        """Cards must match every query word."""
+        index = _index()
+        assert index.search("deal 6") == ["FB"]
+        assert index.search("fireball taunt") == []
+
+    def test_name_match_ranks_first(self):
+        """Exact names beat name prefixes, which beat text matches."""
+        index = _index()
+        assert index.search("fire") == ["FIRE", "ELE", "FB"]
+        assert index.search("battlecry") == ["ELE"]
+
+    def test_apostrophes_and_markup_in_query(self):
+        """Queries are normalized the same way as card text."""
+        index = _index()
+        assert index.search("Sen'jin") == ["SEN"]
+        assert index.search("<b>Taunt</b>") == ["SEN"]
+        assert index.search("draw a card") == ["DRAW"]
+
+    def test_limit_and_empty_query(self):
+        """limit truncates the ranked results; blank queries match nothing."""
+        index = _index()
+        assert index.search("fire", limit=1) == ["FIRE"]
+        assert index.search("  ") == []
+
+    def test_substring_fallback(self):
+        """Longer tokens also match inside words, after prefix matches; whole phrases match on a miss."""
+        index = _index()
+        assert index.search("ball") == ["FB"]
+        assert index.search("storm") == ["CHAMP"]
+        assert index.search("wind champ") == ["CHAMP"]
+        assert index.search("ire") == ["ELE", "FB", "FIRE"]  # collectible first
+        assert index.search("d champ") == ["CHAMP"]
+        assert index.search("mp") == []  # too short to match inside a word
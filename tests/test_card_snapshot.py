@@ -0,0 +1,73 @@
+"""Tests for the compiled card database snapshot."""
+
+import pytest
+
+
+def _cards():
+    from simulator import CardData, CardType, CardClass
+
+    return {
+        "TEST_001": CardData(card_id="TEST_001", name="Wisp", cost=0, attack=1, health=1,
+                             card_type=CardType.MINION, card_class=CardClass.NEUTRAL, taunt=True,
+                             tags={106: 0}),
+        "TEST_002": CardData(card_id="TEST_002", name="Fireball", cost=4,
+                             card_type=CardType.SPELL, card_class=CardClass.MAGE),
+    }
+
+
+class TestCardSnapshot:
+    """Tests for snapshot writing, validation and lazy loading."""
+
+    def test_round_trip(self, tmp_path):
+        """Cards read back from a snapshot equal the originals."""
+        from simulator.card_snapshot import CardSnapshot, LazyCardMap, write_snapshot
+
+        path = str(tmp_path / "cards.snapshot")
+        cards = _cards()
+        write_snapshot(path, cards, "abc")
+
+        loaded = LazyCardMap(CardSnapshot.open(path, "abc"))
+        assert len(loaded) == 2
+        assert loaded["TEST_001"] == cards["TEST_001"]
+        assert loaded.get("TEST_002") == cards["TEST_002"]
+        assert loaded.get("MISSING") is None
+
+    def test_stale_fingerprint_is_rejected(self, tmp_path):
+        """A snapshot built from other sources is ignored."""
+        from simulator.card_snapshot import CardSnapshot, write_snapshot
+
+        path = str(tmp_path / "cards.snapshot")
+        write_snapshot(path, _cards(), "abc")
+        assert CardSnapshot.open(path, "def") is None
+        assert CardSnapshot.open(str(tmp_path / "missing"), "abc") is None
+
+    def test_corrupt_file_is_rejected(self, tmp_path):
+        """Garbage on disk falls back to a normal load."""
+        from simulator.card_snapshot import CardSnapshot
+
+        path = tmp_path / "cards.snapshot"
+        path.write_bytes(b"not a snapshot")
+        assert CardSnapshot.open(str(path), "abc") is None
+
+    def test_cards_materialize_on_access(self, tmp_path):
+        """CardData objects are only built when requested, then reused."""
+        from simulator.card_snapshot import CardSnapshot, LazyCardMap, write_snapshot
+
+        path = str(tmp_path / "cards.snapshot")
+        write_snapshot(path, _cards(), "abc")
+        loaded = LazyCardMap(CardSnapshot.open(path, "abc"))
+
+        assert "TEST_002" in loaded
+        assert loaded.materialized == 0
+        assert loaded["TEST_001"] is loaded["TEST_001"]
+        assert loaded.materialized == 1
+
+    def test_fingerprint_tracks_source_content(self, tmp_path):
+        """Editing a source file changes the fingerprint."""
+        from simulator.card_snapshot import source_fingerprint
+
+        source = tmp_path / "manual_cards.json"
+        source.write_text("[]")
+        before = source_fingerprint([str(source)])
+        source.write_text('[{"id": "X"}]')
+        assert source_fingerprint([str(source)]) != before
@@ -0,0 +1,75 @@
+"""Tests for the card vocabulary and static feature table."""
+
+
+class TestCardVocabulary:
+    """Tests for ai.card_vocab.CardVocabulary."""
+
+    def test_stable_ids_and_reserved(self, tmp_path):
+        """Ids follow dbf_id, survive a save/load and new cards are appended."""
+        from ai.card_vocab import CardVocabulary, PAD, UNKNOWN, HIDDEN, VOCAB_CAPACITY
+
+        vocab = CardVocabulary.default()
+        assert len(vocab) <= VOCAB_CAPACITY
+        assert vocab.dbf_ids == sorted(vocab.dbf_ids)
+        assert list(vocab.lookup(["CS2_029", None, "NOT_A_CARD"]))[1:] == [HIDDEN, UNKNOWN]
+        assert vocab.card_id(vocab.index("CS2_029")) == "CS2_029" and vocab.card_id(PAD) is None
+
+        path = tmp_path / "card_vocab.json"
+        # An older vocabulary without Fireball: Fireball goes last, the others keep their ids
+        older = CardVocabulary([c for c in vocab.card_ids if c != "CS2_029"],
+                               [d for c, d in zip(vocab.card_ids, vocab.dbf_ids) if c != "CS2_029"])
+        older.save(str(path))
+        loaded = CardVocabulary.load_or_build(str(path))
+        assert loaded.index("CS2_029") == len(vocab) - 1
+        assert loaded.index("CS2_182") == older.index("CS2_182")
+        assert CardVocabulary.load(str(path)).card_ids == loaded.card_ids
+
+    def test_static_features(self):
+        """One gather gives base stats, type, class and keywords; reserved rows are zero."""
+        from ai.card_vocab import CardVocabulary, FEATURE_NAMES, STATIC_FEATURES, UNKNOWN
+
+        vocab = CardVocabulary.default()
+        features = vocab.features
+        assert features.shape == (len(vocab), STATIC_FEATURES)
+        assert not features[:UNKNOWN + 2].any()
+
+        column = {name: i for i, name in enumerate(FEATURE_NAMES)}
+        fireball, yeti = features[vocab.lookup(["CS2_029", "CS2_182"])]
+        assert fireball[column["cost"]] == 0.4 and fireball[column["type_spell"]] == 1
+        assert fireball[column["class_mage"]] == 1
+        assert yeti[column["attack"]] == 0.4 and yeti[column["health"]] == 0.5
+        assert yeti[column["type_minion"]] == 1 and yeti[column["class_neutral"]] == 1
+        assert features[vocab.index("CS2_125"), column["keyword_taunt"]] == 1  # Ironfur Grizzly
+
+    def test_encoder_uses_vocabulary(self):
+        """Structured ids are vocabulary ids; card rows carry type and live stats."""
+        from simulator import Game, Player, create_card
+        from ai.encoder import FeatureEncoder
+        from ai.game_state import GameState
+
+        game = Game(seed=5)
+        game.setup(Player("P1", game), Player("P2", game))
+        me = game.players[0]
+        yeti = create_card("CS2_182", game)
+        yeti.controller = me
+        me.summon(yeti)
+        yeti._damage = 2
+        me.hand.clear()
+        fireball = create_card("CS2_029", game)
+        fireball.controller = me
+        me.add_to_hand(fireball)
+
+        encoder = FeatureEncoder()
+        state = GameState.from_simulator_game(game, 1)
+        encoded = encoder.structured_encode(state)
+        hand_ids, hand_stats = encoded["hand"]
+        board_ids, board_stats = encoded["my_board"]
+        assert hand_ids[0] == encoder.vocab.index("CS2_029") and hand_ids[1] == 0
+        assert list(encoded["masks"]["hand"][:2]) == [False, True]
+        assert board_ids[0] == encoder.vocab.index("CS2_182")
+        # cost, atk, hp, max hp, minion, spell, weapon, other
+        assert [round(float(x), 2) for x in board_stats[0, :8]] == [0.4, 0.4, 0.3, 0.5, 1, 0, 0, 0]
+        assert hand_stats[0, 5] == 1
+
+        flat = encoder.encode(state)
+        assert flat.shape == (encoder.input_dim,)
@@ -0,0 +1,156 @@
+"""Tests for the vectorized combat resolver."""
+
+import random
+
+
+def _vanilla_ids():
+    from simulator import CardDatabase, CardType
+    from simulator.entities import KEYWORD_BITS
+
+    CardDatabase.load()
+    allowed = 0
+    for name in ("taunt", "divine_shield", "charge", "windfury", "stealth",
+                 "poisonous", "lifesteal", "rush", "reborn"):
+        allowed |= KEYWORD_BITS[name]
+    return sorted(
+        data.card_id for data in CardDatabase._cards.values()
+        if data.card_type == CardType.MINION and data.collectible and data.attack <= 8
+        and 0 < data.health <= 8 and not data.keywords & ~allowed and not data.effects.has_handlers
+    )
+
+
+def _game(rng, card_ids):
+    """A game with random vanilla boards and random keywords, player 1 to act."""
+    from simulator import Game, Player, create_card
+
+    game = Game(seed=rng.randrange(1 << 30))
+    game.setup(Player("P1", game), Player("P2", game))
+    game.is_simulation = True
+    for player in game.players:
+        player.hero = create_card("HERO_08", game)
+        player.hero.controller = player
+        player.hero._max_health = 30
+        player.hero._damage = rng.randrange(0, 25)
+        player.hero.armor = rng.choice((0, 0, 3))
+        for _ in range(rng.randrange(0, 8)):
+            minion = create_card(rng.choice(card_ids), game)
+            minion.controller = player
+            player.summon(minion)
+            for keyword in ("divine_shield", "poisonous", "taunt", "stealth",
+                            "windfury", "lifesteal", "reborn"):
+                if rng.random() < 0.15:
+                    setattr(minion, keyword, True)
+            minion.exhausted = rng.random() < 0.2
+            minion._damage = rng.randrange(0, minion.health)
+    game.current_player_idx = 0
+    return game
+
+
+def _sequence(rng, game, length=6):
+    """Random (attacker slot, defender) pairs, mostly naming minions on the boards."""
+    from simulator.combat import HERO
+
+    friendly = len(game.players[0].board) or 1
+    enemy = len(game.players[1].board) or 1
+    return [(rng.randrange(friendly), rng.choice((HERO, rng.randrange(enemy), rng.randrange(enemy))))
+            for _ in range(length)]
+
+
+class TestCombat:
+    """Tests for simulator.combat against Game.attack."""
+
+    def test_matches_game_attack(self):
+        """The batched kernel agrees with Game.attack on random vanilla boards."""
+        from simulator import combat
+
+        rng = random.Random(2024)
+        card_ids = _vanilla_ids()
+        games = [_game(rng, card_ids) for _ in range(150)]
+        sequences = [_sequence(rng, game) for game in games]
+
+        boards, supported = combat.from_games(games)
+        assert supported.all()
+        results = combat.simulate(games, sequences)
+        for game, sequence, result in zip(games, sequences, results):
+            assert result == combat.simulate_game(game, sequence)
+
+    def test_keywords(self):
+        """Divine shield, poisonous, lifesteal, reborn and taunt on a hand-built board."""
+        import numpy as np
+        from simulator.combat import CombatBoards, HERO, attack
+
+        boards = CombatBoards.empty(1)
+        boards.hero_health[:] = 20
+        boards.hero_max_health[:] = 30
+        boards.alive[0, 0, :2] = True
+        boards.attack[0, 0, :2] = (3, 1)
+        boards.health[0, 0, :2] = (2, 3)
+        boards.attacks_left[0, 0, :2] = 1
+        boards.lifesteal[0, 0, 0] = True
+        boards.poisonous[0, 0, 1] = True
+        boards.alive[0, 1, :2] = True
+        boards.attack[0, 1, :2] = (2, 0)
+        boards.health[0, 1, :2] = (5, 1)
+        boards.divine_shield[0, 1, 0] = True
+        boards.taunt[0, 1, 0] = True
+        boards.reborn[0, 1, 1] = True
+        boards.base_attack[0, 1, 1] = 4
+
+        assert not attack(boards, 0, HERO).any()  # taunt
+        assert not attack(boards, 0, 1).any()
+        assert attack(boards, 0, 0).all()
+        # Shield absorbs the hit: no lifesteal; the attacker dies to the counter
+        assert not boards.divine_shield[0, 1, 0] and boards.health[0, 1, 0] == 5
+        assert boards.hero_health[0, 0] == 20 and not boards.alive[0, 0, 0]
+        assert attack(boards, 1, 0).all()  # poisonous kills the taunt
+        assert not boards.alive[0, 1, 0]
+        assert not attack(boards, 1, HERO).any()  # no attacks left
+        boards.attacks_left[0, 0, 1] = 1
+        boards.lifesteal[0, 0, 1] = True
+        assert attack(boards, 1, 1).all()
+        # Reborn: back as the card with 1 health; the lifesteal attacker healed 1
+        assert boards.alive[0, 1, 1] and boards.health[0, 1, 1] == 1
+        assert boards.attack[0, 1, 1] == 4 and not boards.reborn[0, 1, 1]
+        assert boards.hero_health[0, 0] == 21
+        np.testing.assert_array_equal(boards.alive[0, 0, :2], (False, True))
+
+    def test_scripted_boards_fall_back(self):
+        """Boards with triggers or auras go through Game.attack."""
+        from simulator import combat, create_card
+
+        rng = random.Random(7)
+        game = _game(rng, _vanilla_ids())
+        champion = create_card("CS2_222", game)
+        champion.controller = game.players[1]
+        game.players[1].summon(champion)
+        boards, supported = combat.from_games([game])
+        assert not supported[0]
+        sequence = [(0, combat.HERO), (1, 0)]
+        assert combat.simulate([game], [sequence]) == [combat.simulate_game(game, sequence)]
+
+    def test_find_lethal(self):
+        """find_lethal clears the taunt with the right minion, and reports when there is no lethal."""
+        import numpy as np
+        from simulator import combat
+        from simulator.combat import CombatBoards, HERO
+
+        boards = CombatBoards.empty(1)
+        boards.hero_health[:] = (30, 5)
+        boards.hero_max_health[:] = 30
+        boards.alive[0, 0, :3] = True
+        boards.attack[0, 0, :3] = (2, 3, 1)
+        boards.health[0, 0, :3] = (1, 4, 1)
+        boards.attacks_left[0, 0, :3] = 1
+        boards.alive[0, 1, 0] = boards.taunt[0, 1, 0] = True
+        boards.attack[0, 1, 0], boards.health[0, 1, 0] = 1, 1
+
+        sequence, complete = combat.find_lethal(boards)
+        assert complete and len(sequence) == 3
+        assert sequence[0, 0] == 2 and sequence[0, 1] == 0
+        result = boards.copy()
+        assert combat.resolve(result, sequence[None]).all() and combat.lethal(result)[0]
+        assert combat.find_lethal(boards, limit=2) == (None, False)
+
+        boards.hero_armor[0, 1] = 1
+        assert combat.find_lethal(boards) == (None, True)
+        np.testing.assert_array_equal(boards.alive[0, 1], [True] + [False] * 6)  # left untouched
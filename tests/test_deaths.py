@@ -0,0 +1,85 @@
+"""Tests for the death-resolution queue."""
+
+import pytest
+
+
+@pytest.fixture
+def board(board):
+    """The shared board, in simulation mode."""
+    board[0].is_simulation = True
+    return board
+
+
+class TestDeathQueue:
+    """Tests for mark_for_death / destroy / process_deaths."""
+
+    def test_lethal_damage_queues(self, board, summon):
+        """Only minions taken to 0 health are queued; they die at the death check."""
+        from simulator.enums import Zone
+
+        game, (p1, _) = board
+        croc = summon(game, p1, "CS2_120")
+        other = summon(game, p1, "CS2_120")
+        game.deal_damage(other, 1)
+        assert game._pending_deaths == []
+        game.deal_damage(croc, 10)
+        assert game._pending_deaths == [croc]
+        assert croc in p1.board
+
+        assert game.process_deaths() == [croc]
+        assert croc.zone == Zone.GRAVEYARD and croc not in p1.board
+        assert croc in p1.graveyard and p1.corpses == 1
+        assert game.process_deaths() == []
+
+    def test_healed_before_check_survives(self, board, summon):
+        """A queued minion healed before the death check stays in play."""
+        from simulator.enums import GameTag
+
+        game, (p1, _) = board
+        croc = summon(game, p1, "CS2_120")
+        game.deal_damage(croc, 3)
+        croc.damage = 0
+        assert game.process_deaths() == []
+        assert croc in p1.board and not croc.has_tag(GameTag.MORTALLY_WOUNDED)
+
+    def test_destroy_and_play_order(self, board, summon):
+        """Destroyed minions die regardless of health, first played first."""
+        game, (p1, p2) = board
+        first = summon(game, p2, "CS2_120")
+        second = summon(game, p1, "CS2_120")
+        game.destroy(second)
+        game.destroy(second)
+        game.destroy(first)
+        assert game.process_deaths() == [first, second]
+
+    def test_deathrattle_deaths_resolve_next(self, board, summon):
+        """Deaths caused while resolving a batch are resolved in a later batch."""
+        game, (p1, p2) = board
+        victim = summon(game, p2, "CS2_120")
+        croc = summon(game, p1, "CS2_120")
+        game.register_trigger("on_minion_death", croc,
+                              lambda g, src, dead: dead is not victim and g.deal_damage(victim, 10))
+        game.destroy(summon(game, p1, "CS2_120"))
+        died = game.process_deaths()
+        assert len(died) == 2 and died[1] is victim
+
+    def test_summoned_without_health_dies(self, board):
+        """A minion entering play at 0 health is queued on summon."""
+        from simulator import Minion, CardData, CardType
+
+        game, (p1, _) = board
+        husk = Minion(CardData(card_id="T", attack=1, health=0, card_type=CardType.MINION), game)
+        p1.summon(husk)
+        assert game.process_deaths() == [husk]
+
+    def test_aura_loss_does_not_kill(self, board, summon):
+        """Losing an aura's health keeps the minion at its new maximum."""
+        game, (p1, _) = board
+        wisp = summon(game, p1, "CS2_231")
+        champion = summon(game, p1, "CS2_222")
+        game.deal_damage(wisp, 1)
+        assert wisp.health == 1
+        game.destroy(champion)
+        assert game.process_deaths() == [champion]
+        assert (wisp.health, wisp.max_health) == (1, 1)
+        assert game.process_deaths() == []
@@ -0,0 +1,158 @@
+"""Tests for the card effect registry."""
+
+import pytest
+
+
+class TestEffectRegistry:
+    """Tests for card_id -> effect module indexing."""
+
+    def test_indexes_effect_modules(self):
+        """Every effect file is indexed by card ID."""
+        from simulator.effect_registry import EffectRegistry
+
+        assert EffectRegistry.count() > 1000
+        assert EffectRegistry.has_effect("EX1_287")
+
+    def test_handler_names_read_from_source(self):
+        """Handler names are known without importing the module."""
+        from simulator.effect_registry import EffectRegistry
+
+        names = EffectRegistry.handler_names("EX1_287")
+        assert "on_spell_cast" in names
+        assert "on_play" in names
+
+    def test_star_reexports_are_indexed(self):
+        """Every public function of every effect module is a known handler, re-exports included."""
+        import inspect
+        from simulator.effect_registry import EffectRegistry, EFFECTS_PACKAGE
+
+        EffectRegistry.build()
+        assert "on_battlecry" in EffectRegistry.handler_names("CORE_REV_023")  # from ..revendreth import *
+        assert callable(EffectRegistry.get_handler("CORE_DRG_107", "on_deathrattle"))
+        for module_path in list(EffectRegistry._source_names):
+            module = EffectRegistry._import(module_path)
+            if module is None:
+                continue
+            card_id = module_path.rsplit(".", 1)[1][len("effect_"):]
+            functions = {name for name, value in vars(module).items()
+                         if not name.startswith("_") and inspect.isfunction(value)
+                         and value.__module__.startswith(EFFECTS_PACKAGE + ".")}
+            assert functions <= EffectRegistry.handler_names(card_id), module_path
+
+    def test_get_handler(self):
+        """Handlers resolve to the functions defined in the module."""
+        from simulator.effect_registry import EffectRegistry
+
+        handler = EffectRegistry.get_handler("EX1_554", "on_minion_played")
+        assert callable(handler)
+        assert handler.__name__ == "on_minion_played"
+
+    def test_missing_card_is_negative_cached(self):
+        """Unknown cards return None and are remembered as misses."""
+        from simulator.effect_registry import EffectRegistry
+
+        assert EffectRegistry.get_handler("NOT_A_CARD", "battlecry") is None
+        assert ("NOT_A_CARD", "battlecry") in EffectRegistry._handler_cache
+        assert not EffectRegistry.has_effect("NOT_A_CARD")
+
+    def test_missing_handler_returns_none(self):
+        """A card without the requested handler returns None."""
+        from simulator.effect_registry import EffectRegistry
+
+        assert EffectRegistry.get_handler("EX1_287", "on_frenzy") is None
+
+    def test_game_uses_registry(self):
+        """Game handler lookups go through the registry."""
+        from simulator import Game
+
+        game = Game()
+        handler = game._get_secret_handler("EX1_289", "hero_attacked")
+        assert callable(handler)
+
+
+class TestCardEffects:
+    """Tests for the per-definition handler table on CardData."""
+
+    def test_bind_is_shared_per_card(self):
+        """All instances of a card share one handler table."""
+        from simulator.effect_registry import EffectRegistry
+
+        assert EffectRegistry.bind("EX1_287") is EffectRegistry.bind("EX1_287")
+
+    def test_card_data_exposes_slots(self):
+        """CardData.effects resolves named slots once."""
+        from simulator import CardDatabase
+
+        CardDatabase.load()
+        data = CardDatabase.get_card("EX1_287")
+        assert data.effects is data.effects
+        assert callable(data.effects.on_spell_cast)
+        assert data.effects.on_frenzy is None
+
+    def test_player_style_handler_is_adapted(self):
+        """(game, player, card) scripts are called with the (game, source) convention."""
+        from simulator.effect_registry import EffectRegistry
+
+        names = EffectRegistry.handler_names("EX1_287")
+        on_play = EffectRegistry.bind("EX1_287").on_play
+        assert "on_play" in names
+        assert getattr(on_play, "__wrapped__", on_play).__name__ == "on_play"
+
+    def test_unknown_card_has_empty_table(self):
+        """Cards without scripts get a table of empty slots."""
+        from simulator.effect_registry import EffectRegistry
+
+        effects = EffectRegistry.bind("NOT_A_CARD")
+        assert not effects.has_handlers
+        assert effects.battlecry is None
+        assert effects.get("choose_one_0") is None
+
+
+class TestEffectPreload:
+    """Tests for deck-scoped effect preloading."""
+
+    def test_preload_follows_token_references(self):
+        """Tokens named in effect scripts are resolved with the deck."""
+        from simulator import CardDatabase, EffectRegistry
+
+        CardDatabase.load()
+        report = EffectRegistry.preload(["EX1_554"])
+        assert "EX1_554" in report.card_ids
+        assert "VAN_EX1_554t" in report.card_ids
+
+    def test_preload_is_cached_per_deck(self):
+        """The same deck is only resolved once."""
+        from simulator import CardDatabase, EffectRegistry
+
+        CardDatabase.load()
+        first = EffectRegistry.preload(["EX1_287", "EX1_554"])
+        assert EffectRegistry.preload(["EX1_554", "EX1_287"]) is first
+
+    def test_preload_imports_modules(self):
+        """Every reachable effect module is imported up front."""
+        from simulator import CardDatabase, EffectRegistry
+
+        CardDatabase.load()
+        report = EffectRegistry.preload(["EX1_289"])
+        assert not report.failed
+        for module_path in EffectRegistry._resolve("EX1_289"):
+            assert EffectRegistry._modules.get(module_path) is not None
+
+    def test_strict_reports_unbound(self, caplog, capsys, monkeypatch):
+        """Strict mode logs cards whose scripted mechanics have no effect script."""
+        import logging
+        from simulator import CardDatabase, EffectRegistry
+        from simulator.effect_registry import _related_ids
+
+        CardDatabase.load()
+        monkeypatch.setattr(EffectRegistry, "_preloaded", {})
+        # A battlecry minion nobody has scripted yet
+        card_id = next(cid for cid, data in sorted(CardDatabase._cards.items())
+                       if data.battlecry and not EffectRegistry.has_effect(cid) and not _related_ids(data))
+        with caplog.at_level(logging.WARNING, logger="simulator.effect_registry"):
+            report = EffectRegistry.preload(["EX1_554", card_id], strict=True)
+        assert report.unbound == (card_id,)
+        messages = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+        assert f"No effect script for: {card_id}" in messages
+        assert any("1 unbound" in m for m in messages)
+        assert capsys.readouterr().out == ""
@@ -0,0 +1,87 @@
+"""Tests for the direct simulator encoder."""
+
+
+def _trajectory(seed, steps=60):
+    """(game clone, player to act) along a random self-play game."""
+    import random
+    from ai.game_wrapper import HearthstoneGame
+
+    random.seed(seed)
+    env = HearthstoneGame()
+    env.reset(seed=seed)
+    env.game.is_simulation = True
+    states = []
+    for _ in range(steps):
+        if env.is_game_over:
+            break
+        states.append((env.game.clone(), env.game.current_player_idx))
+        assert env.step(random.choice(env.get_valid_actions()), observe=False)[0] is None
+    return states
+
+
+class TestDirectEncoder:
+    """Tests for FeatureEncoder.encode_game / structured_encode_game."""
+
+    def test_matches_game_state_path(self):
+        """Same tensors as encoding GameState.from_simulator_game, from both sides."""
+        import torch
+        from ai.encoder import FeatureEncoder
+        from ai.game_state import GameState
+
+        encoder = FeatureEncoder()
+        for game, _ in _trajectory(4):
+            for player in (0, 1):
+                state = GameState.from_simulator_game(game, player + 1)
+                expected = encoder.structured_encode(state)
+                encoded = encoder.structured_encode_game(game, player)
+                for zone in ("hand", "my_board", "enemy_board"):
+                    assert torch.equal(encoded[zone][0], expected[zone][0])
+                    assert torch.equal(encoded[zone][1], expected[zone][1])
+                    assert torch.equal(encoded["masks"][zone], expected["masks"][zone])
+                assert torch.allclose(encoded["global_state"], expected["global_state"])
+                assert torch.allclose(encoder.encode_game(game, player), encoder.encode(state))
+
+    def test_rows_are_independent(self):
+        """Each row of a StateBuffers keeps its state; the scratch buffer is reused."""
+        import torch
+        from ai.encoder import FeatureEncoder, StateBuffers
+
+        encoder = FeatureEncoder()
+        (first, p1), (second, p2) = _trajectory(2)[-2:]
+        buffers = StateBuffers(encoder, size=2)
+        a = encoder.structured_encode_game(first, p1, out=buffers, row=0)
+        b = encoder.structured_encode_game(second, p2, out=buffers, row=1)
+        assert torch.equal(a["global_state"], encoder.structured_encode_game(first, p1)["global_state"])
+        assert not torch.equal(a["global_state"], b["global_state"])
+        # Structured stats are views of the flat rows
+        assert buffers.structured["hand"][1].data_ptr() == buffers.flat_tensor[:, encoder.scalar_dim:].data_ptr()
+
+    def test_encode_batch(self):
+        """One call encodes N games into batch tensors that HearthstoneTransformer takes as is."""
+        import torch
+        from ai.encoder import FeatureEncoder
+        from ai.transformer_model import HearthstoneTransformer
+
+        encoder = FeatureEncoder()
+        states = _trajectory(6)[::5]
+        games = [game for game, _ in states]
+        perspectives = [1 - player for _, player in states]
+        hand, my_board, enemy_board, global_state, masks = encoder.encode_batch(games, perspectives)
+        assert hand[0].shape == (len(games), encoder.max_hand) and global_state.shape[0] == len(games)
+        for k, (game, player) in enumerate(zip(games, perspectives)):
+            single = encoder.structured_encode_game(game, player)
+            assert torch.equal(hand[1][k], single["hand"][1])
+            assert torch.equal(enemy_board[0][k], single["enemy_board"][0])
+            assert torch.equal(masks["my_board"][k], single["masks"]["my_board"])
+            assert torch.equal(global_state[k], single["global_state"])
+
+        torch.manual_seed(0)
+        model = HearthstoneTransformer().eval()
+        with torch.no_grad():
+            policy, value = model(hand, my_board, enemy_board, global_state, masks)
+            first = encoder.structured_encode_game(games[0], perspectives[0])
+            alone, _ = model(*(tuple(t.unsqueeze(0) for t in first[z]) for z in ("hand", "my_board", "enemy_board")),
+                             first["global_state"].unsqueeze(0),
+                             {z: m.unsqueeze(0) for z, m in first["masks"].items()})
+        assert policy.shape[0] == len(games) and value.shape == (len(games), 1)
+        assert torch.allclose(policy[0], alone[0], atol=1e-6)
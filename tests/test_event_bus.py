@@ -0,0 +1,85 @@
+"""Tests for the game event bus (register_trigger / fire_event)."""
+
+import pytest
+
+
+def _minion(game, zone):
+    from simulator import CardData, Minion
+
+    minion = Minion(CardData(card_id="T", attack=1, health=1), game)
+    minion.zone = zone
+    return minion
+
+
+class TestEventBus:
+    """Tests for zone-aware trigger dispatch."""
+
+    def test_only_live_sources_fire(self):
+        """Triggers of cards in the deck wait until the card is drawn or played."""
+        from simulator import Game
+        from simulator.enums import Zone
+
+        game = Game()
+        calls = []
+        minion = _minion(game, Zone.DECK)
+        game.register_trigger("on_turn_end", minion, lambda g, src, *a: calls.append(src))
+        game.fire_event("on_turn_end", None)
+        assert calls == [] and not game.has_listeners("on_turn_end")
+
+        minion.zone = Zone.PLAY
+        game.fire_event("on_turn_end", None)
+        assert calls == [minion]
+
+        minion.zone = Zone.GRAVEYARD
+        assert not game.has_listeners("on_turn_end")
+
+    def test_unregister_by_source(self):
+        """unregister_triggers removes every trigger of one source only."""
+        from simulator import Game
+        from simulator.enums import Zone
+
+        game = Game()
+        first, second = _minion(game, Zone.PLAY), _minion(game, Zone.DECK)
+        for event in ("on_turn_end", "on_damage_taken"):
+            game.register_trigger(event, first, lambda g, src, *a: None)
+            game.register_trigger(event, second, lambda g, src, *a: None)
+        game.unregister_triggers(first)
+        assert not game.has_listeners("on_turn_end")
+        assert first.entity_id not in game._trigger_handles
+        assert len(game._dormant_triggers) == 2
+
+    def test_removed_during_dispatch_is_skipped(self):
+        """A trigger removed by an earlier callback of the same event does not run."""
+        from simulator import Game
+        from simulator.enums import Zone
+
+        game = Game()
+        calls = []
+        first, second = _minion(game, Zone.PLAY), _minion(game, Zone.PLAY)
+        game.register_trigger("on_turn_end", first, lambda g, src, *a: g.unregister_triggers(second))
+        game.register_trigger("on_turn_end", second, lambda g, src, *a: calls.append(src))
+        game.fire_event("on_turn_end", None)
+        assert calls == []
+
+    def test_unknown_event_rejected(self):
+        """Events must be declared in GAME_EVENTS."""
+        from simulator import Game
+        from simulator.enums import Zone
+
+        game = Game()
+        with pytest.raises(ValueError):
+            game.register_trigger("on_not_an_event", _minion(game, Zone.PLAY), print)
+
+    def test_previously_dropped_events_fire(self):
+        """Events such as on_minion_attack now reach their subscribers."""
+        from simulator import Game
+        from simulator.game import GAME_EVENTS
+        from simulator.enums import Zone
+
+        game = Game()
+        calls = []
+        minion = _minion(game, Zone.PLAY)
+        assert {"on_minion_attack", "on_awake", "on_weapon_equipped"} <= set(GAME_EVENTS)
+        game.register_trigger("on_minion_attack", minion, lambda g, src, attacker: calls.append(attacker))
+        game.fire_event("on_minion_attack", minion)
+        assert calls == [minion]
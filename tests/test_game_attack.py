@@ -0,0 +1,40 @@
+"""Tests for Game.attack and Game.deal_damage combat rules."""
+
+
+class TestGameAttack:
+    """Tests for combat rules in simulator.game.Game."""
+
+    def test_defending_hero_does_not_hit_back(self, make_game):
+        """A hero only deals damage when it attacks, not when it is attacked."""
+        game = make_game(["CS2_182"], [])
+        minion, enemy = game.players[0].board[0], game.players[1].hero
+        enemy._attack = 3
+        assert game.attack(minion, enemy)
+        assert minion.health == 5 and enemy.health == 26
+
+    def test_zero_damage_keeps_shield(self, make_game):
+        """A hit for 0 neither pops divine shield nor applies poisonous or lifesteal."""
+        game = make_game(["CS2_182"], ["CS2_120"])
+        source, target = game.players[0].board[0], game.players[1].board[0]
+        source.poisonous = source.lifesteal = True
+        game.players[0].hero._damage = 5
+        target.divine_shield = True
+        assert game.deal_damage(target, 0, source) == 0
+        assert target.divine_shield and target in game.players[1].board
+        target.divine_shield = False
+        game.deal_damage(target, 0, source)
+        game.process_deaths()
+        assert target in game.players[1].board
+        assert game.players[0].hero.health == 25
+
+    def test_lifesteal_heals(self, make_game):
+        """Lifesteal heals its controller's hero: no armor, no healing past full."""
+        game = make_game(["CS2_182", "CS2_124"], [])
+        yeti, wolfrider = game.players[0].board
+        hero = game.players[0].hero
+        yeti.lifesteal = wolfrider.lifesteal = True
+        hero._damage = 2
+        assert game.attack(yeti, game.players[1].hero)
+        assert hero.health == 30 and hero.armor == 0
+        assert game.attack(wolfrider, game.players[1].hero)
+        assert hero.health == 30 and hero.armor == 0
@@ -0,0 +1,119 @@
+"""Tests for full-fidelity Game.clone."""
+
+import random
+
+import pytest
+
+
+def _started_game():
+    from ai.game_wrapper import HearthstoneGame
+
+    random.seed(7)
+    env = HearthstoneGame()
+    env.reset()
+    env.game.is_simulation = True
+    for _ in range(30):
+        if env.is_game_over:
+            break
+        env.step(random.choice(env.get_valid_actions()))
+    return env.game
+
+
+class TestGameClone:
+    """Tests for copy-on-write game cloning."""
+
+    def test_keeps_all_zones(self):
+        """Decks, graveyards, secrets and triggers survive the clone."""
+        game = _started_game()
+        clone = game.clone()
+        for player, copy in zip(game.players, clone.players):
+            assert [c.card_id for c in copy.deck] == [c.card_id for c in player.deck]
+            assert [c.card_id for c in copy.graveyard] == [c.card_id for c in player.graveyard]
+            assert len(copy.secrets) == len(player.secrets)
+            assert copy.opponent is clone.players[1 - game.players.index(player)]
+        assert {k: len(v) for k, v in clone._triggers.items()} == {k: len(v) for k, v in game._triggers.items()}
+
+    def test_trigger_sources_are_remapped(self):
+        """Triggers fire for the cloned source entity."""
+        game = _started_game()
+        source = game.players[0].deck[0]
+        callback = lambda game, src: None
+        handle = game.register_trigger("on_turn_end", source, callback)
+        clone = game.clone()
+        event, copy_source, copy_callback = clone._dormant_triggers[handle]
+        assert copy_callback is callback
+        assert copy_source is clone.players[0].deck[0]
+
+    def test_entities_are_copies(self):
+        """Cloned cards belong to the clone and keep their entity IDs."""
+        game = _started_game()
+        clone = game.clone()
+        player, copy = game.players[0], clone.players[0]
+        for original, card in zip(player.hand + player.deck, copy.hand + copy.deck):
+            assert card is not original
+            assert card.entity_id == original.entity_id
+            assert card.game is clone and card.controller is copy
+        assert copy.hero is not player.hero and copy.hero.controller is copy
+
+    def test_deck_is_copied_on_first_use(self):
+        """Shared zones are only copied when the clone touches them."""
+        from simulator.immutable import SharedList
+
+        game = _started_game()
+        clone = game.clone()
+        deck = clone.players[0].deck
+        assert type(deck) is SharedList and deck.is_shared
+        size = len(game.players[0].deck)
+        deck.pop()
+        assert not deck.is_shared
+        assert len(game.players[0].deck) == size
+
+    def test_clone_of_clone(self):
+        """A clone of an untouched clone maps entities through both copies."""
+        game = _started_game()
+        first = game.clone()
+        second = first.clone()
+        card = second.players[0].deck[0]
+        assert card.game is second
+        assert card.entity_id == game.players[0].deck[0].entity_id
+
+    def test_rollout_does_not_touch_source(self):
+        """Playing on a clone leaves the source game unchanged."""
+        from ai.game_wrapper import HearthstoneGame
+
+        game = _started_game()
+        before = [(p.hero.health, len(p.deck), len(p.hand), len(p.board)) for p in game.players]
+        sim = HearthstoneGame()
+        sim._game = game.clone()
+        for _ in range(20):
+            if sim.is_game_over:
+                break
+            sim.step(random.choice(sim.get_valid_actions()))
+        assert [(p.hero.health, len(p.deck), len(p.hand), len(p.board)) for p in game.players] == before
+
+    def test_minimal_clone_keeps_entity_counter(self):
+        """full=False still drops the deck and no longer resets entity IDs."""
+        from simulator.entities import Entity
+
+        game = _started_game()
+        next_id = Entity._next_id
+        clone = game.clone(full=False)
+        assert clone.players[0].deck == []
+        assert Entity._next_id == next_id
+
+    def test_source_keeps_playing(self):
+        """Changes to the source after a clone never show through the clone's shared zones."""
+        from simulator.enums import GameTag, Zone
+
+        game = _started_game()
+        clone = game.clone()
+        second = clone.clone()  # still reads the source's cards through the first clone
+        before = [(c.entity_id, c.attack) for c in game.players[0].deck]
+        card = game.players[0].draw(1)[0]
+        card.attack = 99
+        game.players[0].deck[0].set_tag(GameTag.TAUNT, 1)
+        assert not game._shared
+        for copy in (clone, second):
+            deck = copy.players[0].deck
+            assert [(c.entity_id, c.attack) for c in deck] == before
+            assert all(c.zone == Zone.DECK and not c.get_tag(GameTag.TAUNT) for c in deck)
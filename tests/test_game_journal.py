@@ -0,0 +1,128 @@
+"""Tests for the do/undo mutation journal."""
+
+import random
+
+
+def _started_game(seed=11):
+    from ai.game_wrapper import HearthstoneGame
+
+    random.seed(seed)
+    env = HearthstoneGame()
+    env.reset()
+    env.game.is_simulation = True
+    for _ in range(25):
+        if env.is_game_over:
+            break
+        env.step(random.choice(env.get_valid_actions()))
+    return env
+
+
+def _state(game):
+    return [
+        (p.mana, p.hero.health, p.hero.armor,
+         [(c.entity_id, c.attack, c.health, c.exhausted) for c in p.board],
+         [c.entity_id for c in p.hand], [c.entity_id for c in p.deck],
+         [c.entity_id for c in p.graveyard], dict(p.hero.tags))
+        for p in game.players
+    ] + [game.turn, game.current_player_idx]
+
+
+def _play(env, steps):
+    for _ in range(steps):
+        if env.is_game_over:
+            break
+        env.step(random.choice(env.get_valid_actions()))
+
+
+class TestGameJournal:
+    """Tests for mark()/rollback() on Game."""
+
+    def test_rollback_restores_state(self):
+        """Random play after a mark is fully undone."""
+        env = _started_game()
+        game = env.game
+        before = _state(game)
+        mark = game.mark()
+        _play(env, 20)
+        game.rollback(mark)
+        assert _state(game) == before
+        game.end_journal()
+
+    def test_nested_marks(self):
+        """Rolling back to an inner mark keeps the outer changes."""
+        env = _started_game()
+        game = env.game
+        outer = game.mark()
+        _play(env, 5)
+        middle = _state(game)
+        inner = game.mark()
+        _play(env, 5)
+        game.rollback(inner)
+        assert _state(game) == middle
+        _play(env, 3)
+        game.rollback(inner)
+        assert _state(game) == middle
+        game.rollback(outer)
+        game.end_journal()
+
+    def test_rollback_restores_rng(self):
+        """Draws from the game's random stream repeat after a rollback."""
+        env = _started_game()
+        game = env.game
+        mark = game.mark()
+        first = game.rng.random()
+        game.rollback(mark)
+        assert game.rng.random() == first
+        game.end_journal()
+
+    def test_end_journal_removes_hooks(self):
+        """After end_journal the engine runs on plain lists without recording hooks."""
+        import gc
+        from simulator import Game
+        from simulator.entities import Entity, _hashing_setattr
+
+        env = _started_game()
+        game = env.game
+        game.mark()
+        game.end_journal()
+        gc.collect()  # earlier tests' clones, which keep the clone guard installed
+        # The state hash's hook, if any game was hashed
+        assert Entity.__dict__.get("__setattr__", _hashing_setattr) is _hashing_setattr
+        assert "__setattr__" not in Game.__dict__
+        assert type(game.players[0].hand) is list
+        assert type(game.players[0].hero.tags) is dict
+
+    def test_games_journal_side_by_side(self):
+        """Each game records only its own writes, also from different threads."""
+        import threading
+
+        envs = [_started_game(1), _started_game(2)]
+        games = [env.game for env in envs]
+        before = [_state(game) for game in games]
+        marks = [game.mark() for game in games]
+        _play(envs[0], 10)
+        _play(envs[1], 10)
+        games[0].rollback(marks[0])
+        assert _state(games[0]) == before[0]
+        games[1].rollback(marks[1])
+        assert _state(games[1]) == before[1]
+
+        errors = []
+
+        def search(env, mark, expected):
+            try:
+                for _ in range(20):
+                    _play(env, 8)
+                    env.game.rollback(mark)
+                    assert _state(env.game) == expected
+            except Exception as e:  # reported by the main thread
+                errors.append(e)
+
+        threads = [threading.Thread(target=search, args=args) for args in zip(envs, marks, before)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for game in games:
+            game.end_journal()
+        assert not errors
@@ -0,0 +1,70 @@
+"""Tests for the TorchScript inference runtime."""
+
+
+def _batch(encoder, size=8):
+    """Encoded states of a random self-play game (copies: the encoder reuses its buffers)."""
+    import torch
+    from tests.test_encoder import _trajectory
+
+    states = _trajectory(5)[::4][:size]
+    hand, my_board, enemy_board, global_state, masks = encoder.encode_batch(
+        [game for game, _ in states], [player for _, player in states])
+    copy = lambda zone: tuple(t.clone() for t in zone)
+    return (copy(hand), copy(my_board), copy(enemy_board), global_state.clone(),
+            {zone: m.clone() for zone, m in masks.items()})
+
+
+class TestInference:
+    """Tests for ai.inference export/InferenceModel."""
+
+    def test_transformer_parity(self, tmp_path):
+        """Float export matches eager; int8 stays close; any batch size; action mask applied."""
+        import torch
+        from ai.encoder import FeatureEncoder
+        from ai.inference import InferenceModel, export
+        from ai.transformer_model import HearthstoneTransformer
+
+        torch.manual_seed(0)
+        encoder = FeatureEncoder()
+        model = HearthstoneTransformer()
+        inputs = _batch(encoder)
+        action_mask = torch.ones(inputs[3].shape[0], model.action_dim)
+        action_mask[:, ::2] = 0
+
+        model.eval()
+        with torch.no_grad():
+            policy, value = model(*inputs)
+            masked_policy, _ = model(*inputs, action_mask)
+
+        model.train()  # export must not depend on the caller's mode
+        export(model, str(tmp_path / "float.ts"), quantize=False, encoder=encoder)
+        export(model, str(tmp_path / "int8.ts"), encoder=encoder)
+        assert model.training
+
+        for name, tolerance in (("float.ts", 1e-5), ("int8.ts", 0.05)):
+            runtime = InferenceModel.load(str(tmp_path / name))
+            got_policy, got_value = runtime(*inputs)
+            assert got_policy.shape == policy.shape and got_value.shape == value.shape
+            assert (got_policy - policy).abs().max() < tolerance
+            assert (got_value - value).abs().max() < tolerance
+
+            got_masked, _ = runtime(*inputs, action_mask=action_mask)
+            assert not got_masked[:, ::2].any()
+            assert (got_masked - masked_policy).abs().max() < tolerance
+        assert runtime.quantized
+
+    def test_flat_model_parity(self, tmp_path):
+        """HearthstoneModel exports too, with the (state, action_mask) signature."""
+        import torch
+        from ai.inference import InferenceModel, export
+        from ai.model import HearthstoneModel
+
+        torch.manual_seed(0)
+        model = HearthstoneModel(64, 20).eval()
+        states = torch.rand(5, 64)
+        with torch.no_grad():
+            policy, value = model(states)
+        export(model, str(tmp_path / "flat.ts"), quantize=False)
+        got_policy, got_value = InferenceModel.load(str(tmp_path / "flat.ts"))(states)
+        assert (got_policy - policy).abs().max() < 1e-5
+        assert (got_value - value).abs().max() < 1e-5
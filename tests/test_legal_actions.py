@@ -0,0 +1,68 @@
+"""Tests for the legal action generator."""
+
+
+class TestLegalActions:
+    """Tests for ai.legal_actions."""
+
+    def test_enumerates_every_target_and_position(self, make_game):
+        """All targets of a targeted card, every board slot, every attack target."""
+        from ai.legal_actions import generate
+        from ai.actions import Action, ActionType
+
+        # 4/5 and 3/1 against two 2/3s; Fireball and a 1/1 in hand
+        game = make_game(["CS2_182", "CS2_124"], ["CS2_120", "CS2_120"], hand=["CS2_029", "CS2_231"], mana=10)
+        me, enemy = game.players
+        game._target_handlers["CS2_029"] = lambda game, card: [
+            enemy.hero, *enemy.board, me.hero, *me.board]
+        try:
+            moves = generate(game)
+        finally:
+            del game._target_handlers["CS2_029"]
+        actions = [Action.from_index(i) for i in moves]
+
+        fireball = [a for a in actions if a.action_type == ActionType.PLAY_CARD and a.card_index == 0]
+        assert len(fireball) == 6
+        wisp = [a for a in actions if a.action_type == ActionType.PLAY_CARD and a.card_index == 1]
+        assert sorted(a.position for a in wisp) == [0, 1, 2]
+        attacks = [a for a in actions if a.action_type == ActionType.ATTACK]
+        assert len(attacks) == 2 * 3  # both minions, enemy hero and both 2/3s
+        assert moves[0][0] == "end_turn"
+
+    def test_execute_decodes_index(self, make_game):
+        """An index from the mask is performed without building Action objects."""
+        from ai.legal_actions import LegalActions
+        from ai.actions import Action, ACTION_SPACE_SIZE
+
+        game = make_game(["CS2_182"], [], hand=["CS2_231"], mana=10)
+        legal = LegalActions()
+        mask = legal.mask(game)
+        assert mask.shape == (ACTION_SPACE_SIZE,) and mask.sum() == len(legal.get(game).moves)
+
+        index = Action.play_card(0, position=0).to_index()
+        assert mask[index] == 1
+        assert legal.execute(game, index)
+        assert game.players[0].board[0].card_id == "CS2_231"
+        assert not legal.execute(game, index)  # no card left in that slot
+
+    def test_self_play_indices(self):
+        """In self-play, indices round-trip and the wrapper steps from bare indices."""
+        import random
+        from ai.game_wrapper import HearthstoneGame
+        from ai.actions import Action, ActionType
+
+        random.seed(3)
+        env = HearthstoneGame()
+        env.reset(seed=3)
+        env.game.is_simulation = True
+        driver = random.Random(3)
+        for _ in range(120):
+            if env.is_game_over:
+                break
+            indices = sorted(int(i) for i in env.get_action_mask().nonzero()[0])
+            assert indices == sorted(a.to_index() for a in env.get_valid_actions())
+            assert all(Action.from_index(i).to_index() == i for i in indices)
+            before = env.game.state_hash
+            action = Action.from_index(driver.choice(indices))
+            env.step(action)
+            if action.action_type != ActionType.CHOOSE:  # discover scripts may raise
+                assert env.game.state_hash != before
@@ -0,0 +1,109 @@
+"""Tests for the MCTS search module."""
+
+
+def _mcts(**kwargs):
+    import torch
+    from ai.encoder import FeatureEncoder
+    from ai.model import HearthstoneModel
+    from ai.mcts import MCTS
+    from ai.actions import ACTION_SPACE_SIZE
+
+    torch.manual_seed(0)
+    encoder = FeatureEncoder()
+    model = HearthstoneModel(encoder.input_dim, ACTION_SPACE_SIZE)
+    return MCTS(model, encoder, seed=0, **kwargs)
+
+
+class TestMCTS:
+    """Tests for ai.mcts.MCTS."""
+
+    def test_visits_only_legal_actions(self, make_game):
+        """The root distribution covers legal actions only and the game is left untouched."""
+        from ai.legal_actions import generate
+
+        game = make_game(["CS2_182", "CS2_124"], ["CS2_120"])
+        before = game.state_hash
+        mcts = _mcts(num_simulations=40)
+        probs = mcts.search(game)
+        assert mcts.simulations == 40
+        assert abs(probs.sum() - 1.0) < 1e-5
+        assert set(probs.nonzero()[0]) <= set(generate(game))
+        assert game.state_hash == before
+
+    def test_finds_lethal(self, make_game):
+        """A winning attack ends the game: search prefers it whatever the network says."""
+        from ai.actions import Action
+
+        game = make_game(["CS2_182"], [], enemy_health=4)
+        mcts = _mcts(num_simulations=60)
+        mcts.search(game)
+        assert mcts.best_action() == Action.attack(0, -1).to_index()
+
+    def test_batches_and_reuses_subtree(self, make_game):
+        """Leaves share forward passes; advance() keeps the chosen subtree."""
+        game = make_game(["CS2_182", "CS2_124"], ["CS2_120"])
+        mcts = _mcts(num_simulations=64, batch_size=8)
+        calls = []
+        forward = mcts.model.forward
+        mcts.model.forward = lambda *args, **kwargs: calls.append(1) or forward(*args, **kwargs)
+        mcts.search(game)
+        assert len(calls) < 64 / 2
+
+        index = mcts.best_action()
+        child = mcts.root.children[index]
+        mcts.advance(index)
+        assert mcts.root is child and child.visits is not None
+
+    def test_time_budget(self, make_game):
+        """A time budget alone bounds the search."""
+        game = make_game(["CS2_182"], ["CS2_120"])
+        mcts = _mcts(num_simulations=None, time_budget=0.2)
+        probs = mcts.search(game)
+        assert mcts.simulations > 0 and probs.sum() > 0
+
+    def test_reuse_drops_tree_of_other_player(self, make_game):
+        """A root advanced to the opponent's turn is not reused for our own decision."""
+        from ai.actions import Action
+
+        game = make_game(["CS2_182"], [], enemy_health=4)
+        mcts = _mcts(num_simulations=60)
+        mcts.search(game)
+        mcts.advance(Action.end_turn().to_index())
+        assert mcts.root.player == 1
+        mcts.search(game)
+        assert mcts.root.player == 0
+        assert mcts.best_action() == Action.attack(0, -1).to_index()
+
+    def test_search_threads_share_evaluator(self, make_game):
+        """Several threads descend one tree; their batches are stacked into shared forward passes."""
+        import threading
+        import time
+        from ai.actions import ACTION_SPACE_SIZE
+        from ai.legal_actions import generate
+        from ai.transformer_model import HearthstoneTransformer
+
+        game = make_game(["CS2_182", "CS2_124"], ["CS2_120"])
+        before = game.state_hash
+        for transformer in (False, True):
+            mcts = _mcts(num_simulations=48, batch_size=4, num_threads=4)
+            if transformer:
+                mcts.model = HearthstoneTransformer(action_dim=ACTION_SPACE_SIZE)
+                mcts.structured = True
+            threads, rows = set(), []
+            collect, forward = mcts._collect, mcts.model.forward
+
+            def slow_forward(*args, **kwargs):
+                time.sleep(0.05)  # let the other threads' batches queue up
+                policy, value = forward(*args, **kwargs)
+                rows.append(value.shape[0])
+                return policy, value
+
+            mcts._collect = lambda descent: threads.add(threading.get_ident()) or collect(descent)
+            mcts.model.forward = slow_forward
+            probs = mcts.search(game)
+            mcts.close()
+            assert mcts.simulations == 48 and mcts.root.visits.sum() == 47  # the first evaluates the root
+            assert set(probs.nonzero()[0]) <= set(generate(game))
+            assert len(threads) > 1
+            assert max(rows) > 4
+            assert game.state_hash == before
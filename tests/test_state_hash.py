@@ -0,0 +1,101 @@
+"""Tests for the incremental state hash (Game.state_hash)."""
+
+
+def _assert_fresh(game):
+    """Every card's contribution matches a hash computed from scratch."""
+    from simulator import zobrist
+
+    game.state_hash
+    contributions = game._state_hash.contributions
+    for player in game.players:
+        for card in (player.hero, player.hero_power, *player.hand, *player.board, *player.deck):
+            if card is not None:
+                assert contributions[card.entity_id] == zobrist.entity_hash(card)
+
+
+class TestStateHash:
+    """Tests for Game.state_hash and simulator.zobrist."""
+
+    def test_follows_writes(self, make_game):
+        """Stat and tag writes change the hash; undoing them restores it."""
+        from simulator import GameTag
+
+        game = make_game(["CS2_182"], ["CS2_120"])
+        before = game.state_hash
+        minion = game.players[0].board[0]
+        minion._damage = 2
+        assert game.state_hash != before
+        minion._damage = 0
+        assert game.state_hash == before
+        minion.set_tag(GameTag.CREATOR, 7)
+        assert game.state_hash != before
+        _assert_fresh(game)
+
+    def test_transpositions_hash_equal(self, make_game):
+        """Two attack orders reaching the same position give the same hash."""
+        game = make_game(["CS2_124", "CS2_182"], [])
+        first, second = game.clone(), game.clone()
+        assert first.state_hash == second.state_hash == game.state_hash
+        for clone, order in ((first, (0, 1)), (second, (1, 0))):
+            for slot in order:
+                assert clone.attack(clone.players[0].board[slot], clone.players[1].hero)
+        assert first.state_hash == second.state_hash != game.state_hash
+        _assert_fresh(first)
+
+    def test_clone_and_rollback(self, make_game):
+        """Clones hash like their source; a rollback restores the hash."""
+        game = make_game(["CS2_124", "CS2_182"], ["CS2_120"])
+        before = game.state_hash
+        mark = game.mark()
+        game.attack(game.players[0].board[0], game.players[1].board[0])
+        after = game.state_hash
+        assert after != before and game.clone().state_hash == after
+        game.rollback(mark)
+        game.end_journal()
+        assert game.state_hash == before
+        _assert_fresh(game)
+
+    def test_action_cache_follows_state(self, make_game):
+        """HearthstoneGame's action cache misses when the state changes outside step()."""
+        from ai.game_wrapper import HearthstoneGame
+
+        env = HearthstoneGame()
+        env._game = make_game(["CS2_182"], ["CS2_120"])
+        minion = env.game.players[0].board[0]
+        minion.exhausted = True
+        assert not any(a.action_type.name == "ATTACK" for a in env.get_valid_actions())
+        minion.exhausted = False  # same turn, mana, hand and board sizes
+        assert any(a.action_type.name == "ATTACK" for a in env.get_valid_actions())
+
+    def test_stable_across_processes(self):
+        """The hash ignores the per-process string salt; writes are plain until a hash is read
+        and again once no hashed game is left."""
+        import os
+        import subprocess
+        import sys
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = "\n".join((
+            "from simulator import Game, Player, create_card",
+            "from simulator.entities import Entity",
+            "game = Game(seed=7)",
+            "game.setup(Player('P1', game), Player('P2', game))",
+            "for player, card_id in zip(game.players, ('CS2_182', 'CS2_120')):",
+            "    minion = create_card(card_id, game)",
+            "    minion.controller = player",
+            "    player.summon(minion)",
+            "    player.add_to_hand(create_card('CS2_029', game))",
+            "hooked = '__setattr__' in Entity.__dict__",
+            "print(hooked, game.state_hash, '__setattr__' in Entity.__dict__)",
+            "import gc; clone = game.clone(); del game, player, minion; gc.collect()",
+            "print('__setattr__' in Entity.__dict__)",
+            "del clone; gc.collect()",
+            "print('__setattr__' in Entity.__dict__)",
+        ))
+        outputs = []
+        for hash_seed in ("1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+            outputs.append(subprocess.run([sys.executable, "-c", script], cwd=root, env=env,
+                                          capture_output=True, text=True, check=True).stdout.split()[-5:])
+        assert outputs[0] == outputs[1]
+        assert outputs[0][0] == "False" and outputs[0][2:] == ["True", "True", "False"]
@@ -0,0 +1,135 @@
+"""Tests for the structured game trace."""
+
+import io
+import json
+
+
+class TestTrace:
+    """Tests for Game.set_trace_sink and the trace sinks."""
+
+    def test_disabled_by_default(self, capsys, board, summon):
+        """Untraced games neither build records nor print."""
+        game, (p1, p2) = board
+        croc = summon(game, p1, "CS2_120")
+        game.deal_damage(summon(game, p2, "CS2_120"), 1, croc)
+        assert not game.tracing and game._trace_seq == 0
+        assert capsys.readouterr().out == ""
+
+    def test_records_are_structured(self, board, summon):
+        """Records carry the turn, player, kind and entity references."""
+        from simulator import trace
+
+        game, (p1, p2) = board
+        sink = trace.ListSink()
+        game.set_trace_sink(sink)
+        croc = summon(game, p1, "CS2_120")
+        target = summon(game, p2, "CS2_120")
+        game.deal_damage(target, 2, croc)
+        game.deal_damage(target, 0, croc)
+        game.destroy(croc)
+        game.process_deaths()
+
+        assert sink.kinds() == [trace.DAMAGE]
+        damage = sink.events[0]
+        assert damage.seq == 1 and damage.turn == game.turn
+        assert damage.data["amount"] == 2
+        assert damage.data["target"] == {"id": target.entity_id, "card_id": "CS2_120", "name": target.name}
+        assert "takes 2" in damage.message()
+
+        game.set_trace_sink(None)
+        game.deal_damage(target, 1, croc)
+        assert len(sink.events) == 1
+
+    def test_ring_buffer_dumps_jsonl(self, board, summon):
+        """The ring buffer keeps the last records and dumps them as JSON lines."""
+        from simulator import trace
+
+        game, (p1, p2) = board
+        sink = trace.RingBufferSink(3)
+        game.set_trace_sink(sink)
+        croc = summon(game, p1, "CS2_120")
+        target = summon(game, p2, "CS2_120")
+        for _ in range(5):
+            game.deal_damage(target, 1, croc)
+        stream = io.StringIO()
+        assert sink.dump_jsonl(stream) == 3
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [r["seq"] for r in records] == [3, 4, 5]
+        assert records[-1]["kind"] == "damage" and records[-1]["source"]["card_id"] == "CS2_120"
+
+    def test_effect_errors_counted(self, board, summon):
+        """Exceptions swallowed from scripts are counted per card_id."""
+        from simulator import trace
+
+        game, (p1, _) = board
+        croc = summon(game, p1, "CS2_120")
+        before = trace.EFFECT_ERRORS["CS2_120"]
+
+        def broken(g, source, *args):
+            raise ValueError("boom")
+
+        sink = trace.ListSink()
+        game.set_trace_sink(sink)
+        game.register_trigger("on_turn_start", croc, broken)
+        game.fire_event("on_turn_start", p1)
+        game._run_effect(broken, croc, None)
+        assert trace.EFFECT_ERRORS["CS2_120"] == before + 2
+        assert sink.kinds() == [trace.EFFECT_ERROR] * 2
+        assert sink.events[0].data["where"] == "on_turn_start"
+
+    def test_choice_and_titan_errors_counted(self, board, summon):
+        """Discover callbacks and titan abilities are isolated like other scripts."""
+        from types import SimpleNamespace
+        from simulator import trace
+
+        game, (p1, p2) = board
+        # EDR_105's discover callback calls create_card without importing it
+        source = summon(game, p1, "EDR_105")
+        game._run_effect(source.data.effects.battlecry, source, None)
+        before = trace.EFFECT_ERRORS["effect_EDR_105"]
+        assert game.choose_discover(0)
+        assert trace.EFFECT_ERRORS["effect_EDR_105"] == before + 1
+
+        def broken(g, player, titan, target=None):
+            raise AttributeError("boom")
+
+        titan = summon(game, p1, "TTN_075")
+        titan.data = titan.data.replace(titan_abilities=("TTN_075t1",))
+        object.__setattr__(titan.data, "_effects", SimpleNamespace(get={"titan_ability_0": broken}.get))
+        before = trace.EFFECT_ERRORS["TTN_075"]
+        assert game.use_titan_ability(titan, 0)
+        assert trace.EFFECT_ERRORS["TTN_075"] == before + 1
+        assert titan.titan_abilities_used == ["TTN_075t1"]
+
+    def test_action_errors_counted_and_logged(self, caplog, board):
+        """execute_action exceptions are counted and logged, traced or not; a warning the first time."""
+        import logging
+        from ai.actions import Action
+        from simulator import trace
+
+        game, _ = board
+
+        def broken():
+            raise KeyError("boom")
+
+        game.end_turn = broken
+        before = trace.ACTION_ERRORS["END_TURN:KeyError"]
+        with caplog.at_level(logging.DEBUG, logger="simulator.game"):
+            assert not game.execute_action(Action.end_turn())
+            sink = trace.ListSink()
+            game.set_trace_sink(sink)
+            assert not game.execute_action(Action.end_turn())
+        assert trace.ACTION_ERRORS["END_TURN:KeyError"] == before + 2
+        assert sink.kinds() == [trace.ACTION_ERROR]
+        levels = [r.levelno for r in caplog.records if "execute_action" in r.getMessage()]
+        assert len(levels) == 2 and levels[1] == logging.DEBUG
+        assert levels[0] == (logging.WARNING if before == 0 else logging.DEBUG)
+
+    def test_clones_are_not_traced(self, board):
+        """Rollout clones drop the sink."""
+        from simulator import trace
+
+        game, _ = board
+        game.set_trace_sink(trace.ListSink())
+        for clone in (game.clone(), game.clone(full=False)):
+            assert not clone.tracing and clone.trace_sink is None
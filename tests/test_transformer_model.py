@@ -0,0 +1,86 @@
+"""Tests for HearthstoneTransformer."""
+
+import math
+
+
+def _reference_attention(attention, x, mask):
+    """MultiHeadAttention as first written: explicit softmax, NaN rows zeroed."""
+    import torch
+    import torch.nn.functional as F
+
+    b = x.size(0)
+    q, k, v = (w(x).view(b, -1, attention.n_heads, attention.d_k).transpose(1, 2)
+               for w in (attention.W_q, attention.W_k, attention.W_v))
+    scores = torch.matmul(q, k.transpose(-2, -1)) / math.sqrt(attention.d_k)
+    if mask is not None:
+        scores = scores.masked_fill(mask.unsqueeze(1).unsqueeze(2), float('-inf'))
+        probs = F.softmax(scores, dim=-1)
+        probs = probs.masked_fill(torch.isnan(probs), 0.0)
+    else:
+        probs = F.softmax(scores, dim=-1)
+    out = torch.matmul(probs, v).transpose(1, 2).contiguous().view(b, -1, attention.d_model)
+    return attention.W_o(out)
+
+
+def _reference_forward(model, hand, my_board, enemy_board, global_state, masks):
+    """Zone-by-zone forward (three card encoder calls, one board pass per side)."""
+    import torch
+    import torch.nn.functional as F
+
+    def blocks(layers, x, mask):
+        for block in layers:
+            x = block.norm1(x + _reference_attention(block.attention, x, mask))
+            x = block.norm2(x + block.ffn(x))
+        return x
+
+    zones = []
+    for name, data, layers in (("hand", hand, model.hand_transformer),
+                               ("my_board", my_board, model.board_transformer),
+                               ("enemy_board", enemy_board, model.board_transformer)):
+        x = blocks(layers, model.card_encoder(*data), masks.get(name))
+        zones.append(model._pool(x, masks.get(name)))
+    combined = torch.cat(zones + [model.global_encoder(global_state)], dim=-1)
+    return F.softmax(model.policy_head(combined), dim=-1), torch.tanh(model.value_head(combined))
+
+
+class TestHearthstoneTransformer:
+    """Tests for the fused attention / shared board pass forward."""
+
+    def test_matches_reference_forward(self):
+        """Same policy and value as the zone-by-zone forward, with empty zones and without masks."""
+        import torch
+        from ai.encoder import FeatureEncoder
+        from ai.transformer_model import HearthstoneTransformer
+        from tests.test_inference import _batch
+
+        torch.manual_seed(0)
+        model = HearthstoneTransformer().eval()
+        hand, my_board, enemy_board, global_state, masks = _batch(FeatureEncoder())
+        assert masks["enemy_board"].all(dim=1).any()  # some empty boards
+        masks["hand"][0] = True  # and an empty hand
+
+        with torch.no_grad():
+            for m in (masks, {}):
+                policy, value = model(hand, my_board, enemy_board, global_state, m)
+                expected_policy, expected_value = _reference_forward(
+                    model, hand, my_board, enemy_board, global_state, m)
+                assert not torch.isnan(policy).any() and not torch.isnan(value).any()
+                assert torch.allclose(policy, expected_policy, atol=1e-6)
+                assert torch.allclose(value, expected_value, atol=1e-5)
+
+    def test_gradients_with_empty_boards(self):
+        """Fully padded zones give finite gradients (no NaN through the attention)."""
+        import torch
+        from ai.transformer_model import HearthstoneTransformer
+
+        torch.manual_seed(0)
+        model = HearthstoneTransformer(card_vocab_size=50, d_model=32, n_layers=1)
+        ids = lambda n: torch.randint(3, 50, (2, n))
+        stats = lambda n: torch.rand(2, n, 10)
+        masks = {"hand": torch.zeros(2, 10, dtype=torch.bool),
+                 "my_board": torch.ones(2, 7, dtype=torch.bool),
+                 "enemy_board": torch.tensor([[False] * 3 + [True] * 4] * 2)}
+        policy, value = model((ids(10), stats(10)), (ids(7), stats(7)), (ids(7), stats(7)),
+                              torch.rand(2, 20), masks)
+        (value.sum() + policy[:, 0].sum()).backward()
+        assert all(torch.isfinite(p.grad).all() for p in model.parameters() if p.grad is not None)
@@ -0,0 +1,90 @@
+"""Tests for the turn solver."""
+
+
+class TestTurnSolver:
+    """Tests for ai.turn_solver.TurnSolver."""
+
+    def test_finds_lethal_through_taunt(self, make_game):
+        """Lethal needs the taunt cleared first, by the right minion."""
+        from ai.turn_solver import TurnSolver, state_key
+
+        # 3/1 and 4/5 against a 2/3 taunt and a hero on 4
+        game = make_game([("CS2_124", False), ("CS2_182", False)], [("CS2_120", True)], enemy_health=4)
+        before = state_key(game)
+        plan = TurnSolver(time_budget=1.0).solve(game)
+        assert plan.lethal and plan.complete
+        assert state_key(game) == before
+
+        clone = game.clone()
+        for move in plan.moves:
+            source, target = move.resolve(clone)
+            assert clone.attack(source, target)
+        assert clone.players[1].hero.health <= 0
+
+    def test_no_lethal_gives_best_line(self, make_game):
+        """Without lethal the plan scores at least as well as passing."""
+        from ai.turn_solver import TurnSolver, evaluate_board
+
+        game = make_game([("CS2_124", False), ("CS2_182", False)], [("CS2_120", True), ("CS2_231", False)])
+        plan = TurnSolver(time_budget=1.0).solve(game)
+        assert not plan.lethal and plan.complete
+        assert plan.moves and plan.score > evaluate_board(game, game.players[0])
+
+    def test_transpositions_are_merged(self, make_game):
+        """Attack orders reaching the same board are searched once."""
+        from ai.turn_solver import TurnSolver
+
+        game = make_game([("CS2_231", False)] * 3, [("CS2_182", False)])
+        plan = TurnSolver(time_budget=1.0).solve(game)
+        assert plan.complete and plan.table_hits > 0
+
+    def test_attack_phase_uses_combat_resolver(self, make_game):
+        """Once only attacks are left, lethal comes from simulator.combat and agrees with the move search."""
+        from simulator import combat
+        from ai.turn_solver import TurnSolver
+
+        board = [("CS2_124", False), ("CS2_182", False), ("CS2_120", False), ("CS2_231", False)]
+        for enemy_health, lethal in ((6, True), (7, True), (8, False)):
+            game = make_game(board, [("CS2_120", True)], enemy_health=enemy_health)
+            calls = []
+            find_lethal = combat.find_lethal
+            combat.find_lethal = lambda *args, **kwargs: calls.append(1) or find_lethal(*args, **kwargs)
+            try:
+                plan = TurnSolver(time_budget=2.0).solve(game)
+            finally:
+                combat.find_lethal = find_lethal
+            moves_only = TurnSolver(time_budget=2.0)
+            moves_only._attacks_only = lambda game, player: False
+            expected = moves_only.solve(game)
+            assert calls and plan.complete and expected.complete
+            assert plan.lethal == expected.lethal == lethal
+
+            if lethal:
+                clone = game.clone()
+                for move in plan.moves:
+                    source, target = move.resolve(clone)
+                    assert clone.attack(source, target)
+                assert clone.players[1].hero.health <= 0
+
+    def test_damage_bound_counts_affordable_cards(self, make_game):
+        """The lethal bound adds the damage cards and hero power the mana left can pay for."""
+        from simulator import create_card
+        from ai.turn_solver import TurnSolver
+
+        solver = TurnSolver()
+        # 4/5 Yeti, two Fireballs (4 mana, 6 damage) and Wolfrider (3 mana, 3/1 charge)
+        hand = ["CS2_029", "CS2_029", "CS2_124"]
+        for mana, bound in ((3, 4 + 3), (5, 4 + 6), (7, 4 + 6 + 3), (8, 4 + 12)):
+            game = make_game(["CS2_182"], [], hand=hand, mana=mana)
+            assert solver._damage_bound(game, game.players[0]) == bound
+        game = make_game(["CS2_182"], [], hand=hand + ["GAME_005"], mana=7)
+        assert solver._damage_bound(game, game.players[0]) == 4 + 12  # The Coin pays for the second Fireball
+        game = make_game(["CS2_182"], [], hand=hand, mana=6)
+        me = game.players[0]
+        me.hero.hero_power = create_card("TU4d_003", game)  # Shotgun Blast: 2 mana, 1 damage
+        me.hero.hero_power.controller = me
+        assert solver._damage_bound(game, me) == 4 + 6 + 1
+        game = make_game(["CS2_182"], [], hand=["EX1_284"], mana=5)  # Azure Drake: unknown effect
+        assert solver._damage_bound(game, game.players[0]) is None
+        game = make_game(["CS2_182"], [], hand=["EX1_284"], mana=4)  # but too expensive
+        assert solver._damage_bound(game, game.players[0]) == 4
@@ -0,0 +1,103 @@
+"""Benchmark the direct simulator encoder against the GameState path."""
+
+import os
+import random
+import sys
+import time
+
+import torch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai.encoder import FeatureEncoder
+from ai.game_state import GameState
+from ai.game_wrapper import HearthstoneGame
+
+
+def trajectory(seed, steps=80):
+    """(game clone, player to act) along a random self-play game."""
+    random.seed(seed)
+    env = HearthstoneGame()
+    env.reset(seed=seed)
+    env.game.is_simulation = True
+    states = []
+    for _ in range(steps):
+        if env.is_game_over:
+            break
+        states.append((env.game.clone(), env.game.current_player_idx))
+        env.step(random.choice(env.get_valid_actions()), observe=False)
+    return states
+
+
+def bench(fn, states, repeat):
+    fn(states)  # materialize lazy clones
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(states)
+        best = min(best, time.perf_counter() - start)
+    return best / len(states) * 1e6
+
+
+def main():
+    encoder = FeatureEncoder()
+    states = [s for seed in range(3) for s in trajectory(seed)]
+
+    def via_game_state(states):
+        for game, player in states:
+            encoder.structured_encode(GameState.from_simulator_game(game, player + 1))
+
+    def direct(states):
+        for game, player in states:
+            encoder.structured_encode_game(game, player)
+
+    def via_game_state_flat(states):
+        for game, player in states:
+            encoder.encode(GameState.from_simulator_game(game, player + 1))
+
+    def direct_flat(states):
+        for game, player in states:
+            encoder.encode_game(game, player)
+
+    print(f"States: {len(states)}")
+    for name, slow, fast in (("structured", via_game_state, direct), ("flat", via_game_state_flat, direct_flat)):
+        slow_us = bench(slow, states, 10)
+        fast_us = bench(fast, states, 10)
+        print(f"{name:10}  GameState: {slow_us:7.1f} us/state   direct: {fast_us:6.1f} us/state  "
+              f"({slow_us / fast_us:.1f}x)")
+
+    # A training step used to build the GameState twice: once in step() and once to encode
+    def step_before(states):
+        for game, player in states:
+            GameState.from_simulator_game(game, player + 1)
+            encoder.structured_encode(GameState.from_simulator_game(game, player + 1))
+
+    before_us = bench(step_before, states, 10)
+    after_us = bench(direct, states, 10)
+    print(f"per step    before: {before_us:7.1f} us/step    after: {after_us:6.1f} us/step   "
+          f"({before_us / after_us:.1f}x)")
+
+    # Batches of 32: encode each state, then stack every component (MCTS and trainer before)
+    def batches(states, size=32):
+        return [states[i:i + size] for i in range(0, len(states), size)]
+
+    def stack_batch(states):
+        for batch in batches(states):
+            encoded = [encoder.structured_encode(GameState.from_simulator_game(g, p + 1)) for g, p in batch]
+            zones = [tuple(torch.stack([e[z][k] for e in encoded]) for k in (0, 1))
+                     for z in ("hand", "my_board", "enemy_board")]
+            masks = {z: torch.stack([e["masks"][z] for e in encoded]) for z in encoded[0]["masks"]}
+            torch.stack([e["global_state"] for e in encoded])
+
+    def encode_batch(states):
+        for batch in batches(states):
+            encoder.encode_batch([g for g, _ in batch], [p for _, p in batch])
+
+    stack_us = bench(stack_batch, states, 10)
+    batch_us = bench(encode_batch, states, 10)
+    print(f"batch of 32 stacked: {stack_us:7.1f} us/state   encode_batch: {batch_us:6.1f} us/state  "
+          f"({stack_us / batch_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
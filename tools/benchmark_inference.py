@@ -0,0 +1,80 @@
+"""Benchmark CPU inference: eager PyTorch vs frozen TorchScript (float and int8)."""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import torch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai.encoder import FeatureEncoder
+from ai.inference import InferenceModel, export, set_threads
+from ai.transformer_model import HearthstoneTransformer
+from tools.benchmark_encoder import trajectory
+
+BATCH_SIZES = (1, 8, 64)
+
+
+def bench(fn, inputs, repeat):
+    for _ in range(3):
+        fn(*inputs)  # warm up (TorchScript profiles its first runs)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*inputs)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checkpoint", help="HearthstoneTransformer state dict (default: random weights)")
+    parser.add_argument("--threads", type=int, help="intra-op threads (default: tuned on batch 8)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    model = HearthstoneTransformer()
+    if args.checkpoint:
+        model.load_state_dict(torch.load(args.checkpoint, map_location="cpu"))
+    model.eval()
+
+    encoder = FeatureEncoder()
+    states = [s for seed in range(8) for s in trajectory(seed)]
+    with tempfile.TemporaryDirectory() as tmp:
+        runtimes = {
+            "script": export(model, os.path.join(tmp, "float.ts"), quantize=False, encoder=encoder),
+            "int8": export(model, os.path.join(tmp, "int8.ts"), encoder=encoder),
+        }
+
+    def inputs(size):
+        batch = states[:size]
+        return encoder.encode_batch([g for g, _ in batch], [p for _, p in batch])
+
+    if args.threads:
+        set_threads(args.threads)
+    else:
+        print(f"threads: {runtimes['int8'].tune_threads(inputs(8))} (tuned of {os.cpu_count()} CPUs)")
+
+    def eager(*x):
+        with torch.inference_mode():
+            return model(*x)
+
+    print(f"{'batch':>5}  {'eager ms':>9}  {'script ms':>9}  {'int8 ms':>9}  {'int8 states/s':>13}  "
+          f"{'max |dp|':>9}  {'max |dv|':>9}")
+    for size in BATCH_SIZES:
+        x = inputs(size)
+        policy, value = eager(*x)
+        got_policy, got_value = runtimes["int8"](*x)
+        eager_ms = bench(eager, x, args.repeat)
+        script_ms = bench(runtimes["script"], x, args.repeat)
+        int8_ms = bench(runtimes["int8"], x, args.repeat)
+        print(f"{size:5d}  {eager_ms:9.2f}  {script_ms:9.2f}  {int8_ms:9.2f}  {size / int8_ms * 1000:13.0f}  "
+              f"{(got_policy - policy).abs().max():9.2e}  {(got_value - value).abs().max():9.2e}")
+
+
+if __name__ == "__main__":
+    main()
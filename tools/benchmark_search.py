@@ -0,0 +1,56 @@
+"""Benchmark CardDatabase.search (inverted index) against the old linear scan."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from simulator.card_loader import CardDatabase
+
+QUERIES = [
+    "fireball", "fire ele", "Sen'jin", "zilliax", "ragnaros", "deal 3 damage",
+    "battlecry", "<b>Deathrattle:</b> summon", "taunt", "draw a card", "murloc", "a",
+    "ball", "storm", "wind champion", "d champ",
+]
+
+
+def linear_search(query):
+    """The previous implementation: lowercase every name and text per query."""
+    query = query.lower()
+    return [c for c in CardDatabase._cards.values()
+            if query in c.name.lower() or query in c.text.lower()]
+
+
+def bench(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            fn(query)
+    return (time.perf_counter() - start) / (repeat * len(QUERIES)) * 1000
+
+
+def main():
+    CardDatabase.load()
+    start = time.perf_counter()
+    CardDatabase.search_index()
+    build = time.perf_counter() - start
+    linear_search("warmup")
+
+    print(f"Cards: {len(CardDatabase._cards)}  index build: {build:.2f}s")
+    linear_ms = bench(linear_search, 3)
+    indexed_ms = bench(CardDatabase.search, 50)
+    print(f"Linear scan : {linear_ms:8.3f} ms/query")
+    print(f"Inverted idx: {indexed_ms:8.3f} ms/query  ({linear_ms / indexed_ms:.0f}x faster)")
+
+    print("\nPer query (indexed, top 3):")
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(50):
+            results = CardDatabase.search(query, limit=3)
+        ms = (time.perf_counter() - start) / 50 * 1000
+        print(f"  {query!r:32} {ms:7.3f} ms  {[c.name for c in results]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark the turn solver on recorded positions.
+
+A position is recorded as {"seed": s, "steps": n}: the game reset with seed s
+after n random legal actions (drawn from random.Random(s)). Seeded games
+replay exactly, so the file is enough to rebuild every position.
+
+Usage:
+    python tools/benchmark_turn_solver.py --record positions.jsonl --count 200
+    python tools/benchmark_turn_solver.py --positions positions.jsonl --budget 0.2
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from simulator.card_loader import CardDatabase
+
+
+def replay(seed, steps):
+    """Rebuild a recorded position; None if the game ended before it."""
+    from ai.game_wrapper import HearthstoneGame
+
+    random.seed(seed)  # deck picks
+    env = HearthstoneGame()
+    env.reset(seed=seed)
+    env.game.is_simulation = True
+    actions = random.Random(seed)
+    for _ in range(steps):
+        if env.is_game_over:
+            return None
+        env.step(actions.choice(env.get_valid_actions()))
+    return None if env.is_game_over else env.game
+
+
+def record(path, count, first_seed):
+    rng = random.Random(first_seed)
+    with open(path, "w", encoding="utf-8") as f:
+        written, seed = 0, first_seed
+        while written < count:
+            steps = rng.randrange(10, 120)
+            if replay(seed, steps) is not None:
+                f.write(json.dumps({"seed": seed, "steps": steps}) + "\n")
+                written += 1
+            seed += 1
+    print(f"Recorded {count} positions to {path}")
+
+
+def bench(path, budget):
+    from ai.turn_solver import TurnSolver
+
+    with open(path, encoding="utf-8") as f:
+        positions = [json.loads(line) for line in f if line.strip()]
+    solver = TurnSolver(time_budget=budget)
+    elapsed, nodes, hits, lethal, complete = [], [], [], 0, 0
+    start = time.perf_counter()
+    for position in positions:
+        game = replay(position["seed"], position["steps"])
+        if game is None:
+            continue
+        plan = solver.solve(game)
+        elapsed.append(plan.elapsed * 1000)
+        nodes.append(plan.nodes)
+        hits.append(plan.table_hits)
+        lethal += plan.lethal
+        complete += plan.complete
+    total = time.perf_counter() - start
+
+    n = len(elapsed)
+    elapsed.sort()
+    print(f"Positions: {n}  budget: {budget * 1000:.0f} ms  total: {total:.1f}s")
+    print(f"Solve time: mean {statistics.mean(elapsed):6.1f} ms  p50 {elapsed[n // 2]:6.1f} ms  "
+          f"p95 {elapsed[int(n * 0.95)]:6.1f} ms  max {elapsed[-1]:6.1f} ms")
+    print(f"Nodes: mean {statistics.mean(nodes):.0f}  table hits: mean {statistics.mean(hits):.0f}")
+    print(f"Searched fully: {complete}/{n}  lethal found: {lethal}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--record", help="write COUNT positions to this JSONL file")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0, help="first seed when recording")
+    parser.add_argument("--positions", help="JSONL file of positions to solve")
+    parser.add_argument("--budget", type=float, default=0.2, help="seconds per solve")
+    args = parser.parse_args()
+
+    CardDatabase.load()
+    if args.record:
+        record(args.record, args.count, args.seed)
+    if args.positions:
+        bench(args.positions, args.budget)
+    if not (args.record or args.positions):
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Export a trained checkpoint for CPU inference (frozen TorchScript, optional ONNX)."""
+
+import argparse
+import os
+import sys
+
+import torch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai.actions import ACTION_SPACE_SIZE
+from ai.card_vocab import CardVocabulary, VOCAB_FILE
+from ai.encoder import FeatureEncoder
+from ai.inference import export, export_onnx
+from ai.model import HearthstoneModel
+from ai.transformer_model import HearthstoneTransformer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("checkpoint", help="state dict saved by the trainer")
+    parser.add_argument("--out", help="TorchScript artifact (default: checkpoint with .ts)")
+    parser.add_argument("--flat", type=int, metavar="INPUT_DIM",
+                        help="checkpoint is a HearthstoneModel with this input size")
+    parser.add_argument("--float", action="store_true", help="no int8 quantization")
+    parser.add_argument("--onnx", metavar="PATH", help="also write the float model as ONNX")
+    args = parser.parse_args()
+
+    checkpoint = torch.load(args.checkpoint, map_location="cpu")
+    if isinstance(checkpoint, dict) and "model_state_dict" in checkpoint:
+        checkpoint = checkpoint["model_state_dict"]
+    if args.flat:
+        model = HearthstoneModel(args.flat, ACTION_SPACE_SIZE)
+    else:
+        model = HearthstoneTransformer(action_dim=ACTION_SPACE_SIZE)
+    model.load_state_dict(checkpoint)
+
+    vocab_path = os.path.join(os.path.dirname(args.checkpoint), VOCAB_FILE)
+    encoder = FeatureEncoder(CardVocabulary.load(vocab_path) if os.path.exists(vocab_path) else None)
+
+    out = args.out or os.path.splitext(args.checkpoint)[0] + ".ts"
+    export(model, out, quantize=not args.float, encoder=encoder)
+    print(f"Exported {'float' if args.float else 'int8'} TorchScript to {out}")
+
+    if args.onnx:
+        try:
+            export_onnx(model, args.onnx, encoder=encoder)
+            print(f"Exported ONNX to {args.onnx}")
+        except Exception as e:
+            print(f"ONNX export failed (is the onnx package installed?): {e}")
+
+
+if __name__ == "__main__":
+    main()
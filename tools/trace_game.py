@@ -0,0 +1,63 @@
+"""Play a seeded game with random legal actions and dump its trace as JSONL.
+
+Usage:
+    python tools/trace_game.py --seed 7                  # whole trace to stdout
+    python tools/trace_game.py --seed 7 -o game.jsonl
+    python tools/trace_game.py --seed 7 --last 200       # ring buffer: last 200 records
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from simulator import CardDatabase
+from simulator import trace
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, help="game seed (decks, game and actions)")
+    parser.add_argument("--max-steps", type=int, default=300)
+    parser.add_argument("--last", type=int, default=0, help="keep only the last N records")
+    parser.add_argument("-o", "--output", help="JSONL file (default: stdout)")
+    args = parser.parse_args()
+
+    CardDatabase.load()
+    from ai.game_wrapper import HearthstoneGame
+
+    random.seed(args.seed)  # deck picks
+    env = HearthstoneGame()
+    env.reset(seed=args.seed)
+    actions = random.Random(args.seed)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    sink = trace.RingBufferSink(args.last) if args.last else trace.JsonlSink(out)
+    env.game.set_trace_sink(sink)
+
+    errors_before = sum(trace.EFFECT_ERRORS.values())
+    action_errors_before = sum(trace.ACTION_ERRORS.values())
+    steps = 0
+    while not env.is_game_over and steps < args.max_steps:
+        env.step(actions.choice(env.get_valid_actions()))
+        steps += 1
+
+    if args.last:
+        sink.dump_jsonl(out)
+    sink.close()
+    if out is not sys.stdout:
+        out.close()
+
+    print(f"seed {args.seed}: {steps} steps, {env.game._trace_seq} records, "
+          f"{sum(trace.EFFECT_ERRORS.values()) - errors_before} effect errors, "
+          f"{sum(trace.ACTION_ERRORS.values()) - action_errors_before} action errors", file=sys.stderr)
+    for card_id, count in trace.EFFECT_ERRORS.most_common(10):
+        print(f"  {count:4} {card_id}", file=sys.stderr)
+    for kind, count in trace.ACTION_ERRORS.most_common(10):
+        print(f"  {count:4} {kind}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
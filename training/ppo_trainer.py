@@ -20,7 +20,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from ai.transformer_model import HearthstoneTransformer
 from ai.ppo import PPO
-from ai.encoder import FeatureEncoder
+from ai.encoder import FeatureEncoder, StateBuffers
+from ai.card_vocab import CardVocabulary, VOCAB_FILE
 from ai.game_wrapper import HearthstoneGame
 from ai.actions import ACTION_SPACE_SIZE
 from training.league import League, create_league
@@ -48,7 +49,9 @@ class PPOTrainer:
         )
         
         # Components
-        self.encoder = FeatureEncoder()
+        self.save_dir = self.config.get("save_dir", "models")
+        self.vocab = CardVocabulary.load_or_build(os.path.join(self.save_dir, VOCAB_FILE))
+        self.encoder = FeatureEncoder(self.vocab)
         self.league = create_league({
             "save_dir": "models/league_ppo",
             "snapshot_interval": 20
@@ -117,26 +120,21 @@ class PPOTrainer:
                 opp_model.eval()
             
             step_count = 0
-            while not env.is_game_over and step_count < 300:
+            max_steps = 300
+            buffers = StateBuffers(self.encoder, size=max_steps, pin_memory=self.device.type == "cuda")
+            while not env.is_game_over and step_count < max_steps:
                 current_p_idx = env.game.current_player_idx
                 
-                # Encode state (Structured for Transformer)
+                # Encode state (Structured for Transformer), straight from the simulator,
+                # as a batch of one already on the device; one buffer row per step since
+                # the memory keeps the tensors
                 env.perspective = current_p_idx + 1
-                state_structured = self.encoder.structured_encode(env.get_state())
+                state_inputs = self.encoder.encode_batch(
+                    [env.game], [current_p_idx], out=buffers, start=step_count, device=self.device)
                 action_mask = torch.tensor(env.get_action_mask(), dtype=torch.float32)
                 
-                # Prepare inputs for model
-                # (hand, board, en_board, global, masks)
-                input_args = (
-                    state_structured["hand"],
-                    state_structured["my_board"],
-                    state_structured["enemy_board"],
-                    state_structured["global_state"],
-                    state_structured["masks"],
-                    action_mask
-                )
-                # Move to device
-                input_args = [self._to_device(arg) for arg in input_args]
+                # Model inputs: (hand, board, en_board, global, masks, action_mask)
+                input_args = [*state_inputs, self._to_device(action_mask)]
                 
                 if current_p_idx == 0 or opp_model is None:
                     # Decision from current/main model
@@ -145,7 +143,7 @@ class PPOTrainer:
                     # Execute step
                     from ai.actions import Action
                     action = Action.from_index(action_idx)
-                    _, reward, done, _ = env.step(action)
+                    _, reward, done, _ = env.step(action, observe=False)
                     
                     # Store in memory (Only for P1 or if both are training)
                     # We store the structured input components directly
@@ -161,7 +159,7 @@ class PPOTrainer:
                         action_idx = torch.multinomial(policy, 1).item()
                         from ai.actions import Action
                         action = Action.from_index(action_idx)
-                        env.step(action)
+                        env.step(action, observe=False)
                 
                 step_count += 1
             
@@ -181,9 +179,11 @@ class PPOTrainer:
         return obj
 
     def save_checkpoint(self, name):
-        path = os.path.join("models", name)
-        os.makedirs("models", exist_ok=True)
+        path = os.path.join(self.save_dir, name)
+        os.makedirs(self.save_dir, exist_ok=True)
         torch.save(self.model.state_dict(), path)
+        # Embedding rows are only meaningful with the vocabulary they were trained on
+        self.vocab.save(os.path.join(self.save_dir, VOCAB_FILE))
 
 if __name__ == "__main__":
     # Standard training scale